@@ -0,0 +1,241 @@
+"""Benchmark each rendering stage on synthetic CVs of increasing size.
+
+Usage:
+    just benchmark --sizes 10,100 --baseline benchmark_baseline.json
+
+Results are written as JSON. With `--baseline`, they are compared against a
+previous results file and the script exits with status 1 if any stage got slower
+or used more memory than `--threshold` allows. Peak memory is the Python heap
+measured with `tracemalloc`; memory allocated by the Typst compiler itself is not
+included.
+"""
+
+import argparse
+import io
+import json
+import math
+import pathlib
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from teklinicv import __version__
+from teklinicv.cli.lsp_command.language_server import LanguageServer
+from teklinicv.renderer.pdf_png import compile_typst
+from teklinicv.renderer.templater.model_processor import process_model
+from teklinicv.renderer.templater.templater import render_full_template
+from teklinicv.schema.synthetic_generator import (
+    SyntheticCvOptions,
+    write_synthetic_yaml_input_file,
+)
+from teklinicv.schema.teklinicv_model_builder import (
+    build_teklinicv_model_from_commented_map,
+)
+from teklinicv.schema.yaml_reader import read_yaml
+
+stages = (
+    "read_yaml",
+    "validation",
+    "process_model",
+    "render_full_template",
+    "typst_pdf",
+    "typst_png",
+    "lsp_revalidation",
+)
+entries_per_section = 10
+
+
+def create_synthetic_cv_options(entry_count: int) -> SyntheticCvOptions:
+    """Spread about `entry_count` entries over all entry types, ten per section."""
+    entries_per_type = math.ceil(entry_count / 9)
+    return SyntheticCvOptions(
+        section_count=9 * math.ceil(entries_per_type / entries_per_section),
+        entries_per_type=entries_per_type,
+        bold_keyword_count=50,
+        connection_count=8,
+    )
+
+
+def measure(function: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Time a function and measure the peak Python memory of one more call.
+
+    The first call is part of the timings, so cold caches show up in `max`.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median_seconds": statistics.median(durations),
+        "min_seconds": min(durations),
+        "max_seconds": max(durations),
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_benchmark(
+    entry_count: int, selected_stages: list[str], repeat: int
+) -> dict[str, dict[str, float]]:
+    """Benchmark the selected stages on a synthetic CV with `entry_count` entries."""
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory = pathlib.Path(temporary_directory)
+        input_file_path = directory / "Benchmark_CV.yaml"
+        write_synthetic_yaml_input_file(
+            create_synthetic_cv_options(entry_count), input_file_path
+        )
+
+        # Each stage runs on the output of the previous one, prepared untimed:
+        commented_map = read_yaml(input_file_path)
+        model = build_teklinicv_model_from_commented_map(commented_map, input_file_path)
+        typst_path = directory / "Benchmark_CV.typ"
+        typst_path.write_text(render_full_template(model, "typst"), encoding="utf-8")
+        uri = input_file_path.as_uri()
+        language_server = LanguageServer(io.BytesIO(), io.BytesIO())
+        language_server.initialize({})
+        language_server.did_open(
+            {
+                "textDocument": {
+                    "uri": uri,
+                    "text": input_file_path.read_text(encoding="utf-8"),
+                }
+            }
+        )
+        # Typing one character into the name, revalidated after every keystroke:
+        keystroke = {
+            "textDocument": {"uri": uri},
+            "contentChanges": [
+                {
+                    "range": {
+                        "start": {"line": 1, "character": 8},
+                        "end": {"line": 1, "character": 8},
+                    },
+                    "text": "A",
+                }
+            ],
+        }
+
+        stage_functions: dict[str, Callable[[], Any]] = {
+            "read_yaml": lambda: read_yaml(input_file_path),
+            "validation": lambda: build_teklinicv_model_from_commented_map(
+                commented_map, input_file_path
+            ),
+            "process_model": lambda: process_model(model, "typst"),
+            "render_full_template": lambda: render_full_template(model, "typst"),
+            "typst_pdf": lambda: list(
+                compile_typst(typst_path, input_file_path, "pdf")[1]
+            ),
+            "typst_png": lambda: list(
+                compile_typst(typst_path, input_file_path, "png", ppi=150)[1]
+            ),
+            "lsp_revalidation": lambda: language_server.did_change(keystroke),
+        }
+
+        results = {}
+        for stage in selected_stages:
+            results[stage] = measure(stage_functions[stage], repeat)
+            print(  # NOQA: T201
+                f"{entry_count:>6} entries  {stage:<21}"
+                f" {results[stage]['median_seconds']:9.4f} s"
+                f" {results[stage]['peak_memory_bytes'] / 1024**2:9.1f} MiB"
+            )
+        return results
+
+
+def find_regressions(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """List stages whose time or memory grew by more than `threshold` (a ratio)."""
+    regressions = []
+    for size, stage_results in results["results"].items():
+        for stage, result in stage_results.items():
+            baseline_result = baseline["results"].get(size, {}).get(stage)
+            if baseline_result is None:
+                continue
+            for metric in ("median_seconds", "peak_memory_bytes"):
+                old, new = baseline_result[metric], result[metric]
+                if old and new > old * (1 + threshold):
+                    regressions.append(
+                        f"{size} entries, {stage}: {metric} went from {old:g} to"
+                        f" {new:g} (+{new / old - 1:.0%})"
+                    )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="10,100,1000,10000",
+        help="Comma-separated entry counts of the synthetic CVs.",
+    )
+    parser.add_argument(
+        "--stages",
+        default=",".join(stages),
+        help=f"Comma-separated stages to benchmark, out of {', '.join(stages)}.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed runs of each stage."
+    )
+    parser.add_argument(
+        "--output",
+        type=pathlib.Path,
+        default=pathlib.Path("benchmark_results.json"),
+        help="Where to write the results JSON.",
+    )
+    parser.add_argument(
+        "--baseline", type=pathlib.Path, help="Results JSON to compare against."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed growth over the baseline as a ratio (0.2 means 20%%).",
+    )
+    arguments = parser.parse_args()
+
+    selected_stages = arguments.stages.split(",")
+    if unknown_stages := set(selected_stages) - set(stages):
+        parser.error(f"unknown stages: {', '.join(sorted(unknown_stages))}")
+
+    results = {
+        "metadata": {
+            "teklinicv_version": __version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": arguments.repeat,
+        },
+        "results": {
+            size: run_benchmark(int(size), selected_stages, arguments.repeat)
+            for size in arguments.sizes.split(",")
+        },
+    }
+    arguments.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Results written to {arguments.output}.")  # NOQA: T201
+
+    if arguments.baseline is None:
+        return
+    baseline = json.loads(arguments.baseline.read_text(encoding="utf-8"))
+    regressions = find_regressions(results, baseline, arguments.threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}")  # NOQA: T201
+    if regressions:
+        sys.exit(1)
+    print("No regressions against the baseline.")  # NOQA: T201
+
+
+if __name__ == "__main__":
+    main()
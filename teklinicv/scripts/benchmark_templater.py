@@ -0,0 +1,461 @@
+"""Benchmark the templater's hot functions on realistic inputs, in operations per second.
+
+Usage:
+    just benchmark-templater --filter markdown --baseline templater_baseline.json
+
+Inputs are taken from seeded synthetic CVs: short strings (names, titles), long
+strings (summaries with their highlights), markup-heavy strings, and keyword
+sets of 10 and 200 keywords. Each benchmark calls its function on its inputs in
+turn, for rounds of at least `--min-seconds`, and reports the median over
+`--repeat` rounds. Results are written as JSON. With `--baseline`, they are
+compared against a previous results file and the script exits with status 1 if
+any benchmark got slower than `--threshold` allows.
+"""
+
+import argparse
+import functools
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from teklinicv import __version__
+from teklinicv.renderer.templater.connections import compute_connections
+from teklinicv.renderer.templater.date import (
+    compute_time_span_string,
+    format_date_range,
+    get_date_locale,
+    memoized_compute_time_span_string,
+    memoized_format_date_range,
+)
+from teklinicv.renderer.templater.entry_templates_from_input import (
+    compile_entry_template_plans,
+    render_entry_templates,
+)
+from teklinicv.renderer.templater.markdown_parser import (
+    escape_typst_characters,
+    markdown_to_typst,
+)
+from teklinicv.renderer.templater.string_processor import (
+    make_keywords_bold,
+    substitute_placeholders,
+)
+from teklinicv.schema.models.cv.section import get_entry_type_name_and_section_model
+from teklinicv.schema.models.teklinicv_model import TekliniCVModel
+from teklinicv.schema.synthetic_generator import (
+    SyntheticCvOptions,
+    create_synthetic_yaml_input,
+)
+from teklinicv.schema.teklinicv_model_builder import (
+    build_teklinicv_model_from_commented_map,
+)
+from teklinicv.schema.yaml_reader import read_yaml
+
+file_name_templates = (
+    "NAME_IN_SNAKE_CASE_CV.pdf",
+    "NAME_IN_LOWER_KEBAB_CASE_CV_YEAR.typ",
+    "NAME_CV_MONTH_ABBREVIATION_YEAR_IN_TWO_DIGITS.png",
+)
+
+
+@dataclass
+class Benchmark:
+    """A function called with each of its argument tuples in turn.
+
+    Args:
+        name: Name of the benchmark, as `function[inputs]`.
+        function: Function to time.
+        arguments: Positional arguments of the calls.
+        prepare: Makes untimed copies of arguments the function modifies.
+    """
+
+    name: str
+    function: Callable[..., Any]
+    arguments: list[tuple[Any, ...]]
+    prepare: Callable[[tuple[Any, ...]], tuple[Any, ...]] | None = None
+
+
+@dataclass
+class Corpus:
+    """Inputs shared by the benchmarks, from seeded synthetic CVs."""
+
+    model: TekliniCVModel
+    raw_entries: list[Any]
+    short_strings: list[str]
+    long_strings: list[str]
+    markup_strings: list[str]
+    keywords: list[str]
+
+
+def create_synthetic_model(
+    markup_density: float,
+) -> tuple[dict[str, Any], TekliniCVModel]:
+    """Read and validate a synthetic CV with every entry type and 200 keywords."""
+    commented_map = read_yaml(
+        create_synthetic_yaml_input(
+            SyntheticCvOptions(
+                seed=0,
+                section_count=18,
+                entries_per_type=20,
+                bold_keyword_count=200,
+                connection_count=8,
+                markup_density=markup_density,
+            )
+        )
+    )
+    return commented_map, build_teklinicv_model_from_commented_map(commented_map)
+
+
+def get_entries(model: TekliniCVModel) -> list[Any]:
+    return [
+        entry for section in (model.cv.sections or {}).values() for entry in section
+    ]
+
+
+def create_corpus() -> Corpus:
+    """Collect the benchmark inputs from a plain and a markup-heavy synthetic CV."""
+    commented_map, model = create_synthetic_model(markup_density=0.2)
+    _, markup_model = create_synthetic_model(markup_density=1.0)
+    entries = get_entries(model)
+
+    short_strings = [
+        value
+        for entry in entries
+        if not isinstance(entry, str)
+        for key in ("name", "company", "institution", "title", "label", "location")
+        if isinstance(value := getattr(entry, key, None), str)
+    ]
+    long_strings = [
+        " ".join([getattr(entry, "summary", None) or "", *entry.highlights])
+        for entry in entries
+        if getattr(entry, "highlights", None)
+    ]
+    markup_strings = [
+        highlight
+        for entry in get_entries(markup_model)
+        for highlight in getattr(entry, "highlights", None) or []
+    ]
+    return Corpus(
+        model=model,
+        raw_entries=[
+            entry
+            for section in commented_map["cv"]["sections"].values()
+            for entry in section
+        ],
+        short_strings=short_strings,
+        long_strings=long_strings,
+        markup_strings=markup_strings,
+        keywords=model.settings.bold_keywords,
+    )
+
+
+def create_benchmarks(corpus: Corpus) -> list[Benchmark]:
+    """Define the benchmarks of the templater's hot functions."""
+    model = corpus.model
+    templates = model.design.templates
+    locale = model.locale
+    current_date = model.settings.current_date
+    entries = get_entries(model)
+    dated_entries = [entry for entry in entries if getattr(entry, "end_date", None)]
+    date_ranges = [(entry.start_date, entry.end_date) for entry in dated_entries]
+    string_corpora = {
+        "short": corpus.short_strings,
+        "long": corpus.long_strings,
+        "markup": corpus.markup_strings,
+    }
+
+    def as_arguments(*values: Any) -> list[tuple[Any, ...]]:
+        return [(value,) for value in values]
+
+    benchmarks = []
+    for function in (escape_typst_characters, markdown_to_typst):
+        benchmarks.extend(
+            Benchmark(f"{function.__name__}[{name}]", function, as_arguments(*strings))
+            for name, strings in string_corpora.items()
+        )
+    benchmarks.extend(
+        Benchmark(
+            f"make_keywords_bold[{len(keywords)} keywords]",
+            make_keywords_bold,
+            [(string, keywords) for string in corpus.long_strings],
+        )
+        for keywords in (corpus.keywords[:10], corpus.keywords)
+    )
+
+    entry_placeholders = [
+        (
+            template,
+            {
+                key.upper(): str(value)
+                for key, value in entry.model_dump(exclude_none=True).items()
+            },
+        )
+        for entry in entries
+        if not isinstance(entry, str)
+        and hasattr(templates, entry.entry_type_in_snake_case)
+        for template in getattr(templates, entry.entry_type_in_snake_case)
+        .model_dump(exclude_none=True)
+        .values()
+    ]
+    file_name_placeholders = {
+        "NAME": model.cv.name or "",
+        "NAME_IN_SNAKE_CASE": (model.cv.name or "").replace(" ", "_"),
+        "NAME_IN_LOWER_KEBAB_CASE": (model.cv.name or "").replace(" ", "-").lower(),
+        "MONTH_ABBREVIATION": locale.month_abbreviations[current_date.month - 1],
+        "YEAR": str(current_date.year),
+        "YEAR_IN_TWO_DIGITS": str(current_date.year)[-2:],
+    }
+    benchmarks.extend(
+        [
+            Benchmark(
+                "substitute_placeholders[entry templates]",
+                substitute_placeholders,
+                entry_placeholders,
+            ),
+            Benchmark(
+                "substitute_placeholders[file names]",
+                substitute_placeholders,
+                [(name, file_name_placeholders) for name in file_name_templates],
+            ),
+            Benchmark(
+                "render_entry_templates",
+                functools.partial(
+                    render_entry_templates,
+                    templates=templates,
+                    locale=locale,
+                    show_time_span=True,
+                    current_date=current_date,
+                    entry_template_plans=compile_entry_template_plans(templates),
+                ),
+                as_arguments(
+                    *(entry for entry in entries if not isinstance(entry, str))
+                ),
+                # Entries are filled in place:
+                prepare=lambda arguments: (arguments[0].model_copy(deep=True),),
+            ),
+        ]
+    )
+
+    date_locale = get_date_locale(locale)
+    benchmarks.extend(
+        [
+            Benchmark(
+                "format_date_range[cached]",
+                functools.partial(
+                    format_date_range,
+                    locale=locale,
+                    single_date_template=templates.single_date,
+                    date_range_template=templates.date_range,
+                ),
+                date_ranges,
+            ),
+            Benchmark(
+                "format_date_range[uncached]",
+                lambda start_date, end_date: memoized_format_date_range.__wrapped__(
+                    start_date,
+                    end_date,
+                    date_locale,
+                    templates.single_date,
+                    templates.date_range,
+                ),
+                date_ranges,
+            ),
+            Benchmark(
+                "compute_time_span_string[cached]",
+                functools.partial(
+                    compute_time_span_string,
+                    locale=locale,
+                    current_date=current_date,
+                    time_span_template=templates.time_span,
+                ),
+                date_ranges,
+            ),
+            Benchmark(
+                "compute_time_span_string[uncached]",
+                lambda start_date, end_date: (
+                    memoized_compute_time_span_string.__wrapped__(
+                        start_date,
+                        end_date,
+                        date_locale,
+                        current_date,
+                        templates.time_span,
+                    )
+                ),
+                date_ranges,
+            ),
+        ]
+    )
+
+    benchmarks.extend(
+        Benchmark(
+            f"compute_connections[{file_type}]",
+            compute_connections,
+            [(model, file_type)],
+        )
+        for file_type in ("typst", "markdown")
+    )
+    benchmarks.extend(
+        [
+            Benchmark(
+                "get_entry_type_name_and_section_model[raw]",
+                get_entry_type_name_and_section_model,
+                as_arguments(*corpus.raw_entries),
+            ),
+            Benchmark(
+                "get_entry_type_name_and_section_model[validated]",
+                get_entry_type_name_and_section_model,
+                as_arguments(*entries),
+            ),
+        ]
+    )
+    return benchmarks
+
+
+def time_calls(benchmark: Benchmark, call_count: int) -> float:
+    """Call the function `call_count` times, cycling through its arguments."""
+    calls = [
+        benchmark.arguments[index % len(benchmark.arguments)]
+        for index in range(call_count)
+    ]
+    if benchmark.prepare is not None:
+        calls = [benchmark.prepare(arguments) for arguments in calls]
+
+    function = benchmark.function
+    start = time.perf_counter()
+    for arguments in calls:
+        function(*arguments)
+    return time.perf_counter() - start
+
+
+def measure(benchmark: Benchmark, min_seconds: float, repeat: int) -> dict[str, float]:
+    """Find how many calls take `min_seconds`, then time `repeat` rounds of them.
+
+    The calibration calls also warm the caches, so cached functions are measured
+    as they run during a render.
+    """
+    call_count = len(benchmark.arguments)
+    while (seconds := time_calls(benchmark, call_count)) < min_seconds:
+        call_count = max(call_count * 2, int(call_count * min_seconds / seconds))
+
+    durations = [time_calls(benchmark, call_count) for _ in range(repeat)]
+    return {
+        "ops_per_second": call_count / statistics.median(durations),
+        "best_ops_per_second": call_count / min(durations),
+        "calls_per_round": call_count,
+    }
+
+
+def compare_with_baseline(
+    results: dict[str, Any], baseline: dict[str, Any] | None
+) -> dict[str, float]:
+    """Return each benchmark's change in operations per second, as a ratio."""
+    if baseline is None:
+        return {}
+    changes = {}
+    for name, result in results.items():
+        baseline_result = baseline["results"].get(name)
+        if baseline_result and baseline_result["ops_per_second"]:
+            changes[name] = (
+                result["ops_per_second"] / baseline_result["ops_per_second"] - 1
+            )
+    return changes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--filter",
+        default="",
+        help="Only run benchmarks whose names contain this text.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed rounds of each benchmark."
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.2,
+        help="Minimum duration of a round.",
+    )
+    parser.add_argument(
+        "--output",
+        type=pathlib.Path,
+        default=pathlib.Path("benchmark_templater_results.json"),
+        help="Where to write the results JSON.",
+    )
+    parser.add_argument(
+        "--baseline", type=pathlib.Path, help="Results JSON to compare against."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown from the baseline as a ratio (0.2 means 20%%).",
+    )
+    arguments = parser.parse_args()
+
+    baseline = (
+        json.loads(arguments.baseline.read_text(encoding="utf-8"))
+        if arguments.baseline
+        else None
+    )
+    benchmarks = [
+        benchmark
+        for benchmark in create_benchmarks(create_corpus())
+        if arguments.filter in benchmark.name
+    ]
+    if not benchmarks:
+        parser.error(f"no benchmark names contain {arguments.filter!r}")
+
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = measure(
+            benchmark, arguments.min_seconds, arguments.repeat
+        )
+        change = compare_with_baseline(
+            {benchmark.name: results[benchmark.name]}, baseline
+        ).get(benchmark.name)
+        print(  # NOQA: T201
+            f"{benchmark.name:<50} {results[benchmark.name]['ops_per_second']:>12,.0f}"
+            " ops/s" + (f" {change:+8.1%}" if change is not None else "")
+        )
+
+    arguments.output.write_text(
+        json.dumps(
+            {
+                "metadata": {
+                    "teklinicv_version": __version__,
+                    "python_version": platform.python_version(),
+                    "platform": platform.platform(),
+                    "repeat": arguments.repeat,
+                    "min_seconds": arguments.min_seconds,
+                },
+                "results": results,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"Results written to {arguments.output}.")  # NOQA: T201
+
+    if baseline is None:
+        return
+    regressions = [
+        f"{name}: {change:.0%} operations per second"
+        for name, change in compare_with_baseline(results, baseline).items()
+        if change < -arguments.threshold
+    ]
+    for regression in regressions:
+        print(f"Regression: {regression}")  # NOQA: T201
+    if regressions:
+        sys.exit(1)
+    print("No regressions against the baseline.")  # NOQA: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+from teklinicv.renderer.typst_package import (
+    bundled_typst_packages_path,
+    prewarm_typst_package,
+)
+
+package_directory = prewarm_typst_package(bundled_typst_packages_path)
+print(f"Typst package bundled at {package_directory}.")  # NOQA: T201
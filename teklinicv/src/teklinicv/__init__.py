@@ -1,7 +1,11 @@
 import warnings
 
+from .caches import clear_caches
+
 __version__ = "2.6"
 __description__ = "Typst-based CV/resume generator for academics and engineers."
 
 
 warnings.filterwarnings("ignore")  # Ignore Pydantic warnings
+
+__all__ = ["clear_caches"]
@@ -0,0 +1,195 @@
+import functools
+import threading
+from collections.abc import Callable
+from typing import Any
+
+registered_caches: list["functools._lru_cache_wrapper | ThreadLocalCache"] = []
+# How many results each thread computed, by cache:
+miss_counters: dict[Any, threading.local] = {}
+registration_lock = threading.Lock()
+
+
+def bounded_cache[T](
+    maxsize: int,
+) -> Callable[[Callable[..., T]], "functools._lru_cache_wrapper[T]"]:
+    """Cache a function's results in a bounded LRU cache that `clear_caches` empties.
+
+    Why:
+        Renderers embedded in long-running workers go through thousands of
+        inputs. An unbounded cache keyed by inputs grows with every one of them,
+        and caches that can't be emptied keep their models and compilers alive
+        for the life of the process. Requiring a size and registering every
+        cache keeps memory flat and gives one place to release it.
+
+    Example:
+        ```py
+        @bounded_cache(maxsize=64)
+        def build_keyword_matcher_pattern(keywords: frozenset[str]) -> re.Pattern: ...
+        ```
+
+    Args:
+        maxsize: Maximum number of cached results.
+
+    Returns:
+        Decorator that wraps the function with `functools.lru_cache`.
+    """
+
+    def decorator(function: Callable[..., T]) -> "functools._lru_cache_wrapper[T]":
+        miss_counter = threading.local()
+
+        @functools.wraps(function)
+        def count_miss(*args: Any, **kwargs: Any) -> T:
+            miss_counter.count = getattr(miss_counter, "count", 0) + 1
+            return function(*args, **kwargs)
+
+        cached_function = functools.lru_cache(maxsize=maxsize)(count_miss)
+        with registration_lock:
+            registered_caches.append(cached_function)
+            miss_counters[cached_function] = miss_counter
+        return cached_function
+
+    return decorator
+
+
+class ThreadLocalCache[T]:
+    """Bounded LRU cache of a function's results, kept separately by each thread.
+
+    Why:
+        Some cached objects, such as Typst compilers, can't be used from two
+        threads at once. Each thread keeps its own results, so concurrent
+        renders never share one. Like `functools.lru_cache`, the cache has
+        `cache_info` and `cache_clear`. Clearing it from one thread empties the
+        other threads' caches on their next call.
+
+    Args:
+        function: Function whose results are cached.
+        maxsize: Maximum number of cached results per thread.
+    """
+
+    def __init__(self, function: Callable[..., T], maxsize: int):
+        functools.update_wrapper(self, function)
+        self.function = function
+        self.maxsize = maxsize
+        self.local = threading.local()
+        self.miss_counter = threading.local()
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_results(self) -> dict[tuple, T]:
+        """Return the calling thread's results, dropping them if they were cleared.
+
+        Returns:
+            Results by arguments, least recently used first.
+        """
+        if getattr(self.local, "generation", None) != self.generation:
+            self.local.results = {}
+            self.local.generation = self.generation
+        return self.local.results
+
+    def __call__(self, *args: Any) -> T:
+        results = self.get_results()
+        hit = args in results
+        if hit:
+            result = results.pop(args)
+        else:
+            self.miss_counter.count = getattr(self.miss_counter, "count", 0) + 1
+            result = self.function(*args)
+            if len(results) >= self.maxsize:
+                del results[next(iter(results))]
+        results[args] = result
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return result
+
+    def cache_info(self) -> functools._CacheInfo:
+        """Return the hits and misses of all threads, and the calling thread's size.
+
+        Returns:
+            Cache statistics.
+        """
+        return functools._CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self.get_results())
+        )
+
+    def cache_clear(self) -> None:
+        """Empty the cache of every thread and reset the statistics."""
+        with self.lock:
+            self.generation += 1
+            self.hits = 0
+            self.misses = 0
+
+
+def bounded_thread_local_cache[T](
+    maxsize: int,
+) -> Callable[[Callable[..., T]], ThreadLocalCache[T]]:
+    """Cache a function's results per thread in a bounded cache that `clear_caches` empties.
+
+    Example:
+        ```py
+        @bounded_thread_local_cache(maxsize=4)
+        def create_typst_compiler(file_path, font_folders) -> typst.Compiler: ...
+        ```
+
+    Args:
+        maxsize: Maximum number of cached results per thread.
+
+    Returns:
+        Decorator that wraps the function with `ThreadLocalCache`.
+    """
+
+    def decorator(function: Callable[..., T]) -> ThreadLocalCache[T]:
+        cached_function = ThreadLocalCache(function, maxsize)
+        with registration_lock:
+            registered_caches.append(cached_function)
+            miss_counters[cached_function] = cached_function.miss_counter
+        return cached_function
+
+    return decorator
+
+
+def count_thread_misses(
+    cached_function: "functools._lru_cache_wrapper | ThreadLocalCache",
+) -> int:
+    """Return how many results of a cache the calling thread has computed.
+
+    Why:
+        `cache_info()` adds up every thread's hits and misses, so comparing it
+        before and after a call mixes in other threads' calls. The cached
+        function counts its own runs per thread, so a change in this count
+        means the call was a miss.
+
+    Args:
+        cached_function: Function decorated with `bounded_cache` or
+            `bounded_thread_local_cache`.
+
+    Returns:
+        Number of misses of the calling thread.
+    """
+    return getattr(miss_counters[cached_function], "count", 0)
+
+
+def clear_caches() -> None:
+    """Empty TekliniCV's in-process caches.
+
+    Why:
+        The caches are bounded, but a worker that is idle, or that moves on to a
+        different set of themes and fonts, can release the models, template
+        environments, fonts, and Typst compilers they hold right away. Files
+        cached on disk, such as compiled templates and the font index, are kept.
+
+    Example:
+        ```py
+        import teklinicv
+
+        teklinicv.clear_caches()
+        ```
+    """
+    with registration_lock:
+        caches = tuple(registered_caches)
+    for cache in caches:
+        cache.cache_clear()
@@ -1,3 +1,4 @@
+import contextvars
 import importlib
 import json
 import pathlib
@@ -8,6 +9,7 @@ from typing import Annotated
 import packaging.version
 import typer
 from rich import print
+from rich.console import Console
 
 from teklinicv import __version__
 
@@ -18,6 +20,10 @@ app = typer.Typer(
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 
+version_check_is_skipped: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "version_check_is_skipped", default=False
+)
+
 
 @app.callback()
 def cli_command_no_args(
@@ -29,7 +35,16 @@ def cli_command_no_args(
     """TekliniCV is a command-line tool for rendering CVs from YAML input files. For more
     information, see https://docs.teklinicv.com.
     """
-    warn_if_new_version_is_available()
+    version_check_is_skipped.set(False)
+
+    def warn_unless_skipped() -> None:
+        if not version_check_is_skipped.get():
+            warn_if_new_version_is_available()
+
+    # The language server speaks JSON-RPC over stdio and must start right away:
+    if ctx.invoked_subcommand != "lsp":
+        # Checked once the command is done, when its options are known:
+        ctx.call_on_close(warn_unless_skipped)
 
     if version_requested:
         print(f"TekliniCV v{__version__}")
@@ -39,18 +54,30 @@ def cli_command_no_args(
         raise typer.Exit()
 
 
+def skip_version_check() -> None:
+    """Don't check for a new version after the current command.
+
+    Why:
+        Commands whose output is read by another program, such as
+        `validate --format json` or `render --report json`, are run by scripts
+        and CI, where the check only slows them down and its notice is noise.
+    """
+    version_check_is_skipped.set(True)
+
+
 def warn_if_new_version_is_available() -> None:
     """Check PyPI for newer TekliniCV version and display update notice.
 
     Why:
         Users should be notified of updates for bug fixes and features.
-        Non-blocking check on startup ensures users stay informed without
-        interrupting workflow if check fails.
+        The check gives up after a short timeout and the notice goes to stderr,
+        so a slow network or a failed check never holds up or corrupts a
+        command's output.
     """
     url = "https://pypi.org/pypi/teklinicv/json"
     try:
         with urllib.request.urlopen(
-            url, context=ssl._create_unverified_context()
+            url, timeout=2, context=ssl._create_unverified_context()
         ) as response:
             data = response.read()
             encoding = response.info().get_content_charset("utf-8")
@@ -63,7 +90,7 @@ def warn_if_new_version_is_available() -> None:
     if latest_version is not None:
         version = packaging.version.Version(__version__)
         if version < latest_version:
-            print(
+            Console(stderr=True).print(
                 "\n[bold yellow]A new version of TekliniCV is available! You are using"
                 f" v{__version__}, and the latest version is v{latest_version}.[/bold"
                 " yellow]\n"
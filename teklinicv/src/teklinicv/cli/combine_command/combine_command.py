@@ -0,0 +1,135 @@
+import pathlib
+from typing import Annotated
+
+import typer
+
+from teklinicv.exception import TekliniCVUserError
+from teklinicv.schema.teklinicv_model_builder import (
+    BuildTeklinicvModelArguments,
+    build_teklinicv_dictionary_and_model,
+)
+
+from ..app import app
+from ..error_handler import handle_user_errors
+from ..render_command.progress_reporter import BatchProgressReporter
+from ..render_command.render_command import create_progress_reporter
+
+
+@app.command(
+    name="combine",
+    help=(
+        "Combine several YAML input files into one PDF, with each CV as a chapter."
+        " Example: [yellow]teklinicv combine team/*.yaml --output Team_CVs.pdf"
+        " --table-of-contents[/yellow]. Details: [cyan]teklinicv combine"
+        " --help[/cyan]"
+    ),
+)
+@handle_user_errors
+def cli_command_combine(
+    input_file_paths: Annotated[
+        list[pathlib.Path], typer.Argument(help="The YAML input files, in order.")
+    ],
+    output_file_path: Annotated[
+        pathlib.Path,
+        typer.Option(
+            "--output",
+            "-o",
+            help="The combined PDF. The Typst source is saved next to it.",
+        ),
+    ] = pathlib.Path("Combined_CVs.pdf"),
+    design: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--design",
+            "-d",
+            help='The "design" field\'s YAML input file, shared by all CVs.',
+        ),
+    ] = None,
+    locale: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--locale-catalog",
+            "-lc",
+            help='The "locale" field\'s YAML input file, shared by all CVs.',
+        ),
+    ] = None,
+    table_of_contents: Annotated[
+        bool,
+        typer.Option(
+            "--table-of-contents",
+            "-toc",
+            help="If provided, a table of contents page is added before the CVs.",
+        ),
+    ] = False,
+    table_of_contents_title: Annotated[
+        str,
+        typer.Option(
+            "--table-of-contents-title",
+            "-toct",
+            help="Title of the table of contents page.",
+        ),
+    ] = "Contents",
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="If provided, TekliniCV will only print errors.",
+        ),
+    ] = False,
+):
+    # Imported here so other commands, such as `validate`, start without the renderer:
+    from teklinicv.renderer.book import (  # NOQA: PLC0415
+        generate_book_pdf,
+        generate_book_typst,
+    )
+
+    from ..render_command.run_teklinicv import (  # NOQA: PLC0415
+        catch_render_errors,
+        timed_step,
+    )
+
+    arguments: BuildTeklinicvModelArguments = {
+        "design_file_path_or_contents": design,
+        "locale_file_path_or_contents": locale,
+    }
+    typst_path = output_file_path.with_suffix(".typ")
+
+    # Up to hundreds of inputs are validated on one live line, and all invalid
+    # files are listed together instead of stopping at the first one:
+    teklinicv_models = []
+    with BatchProgressReporter(
+        total=len(input_file_paths), action="validated", quiet=quiet
+    ) as batch_progress:
+        for input_file_path in input_file_paths:
+            batch_progress.start_render(input_file_path.name)
+            with catch_render_errors(batch_progress):
+                _, teklinicv_model = build_teklinicv_dictionary_and_model(
+                    input_file_path, **arguments
+                )
+                teklinicv_models.append(teklinicv_model)
+                batch_progress.finish_progress()
+
+    with create_progress_reporter(quiet) as progress, catch_render_errors(progress):
+        if batch_progress.failed_errors:
+            raise TekliniCVUserError(
+                message="Some input files are invalid!\n\n"
+                + "\n".join(batch_progress.failed_errors)
+            )
+        timed_step(
+            "Generated Typst",
+            progress,
+            generate_book_typst,
+            teklinicv_models,
+            typst_path,
+            table_of_contents_title if table_of_contents else None,
+        )
+        timed_step(
+            "Generated PDF",
+            progress,
+            generate_book_pdf,
+            teklinicv_models,
+            typst_path,
+            output_file_path,
+        )
+        progress.finish_progress(title="Your combined CVs are ready")
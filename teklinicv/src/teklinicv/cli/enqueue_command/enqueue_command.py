@@ -0,0 +1,126 @@
+import pathlib
+import time
+from typing import Annotated
+
+import typer
+from rich import print
+from rich.markup import escape
+
+from ..app import app
+from ..error_handler import handle_user_errors
+from ..worker_command.job_queue import JobQueue, JobStatus, read_manifest
+
+
+def format_job_counts(counts: dict[JobStatus, int]) -> str:
+    """Summarize a queue in a single line, such as `3/10 done, 1 failed, 2 running`."""
+    total = sum(counts.values())
+    return (
+        f"{counts[JobStatus.done]}/{total} done, {counts[JobStatus.failed]} failed,"
+        f" {counts[JobStatus.running]} running, {counts[JobStatus.queued]} queued"
+    )
+
+
+def watch_queue(job_queue: JobQueue, poll_seconds: float) -> dict[JobStatus, int]:
+    """Print the job counts whenever they change, until no job is left to run.
+
+    Args:
+        job_queue: Queue to watch.
+        poll_seconds: Seconds between checks.
+
+    Returns:
+        Final number of jobs by status.
+    """
+    last_summary = None
+    while True:
+        counts = job_queue.count_jobs()
+        summary = format_job_counts(counts)
+        if summary != last_summary:
+            print(summary)
+            last_summary = summary
+        if not counts[JobStatus.queued] and not counts[JobStatus.running]:
+            return counts
+        time.sleep(poll_seconds)
+
+
+@app.command(
+    name="enqueue",
+    help=(
+        "Add the render jobs of a JSON Lines manifest to a queue for `teklinicv"
+        " worker`. Example: [yellow]teklinicv enqueue nightly.jsonl --queue"
+        " /shared/jobs.sqlite --watch[/yellow]. Details: [cyan]teklinicv enqueue"
+        " --help[/cyan]"
+    ),
+)
+@handle_user_errors
+def cli_command_enqueue(
+    manifest: Annotated[
+        pathlib.Path | None,
+        typer.Argument(
+            help=(
+                'The manifest, with a JSON object per line, such as {"input":'
+                ' "John_Doe_CV.yaml", "design": "design.yaml", "overrides":'
+                ' {"cv.phone": "+1 555 0100"}, "output_directory": "out/john"}.'
+                " Leave out to only watch the queue."
+            )
+        ),
+    ] = None,
+    queue: Annotated[
+        pathlib.Path,
+        typer.Option(
+            "--queue",
+            "-Q",
+            help="The queue database. It is created if it doesn't exist.",
+        ),
+    ] = pathlib.Path("teklinicv_jobs.sqlite"),
+    max_attempts: Annotated[
+        int,
+        typer.Option(
+            "--max-attempts",
+            "-ma",
+            min=1,
+            help=(
+                "Number of times a job is tried when its workers stop before"
+                " finishing it."
+            ),
+        ),
+    ] = 3,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            "-w",
+            help=(
+                "If provided, show the progress of the queue until all jobs are done"
+                " or failed, and exit with an error if any failed."
+            ),
+        ),
+    ] = False,
+    poll_seconds: Annotated[
+        float,
+        typer.Option(
+            "--poll-seconds",
+            "-ps",
+            min=0,
+            help="With --watch, seconds between checks of the queue.",
+        ),
+    ] = 1,
+):
+    with JobQueue(queue) as job_queue:
+        if manifest is not None:
+            job_ids = job_queue.enqueue(read_manifest(manifest), max_attempts)
+            print(
+                f"[green]+[/green] Enqueued {len(job_ids)}"
+                f" job{'s' if len(job_ids) != 1 else ''} in"
+                f" [purple]{escape(str(queue))}[/purple]"
+            )
+        if not watch:
+            return
+
+        counts = watch_queue(job_queue, poll_seconds)
+        if counts[JobStatus.failed]:
+            for record in job_queue.get_jobs(JobStatus.failed):
+                print(
+                    f"[red]Job {record.id} ({escape(str(record.job.input))})"
+                    f" failed:[/red] {escape(record.error or '')}"
+                )
+            raise typer.Exit(code=1)
@@ -0,0 +1,79 @@
+import pathlib
+import sys
+from typing import Annotated
+
+import typer
+from rich import print
+
+from teklinicv.schema.synthetic_generator import (
+    SyntheticCvOptions,
+    write_synthetic_yaml_input_file,
+)
+
+from ..app import app
+
+
+@app.command(
+    name="generate-synthetic",
+    help=(
+        "Generate a synthetic YAML input file of any size for benchmarks and load"
+        " tests. Example: [yellow]teklinicv generate-synthetic Big_CV.yaml"
+        " --entries-per-type 1000[/yellow]. Details: [cyan]teklinicv"
+        " generate-synthetic --help[/cyan]"
+    ),
+)
+def cli_command_generate_synthetic(
+    output_file_path: Annotated[
+        pathlib.Path,
+        typer.Argument(help="Where to write the YAML input file. Use - for stdout"),
+    ] = pathlib.Path("Synthetic_CV.yaml"),
+    seed: Annotated[
+        int, typer.Option(help="Seed of the random generator, for reproducible files")
+    ] = 0,
+    section_count: Annotated[
+        int,
+        typer.Option(
+            min=0,
+            help="Number of sections. Sections cycle through the nine entry types",
+        ),
+    ] = 9,
+    entries_per_type: Annotated[
+        int, typer.Option(min=0, help="Number of entries of each entry type")
+    ] = 2,
+    highlights_per_entry: Annotated[
+        int, typer.Option(min=0, help="Number of highlights per entry")
+    ] = 3,
+    bold_keyword_count: Annotated[
+        int, typer.Option(min=0, help="Number of bold keywords")
+    ] = 10,
+    connection_count: Annotated[
+        int, typer.Option(min=0, help="Number of connections (emails, websites, etc.)")
+    ] = 4,
+    markup_density: Annotated[
+        float,
+        typer.Option(
+            min=0,
+            max=1,
+            help="Share of sentences with Markdown or Typst markup, from 0 to 1",
+        ),
+    ] = 0.2,
+):
+    options = SyntheticCvOptions(
+        seed=seed,
+        section_count=section_count,
+        entries_per_type=entries_per_type,
+        highlights_per_entry=highlights_per_entry,
+        bold_keyword_count=bold_keyword_count,
+        connection_count=connection_count,
+        markup_density=markup_density,
+    )
+
+    if str(output_file_path) == "-":
+        write_synthetic_yaml_input_file(options, sys.stdout)
+        return
+
+    write_synthetic_yaml_input_file(options, output_file_path)
+    print(
+        "[green]+[/green] Created the synthetic YAML input file:"
+        f" [purple]{output_file_path}[/purple]"
+    )
@@ -0,0 +1,325 @@
+import re
+from typing import Any
+
+from teklinicv.caches import bounded_cache
+
+from .document_parser import get_indent, is_content_line, sequence_item_pattern
+
+key_pattern = re.compile(
+    r"""(?:-\s+)*(?P<key>"[^"]*"|'[^']*'|[^\s#:"'][^#:]*?)\s*:(?:\s+(?P<value>.*))?$"""
+)
+comment_pattern = re.compile(r"(^|\s)#.*")
+# The path segment of a sequence item in a YAML path:
+item_segment = "-"
+# https://microsoft.github.io/language-server-protocol/specifications/lsp/3.17/specification/#completionItemKind
+property_kind = 10
+value_kind = 12
+
+
+@bounded_cache(maxsize=1)
+def get_json_schema() -> dict[str, Any]:
+    """Return the JSON Schema of the input file, generating it once per process.
+
+    Returns:
+        Draft-07 JSON Schema dictionary.
+    """
+    from teklinicv.schema.json_schema_generator import (  # NOQA: PLC0415
+        generate_json_schema,
+    )
+
+    return generate_json_schema()
+
+
+def parse_key_line(line: str) -> tuple[str, str | None] | None:
+    """Parse a `key: value` line, ignoring leading sequence dashes.
+
+    Args:
+        line: Line of the document.
+
+    Returns:
+        Key and value text (None if empty), or None if the line has no key.
+    """
+    match = key_pattern.match(line.strip())
+    if match is None:
+        return None
+    key = match.group("key")
+    if key[0] in "\"'":
+        key = key[1:-1]
+    value = match.group("value")
+    if value is not None:
+        value = comment_pattern.sub("", value).strip().strip("\"'") or None
+    return key, value
+
+
+def get_content_column(line: str) -> int:
+    """Return the column of a line's content after any sequence dashes."""
+    column = get_indent(line)
+    while match := sequence_item_pattern.match(line, column):
+        column = match.end()
+        while column < len(line) and line[column] == " ":
+            column += 1
+    return column
+
+
+def get_yaml_path(lines: list[str], line_number: int, column: int) -> list[str]:
+    """Find the path of the mapping a key typed at a position would belong to.
+
+    Why:
+        While typing, the document usually isn't valid YAML, so the path is
+        read from indentation: each less indented key line above the position is
+        a parent, and each sequence dash is an item of its parent.
+
+    Example:
+        ```py
+        lines = ["cv:\\n", "  sections:\\n", "    Education:\\n", "      - \\n"]
+        get_yaml_path(lines, 3, 8)
+        # ["cv", "sections", "Education", "-"]
+        ```
+
+    Args:
+        lines: Lines of the document.
+        line_number: Line of the position (0-indexed).
+        column: Column of the key's first character.
+
+    Returns:
+        Keys and item segments (`-`) from the root.
+    """
+    path: list[str] = []
+    current_line = lines[line_number] if line_number < len(lines) else ""
+    if sequence_item_pattern.match(current_line, get_indent(current_line)):
+        path.append(item_segment)
+        column = get_indent(current_line)
+
+    for line in reversed(lines[:line_number]):
+        if not is_content_line(line):
+            continue
+        indent = get_indent(line)
+        if indent >= column:
+            continue
+        content_column = get_content_column(line)
+        if content_column < column:
+            key_line = parse_key_line(line)
+            if key_line is not None and key_line[1] is None:
+                path.append(key_line[0])
+        if content_column > indent:
+            path.append(item_segment)
+        column = indent
+
+    return list(reversed(path))
+
+
+def get_sibling_values(
+    lines: list[str], line_number: int, column: int
+) -> dict[str, str | None]:
+    """Collect the keys of the mapping around a position, with their values.
+
+    Args:
+        lines: Lines of the document.
+        line_number: Line of the position (0-indexed).
+        column: Column of the mapping's keys.
+
+    Returns:
+        Values of the keys, or None for keys with nested values.
+    """
+    siblings: dict[str, str | None] = {}
+    for step in (-1, 1):
+        index = line_number + step
+        while 0 <= index < len(lines):
+            line = lines[index]
+            index += step
+            if not is_content_line(line) or get_indent(line) > column:
+                continue
+            content_column = get_content_column(line)
+            # A parent, or the first line of this or the next sequence item:
+            is_boundary = get_indent(line) < column or content_column > get_indent(line)
+            key_line = parse_key_line(line)
+            if (
+                content_column == column
+                and key_line
+                and not (step == 1 and is_boundary)
+            ):
+                siblings.setdefault(*key_line)
+            if is_boundary:
+                break
+    return siblings
+
+
+def resolve_schema(schema: dict[str, Any], root: dict[str, Any]) -> list[dict]:
+    """Resolve references and unions of a schema to its alternatives.
+
+    Args:
+        schema: Schema to resolve.
+        root: Root schema holding the `$defs`.
+
+    Returns:
+        Schemas without `$ref`, `anyOf`, or `oneOf`.
+    """
+    if "$ref" in schema:
+        definition = schema["$ref"].removeprefix("#/$defs/")
+        return resolve_schema(root["$defs"][definition], root)
+    alternatives = schema.get("anyOf") or schema.get("oneOf") or schema.get("allOf")
+    if alternatives is None:
+        return [schema]
+    return [
+        resolved
+        for alternative in alternatives
+        for resolved in resolve_schema(alternative, root)
+    ]
+
+
+def select_discriminated_schemas(
+    schema: dict[str, Any], root: dict[str, Any], values: dict[str, str | None]
+) -> list[dict]:
+    """Resolve a schema, keeping only the alternative chosen by a discriminator.
+
+    Why:
+        Designs and locales are unions discriminated by `theme` and `language`.
+        Once the document sets the discriminator, only that theme's or
+        language's keys are offered.
+
+    Args:
+        schema: Schema to resolve.
+        root: Root schema holding the `$defs`.
+        values: Values of the keys of the mapping, as written in the document.
+
+    Returns:
+        Schemas without `$ref`, `anyOf`, or `oneOf`.
+    """
+    if "$ref" in schema:
+        definition = schema["$ref"].removeprefix("#/$defs/")
+        schema = root["$defs"][definition]
+    discriminator = schema.get("discriminator")
+    if discriminator is not None:
+        reference = discriminator["mapping"].get(
+            values.get(discriminator["propertyName"])
+        )
+        if reference is not None:
+            return resolve_schema({"$ref": reference}, root)
+    return resolve_schema(schema, root)
+
+
+def get_schemas_at_path(path: list[str], root: dict[str, Any]) -> list[dict]:
+    """Follow a YAML path through the schema.
+
+    Args:
+        path: Keys and item segments (`-`) from the root.
+        root: Root schema.
+
+    Returns:
+        Schemas of all alternatives the path can lead to.
+    """
+    schemas = [root]
+    for segment in path:
+        next_schemas = []
+        for schema in schemas:
+            for alternative in resolve_schema(schema, root):
+                if segment == item_segment:
+                    child = alternative.get("items")
+                else:
+                    child = alternative.get("properties", {}).get(segment)
+                    if child is None:
+                        child = alternative.get("additionalProperties")
+                if isinstance(child, dict):
+                    next_schemas.append(child)
+        schemas = next_schemas
+    return schemas
+
+
+def get_completion_items(
+    lines: list[str], line_number: int, character: int
+) -> list[dict[str, Any]]:
+    """Offer keys or values from the JSON Schema at a position.
+
+    Why:
+        The JSON Schema generated from the models already describes every key,
+        its documentation, and allowed values, so completion stays in sync
+        with validation. Keys already in the mapping aren't offered again.
+
+    Example:
+        ```py
+        get_completion_items(["cv:\\n", "  na\\n"], 1, 4)
+        # [{"label": "name", "kind": 10, ...}, ...]
+        ```
+
+    Args:
+        lines: Lines of the document.
+        line_number: Line of the cursor (0-indexed).
+        character: Column of the cursor.
+
+    Returns:
+        LSP completion items.
+    """
+    root = get_json_schema()
+    line = lines[line_number] if line_number < len(lines) else ""
+    prefix = line[:character]
+    key_column = get_content_column(prefix)
+    path = get_yaml_path(lines, line_number, key_column)
+    siblings = get_sibling_values(lines, line_number, key_column)
+
+    parent_schemas = [
+        alternative
+        for schema in get_schemas_at_path(path, root)
+        for alternative in select_discriminated_schemas(schema, root, siblings)
+    ]
+
+    typed = prefix[key_column:]
+    if ":" in typed:
+        key = typed.split(":")[0].strip().strip("\"'")
+        return get_value_items(parent_schemas, key, root)
+    if " " in typed.strip():
+        # Text, not a key:
+        return []
+
+    items: dict[str, dict[str, Any]] = {}
+    for schema in parent_schemas:
+        for key, property_schema in schema.get("properties", {}).items():
+            if key in siblings or key in items:
+                continue
+            item: dict[str, Any] = {
+                "label": key,
+                "kind": property_kind,
+                "insertText": f"{key}: ",
+            }
+            if "title" in property_schema:
+                item["detail"] = property_schema["title"]
+            if "description" in property_schema:
+                item["documentation"] = property_schema["description"]
+            items[key] = item
+    return list(items.values())
+
+
+def get_value_items(
+    parent_schemas: list[dict], key: str, root: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Offer the allowed values of a key.
+
+    Args:
+        parent_schemas: Schemas of the mapping the key is in.
+        key: Key whose value is being typed.
+        root: Root schema.
+
+    Returns:
+        LSP completion items for enum, constant, and boolean values.
+    """
+    values: dict[str, str | None] = {}
+    for parent_schema in parent_schemas:
+        property_schema = parent_schema.get("properties", {}).get(key)
+        if property_schema is None:
+            continue
+        for alternative in resolve_schema(property_schema, root):
+            description = alternative.get("description")
+            for value in alternative.get("enum", []):
+                values.setdefault(str(value), description)
+            if "const" in alternative:
+                values.setdefault(str(alternative["const"]), description)
+            if alternative.get("type") == "boolean":
+                values.setdefault("true", description)
+                values.setdefault("false", description)
+
+    items = []
+    for value, description in values.items():
+        item: dict[str, Any] = {"label": value, "kind": value_kind}
+        if description:
+            item["documentation"] = description
+        items.append(item)
+    return items
@@ -0,0 +1,381 @@
+import json
+import pathlib
+import sys
+import time
+import traceback
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO
+
+from teklinicv import __version__
+from teklinicv.exception import (
+    TekliniCVUserError,
+    TekliniCVUserValidationError,
+    TekliniCVValidationError,
+)
+from teklinicv.schema.teklinicv_model_builder import (
+    build_teklinicv_model_from_commented_map,
+)
+
+from .completion import get_completion_items, get_json_schema
+from .document_parser import DocumentParser, ParsedDocument, split_lines
+
+# https://microsoft.github.io/language-server-protocol/specifications/lsp/3.17/specification/#errorCodes
+method_not_found_code = -32601
+internal_error_code = -32603
+error_severity = 1
+log_message_type = 4
+incremental_sync_kind = 2
+
+
+@dataclass
+class OpenDocument:
+    uri: str
+    text: str
+    parser: DocumentParser = field(default_factory=DocumentParser)
+
+
+def read_message(stream: BinaryIO) -> dict[str, Any] | None:
+    """Read a JSON-RPC message framed with a `Content-Length` header.
+
+    Args:
+        stream: Standard input of the server.
+
+    Returns:
+        Message, or None when the stream has ended.
+    """
+    content_length = None
+    while True:
+        header = stream.readline()
+        if not header:
+            return None
+        header = header.strip()
+        if not header:
+            break
+        name, _, value = header.decode("ascii").partition(":")
+        if name.lower() == "content-length":
+            content_length = int(value)
+    if content_length is None:
+        return None
+    return json.loads(stream.read(content_length))
+
+
+def write_message(stream: BinaryIO, message: dict[str, Any]) -> None:
+    """Write a JSON-RPC message framed with a `Content-Length` header.
+
+    Args:
+        stream: Standard output of the server.
+        message: Message to send.
+    """
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> pathlib.Path | None:
+    """Return the file path of a `file://` URI, or None for other URIs."""
+    parsed_uri = urllib.parse.urlparse(uri)
+    if parsed_uri.scheme != "file":
+        return None
+    return pathlib.Path(urllib.request.url2pathname(parsed_uri.path))
+
+
+def get_utf16_length(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+def utf16_to_index(line: str, character: int) -> int:
+    """Convert an LSP column, counted in UTF-16 code units, to a string index."""
+    count = 0
+    for index, char in enumerate(line):
+        if count >= character:
+            return index
+        count += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def apply_change(text: str, change: dict[str, Any]) -> str:
+    """Apply a `didChange` content change to a document.
+
+    Args:
+        text: Text of the document.
+        change: Either the full new text, or a range and its replacement.
+
+    Returns:
+        New text of the document.
+    """
+    if "range" not in change:
+        return change["text"]
+    lines = split_lines(text)
+
+    def get_offset(position: dict[str, int]) -> int:
+        line_number = position["line"]
+        if line_number >= len(lines):
+            return len(text)
+        offset = sum(len(line) for line in lines[:line_number])
+        return offset + utf16_to_index(lines[line_number], position["character"])
+
+    start = get_offset(change["range"]["start"])
+    end = get_offset(change["range"]["end"])
+    return text[:start] + change["text"] + text[end:]
+
+
+def get_validation_errors(
+    parsed_document: ParsedDocument, input_file_path: pathlib.Path | None
+) -> list[TekliniCVValidationError]:
+    """Validate a parsed document, with errors at their document coordinates.
+
+    Args:
+        parsed_document: Document parsed by a `DocumentParser`.
+        input_file_path: Path of the document, for resolving relative paths.
+
+    Returns:
+        YAML errors if the document isn't valid YAML, validation errors
+        otherwise.
+    """
+    if parsed_document.yaml_errors:
+        return parsed_document.yaml_errors
+    if parsed_document.dictionary is None or parsed_document.root is None:
+        return []
+    try:
+        build_teklinicv_model_from_commented_map(
+            parsed_document.dictionary, input_file_path
+        )
+    except TekliniCVUserValidationError as e:
+        return [
+            TekliniCVValidationError(
+                location=error.location,
+                yaml_location=parsed_document.root.get_coordinates(error.location),
+                message=error.message,
+                input=error.input,
+            )
+            for error in e.validation_errors
+        ]
+    except TekliniCVUserError as e:
+        return [
+            TekliniCVValidationError(
+                location=(),
+                yaml_location=None,
+                message=e.message or "An unknown error occurred.",
+                input="",
+            )
+        ]
+    return []
+
+
+def create_diagnostic(
+    error: TekliniCVValidationError, lines: list[str]
+) -> dict[str, Any]:
+    """Convert a validation error to an LSP diagnostic.
+
+    Args:
+        error: Validation error with 1-indexed YAML coordinates.
+        lines: Lines of the document.
+
+    Returns:
+        Diagnostic covering the rest of the error's line from its column.
+    """
+    line_number, column = 0, 0
+    if error.yaml_location is not None:
+        line_number, column = error.yaml_location[0]
+        line_number, column = max(line_number - 1, 0), max(column - 1, 0)
+    line = lines[line_number].rstrip("\r\n") if line_number < len(lines) else ""
+    return {
+        "range": {
+            "start": {
+                "line": line_number,
+                "character": get_utf16_length(line[:column]),
+            },
+            "end": {"line": line_number, "character": get_utf16_length(line)},
+        },
+        "severity": error_severity,
+        "source": "teklinicv",
+        "message": error.message,
+    }
+
+
+class LanguageServer:
+    """Validate and complete TekliniCV YAML files in editors over stdio.
+
+    Why:
+        Users only saw errors when they ran `render`. The server keeps each open
+        document and its parsed blocks in memory, and on every change reparses
+        only the changed blocks and revalidates, so errors appear while typing.
+        The Pydantic models and their adapters are built once per process, and
+        the server validates a sample CV at startup so the first keystroke is as
+        fast as the rest.
+
+    Example:
+        ```py
+        LanguageServer(sys.stdin.buffer, sys.stdout.buffer).serve()
+        ```
+
+    Args:
+        input_stream: Stream to read client messages from.
+        output_stream: Stream to write server messages to.
+    """
+
+    def __init__(self, input_stream: BinaryIO, output_stream: BinaryIO):
+        self.input_stream = input_stream
+        self.output_stream = output_stream
+        self.documents: dict[str, OpenDocument] = {}
+        self.shutdown_requested = False
+
+    def serve(self) -> int:
+        """Handle messages until the client exits.
+
+        Returns:
+            Exit code: 0 if the client asked to shut down first, 1 otherwise.
+        """
+        while (message := read_message(self.input_stream)) is not None:
+            if message.get("method") == "exit":
+                break
+            self.handle_message(message)
+        return 0 if self.shutdown_requested else 1
+
+    def send(self, message: dict[str, Any]) -> None:
+        write_message(self.output_stream, {"jsonrpc": "2.0", **message})
+
+    def handle_message(self, message: dict[str, Any]) -> None:
+        method = message.get("method")
+        params = message.get("params") or {}
+        handler = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didClose": self.did_close,
+            "textDocument/completion": self.completion,
+        }.get(method or "")
+
+        if "id" not in message:
+            # Notifications get no response, and unknown ones are ignored:
+            if handler is not None:
+                try:
+                    handler(params)
+                except Exception:  # NOQA: BLE001
+                    traceback.print_exc(file=sys.stderr)
+            return
+
+        if handler is None:
+            self.send(
+                {
+                    "id": message["id"],
+                    "error": {
+                        "code": method_not_found_code,
+                        "message": f"Unknown method: {method}",
+                    },
+                }
+            )
+            return
+        try:
+            result = handler(params)
+        except Exception as e:  # NOQA: BLE001
+            traceback.print_exc(file=sys.stderr)
+            self.send(
+                {
+                    "id": message["id"],
+                    "error": {"code": internal_error_code, "message": str(e)},
+                }
+            )
+            return
+        self.send({"id": message["id"], "result": result})
+
+    def initialize(self, params: dict[str, Any]) -> dict[str, Any]:  # NOQA: ARG002
+        warm_up()
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": incremental_sync_kind,
+                },
+                "completionProvider": {"triggerCharacters": [":", "-"]},
+            },
+            "serverInfo": {"name": "teklinicv", "version": __version__},
+        }
+
+    def shutdown(self, params: dict[str, Any]) -> None:  # NOQA: ARG002
+        self.shutdown_requested = True
+
+    def did_open(self, params: dict[str, Any]) -> None:
+        text_document = params["textDocument"]
+        document = OpenDocument(text_document["uri"], text_document["text"])
+        self.documents[document.uri] = document
+        self.publish_diagnostics(document)
+
+    def did_change(self, params: dict[str, Any]) -> None:
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return
+        for change in params["contentChanges"]:
+            document.text = apply_change(document.text, change)
+        self.publish_diagnostics(document)
+
+    def did_close(self, params: dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self.send(
+            {
+                "method": "textDocument/publishDiagnostics",
+                "params": {"uri": uri, "diagnostics": []},
+            }
+        )
+
+    def completion(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return []
+        lines = split_lines(document.text)
+        position = params["position"]
+        line_number = position["line"]
+        line = lines[line_number] if line_number < len(lines) else ""
+        return get_completion_items(
+            lines, line_number, utf16_to_index(line, position["character"])
+        )
+
+    def publish_diagnostics(self, document: OpenDocument) -> None:
+        """Revalidate a document and send its diagnostics to the client."""
+        start = time.perf_counter()
+        errors = get_validation_errors(
+            document.parser.parse(document.text), uri_to_path(document.uri)
+        )
+        lines = split_lines(document.text)
+        self.send(
+            {
+                "method": "textDocument/publishDiagnostics",
+                "params": {
+                    "uri": document.uri,
+                    "diagnostics": [
+                        create_diagnostic(error, lines) for error in errors
+                    ],
+                },
+            }
+        )
+        duration_ms = (time.perf_counter() - start) * 1000
+        self.send(
+            {
+                "method": "window/logMessage",
+                "params": {
+                    "type": log_message_type,
+                    "message": f"Validated {document.uri} in {duration_ms:.1f} ms",
+                },
+            }
+        )
+
+
+def warm_up() -> None:
+    """Build the JSON Schema and validate the sample CV once.
+
+    Why:
+        Pydantic builds validators and fills caches on first use, which would
+        otherwise make the first validation after opening a file noticeably
+        slower than the rest.
+    """
+    from teklinicv.schema.sample_generator import (  # NOQA: PLC0415
+        create_sample_yaml_input_file,
+    )
+
+    get_json_schema()
+    sample = create_sample_yaml_input_file(file_path=None)
+    get_validation_errors(DocumentParser().parse(sample), None)
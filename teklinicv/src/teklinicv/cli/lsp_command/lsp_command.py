@@ -0,0 +1,20 @@
+import sys
+
+import typer
+
+from ..app import app
+
+
+@app.command(
+    name="lsp",
+    help=(
+        "Start a language server over standard input and output, for live"
+        " validation and completion of YAML input files in editors. Example:"
+        " [yellow]teklinicv lsp[/yellow]. Details: [cyan]teklinicv lsp --help[/cyan]"
+    ),
+)
+def cli_command_lsp():
+    from .language_server import LanguageServer  # NOQA: PLC0415
+
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer)
+    raise typer.Exit(code=server.serve())
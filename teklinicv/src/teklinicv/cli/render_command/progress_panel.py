@@ -1,8 +1,9 @@
-import contextlib
+import functools
 import pathlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import rich.box
+import rich.console
 import rich.live
 import rich.panel
 import rich.table
@@ -10,8 +11,10 @@ import typer
 
 from teklinicv.exception import TekliniCVUserError, TekliniCVValidationError
 
+from .progress_reporter import ProgressReporter, format_output_paths
 
-class ProgressPanel(rich.live.Live):
+
+class ProgressPanel(rich.live.Live, ProgressReporter):
     """Live-updating terminal panel showing CV generation progress with timing.
 
     Example:
@@ -24,9 +27,12 @@ class ProgressPanel(rich.live.Live):
 
     Args:
         quiet: Suppress all terminal output.
+        console: Console to print to. Defaults to standard output.
     """
 
-    def __init__(self, quiet: bool = False):
+    def __init__(
+        self, quiet: bool = False, console: rich.console.Console | None = None
+    ):
         self.quiet = quiet
         self.completed_steps: list[CompletedStep] = []
         super().__init__(
@@ -36,11 +42,16 @@ class ProgressPanel(rich.live.Live):
                 title_align="left",
                 border_style="bright_black",
             ),
+            console=console,
             refresh_per_second=4,
         )
 
     def update_progress(
-        self, time_took: str, message: str, paths: list[pathlib.Path]
+        self,
+        time_took: str,
+        message: str,
+        paths: list[pathlib.Path],
+        unchanged_paths: list[pathlib.Path] | None = None,
     ) -> None:
         """Add completed step to progress display.
 
@@ -48,13 +59,21 @@ class ProgressPanel(rich.live.Live):
             time_took: Execution time in milliseconds as string.
             message: Step description.
             paths: Generated file paths to display.
+            unchanged_paths: Paths among `paths` that were not rewritten because
+                their contents did not change.
         """
-        self.completed_steps.append(CompletedStep(time_took, message, paths))
+        self.completed_steps.append(
+            CompletedStep(time_took, message, paths, unchanged_paths or [])
+        )
         self.print_progress_panel(title="Rendering your CV...")
 
-    def finish_progress(self) -> None:
-        """Display final success panel and clear state."""
-        self.print_progress_panel(title="Your CV is ready")
+    def finish_progress(self, title: str = "Your CV is ready") -> None:
+        """Display final success panel and clear state.
+
+        Args:
+            title: Panel title text.
+        """
+        self.print_progress_panel(title=title)
         self.completed_steps.clear()
 
     def print_progress_panel(self, title: str) -> None:
@@ -66,22 +85,7 @@ class ProgressPanel(rich.live.Live):
         if self.quiet:
             return
 
-        lines: list[str] = []
-        for step in self.completed_steps:
-            paths_str = ""
-            if step.paths:
-                with contextlib.suppress(ValueError):
-                    step.paths = [
-                        path.relative_to(pathlib.Path.cwd()) for path in step.paths
-                    ]
-                paths_as_strings = [f"./{path}" for path in step.paths]
-                paths_str = "; ".join(paths_as_strings)
-
-            timing = f"[bold green]{step.timing_ms + ' ms':<8}[/bold green]"
-            message = step.message + (": " if paths_str else ".")
-            paths_display = f"[purple]{paths_str}[/purple]" if paths_str else ""
-            lines.append(f"[green]+[/green] {timing} {message:<26} {paths_display}")
-
+        lines = [step.line for step in self.completed_steps]
         content = "\n".join(lines) if lines else "Rendering..."
 
         self.update(
@@ -155,3 +159,13 @@ class CompletedStep:
     timing_ms: str
     message: str
     paths: list[pathlib.Path]
+    unchanged_paths: list[pathlib.Path] = field(default_factory=list)
+
+    @functools.cached_property
+    def line(self) -> str:
+        """Panel line of the step, formatted once since the panel is redrawn often."""
+        paths_str = format_output_paths(self.paths, self.unchanged_paths)
+        timing = f"[bold green]{self.timing_ms + ' ms':<8}[/bold green]"
+        message = self.message + (": " if paths_str else ".")
+        paths_display = f"[purple]{paths_str}[/purple]" if paths_str else ""
+        return f"[green]+[/green] {timing} {message:<26} {paths_display}"
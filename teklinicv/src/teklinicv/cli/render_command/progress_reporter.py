@@ -0,0 +1,303 @@
+import contextlib
+import pathlib
+import sys
+import time
+from types import TracebackType
+from typing import IO, NoReturn, Self
+
+import rich.console
+import rich.live
+import rich.text
+import typer
+
+from teklinicv.exception import TekliniCVUserError, TekliniCVValidationError
+
+
+class ProgressReporter:
+    """Receive the steps and errors of renders, showing nothing.
+
+    Why:
+        Rendering reports progress through this interface, so the output can
+        suit where it goes: a live panel in terminals, plain lines in CI logs,
+        or one aggregated line for batch runs. This base reporter shows nothing,
+        for renders whose errors are handled elsewhere. Like the panel, it ends
+        the command on errors.
+
+    Example:
+        ```py
+        with ProgressReporter() as progress:
+            run_teklinicv(pathlib.Path("John_Doe_CV.yaml"), progress)
+        ```
+    """
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+        /,
+    ) -> None:
+        pass
+
+    def update_progress(
+        self,
+        time_took: str,
+        message: str,
+        paths: list[pathlib.Path],
+        unchanged_paths: list[pathlib.Path] | None = None,
+    ) -> None:
+        """Report a completed step.
+
+        Args:
+            time_took: Execution time in milliseconds as string.
+            message: Step description.
+            paths: Generated file paths.
+            unchanged_paths: Paths among `paths` that were not rewritten because
+                their contents did not change.
+        """
+
+    def finish_progress(self, title: str = "Your CV is ready") -> None:
+        """Report a finished render.
+
+        Args:
+            title: Completion message.
+        """
+
+    def count_render(self, error: str | None = None) -> None:
+        """Report a render of a batch that already logged its own steps.
+
+        Args:
+            error: Why the render failed, if it did.
+        """
+
+    def print_user_error(self, user_error: TekliniCVUserError) -> None:  # NOQA: ARG002
+        """Report a failed render and exit with error code.
+
+        Args:
+            user_error: User-facing error.
+        """
+        raise typer.Exit(code=1)
+
+    def print_validation_errors(
+        self,
+        errors: list[TekliniCVValidationError],  # NOQA: ARG002
+    ) -> None:
+        """Report an invalid input file and exit with error code.
+
+        Args:
+            errors: List of validation errors with location, input, and message.
+        """
+        raise typer.Exit(code=1)
+
+
+def format_output_paths(
+    paths: list[pathlib.Path], unchanged_paths: list[pathlib.Path]
+) -> str:
+    """Join output paths for display, relative to the working directory if possible.
+
+    Args:
+        paths: Generated file paths.
+        unchanged_paths: Paths among `paths` that were left as they were.
+
+    Returns:
+        Paths separated by semicolons, with unchanged ones marked.
+    """
+    cwd = pathlib.Path.cwd()
+    path_strings = []
+    for path in paths:
+        path_string = f"./{path}"
+        with contextlib.suppress(ValueError):
+            path_string = f"./{path.relative_to(cwd)}"
+        if path in unchanged_paths:
+            path_string += " (unchanged)"
+        path_strings.append(path_string)
+    return "; ".join(path_strings)
+
+
+class LineProgressReporter(ProgressReporter):
+    """Write each step as a plain line, for logs and other non-terminal output.
+
+    Why:
+        A live panel redraws itself, which turns into repeated panels or
+        escape codes in CI logs. Writing one line per step as it completes
+        keeps logs readable and does no work between steps.
+
+    Example:
+        ```py
+        with LineProgressReporter(sys.stderr) as progress:
+            run_teklinicv(pathlib.Path("John_Doe_CV.yaml"), progress)
+        # + 150 ms   Generated PDF: ./teklinicv_output/John_Doe_CV.pdf
+        ```
+
+    Args:
+        file: Stream to write to. Defaults to standard output.
+    """
+
+    def __init__(self, file: IO[str] | None = None):
+        self.file = file
+
+    def write_line(self, line: str) -> None:
+        file = self.file or sys.stdout
+        file.write(f"{line}\n")
+        file.flush()
+
+    def update_progress(
+        self,
+        time_took: str,
+        message: str,
+        paths: list[pathlib.Path],
+        unchanged_paths: list[pathlib.Path] | None = None,
+    ) -> None:
+        if not paths:
+            return
+        paths_string = format_output_paths(paths, unchanged_paths or [])
+        self.write_line(f"+ {time_took + ' ms':<8} {message + ':':<27} {paths_string}")
+
+    def finish_progress(self, title: str = "Your CV is ready") -> None:
+        self.write_line(f"{title}.")
+
+    def print_user_error(self, user_error: TekliniCVUserError) -> NoReturn:
+        self.write_line(f"Error: {user_error.message or 'An unknown error occurred.'}")
+        raise typer.Exit(code=1)
+
+    def print_validation_errors(
+        self, errors: list[TekliniCVValidationError]
+    ) -> NoReturn:
+        self.write_line("There are errors in the input file!")
+        for error in errors:
+            self.write_line(
+                f"{'.'.join(error.location)}: {error.message} (input: {error.input})"
+            )
+        raise typer.Exit(code=1)
+
+
+class QuietProgressReporter(ProgressReporter):
+    """Hide progress, but show errors through another reporter.
+
+    Why:
+        `--quiet` is for scripts that only care about failures. Steps are not
+        shown at all, and the other reporter is only started once there is an
+        error to show, so a live panel never appears for successful renders.
+
+    Example:
+        ```py
+        with QuietProgressReporter(LineProgressReporter(sys.stderr)) as progress:
+            run_teklinicv(pathlib.Path("John_Doe_CV.yaml"), progress)
+        ```
+
+    Args:
+        error_reporter: Reporter to show errors with.
+    """
+
+    def __init__(self, error_reporter: ProgressReporter):
+        self.error_reporter = error_reporter
+
+    def print_user_error(self, user_error: TekliniCVUserError) -> None:
+        with self.error_reporter:
+            self.error_reporter.print_user_error(user_error)
+
+    def print_validation_errors(self, errors: list[TekliniCVValidationError]) -> None:
+        with self.error_reporter:
+            self.error_reporter.print_validation_errors(errors)
+
+
+class BatchProgressReporter(rich.live.Live, ProgressReporter):
+    """Show one live line with the number of finished renders, the rate, and an ETA.
+
+    Why:
+        When hundreds of files are rendered in one process, per-step output
+        scrolls by too fast to read and costs time itself. Only finished and
+        failed renders are counted, and the line is redrawn a few times per
+        second. Unlike the other reporters, errors don't end the command, so
+        the remaining files are still rendered and all failures can be listed
+        at the end.
+
+    Example:
+        ```py
+        with BatchProgressReporter(total=len(input_files)) as progress:
+            for input_file in input_files:
+                progress.start_render(input_file.name)
+                run_teklinicv(input_file, progress)
+        # 37/100 rendered, 1 failed  12.3 CVs/s  ETA 5 s
+        ```
+
+    Args:
+        total: Number of renders in the batch, if known, for the ETA.
+        action: What is done to each file, for the status line.
+        quiet: Count renders without showing anything.
+        console: Console to print to. Defaults to standard output.
+    """
+
+    def __init__(
+        self,
+        total: int | None = None,
+        action: str = "rendered",
+        quiet: bool = False,
+        console: rich.console.Console | None = None,
+    ):
+        self.total = total
+        self.action = action
+        self.quiet = quiet
+        self.finished_count = 0
+        self.failed_count = 0
+        self.failed_errors: list[str] = []
+        self.render_name: str | None = None
+        self.start_time = time.perf_counter()
+        super().__init__(
+            self.create_status_line(),
+            console=rich.console.Console(quiet=True) if quiet else console,
+            auto_refresh=not quiet,
+            refresh_per_second=4,
+        )
+
+    def create_status_line(self) -> rich.text.Text:
+        done_count = self.finished_count + self.failed_count
+        elapsed = time.perf_counter() - self.start_time
+        rate = done_count / elapsed if elapsed > 0 else 0.0
+        status = f"{done_count}/{self.total}" if self.total else f"{done_count}"
+        status += f" {self.action}, {self.failed_count} failed  {rate:.1f} CVs/s"
+        if self.total and rate > 0:
+            status += f"  ETA {max(self.total - done_count, 0) / rate:.0f} s"
+        return rich.text.Text(status)
+
+    def stop(self) -> None:
+        was_started = self.is_started
+        super().stop()
+        # Rich ends the line itself only in terminals:
+        if was_started and not self.console.is_terminal:
+            self.console.line()
+
+    def start_render(self, name: str) -> None:
+        """Name the render that follows in its error messages.
+
+        Args:
+            name: Name of the rendered file.
+        """
+        self.render_name = name
+
+    def count_render(self, error: str | None = None) -> None:
+        if error is None:
+            self.finished_count += 1
+        else:
+            self.failed_count += 1
+            self.failed_errors.append(
+                f"{self.render_name}: {error}" if self.render_name else error
+            )
+        if not self.quiet:
+            self.update(self.create_status_line())
+
+    def finish_progress(self, title: str = "Your CV is ready") -> None:  # NOQA: ARG002
+        self.count_render()
+
+    def print_user_error(self, user_error: TekliniCVUserError) -> None:
+        self.count_render(user_error.message or "An unknown error occurred.")
+
+    def print_validation_errors(self, errors: list[TekliniCVValidationError]) -> None:
+        self.count_render(
+            "; ".join(
+                f"{'.'.join(error.location)}: {error.message}" for error in errors
+            )
+        )
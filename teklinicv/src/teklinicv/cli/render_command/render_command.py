@@ -1,20 +1,42 @@
+import contextlib
+import enum
 import pathlib
+from collections.abc import Iterator
 from typing import Annotated
 
+import rich.console
 import typer
 
+from teklinicv.profiler import Profiler
+from teklinicv.render_report import RenderReport
 from teklinicv.schema.teklinicv_model_builder import (
     BuildTeklinicvModelArguments,
 )
 
-from ..app import app
+from ..app import app, skip_version_check
 from ..error_handler import handle_user_errors
 from .parse_override_arguments import parse_override_arguments
 from .progress_panel import ProgressPanel
-from .run_teklinicv import run_teklinicv
+from .progress_reporter import (
+    LineProgressReporter,
+    ProgressReporter,
+    QuietProgressReporter,
+)
 from .watcher import run_function_if_file_changes
 
 
+class ReportFormat(enum.StrEnum):
+    json = "json"
+
+
+# The same as `teklinicv.renderer.page_fit.FitParameter`, which can't be imported
+# here without loading the renderer:
+class FitParameter(enum.StrEnum):
+    font_size = "font_size"
+    line_spacing = "line_spacing"
+    margins = "margins"
+
+
 @app.command(
     name="render",
     help=(
@@ -109,6 +131,33 @@ def cli_command_render(
             ),
         ),
     ] = None,
+    png_pages: Annotated[
+        str | None,
+        typer.Option(
+            "--png-pages",
+            "-pngp",
+            help=("Only export the given pages as PNG files (e.g., 1 or 1,3-5 or 2-)."),
+        ),
+    ] = None,
+    png_ppi: Annotated[
+        float | None,
+        typer.Option(
+            "--png-ppi",
+            "-ppi",
+            help="Resolution of the PNG files in pixels per inch. Defaults to 144.",
+        ),
+    ] = None,
+    photo_ppi: Annotated[
+        float | None,
+        typer.Option(
+            "--photo-ppi",
+            "-phppi",
+            help=(
+                "Downscale the photo to the given resolution in pixels per inch before"
+                " embedding it."
+            ),
+        ),
+    ] = None,
     dont_generate_markdown: Annotated[
         bool | None,
         typer.Option(
@@ -166,14 +215,136 @@ def cli_command_render(
             ),
         ),
     ] = None,
+    preview: Annotated[
+        bool | None,
+        typer.Option(
+            "--preview",
+            "-pv",
+            help=(
+                "If provided, only a low-resolution PNG preview of the first pages is"
+                " rendered. With --watch, the preview is rendered on every save and"
+                " all other outputs once the input file stops changing."
+            ),
+        ),
+    ] = None,
+    preview_pages: Annotated[
+        int,
+        typer.Option(
+            "--preview-pages",
+            "-pvp",
+            min=1,
+            help="Number of pages in the preview.",
+        ),
+    ] = 1,
+    preview_ppi: Annotated[
+        float,
+        typer.Option(
+            "--preview-ppi",
+            "-pvppi",
+            min=1,
+            help="Resolution of the preview in pixels per inch.",
+        ),
+    ] = 50,
+    preview_idle_seconds: Annotated[
+        float,
+        typer.Option(
+            "--preview-idle-seconds",
+            "-pvidle",
+            min=0,
+            help=(
+                "With --watch and --preview, seconds without changes before all"
+                " outputs are rendered."
+            ),
+        ),
+    ] = 2.0,
     quiet: Annotated[
         bool,
         typer.Option(
             "--quiet",
             "-q",
-            help="If provided, TekliniCV will not print any messages.",
+            help="If provided, TekliniCV will only print errors.",
+        ),
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            "-prof",
+            help=(
+                "If provided, the time spent in each stage, section, and template is"
+                " saved next to the input file as a Chrome trace"
+                " (INPUT_profile.json), which Perfetto or chrome://tracing can open."
+            ),
+        ),
+    ] = False,
+    profile_python: Annotated[
+        bool,
+        typer.Option(
+            "--profile-python",
+            "-profpy",
+            help=(
+                "If provided with --profile, Python functions are also profiled with"
+                " cProfile and saved as INPUT_profile.pstats."
+            ),
         ),
     ] = False,
+    report: Annotated[
+        ReportFormat | None,
+        typer.Option(
+            "--report",
+            "-r",
+            help=(
+                "Print a machine-readable report of each render (stage durations,"
+                " outputs, peak memory, page count, cache hits, and input size) as a"
+                " line of JSON to stdout. Other messages go to stderr then."
+            ),
+        ),
+    ] = None,
+    report_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--report-path",
+            "-rp",
+            help=(
+                "With --report, append the reports to this file as JSON Lines instead"
+                " of printing them."
+            ),
+        ),
+    ] = None,
+    fit_pages: Annotated[
+        int | None,
+        typer.Option(
+            "--fit-pages",
+            "-fit",
+            min=1,
+            help=(
+                "Shrink the design as little as possible until the CV fits on this"
+                " many pages."
+            ),
+        ),
+    ] = None,
+    fit_parameters: Annotated[
+        list[FitParameter] | None,
+        typer.Option(
+            "--fit-parameter",
+            "-fitp",
+            help=(
+                "With --fit-pages, a design parameter that may be shrunk. Can be"
+                " given multiple times. Defaults to all of them."
+            ),
+        ),
+    ] = None,
+    fit_design_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--fit-design-path",
+            "-fitd",
+            help=(
+                "With --fit-pages, save the fitted design to this YAML file, which"
+                " can be used with --design."
+            ),
+        ),
+    ] = None,
     # This is a dummy argument for the help message for
     # extra_data_model_override_argumets:
     _: Annotated[
@@ -195,6 +366,9 @@ def cli_command_render(
         "markdown_path": markdown_path,
         "html_path": html_path,
         "png_path": png_path,
+        "png_pages": png_pages,
+        "png_ppi": png_ppi,
+        "photo_ppi": photo_ppi,
         "dont_generate_typst": dont_generate_typst,
         "dont_generate_html": dont_generate_html,
         "dont_generate_markdown": dont_generate_markdown,
@@ -203,12 +377,94 @@ def cli_command_render(
         "overrides": parse_override_arguments(extra_data_model_override_arguments),
     }
     input_file_path = pathlib.Path(input_file_name)
+    # Imported here so other commands, such as `validate`, start without the renderer:
+    from .run_teklinicv import run_teklinicv, run_teklinicv_preview  # NOQA: PLC0415
 
-    with ProgressPanel(quiet=quiet) as progress_panel:
-        if watch:
+    def create_profiler() -> Profiler | None:
+        if not profile:
+            return None
+        return Profiler(
+            input_file_path.with_name(f"{input_file_path.stem}_profile"),
+            capture_python=profile_python,
+        )
+
+    @contextlib.contextmanager
+    def create_report() -> Iterator[RenderReport | None]:
+        if report is None:
+            yield None
+            return
+        render_report = RenderReport(input_file_path)
+        try:
+            yield render_report
+        finally:
+            render_report.write_json_line(report_path)
+
+    # Keep stdout clean for the report:
+    if report is not None and report_path is None:
+        skip_version_check()
+    with create_progress_reporter(
+        quiet, stderr=report is not None and report_path is None
+    ) as progress:
+
+        def render() -> None:
+            with create_report() as render_report:
+                run_teklinicv(
+                    input_file_path,
+                    progress,
+                    profiler=create_profiler(),
+                    report=render_report,
+                    fit_pages=fit_pages,
+                    fit_parameters=tuple(fit_parameters or FitParameter),
+                    fit_design_path=fit_design_path,
+                    **arguments,
+                )
+
+        def render_preview() -> None:
+            with create_report() as render_report:
+                run_teklinicv_preview(
+                    input_file_path,
+                    progress,
+                    preview_pages,
+                    preview_ppi,
+                    profiler=create_profiler(),
+                    report=render_report,
+                    **arguments,
+                )
+
+        if watch and preview:
             run_function_if_file_changes(
                 input_file_path,
-                lambda: run_teklinicv(input_file_path, progress_panel, **arguments),
+                render_preview,
+                idle_function=render,
+                idle_seconds=preview_idle_seconds,
             )
+        elif watch:
+            run_function_if_file_changes(input_file_path, render)
+        elif preview:
+            render_preview()
         else:
-            run_teklinicv(input_file_path, progress_panel, **arguments)
+            render()
+
+
+def create_progress_reporter(quiet: bool, stderr: bool = False) -> ProgressReporter:
+    """Choose how to show rendering progress.
+
+    Why:
+        The live panel suits terminals, but in CI logs and pipes it produces
+        redrawn panels. Plain lines are written there instead. With `--quiet`,
+        only errors are shown.
+
+    Args:
+        quiet: Show errors only.
+        stderr: Write to standard error instead of standard output.
+
+    Returns:
+        Progress reporter to render with.
+    """
+    console = rich.console.Console(stderr=stderr)
+    progress: ProgressReporter = (
+        ProgressPanel(console=console)
+        if console.is_terminal
+        else LineProgressReporter(console.file)
+    )
+    return QuietProgressReporter(progress) if quiet else progress
@@ -1,27 +1,42 @@
+import contextlib
 import pathlib
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Unpack
 
 import jinja2
 import ruamel.yaml
 
 from teklinicv.exception import TekliniCVUserError, TekliniCVUserValidationError
+from teklinicv.hooks import hook_stage
+from teklinicv.profiler import Profiler, profile_span
+from teklinicv.render_report import RenderReport, get_active_render_report
 from teklinicv.renderer.html import generate_html
-from teklinicv.renderer.markdown import generate_markdown
-from teklinicv.renderer.pdf_png import generate_pdf, generate_png
+from teklinicv.renderer.markdown import generate_markdown, render_markdown
+from teklinicv.renderer.output_file import record_unchanged_output_files
+from teklinicv.renderer.page_fit import (
+    FitParameter,
+    fit_design_to_pages,
+    write_design_overlay,
+)
+from teklinicv.renderer.pdf_png import (
+    generate_pdf,
+    generate_png,
+    generate_preview_png,
+)
 from teklinicv.renderer.typst import generate_typst
+from teklinicv.schema.models.teklinicv_model import TekliniCVModel
 from teklinicv.schema.teklinicv_model_builder import (
     BuildTeklinicvModelArguments,
     build_teklinicv_dictionary_and_model,
 )
 
-from .progress_panel import ProgressPanel
+from .progress_reporter import ProgressReporter
 
 
 def timed_step[T, **P](
     message: str,
-    progress_panel: ProgressPanel,
+    progress_panel: ProgressReporter,
     func: Callable[P, T],
     *args: P.args,
     **kwargs: P.kwargs,
@@ -30,7 +45,8 @@ def timed_step[T, **P](
 
     Why:
         Each generation step (Typst, PDF, PNG) returns file paths. This wrapper
-        times execution and automatically displays results in progress panel.
+        times execution and automatically displays results in progress panel,
+        marking outputs that were not rewritten because they did not change.
 
     Example:
         ```py
@@ -42,7 +58,7 @@ def timed_step[T, **P](
 
     Args:
         message: Step description for progress display.
-        progress_panel: Progress panel to update.
+        progress_panel: Progress reporter to update.
         func: Function to execute and time.
         args: Positional arguments for func.
         kwargs: Keyword arguments for func.
@@ -50,8 +66,15 @@ def timed_step[T, **P](
     Returns:
         Function result.
     """
+    report = get_active_render_report()
     start = time.perf_counter()
-    result = func(*args, **kwargs)
+    with (
+        profile_span(message, "step"),
+        hook_stage(message),
+        record_unchanged_output_files() as unchanged_paths,
+        report.record_stage(message) if report else contextlib.nullcontext() as stage,
+    ):
+        result = func(*args, **kwargs)
     end = time.perf_counter()
     timing_ms = f"{(end - start) * 1000:.0f}"
 
@@ -63,9 +86,15 @@ def timed_step[T, **P](
             message = f"{message}s"
         paths = result  # ty: ignore[invalid-assignment]
 
+    if stage is not None:
+        stage.add_outputs(paths, unchanged_paths)
+
     if paths:
         progress_panel.update_progress(
-            time_took=timing_ms, message=message, paths=paths
+            time_took=timing_ms,
+            message=message,
+            paths=paths,
+            unchanged_paths=unchanged_paths,
         )
 
     return result
@@ -73,7 +102,13 @@ def timed_step[T, **P](
 
 def run_teklinicv(
     main_input_file_path_or_contents: pathlib.Path | str,
-    progress: ProgressPanel,
+    progress: ProgressReporter,
+    *,
+    profiler: Profiler | None = None,
+    report: RenderReport | None = None,
+    fit_pages: int | None = None,
+    fit_parameters: tuple[str, ...] = tuple(FitParameter),
+    fit_design_path: pathlib.Path | None = None,
     **kwargs: Unpack[BuildTeklinicvModelArguments],
 ):
     """Execute complete CV generation pipeline with progress tracking and error handling.
@@ -94,10 +129,19 @@ def run_teklinicv(
 
     Args:
         main_input_file_path_or_contents: YAML file path or raw content string.
-        progress: Progress panel for output display.
+        progress: Progress reporter for output display.
+        profiler: Profiler to record the render with and write the profile files of.
+        report: Report to record stages, outputs, and memory use in.
+        fit_pages: Shrink the design until the CV fits on this many pages.
+        fit_parameters: Names of the design parameters that may be shrunk to fit.
+        fit_design_path: Write the fitted design to this file, for `--design`.
         kwargs: Optional overrides for design/locale files, output paths, and generation flags.
     """
-    try:
+    with (
+        catch_render_errors(progress),
+        profiler or contextlib.nullcontext(),
+        report or contextlib.nullcontext(),
+    ):
         _, teklinicv_model = timed_step(
             "Validated the input file",
             progress,
@@ -105,12 +149,23 @@ def run_teklinicv(
             main_input_file_path_or_contents,
             **kwargs,
         )
+        if report is not None:
+            report.record_input(teklinicv_model)
         typst_path = timed_step(
             "Generated Typst",
             progress,
             generate_typst,
             teklinicv_model,
         )
+        if fit_pages is not None and typst_path is not None:
+            teklinicv_model = fit_design(
+                teklinicv_model,
+                typst_path,
+                progress,
+                fit_pages,
+                fit_parameters,
+                fit_design_path,
+            )
         timed_step(
             "Generated PDF",
             progress,
@@ -125,11 +180,17 @@ def run_teklinicv(
             teklinicv_model,
             typst_path,
         )
+        md_contents: str | None = None
+
+        def render_and_generate_markdown() -> pathlib.Path | None:
+            # HTML reuses the rendered Markdown, and rendering it is most of the
+            # step's time, so it's rendered inside the timed step:
+            nonlocal md_contents
+            md_contents = render_markdown(teklinicv_model)
+            return generate_markdown(teklinicv_model, md_contents)
+
         md_path = timed_step(
-            "Generated Markdown",
-            progress,
-            generate_markdown,
-            teklinicv_model,
+            "Generated Markdown", progress, render_and_generate_markdown
         )
         timed_step(
             "Generated HTML",
@@ -137,8 +198,162 @@ def run_teklinicv(
             generate_html,
             teklinicv_model,
             md_path,
+            md_contents,
         )
+        if profiler is not None:
+            timed_step("Saved profile", progress, profiler.write_files)
         progress.finish_progress()
+
+
+def fit_design(
+    teklinicv_model: TekliniCVModel,
+    typst_path: pathlib.Path,
+    progress: ProgressReporter,
+    fit_pages: int,
+    fit_parameters: tuple[str, ...],
+    fit_design_path: pathlib.Path | None,
+) -> TekliniCVModel:
+    """Shrink the design to fit the page count and report the chosen values.
+
+    Why:
+        The outcome of fitting is a set of design values rather than files, so
+        the values are shown in the step's message, next to the rewritten Typst
+        file. The fitted design is written to `fit_design_path` if given, so
+        later renders can use it with `--design` without searching again.
+
+    Args:
+        teklinicv_model: Model whose Typst file has been generated.
+        typst_path: Generated Typst file.
+        progress: Progress reporter for output display.
+        fit_pages: Maximum number of pages.
+        fit_parameters: Names of the design parameters that may be shrunk.
+        fit_design_path: File to write the fitted design to.
+
+    Returns:
+        Model with the fitted design.
+    """
+    message = f"Fitted to {fit_pages} page{'s' if fit_pages > 1 else ''}"
+    report = get_active_render_report()
+    start = time.perf_counter()
+    with (
+        profile_span(message, "step"),
+        hook_stage(message),
+        record_unchanged_output_files() as unchanged_paths,
+        report.record_stage(message) if report else contextlib.nullcontext() as stage,
+    ):
+        page_fit = fit_design_to_pages(
+            teklinicv_model, typst_path, fit_pages, fit_parameters
+        )
+        # The Typst file is rewritten with the fitted design:
+        paths = [typst_path]
+        if not page_fit.changed_values:
+            unchanged_paths.append(typst_path)
+        if fit_design_path is not None:
+            write_design_overlay(page_fit.teklinicv_model, fit_design_path)
+            paths.append(fit_design_path)
+    end = time.perf_counter()
+
+    if stage is not None:
+        stage.add_outputs(paths, unchanged_paths)
+    progress.update_progress(
+        time_took=f"{(end - start) * 1000:.0f}",
+        message=(
+            f"{message} ({page_fit.summary}, {page_fit.compilation_count}"
+            f" compilation{'s' if page_fit.compilation_count > 1 else ''})"
+        ),
+        paths=paths,
+        unchanged_paths=unchanged_paths,
+    )
+
+    return page_fit.teklinicv_model
+
+
+def run_teklinicv_preview(
+    main_input_file_path_or_contents: pathlib.Path | str,
+    progress: ProgressReporter,
+    preview_pages: int,
+    preview_ppi: float,
+    *,
+    profiler: Profiler | None = None,
+    report: RenderReport | None = None,
+    **kwargs: Unpack[BuildTeklinicvModelArguments],
+):
+    """Render a low-resolution PNG preview of the first pages only.
+
+    Why:
+        While editing, users mostly look at the first page. Skipping PDF, full
+        PNG, Markdown, and HTML outputs and rasterizing only a few pages at low
+        resolution gives feedback much faster than a full render.
+
+    Example:
+        ```py
+        with ProgressPanel() as progress:
+            run_teklinicv_preview(
+                Path("cv.yaml"), progress, preview_pages=1, preview_ppi=50
+            )
+        # Shows: + 80 ms  Generated preview PNG: ./teklinicv_output/..._preview_1.png
+        ```
+
+    Args:
+        main_input_file_path_or_contents: YAML file path or raw content string.
+        progress: Progress reporter for output display.
+        preview_pages: Number of pages to preview, starting from the first page.
+        preview_ppi: Resolution of the preview in pixels per inch.
+        profiler: Profiler to record the render with and write the profile files of.
+        report: Report to record stages, outputs, and memory use in.
+        kwargs: Optional overrides for design/locale files, output paths, and generation flags.
+    """
+    with (
+        catch_render_errors(progress),
+        profiler or contextlib.nullcontext(),
+        report or contextlib.nullcontext(),
+    ):
+        _, teklinicv_model = timed_step(
+            "Validated the input file",
+            progress,
+            build_teklinicv_dictionary_and_model,
+            main_input_file_path_or_contents,
+            **kwargs,
+        )
+        if report is not None:
+            report.record_input(teklinicv_model)
+        typst_path = timed_step(
+            "Generated Typst",
+            progress,
+            generate_typst,
+            teklinicv_model,
+        )
+        timed_step(
+            "Generated preview PNG",
+            progress,
+            generate_preview_png,
+            teklinicv_model,
+            typst_path,
+            preview_pages,
+            preview_ppi,
+        )
+        if profiler is not None:
+            timed_step("Saved profile", progress, profiler.write_files)
+        progress.finish_progress(title="Your CV preview is ready")
+
+
+@contextlib.contextmanager
+def catch_render_errors(progress: ProgressReporter) -> Iterator[None]:
+    """Show errors raised while rendering through the progress panel.
+
+    Why:
+        Full renders and previews fail in the same ways (invalid YAML, broken
+        templates, validation errors). One handler keeps the user-facing error
+        panels identical for both.
+
+    Args:
+        progress: Progress reporter for error display.
+
+    Returns:
+        Context manager that converts known errors into error panels.
+    """
+    try:
+        yield
     except TekliniCVUserError as e:
         progress.print_user_error(e)
     except ruamel.yaml.YAMLError as e:
@@ -1,6 +1,7 @@
 import contextlib
 import pathlib
 import sys
+import threading
 import time
 from collections.abc import Callable
 
@@ -9,13 +10,26 @@ import watchdog.events
 import watchdog.observers
 
 
-def run_function_if_file_changes(file_path: pathlib.Path, function: Callable):
+def run_function_if_file_changes(
+    file_path: pathlib.Path,
+    function: Callable,
+    idle_function: Callable | None = None,
+    idle_seconds: float = 2.0,
+):
     """Watch the file located at `file_path` and call the `function` when the file is
     modified. The function should not take any arguments.
 
+    If `idle_function` is given, it is called once the file has not been modified
+    for `idle_seconds`. This lets a fast preview run on every save while slower,
+    full outputs wait until the user stops typing. Calls never overlap.
+
     Args:
         file_path (pathlib.Path): The path of the file to watch for.
         function (Callable): The function to be called on file modification.
+        idle_function (Callable | None): The function to be called after the file
+            stops changing.
+        idle_seconds (float): Seconds without modifications before `idle_function`
+            is called.
     """
     path_to_watch = str(file_path.absolute())
     if sys.platform == "win32":
@@ -26,6 +40,23 @@ def run_function_if_file_changes(file_path: pathlib.Path, function: Callable):
         def __init__(self, function: Callable):
             super().__init__()
             self.function = function
+            self.lock = threading.Lock()
+            self.idle_timer: threading.Timer | None = None
+
+        def run_idle_function(self, function: Callable) -> None:
+            with self.lock, contextlib.suppress(typer.Exit):
+                function()
+
+        def restart_idle_timer(self) -> None:
+            if idle_function is None:
+                return
+            if self.idle_timer is not None:
+                self.idle_timer.cancel()
+            self.idle_timer = threading.Timer(
+                idle_seconds, self.run_idle_function, args=(idle_function,)
+            )
+            self.idle_timer.daemon = True
+            self.idle_timer.start()
 
         def on_modified(
             self,
@@ -34,13 +65,14 @@ def run_function_if_file_changes(file_path: pathlib.Path, function: Callable):
             if event.src_path != str(file_path.absolute()):
                 return
 
-            with contextlib.suppress(typer.Exit):
+            with self.lock, contextlib.suppress(typer.Exit):
                 try:
                     self.function()
                 except Exception as e:
                     # This means an unhandled error occurred in the function.
                     # Don't suppress it
                     raise e
+            self.restart_idle_timer()
 
     event_handler = EventHandler(function)
 
@@ -55,5 +87,7 @@ def run_function_if_file_changes(file_path: pathlib.Path, function: Callable):
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
+        if event_handler.idle_timer is not None:
+            event_handler.idle_timer.cancel()
         observer.stop()
     observer.join()
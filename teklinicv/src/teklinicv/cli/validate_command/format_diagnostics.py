@@ -0,0 +1,163 @@
+import pathlib
+from typing import Any
+
+from teklinicv import __version__
+from teklinicv.exception import TekliniCVValidationError
+
+from .validate_files import FileValidationResult
+
+sarif_schema_url = "https://json.schemastore.org/sarif-2.1.0.json"
+sarif_rule_id = "teklinicv-validation"
+
+
+def validation_error_to_dictionary(
+    error: TekliniCVValidationError,
+) -> dict[str, Any]:
+    """Convert a validation error to JSON-compatible data.
+
+    Args:
+        error: Validation error.
+
+    Returns:
+        Error with its location, YAML coordinates (1-indexed), message, and input.
+    """
+    yaml_location = None
+    if error.yaml_location is not None:
+        (start_line, start_column), (end_line, end_column) = error.yaml_location
+        yaml_location = {
+            "start": {"line": start_line, "column": start_column},
+            "end": {"line": end_line, "column": end_column},
+        }
+    return {
+        "location": ".".join(error.location),
+        "yaml_location": yaml_location,
+        "message": error.message,
+        "input": error.input,
+    }
+
+
+def create_json_diagnostics(results: list[FileValidationResult]) -> dict[str, Any]:
+    """Build a JSON report of validation results.
+
+    Example:
+        ```py
+        create_json_diagnostics([validate_file(pathlib.Path("John_Doe_CV.yaml"))])
+        # {"valid_count": 1, "invalid_count": 0, "files": [...]}
+        ```
+
+    Args:
+        results: Results of validated files.
+
+    Returns:
+        Report with per-file validity, timing, and errors.
+    """
+    invalid_count = sum(not result.is_valid for result in results)
+    return {
+        "valid_count": len(results) - invalid_count,
+        "invalid_count": invalid_count,
+        "files": [
+            {
+                "path": str(result.path),
+                "valid": result.is_valid,
+                "duration_ms": result.duration_ms,
+                "errors": [
+                    validation_error_to_dictionary(error) for error in result.errors
+                ],
+            }
+            for result in results
+        ],
+    }
+
+
+def create_sarif_diagnostics(results: list[FileValidationResult]) -> dict[str, Any]:
+    """Build a SARIF 2.1.0 log of validation results.
+
+    Why:
+        Code hosts and CI systems (such as GitHub code scanning) read SARIF and
+        annotate the failing lines of a pull request. Each error becomes a
+        result pointing at its YAML coordinates, and each file's validation
+        time is stored in the properties of its artifact.
+
+    Args:
+        results: Results of validated files.
+
+    Returns:
+        SARIF log with a single run.
+    """
+    sarif_results = []
+    for index, result in enumerate(results):
+        for error in result.errors:
+            physical_location: dict[str, Any] = {
+                "artifactLocation": {
+                    "uri": get_artifact_uri(result.path),
+                    "index": index,
+                }
+            }
+            if error.yaml_location is not None:
+                (start_line, start_column), (end_line, end_column) = error.yaml_location
+                physical_location["region"] = {
+                    "startLine": max(start_line, 1),
+                    "startColumn": max(start_column, 1),
+                    "endLine": max(end_line, 1),
+                    "endColumn": max(end_column, 1),
+                }
+            location: dict[str, Any] = {"physicalLocation": physical_location}
+            if error.location:
+                location["logicalLocations"] = [
+                    {"fullyQualifiedName": ".".join(error.location)}
+                ]
+            sarif_results.append(
+                {
+                    "ruleId": sarif_rule_id,
+                    "level": "error",
+                    "message": {"text": error.message},
+                    "locations": [location],
+                }
+            )
+
+    return {
+        "$schema": sarif_schema_url,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "TekliniCV",
+                        "version": __version__,
+                        "informationUri": "https://docs.teklinicv.com",
+                        "rules": [
+                            {
+                                "id": sarif_rule_id,
+                                "shortDescription": {
+                                    "text": "The input file is not a valid CV."
+                                },
+                            }
+                        ],
+                    }
+                },
+                "artifacts": [
+                    {
+                        "location": {"uri": get_artifact_uri(result.path)},
+                        "properties": {"durationMs": result.duration_ms},
+                    }
+                    for result in results
+                ],
+                "results": sarif_results,
+            }
+        ],
+    }
+
+
+def get_artifact_uri(file_path: pathlib.Path) -> str:
+    """Return the SARIF URI of a file, relative to the working directory if possible.
+
+    Args:
+        file_path: Validated file.
+
+    Returns:
+        Relative URI, or an absolute `file://` URI for files elsewhere.
+    """
+    try:
+        return file_path.resolve().relative_to(pathlib.Path.cwd()).as_posix()
+    except ValueError:
+        return file_path.resolve().as_uri()
@@ -0,0 +1,125 @@
+import enum
+import json
+import pathlib
+import sys
+from collections.abc import Iterator
+from typing import Annotated
+
+import rich.console
+import typer
+from rich.markup import escape
+
+from ..app import app, skip_version_check
+from .format_diagnostics import create_json_diagnostics, create_sarif_diagnostics
+from .validate_files import FileValidationResult, validate_files
+
+
+class DiagnosticsFormat(enum.StrEnum):
+    text = "text"
+    json = "json"
+    sarif = "sarif"
+
+
+@app.command(
+    name="validate",
+    help=(
+        "Validate YAML input files without rendering them. Example:"
+        " [yellow]teklinicv validate cvs/*.yaml --format sarif[/yellow]. Details:"
+        " [cyan]teklinicv validate --help[/cyan]"
+    ),
+)
+def cli_command_validate(
+    input_file_paths: Annotated[
+        list[pathlib.Path], typer.Argument(help="The YAML input files.")
+    ],
+    diagnostics_format: Annotated[
+        DiagnosticsFormat,
+        typer.Option("--format", "-f", help="Output format of the diagnostics."),
+    ] = DiagnosticsFormat.text,
+    output_file_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Write the diagnostics to this file instead of standard output.",
+        ),
+    ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Number of files validated in parallel. Defaults to the CPU count.",
+        ),
+    ] = None,
+):
+    if diagnostics_format != DiagnosticsFormat.text and output_file_path is None:
+        skip_version_check()
+
+    results = validate_files(input_file_paths, jobs)
+
+    if diagnostics_format == DiagnosticsFormat.text:
+        if output_file_path is None:
+            print_text_diagnostics(results)
+        else:
+            output_file_path.write_text(
+                "".join(f"{line}\n" for line in iterate_text_diagnostics(results)),
+                encoding="utf-8",
+            )
+    else:
+        diagnostics = (
+            create_json_diagnostics(results)
+            if diagnostics_format == DiagnosticsFormat.json
+            else create_sarif_diagnostics(results)
+        )
+        contents = json.dumps(diagnostics, indent=2) + "\n"
+        if output_file_path is None:
+            sys.stdout.write(contents)
+        else:
+            output_file_path.write_text(contents, encoding="utf-8")
+
+    if not all(result.is_valid for result in results):
+        raise typer.Exit(code=1)
+
+
+def iterate_text_diagnostics(results: list[FileValidationResult]) -> Iterator[str]:
+    """Yield one line per error, in the `file:line:column: message` form of compilers.
+
+    Args:
+        results: Results of validated files.
+
+    Returns:
+        Iterator of lines, ending with a summary.
+    """
+    for result in results:
+        for error in result.errors:
+            position = ""
+            if error.yaml_location is not None:
+                line, column = error.yaml_location[0]
+                position = f":{line}:{column}"
+            location = f"{'.'.join(error.location)}: " if error.location else ""
+            yield f"{result.path}{position}: {location}{error.message}"
+
+    invalid_count = sum(not result.is_valid for result in results)
+    total_ms = sum(result.duration_ms for result in results)
+    yield (
+        f"{len(results) - invalid_count} valid, {invalid_count} invalid"
+        f" ({len(results)} files, {total_ms:.0f} ms of validation)"
+    )
+
+
+def print_text_diagnostics(results: list[FileValidationResult]) -> None:
+    """Print the text diagnostics, highlighting file names and the summary.
+
+    Args:
+        results: Results of validated files.
+    """
+    # Long lines aren't wrapped, so each error stays on one line for editors and CI:
+    console = rich.console.Console(soft_wrap=True)
+    *error_lines, summary = iterate_text_diagnostics(results)
+    for line in error_lines:
+        file_position, _, message = line.partition(": ")
+        console.print(f"[purple]{escape(file_position)}[/purple]: {escape(message)}")
+    color = "red" if error_lines else "green"
+    console.print(f"[{color}]{escape(summary)}[/{color}]")
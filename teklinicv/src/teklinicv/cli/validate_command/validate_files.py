@@ -0,0 +1,130 @@
+import concurrent.futures
+import multiprocessing
+import os
+import pathlib
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import ruamel.yaml
+
+from teklinicv.exception import (
+    TekliniCVUserError,
+    TekliniCVUserValidationError,
+    TekliniCVValidationError,
+)
+from teklinicv.schema.teklinicv_model_builder import (
+    build_teklinicv_dictionary_and_model,
+)
+
+
+@dataclass
+class FileValidationResult:
+    path: pathlib.Path
+    duration_ms: float
+    errors: list[TekliniCVValidationError] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+def validate_file(file_path: pathlib.Path) -> FileValidationResult:
+    """Validate an input file without rendering it.
+
+    Why:
+        CI only needs to know whether inputs are valid. Stopping after the
+        model is built skips templates and Typst. Errors that stop validation
+        early (invalid YAML, missing files) are reported like validation errors
+        so every file yields the same kind of result.
+
+    Args:
+        file_path: YAML input file.
+
+    Returns:
+        Validation errors and how long validation took.
+    """
+    errors: list[TekliniCVValidationError] = []
+    start = time.perf_counter()
+    try:
+        build_teklinicv_dictionary_and_model(file_path)
+    except TekliniCVUserValidationError as e:
+        errors = e.validation_errors
+    except TekliniCVUserError as e:
+        errors = [create_file_error(e.message or "An unknown error occurred.")]
+    except ruamel.yaml.YAMLError as e:
+        yaml_location = None
+        problem_mark = getattr(e, "problem_mark", None)
+        if problem_mark is not None:
+            line, column = problem_mark.line + 1, problem_mark.column + 1
+            yaml_location = ((line, column), (line, column))
+        errors = [
+            create_file_error(
+                f"This is not a valid YAML file! {getattr(e, 'problem', None) or e}",
+                yaml_location,
+            )
+        ]
+    except OSError as e:
+        errors = [create_file_error(f"OS Error: {e}")]
+    duration_ms = (time.perf_counter() - start) * 1000
+
+    return FileValidationResult(file_path, duration_ms, errors)
+
+
+def create_file_error(
+    message: str,
+    yaml_location: tuple[tuple[int, int], tuple[int, int]] | None = None,
+) -> TekliniCVValidationError:
+    """Create a validation error that applies to the file as a whole.
+
+    Args:
+        message: Error message.
+        yaml_location: Coordinates of the problem, if known.
+
+    Returns:
+        Validation error without a location in the model.
+    """
+    return TekliniCVValidationError(
+        location=(), yaml_location=yaml_location, message=message, input=""
+    )
+
+
+def validate_files(
+    file_paths: Sequence[pathlib.Path], jobs: int | None = None
+) -> list[FileValidationResult]:
+    """Validate input files in parallel across processes.
+
+    Why:
+        Validation is CPU-bound Python, so threads don't help. Files are
+        handed to worker processes in chunks to keep the per-file overhead low
+        when checking thousands of files. Workers are spawned rather than
+        forked, like Typst workers, and import only the schema.
+
+    Example:
+        ```py
+        results = validate_files([pathlib.Path("John_Doe_CV.yaml")], jobs=4)
+        # results[0].is_valid == True
+        ```
+
+    Args:
+        file_paths: YAML input files.
+        jobs: Number of worker processes. Defaults to the number of CPUs. With
+            one job or one file, validation runs in this process.
+
+    Returns:
+        Results in the order of `file_paths`.
+    """
+    jobs = min(jobs or os.cpu_count() or 1, len(file_paths))
+    if jobs <= 1:
+        return [validate_file(file_path) for file_path in file_paths]
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(
+            executor.map(
+                validate_file,
+                file_paths,
+                chunksize=max(1, len(file_paths) // (jobs * 4)),
+            )
+        )
@@ -0,0 +1,66 @@
+import pathlib
+import time
+from typing import Annotated
+
+import typer
+
+from ..app import app
+from ..error_handler import handle_user_errors
+from ..render_command.render_command import create_progress_reporter
+
+
+@app.command(
+    name="warmup",
+    help=(
+        "Populate TekliniCV's caches ahead of time, e.g., while building container"
+        " images. Example: [yellow]teklinicv warmup[/yellow]. Details:"
+        " [cyan]teklinicv warmup --help[/cyan]"
+    ),
+)
+@handle_user_errors
+def cli_command_warmup(
+    theme_folders: Annotated[
+        list[pathlib.Path] | None,
+        typer.Argument(help="Custom theme folders to warm up as well."),
+    ] = None,
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="If provided, TekliniCV will only print errors.",
+        ),
+    ] = False,
+):
+    # Imported here so other commands, such as `validate`, start without the renderer:
+    from teklinicv.renderer.cache_warmup import (  # NOQA: PLC0415
+        check_theme_folder,
+        warm_font_index,
+        warm_jinja_templates,
+        warm_python_bytecode,
+        warm_typst_package,
+    )
+
+    from ..render_command.run_teklinicv import catch_render_errors  # NOQA: PLC0415
+
+    theme_folders = [theme_folder.absolute() for theme_folder in theme_folders or []]
+    with create_progress_reporter(quiet) as progress, catch_render_errors(progress):
+        for theme_folder in theme_folders:
+            check_theme_folder(theme_folder)
+
+        # The Typst package comes last, since it may need the network:
+        for warm_cache in (
+            lambda: warm_python_bytecode(theme_folders),
+            lambda: warm_jinja_templates(theme_folders),
+            lambda: warm_font_index(theme_folders),
+            warm_typst_package,
+        ):
+            start = time.perf_counter()
+            warmed_cache = warm_cache()
+            end = time.perf_counter()
+            progress.update_progress(
+                time_took=f"{(end - start) * 1000:.0f}",
+                message=warmed_cache.summary,
+                paths=[warmed_cache.path],
+            )
+        progress.finish_progress(title="TekliniCV's caches are warm")
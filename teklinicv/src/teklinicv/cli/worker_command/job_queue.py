@@ -0,0 +1,387 @@
+import contextlib
+import enum
+import json
+import pathlib
+import sqlite3
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+from teklinicv.exception import TekliniCVUserError
+
+job_path_fields = ("input", "design", "locale", "settings", "output_directory")
+
+create_jobs_table = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempt_count INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL,
+    result TEXT,
+    error TEXT
+)
+"""
+
+
+class JobStatus(enum.StrEnum):
+    queued = "queued"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+
+@dataclass
+class RenderJob:
+    """A render of one input file, as listed in a manifest line.
+
+    Args:
+        input: YAML input file.
+        design: The "design" field's YAML input file.
+        locale: The "locale" field's YAML input file.
+        settings: The "settings" field's YAML input file.
+        overrides: Values to override, by dotted location, as with `render`.
+        output_directory: Folder to write the outputs to, instead of the folder
+            the settings point to.
+    """
+
+    input: pathlib.Path
+    design: pathlib.Path | None = None
+    locale: pathlib.Path | None = None
+    settings: pathlib.Path | None = None
+    overrides: dict[str, str] = field(default_factory=dict)
+    output_directory: pathlib.Path | None = None
+
+    @classmethod
+    def from_dictionary(
+        cls, dictionary: dict[str, Any], relative_to: pathlib.Path
+    ) -> Self:
+        """Create a job from a manifest line.
+
+        Args:
+            dictionary: Parsed manifest line.
+            relative_to: Folder relative paths are resolved against.
+
+        Returns:
+            Job with absolute paths, so any worker can run it.
+        """
+        unknown_keys = set(dictionary) - {*job_path_fields, "overrides"}
+        if unknown_keys:
+            message = f"Unknown keys: {', '.join(sorted(unknown_keys))}"
+            raise TekliniCVUserError(message)
+        if not isinstance(dictionary.get("input"), str):
+            message = 'The "input" key should be the path of a YAML input file.'
+            raise TekliniCVUserError(message)
+        overrides = dictionary.get("overrides") or {}
+        if not isinstance(overrides, dict):
+            message = 'The "overrides" key should map locations to values.'
+            raise TekliniCVUserError(message)
+
+        paths = {
+            key: (relative_to / dictionary[key]).absolute()
+            for key in job_path_fields
+            if dictionary.get(key) is not None
+        }
+        return cls(
+            **paths,
+            overrides={str(key): str(value) for key, value in overrides.items()},
+        )
+
+    def to_dictionary(self) -> dict[str, Any]:
+        dictionary: dict[str, Any] = {
+            key: str(getattr(self, key))
+            for key in job_path_fields
+            if getattr(self, key) is not None
+        }
+        if self.overrides:
+            dictionary["overrides"] = self.overrides
+        return dictionary
+
+
+def read_manifest(manifest_path: pathlib.Path) -> list[RenderJob]:
+    """Read render jobs from a JSON Lines manifest.
+
+    Example:
+        ```py
+        # team.jsonl:
+        # {"input": "John_Doe_CV.yaml", "output_directory": "out/john"}
+        # {"input": "Jane_Doe_CV.yaml", "design": "compact.yaml"}
+        read_manifest(pathlib.Path("team.jsonl"))
+        ```
+
+    Args:
+        manifest_path: Manifest with a JSON object per line. Relative paths are
+            relative to the manifest.
+
+    Returns:
+        Jobs in manifest order.
+    """
+    if not manifest_path.is_file():
+        message = f"The manifest {manifest_path} doesn't exist!"
+        raise TekliniCVUserError(message)
+
+    jobs = []
+    lines = manifest_path.read_text(encoding="utf-8").splitlines()
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            dictionary = json.loads(line)
+            if not isinstance(dictionary, dict):
+                message = "Each line should be a JSON object."
+                raise TekliniCVUserError(message)
+            jobs.append(
+                RenderJob.from_dictionary(dictionary, manifest_path.parent.absolute())
+            )
+        except (ValueError, TekliniCVUserError) as e:
+            reason = e.message if isinstance(e, TekliniCVUserError) else str(e)
+            message = f"Line {line_number} of {manifest_path} is invalid: {reason}"
+            raise TekliniCVUserError(message) from e
+    return jobs
+
+
+@dataclass
+class ClaimedJob:
+    id: int
+    job: RenderJob
+    attempt: int
+
+
+@dataclass
+class JobRecord:
+    id: int
+    job: RenderJob
+    status: JobStatus
+    attempt_count: int
+    worker_id: str | None
+    result: dict[str, Any] | None
+    error: str | None
+
+
+class JobQueue:
+    """Render jobs shared by workers through a SQLite database.
+
+    Why:
+        Batches bigger than one machine need workers on several nodes that
+        never render the same job at once. A SQLite file on a shared
+        filesystem needs no server: jobs are claimed in write transactions, so
+        each claim is atomic. A claim is a lease that the worker renews while
+        rendering. If a worker crashes, its lease expires and the job is
+        claimed again, up to the job's maximum number of attempts.
+
+    Example:
+        ```py
+        with JobQueue(pathlib.Path("jobs.sqlite")) as job_queue:
+            job_queue.enqueue(read_manifest(pathlib.Path("team.jsonl")))
+            claimed_job = job_queue.claim("node-1", lease_seconds=300)
+        ```
+
+    Args:
+        database_path: SQLite database, created if it doesn't exist.
+    """
+
+    def __init__(self, database_path: pathlib.Path):
+        self.database_path = database_path
+        # Transactions are started explicitly, and writers wait for each other:
+        self.connection = sqlite3.connect(
+            database_path, timeout=60, isolation_level=None
+        )
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute(create_jobs_table)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in a write transaction, which locks out other writers."""
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.connection
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def enqueue(self, jobs: Sequence[RenderJob], max_attempts: int = 3) -> list[int]:
+        """Add jobs to the queue.
+
+        Args:
+            jobs: Jobs to add.
+            max_attempts: How many times a job is claimed before it fails, if
+                its workers keep crashing.
+
+        Returns:
+            IDs of the jobs.
+        """
+        now = time.time()
+        with self.transaction() as connection:
+            return [
+                connection.execute(
+                    "INSERT INTO jobs (job, status, max_attempts, enqueued_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (
+                        json.dumps(job.to_dictionary()),
+                        JobStatus.queued,
+                        max_attempts,
+                        now,
+                    ),
+                ).lastrowid
+                or 0
+                for job in jobs
+            ]
+
+    def expire_leases(self, connection: sqlite3.Connection, now: float) -> None:
+        """Fail jobs whose last allowed lease expired, and requeue the others."""
+        connection.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?,"
+            " error = 'Workers stopped before finishing the job ' || attempt_count"
+            " || CASE attempt_count WHEN 1 THEN ' time.' ELSE ' times.' END"
+            " WHERE status = ? AND lease_expires_at < ?"
+            " AND attempt_count >= max_attempts",
+            (JobStatus.failed, now, JobStatus.running, now),
+        )
+        connection.execute(
+            "UPDATE jobs SET status = ?, worker_id = NULL, lease_expires_at = NULL"
+            " WHERE status = ? AND lease_expires_at < ?",
+            (JobStatus.queued, JobStatus.running, now),
+        )
+
+    def claim(self, worker_id: str, lease_seconds: float) -> ClaimedJob | None:
+        """Take the oldest queued job, or one whose worker's lease expired.
+
+        Args:
+            worker_id: Name of the claiming worker.
+            lease_seconds: How long the job is reserved for the worker unless
+                renewed.
+
+        Returns:
+            Claimed job, or None if no job is waiting.
+        """
+        now = time.time()
+        with self.transaction() as connection:
+            self.expire_leases(connection, now)
+            row = connection.execute(
+                "SELECT id, job, attempt_count FROM jobs WHERE status = ?"
+                " ORDER BY id LIMIT 1",
+                (JobStatus.queued,),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE jobs SET status = ?, worker_id = ?, lease_expires_at = ?,"
+                " attempt_count = attempt_count + 1 WHERE id = ?",
+                (JobStatus.running, worker_id, now + lease_seconds, row["id"]),
+            )
+        return ClaimedJob(
+            id=row["id"],
+            job=RenderJob.from_dictionary(json.loads(row["job"]), pathlib.Path("/")),
+            attempt=row["attempt_count"] + 1,
+        )
+
+    def renew_lease(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a worker's lease on a job.
+
+        Returns:
+            False if the job is no longer the worker's, e.g., because its lease
+            expired and another worker claimed it.
+        """
+        with self.transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET lease_expires_at = ?"
+                " WHERE id = ? AND worker_id = ? AND status = ?",
+                (time.time() + lease_seconds, job_id, worker_id, JobStatus.running),
+            )
+        return cursor.rowcount == 1
+
+    def finish(
+        self,
+        job_id: int,
+        worker_id: str,
+        result: dict[str, Any] | None,
+        error: str | None = None,
+    ) -> bool:
+        """Record the outcome of a job.
+
+        Args:
+            job_id: Finished job.
+            worker_id: Worker that ran it.
+            result: Render report of the job.
+            error: Why the render failed, if it did.
+
+        Returns:
+            False if the job is no longer the worker's, in which case the
+            outcome isn't recorded.
+        """
+        with self.transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, result = ?, error = ?,"
+                " lease_expires_at = NULL WHERE id = ? AND worker_id = ? AND status = ?",
+                (
+                    JobStatus.failed if error else JobStatus.done,
+                    time.time(),
+                    json.dumps(result) if result is not None else None,
+                    error,
+                    job_id,
+                    worker_id,
+                    JobStatus.running,
+                ),
+            )
+        return cursor.rowcount == 1
+
+    def count_jobs(self) -> dict[JobStatus, int]:
+        """Count the jobs in each status, after expiring leases.
+
+        Returns:
+            Number of jobs by status.
+        """
+        with self.transaction() as connection:
+            self.expire_leases(connection, time.time())
+            rows = connection.execute(
+                "SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"
+            ).fetchall()
+        counts = dict.fromkeys(JobStatus, 0)
+        for row in rows:
+            counts[JobStatus(row["status"])] = row["count"]
+        return counts
+
+    def get_jobs(self, status: JobStatus | None = None) -> list[JobRecord]:
+        """Return the jobs in the queue, optionally only those with a status.
+
+        Args:
+            status: Status to filter by.
+
+        Returns:
+            Jobs in enqueueing order.
+        """
+        query = "SELECT * FROM jobs"
+        parameters: tuple[str, ...] = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            parameters = (status,)
+        rows = self.connection.execute(query + " ORDER BY id", parameters).fetchall()
+        return [
+            JobRecord(
+                id=row["id"],
+                job=RenderJob.from_dictionary(
+                    json.loads(row["job"]), pathlib.Path("/")
+                ),
+                status=JobStatus(row["status"]),
+                attempt_count=row["attempt_count"],
+                worker_id=row["worker_id"],
+                result=json.loads(row["result"]) if row["result"] else None,
+                error=row["error"],
+            )
+            for row in rows
+        ]
@@ -0,0 +1,188 @@
+import contextlib
+import os
+import pathlib
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from teklinicv.exception import TekliniCVUserError, TekliniCVValidationError
+from teklinicv.render_report import RenderReport
+from teklinicv.schema.teklinicv_model_builder import BuildTeklinicvModelArguments
+
+from ..render_command.progress_reporter import ProgressReporter
+from ..render_command.run_teklinicv import run_teklinicv
+from .job_queue import ClaimedJob, JobQueue, RenderJob
+
+
+class JobErrorRecorder(ProgressReporter):
+    """Keep the errors of a render instead of ending the command.
+
+    Why:
+        A worker renders many jobs in one process, and a job with an invalid
+        input must fail on its own without stopping the worker.
+    """
+
+    def __init__(self):
+        self.errors: list[str] = []
+
+    def print_user_error(self, user_error: TekliniCVUserError) -> None:
+        self.errors.append(user_error.message or "An unknown error occurred.")
+
+    def print_validation_errors(self, errors: list[TekliniCVValidationError]) -> None:
+        self.errors.append(
+            "; ".join(
+                f"{'.'.join(error.location)}: {error.message}" for error in errors
+            )
+        )
+
+
+def get_default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def get_render_arguments(job: RenderJob) -> BuildTeklinicvModelArguments:
+    """Turn a job into the arguments of `run_teklinicv`.
+
+    Args:
+        job: Job to render.
+
+    Returns:
+        Overlays and overrides, and output paths in the job's output directory if
+        it has one.
+    """
+    arguments: BuildTeklinicvModelArguments = {
+        "design_file_path_or_contents": job.design,
+        "locale_file_path_or_contents": job.locale,
+        "settings_file_path_or_contents": job.settings,
+        "overrides": job.overrides,
+    }
+    if job.output_directory is not None:
+        output_path = job.output_directory / "NAME_IN_SNAKE_CASE_CV"
+        arguments["typst_path"] = output_path.with_suffix(".typ")
+        arguments["pdf_path"] = output_path.with_suffix(".pdf")
+        arguments["markdown_path"] = output_path.with_suffix(".md")
+        arguments["html_path"] = output_path.with_suffix(".html")
+        arguments["png_path"] = output_path.with_suffix(".png")
+    return arguments
+
+
+@contextlib.contextmanager
+def renew_lease_in_background(
+    database_path: pathlib.Path, job_id: int, worker_id: str, lease_seconds: float
+) -> Iterator[None]:
+    """Renew the lease on a job every third of the lease while the block runs.
+
+    Why:
+        Leases must be short so that crashed workers' jobs are retried soon, but
+        a large CV can take longer than a lease to render. Renewing from a
+        thread with its own connection keeps the lease alive while the render
+        holds the main thread.
+
+    Args:
+        database_path: Queue database.
+        job_id: Job being rendered.
+        worker_id: Worker rendering it.
+        lease_seconds: Length of the lease.
+
+    Returns:
+        Context manager that renews the lease until the block ends.
+    """
+    stopped = threading.Event()
+
+    def renew() -> None:
+        with JobQueue(database_path) as job_queue:
+            while not stopped.wait(lease_seconds / 3):
+                if not job_queue.renew_lease(job_id, worker_id, lease_seconds):
+                    return
+
+    thread = threading.Thread(target=renew, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
+
+
+def run_job(claimed_job: ClaimedJob) -> tuple[dict[str, Any], str | None]:
+    """Render a claimed job.
+
+    Args:
+        claimed_job: Job to render.
+
+    Returns:
+        Render report of the job, and the error if it failed.
+    """
+    job = claimed_job.job
+    recorder = JobErrorRecorder()
+    report = RenderReport(job.input, trace_memory=False)
+    try:
+        run_teklinicv(job.input, recorder, report=report, **get_render_arguments(job))
+    except Exception as e:  # NOQA: BLE001
+        # Unexpected errors fail the job instead of the worker:
+        report.error = report.error or f"{type(e).__name__}: {e}"
+        recorder.errors.append(report.error)
+    error = "\n".join(recorder.errors) if recorder.errors else report.error
+    return report.to_dictionary(), error
+
+
+def run_worker(
+    database_path: pathlib.Path,
+    progress: ProgressReporter,
+    worker_id: str,
+    lease_seconds: float = 300,
+    poll_seconds: float = 1,
+    exit_when_empty: bool = False,
+) -> int:
+    """Render jobs from a queue until it is empty or the worker is stopped.
+
+    Why:
+        Nightly batches outgrow one machine. Workers on any number of nodes
+        share a queue database on a common filesystem, claim one job at a time,
+        and write each job's report and status back to the queue, so the
+        enqueuing side can follow the batch.
+
+    Example:
+        ```py
+        with LineProgressReporter() as progress:
+            run_worker(pathlib.Path("jobs.sqlite"), progress, "node-1")
+        ```
+
+    Args:
+        database_path: Queue database.
+        progress: Progress reporter to log or count each finished job with.
+        worker_id: Name of the worker in the queue.
+        lease_seconds: How long a job stays claimed without lease renewal.
+        poll_seconds: How long to wait before checking an empty queue again.
+        exit_when_empty: Return once no job is waiting instead of polling.
+
+    Returns:
+        Number of jobs the worker finished.
+    """
+    finished_count = 0
+    with JobQueue(database_path) as job_queue:
+        while True:
+            claimed_job = job_queue.claim(worker_id, lease_seconds)
+            if claimed_job is None:
+                if exit_when_empty:
+                    return finished_count
+                time.sleep(poll_seconds)
+                continue
+
+            start = time.perf_counter()
+            with renew_lease_in_background(
+                database_path, claimed_job.id, worker_id, lease_seconds
+            ):
+                result, error = run_job(claimed_job)
+            time_took = f"{(time.perf_counter() - start) * 1000:.0f}"
+            if not job_queue.finish(claimed_job.id, worker_id, result, error):
+                message = f"Job {claimed_job.id} was taken over after its lease expired"
+            elif error:
+                message = f"Job {claimed_job.id} failed: {error.splitlines()[0]}"
+            else:
+                message = f"Job {claimed_job.id} finished"
+            finished_count += 1
+            progress.update_progress(time_took, message, [claimed_job.job.input])
+            progress.count_render(error)
@@ -0,0 +1,106 @@
+import pathlib
+from typing import Annotated
+
+import rich.console
+import typer
+
+from ..app import app
+from ..error_handler import handle_user_errors
+from ..render_command.progress_reporter import (
+    BatchProgressReporter,
+    LineProgressReporter,
+    ProgressReporter,
+)
+
+
+@app.command(
+    name="worker",
+    help=(
+        "Render jobs from a shared queue, e.g., on each node of a large batch."
+        " Example: [yellow]teklinicv worker --queue /shared/jobs.sqlite[/yellow]."
+        " Details: [cyan]teklinicv worker --help[/cyan]"
+    ),
+)
+@handle_user_errors
+def cli_command_worker(
+    queue: Annotated[
+        pathlib.Path,
+        typer.Option(
+            "--queue",
+            "-Q",
+            help="The queue database, as given to `teklinicv enqueue`.",
+        ),
+    ] = pathlib.Path("teklinicv_jobs.sqlite"),
+    lease_seconds: Annotated[
+        float,
+        typer.Option(
+            "--lease-seconds",
+            "-ls",
+            min=1,
+            help=(
+                "Seconds a job stays claimed if the worker stops renewing it, e.g.,"
+                " because it crashed. The job is retried after that."
+            ),
+        ),
+    ] = 300,
+    poll_seconds: Annotated[
+        float,
+        typer.Option(
+            "--poll-seconds",
+            "-ps",
+            min=0,
+            help="Seconds to wait before checking an empty queue again.",
+        ),
+    ] = 1,
+    exit_when_empty: Annotated[
+        bool,
+        typer.Option(
+            "--exit-when-empty",
+            "-x",
+            help="If provided, the worker stops once no job is waiting.",
+        ),
+    ] = False,
+    worker_id: Annotated[
+        str | None,
+        typer.Option(
+            "--worker-id",
+            "-id",
+            help="Name of the worker in the queue. Defaults to HOSTNAME-PID.",
+        ),
+    ] = None,
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="If provided, TekliniCV will not print any messages.",
+        ),
+    ] = False,
+):
+    # Imported here so other commands, such as `validate`, start without the renderer:
+    from .run_worker import get_default_worker_id, run_worker  # NOQA: PLC0415
+
+    # A worker runs for long. In a terminal, it keeps one live line with the job
+    # counts and rate; in logs, it writes one line per job instead:
+    console = rich.console.Console()
+    progress: ProgressReporter
+    if quiet:
+        progress = ProgressReporter()
+    elif console.is_terminal:
+        progress = BatchProgressReporter(console=console)
+    else:
+        progress = LineProgressReporter(console.file)
+
+    with progress:
+        finished_count = run_worker(
+            queue,
+            progress,
+            worker_id or get_default_worker_id(),
+            lease_seconds=lease_seconds,
+            poll_seconds=poll_seconds,
+            exit_when_empty=exit_when_empty,
+        )
+    if not quiet:
+        typer.echo(
+            f"Finished {finished_count} job{'s' if finished_count != 1 else ''}."
+        )
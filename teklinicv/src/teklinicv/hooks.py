@@ -0,0 +1,206 @@
+import contextlib
+import contextvars
+import enum
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from teklinicv.caches import ThreadLocalCache, count_thread_misses
+
+no_stage = contextlib.nullcontext()
+
+
+class HookEvent(enum.StrEnum):
+    """Render lifecycle events that callbacks can be registered for.
+
+    Callbacks are called with keyword arguments:
+
+    - `stage_start`: `stage` (str)
+    - `stage_end`: `stage` (str), `duration_seconds` (float), `failed` (bool)
+    - `error`: `stage` (str), `error` (BaseException)
+    - `cache_hit` and `cache_miss`: `cache` (str)
+    - `output_written`: `path` (pathlib.Path), `unchanged` (bool)
+    """
+
+    stage_start = "stage_start"
+    stage_end = "stage_end"
+    error = "error"
+    cache_hit = "cache_hit"
+    cache_miss = "cache_miss"
+    output_written = "output_written"
+
+
+registered_hooks: dict[HookEvent, tuple[Callable[..., None], ...]] = dict.fromkeys(
+    HookEvent, ()
+)
+registration_lock = threading.Lock()
+last_emitted_error: contextvars.ContextVar[BaseException | None] = (
+    contextvars.ContextVar("last_emitted_error", default=None)
+)
+
+
+def register_hook(
+    event: HookEvent, callback: Callable[..., None]
+) -> Callable[..., None]:
+    """Call a function whenever a render lifecycle event happens.
+
+    Why:
+        Monitoring needs stage latencies, cache hit rates, and failure counts
+        without scraping the progress panel. The CLI, the schema builder, and
+        the renderer emit events that any metrics backend can subscribe to.
+        Callbacks run synchronously in the rendering thread, so they should be
+        quick, and exceptions they raise fail the render.
+
+    Example:
+        ```py
+        def export_latency(stage, duration_seconds, failed):
+            histogram.labels(stage=stage).observe(duration_seconds)
+
+
+        register_hook(HookEvent.stage_end, export_latency)
+        ```
+
+    Args:
+        event: Event to subscribe to.
+        callback: Function called with the event's keyword arguments.
+
+    Returns:
+        The registered callback.
+    """
+    with registration_lock:
+        registered_hooks[event] = (*registered_hooks[event], callback)
+    return callback
+
+
+def unregister_hook(event: HookEvent, callback: Callable[..., None]) -> None:
+    """Stop calling a function registered with `register_hook`.
+
+    Args:
+        event: Event the callback was registered for.
+        callback: Registered callback. Unknown callbacks are ignored.
+    """
+    with registration_lock:
+        registered_hooks[event] = tuple(
+            registered_callback
+            for registered_callback in registered_hooks[event]
+            if registered_callback is not callback
+        )
+
+
+def emit_hook(event: HookEvent, **arguments: Any) -> None:
+    """Call the callbacks registered for an event.
+
+    Args:
+        event: Event that happened.
+        arguments: Keyword arguments of the event.
+    """
+    for callback in registered_hooks[event]:
+        callback(**arguments)
+
+
+@contextlib.contextmanager
+def emit_stage_hooks(stage: str) -> Iterator[None]:
+    """Emit the start and end of a stage around the block, and its error if any.
+
+    Why:
+        Listeners need the duration and outcome of every stage, including
+        failed ones. Stages nest, so an error raised in an inner stage passes
+        through the outer ones too; it is reported only once, for the innermost
+        stage where it happened.
+
+    Args:
+        stage: Stage name.
+
+    Returns:
+        Context manager that emits the stage's events.
+    """
+    start = time.perf_counter()
+    emit_hook(HookEvent.stage_start, stage=stage)
+    failed = False
+    try:
+        yield
+    except BaseException as e:
+        failed = True
+        # Stages nest, so only the innermost one reports the error:
+        if last_emitted_error.get() is not e:
+            last_emitted_error.set(e)
+            emit_hook(HookEvent.error, stage=stage, error=e)
+        raise
+    finally:
+        emit_hook(
+            HookEvent.stage_end,
+            stage=stage,
+            duration_seconds=time.perf_counter() - start,
+            failed=failed,
+        )
+
+
+def hook_stage(stage: str) -> contextlib.AbstractContextManager[None]:
+    """Emit stage start, end, and error events for the block.
+
+    Why:
+        Stages run on every render, so they must cost next to nothing when no
+        one listens. Without stage callbacks, a shared no-op context manager
+        is returned.
+
+    Example:
+        ```py
+        with hook_stage("Validate"):
+            model = build_teklinicv_model_from_commented_map(dictionary)
+        ```
+
+    Args:
+        stage: Stage name.
+
+    Returns:
+        Context manager for the block.
+    """
+    if not (
+        registered_hooks[HookEvent.stage_start]
+        or registered_hooks[HookEvent.stage_end]
+        or registered_hooks[HookEvent.error]
+    ):
+        return no_stage
+    return emit_stage_hooks(stage)
+
+
+def emit_cache_hook(cache: str, hit: bool) -> None:
+    """Emit a cache hit or miss event.
+
+    Args:
+        cache: Cache name.
+        hit: Whether the cache had the value.
+    """
+    emit_hook(HookEvent.cache_hit if hit else HookEvent.cache_miss, cache=cache)
+
+
+def call_cached[T](
+    cache: str,
+    function: "functools._lru_cache_wrapper[T] | ThreadLocalCache[T]",
+    *args: Any,
+) -> T:
+    """Call a cached function, emitting whether the cache had the result.
+
+    Why:
+        The calling thread's miss count tells a miss apart from a hit even when
+        other threads call the same cache at the same time.
+
+    Args:
+        cache: Cache name.
+        function: Function decorated with `bounded_cache` or
+            `bounded_thread_local_cache`.
+        args: Arguments for the function.
+
+    Returns:
+        Function result.
+    """
+    if not (
+        registered_hooks[HookEvent.cache_hit] or registered_hooks[HookEvent.cache_miss]
+    ):
+        return function(*args)
+    misses = count_thread_misses(function)
+    result = function(*args)
+    emit_cache_hook(cache, count_thread_misses(function) == misses)
+    return result
@@ -0,0 +1,178 @@
+import contextlib
+import contextvars
+import cProfile
+import json
+import os
+import pathlib
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+active_profiler: contextvars.ContextVar["Profiler | None"] = contextvars.ContextVar(
+    "active_profiler", default=None
+)
+no_span = contextlib.nullcontext()
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    arguments: dict[str, Any] = field(default_factory=dict)
+
+
+class Profiler:
+    """Record nested spans of a render, and optionally a cProfile capture.
+
+    Why:
+        Step timings in the progress panel can't tell whether a slow render is
+        spent in validation, a specific section's templates, Markdown parsing, or
+        Typst. Spans are recorded for stages, sections, and templates and written
+        as a Chrome trace, which Perfetto (https://ui.perfetto.dev) and
+        `chrome://tracing` show as a timeline. The optional cProfile capture is
+        written as a pstats file for `snakeviz` or `python -m pstats`.
+
+    Example:
+        ```py
+        with Profiler(pathlib.Path("John_Doe_CV_profile"), capture_python=True):
+            run_teklinicv(pathlib.Path("John_Doe_CV.yaml"), progress)
+        # Writes John_Doe_CV_profile.json and John_Doe_CV_profile.pstats
+        ```
+
+    Args:
+        output_path: Path of the profile files without their suffixes.
+        capture_python: Also run cProfile while the profiler is active.
+    """
+
+    def __init__(self, output_path: pathlib.Path, capture_python: bool = False):
+        self.output_path = output_path
+        self.spans: list[Span] = []
+        self.python_profile = cProfile.Profile() if capture_python else None
+        self.token: contextvars.Token | None = None
+
+    def __enter__(self) -> Self:
+        self.token = active_profiler.set(self)
+        if self.python_profile is not None:
+            self.python_profile.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self.python_profile is not None:
+            self.python_profile.disable()
+        if self.token is not None:
+            active_profiler.reset(self.token)
+            self.token = None
+
+    @contextlib.contextmanager
+    def span(
+        self, name: str, category: str, arguments: dict[str, Any]
+    ) -> Iterator[None]:
+        """Record the time the block takes as a span.
+
+        Args:
+            name: Span name.
+            category: Kind of span, such as "step" or "template".
+            arguments: Details shown with the span in trace viewers.
+
+        Returns:
+            Context manager that records the span when the block ends.
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.spans.append(
+                Span(
+                    name,
+                    category,
+                    start_ns,
+                    time.perf_counter_ns() - start_ns,
+                    threading.get_ident(),
+                    arguments,
+                )
+            )
+
+    def write_chrome_trace(self, file_path: pathlib.Path) -> pathlib.Path:
+        """Write the spans in the Chrome trace event format.
+
+        Args:
+            file_path: JSON file to write.
+
+        Returns:
+            Written file path.
+        """
+        process_id = os.getpid()
+        origin_ns = min((span.start_ns for span in self.spans), default=0)
+        trace_events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",  # Complete event, with a start and a duration
+                "ts": (span.start_ns - origin_ns) / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": process_id,
+                "tid": span.thread_id,
+                "args": span.arguments,
+            }
+            for span in self.spans
+        ]
+        file_path.write_text(
+            json.dumps(
+                {"traceEvents": trace_events, "displayTimeUnit": "ms"}, default=str
+            ),
+            encoding="utf-8",
+        )
+        return file_path
+
+    def write_files(self) -> list[pathlib.Path]:
+        """Write the Chrome trace and, if captured, the pstats file.
+
+        Returns:
+            Written file paths.
+        """
+        paths = [
+            self.write_chrome_trace(
+                self.output_path.with_name(f"{self.output_path.name}.json")
+            )
+        ]
+        if self.python_profile is not None:
+            pstats_path = self.output_path.with_name(f"{self.output_path.name}.pstats")
+            # dump_stats stops the capture, so it doesn't include writing files:
+            self.python_profile.dump_stats(pstats_path)
+            paths.append(pstats_path)
+        return paths
+
+
+def profile_span(
+    name: str, category: str, **arguments: Any
+) -> contextlib.AbstractContextManager[None]:
+    """Record the block as a span if a profiler is active.
+
+    Why:
+        Spans wrap every template render, so they must cost next to nothing
+        when profiling is off. Without an active profiler, a shared no-op
+        context manager is returned.
+
+    Example:
+        ```py
+        with profile_span("Header.j2.typ", "template"):
+            header = template.render(...)
+        ```
+
+    Args:
+        name: Span name.
+        category: Kind of span, such as "step" or "template".
+        arguments: Details shown with the span in trace viewers.
+
+    Returns:
+        Context manager for the block.
+    """
+    profiler = active_profiler.get()
+    if profiler is None:
+        return no_span
+    return profiler.span(name, category, arguments)
@@ -0,0 +1,87 @@
+import pathlib
+from dataclasses import dataclass
+from typing import Unpack
+
+from teklinicv.renderer.html import generate_html
+from teklinicv.renderer.markdown import generate_markdown, render_markdown
+from teklinicv.renderer.pdf_png import generate_pdf, generate_png
+from teklinicv.renderer.typst import generate_typst
+from teklinicv.schema.teklinicv_model_builder import (
+    BuildTeklinicvModelArguments,
+    build_teklinicv_dictionary_and_model,
+)
+
+
+@dataclass
+class RenderedCV:
+    """Files written by `render_cv`. Outputs that were turned off are None.
+
+    Args:
+        typst_path: Typst source file.
+        pdf_path: PDF file.
+        png_paths: PNG files, one per page.
+        markdown_path: Markdown file.
+        html_path: HTML file.
+    """
+
+    typst_path: pathlib.Path | None
+    pdf_path: pathlib.Path | None
+    png_paths: list[pathlib.Path] | None
+    markdown_path: pathlib.Path | None
+    html_path: pathlib.Path | None
+
+
+def render_cv(
+    main_input_file_path_or_contents: pathlib.Path | str,
+    **kwargs: Unpack[BuildTeklinicvModelArguments],
+) -> RenderedCV:
+    """Render a CV to all enabled outputs, safe to call from several threads at once.
+
+    Why:
+        Services render many CVs concurrently from a thread pool. Typst
+        releases the GIL while compiling, so threads render in parallel, but
+        only if nothing they share changes under them. Every resource a render
+        keeps state in is per thread (Markdown converters, YAML loaders, and
+        Typst compilers) or written atomically (outputs and placed photos), and
+        photos placed in the same folder are guarded by a lock for that folder
+        while they are compiled. Unlike `teklinicv render`, errors are raised
+        instead of printed.
+
+    Thread safety:
+        Concurrent calls are safe. Give each render its own output paths (for
+        example, with `pdf_path` or an output folder per CV): renders writing the
+        same output path don't corrupt it, but the last one to finish wins.
+        Hooks apply to every thread, so register them before starting the
+        threads. A `TypstWorkerPool` applies to the context that entered it, so
+        run the renders in copies of that context (e.g., submit
+        `contextvars.copy_context().run`) to share one pool.
+
+    Example:
+        ```py
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            rendered_cvs = list(
+                executor.map(
+                    lambda path: render_cv(path, pdf_path=f"out/{path.stem}.pdf"),
+                    input_file_paths,
+                )
+            )
+        ```
+
+    Args:
+        main_input_file_path_or_contents: YAML file path or raw content string.
+        kwargs: Optional overrides for design/locale files, output paths, and
+            generation flags.
+
+    Returns:
+        Paths of the written files.
+    """
+    _, teklinicv_model = build_teklinicv_dictionary_and_model(
+        main_input_file_path_or_contents, **kwargs
+    )
+    typst_path = generate_typst(teklinicv_model)
+    pdf_path = generate_pdf(teklinicv_model, typst_path)
+    png_paths = generate_png(teklinicv_model, typst_path)
+    markdown_contents = render_markdown(teklinicv_model)
+    markdown_path = generate_markdown(teklinicv_model, markdown_contents)
+    html_path = generate_html(teklinicv_model, markdown_path, markdown_contents)
+    return RenderedCV(typst_path, pdf_path, png_paths, markdown_path, html_path)
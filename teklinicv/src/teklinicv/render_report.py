@@ -0,0 +1,250 @@
+import contextlib
+import contextvars
+import functools
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC
+from datetime import datetime as DateTime
+from typing import Any, Self
+
+from teklinicv.schema.models.teklinicv_model import TekliniCVModel
+
+active_render_report: contextvars.ContextVar["RenderReport | None"] = (
+    contextvars.ContextVar("active_render_report", default=None)
+)
+
+
+@dataclass
+class OutputFileReport:
+    path: str
+    size_bytes: int
+    unchanged: bool
+
+
+@dataclass
+class StageReport:
+    name: str
+    duration_ms: float
+    peak_memory_bytes: int | None = None
+    outputs: list[OutputFileReport] = field(default_factory=list)
+
+    def add_outputs(
+        self, paths: list[pathlib.Path], unchanged_paths: list[pathlib.Path]
+    ) -> None:
+        """Add the files the stage produced.
+
+        Args:
+            paths: Produced files.
+            unchanged_paths: Files among `paths` that were left as they were.
+        """
+        self.outputs.extend(
+            OutputFileReport(
+                str(path),
+                path.stat().st_size if path.is_file() else 0,
+                path in unchanged_paths,
+            )
+            for path in paths
+        )
+
+
+@dataclass
+class CacheReport:
+    hits: int
+    misses: int
+
+
+def get_cache_infos() -> dict[str, functools._CacheInfo]:
+    """Return the statistics of the in-process caches a render goes through.
+
+    Returns:
+        Cache statistics by cache name.
+    """
+    # Imported here because the renderer records page counts in this module:
+    from teklinicv.renderer.font_index import get_typst_fonts  # NOQA: PLC0415
+    from teklinicv.renderer.pdf_png import create_typst_compiler  # NOQA: PLC0415
+    from teklinicv.renderer.photo import compute_file_digest  # NOQA: PLC0415
+    from teklinicv.renderer.templater.templater import (  # NOQA: PLC0415
+        get_jinja2_environment,
+    )
+
+    return {
+        "jinja2_environment": get_jinja2_environment.cache_info(),
+        "typst_compiler": create_typst_compiler.cache_info(),
+        "typst_fonts": get_typst_fonts.cache_info(),
+        "file_digest": compute_file_digest.cache_info(),
+    }
+
+
+class RenderReport:
+    """Machine-readable timings, outputs, and memory use of a render.
+
+    Why:
+        The progress panel is meant for people. CI jobs and render services need
+        the same information as data: how long each stage took, what it wrote,
+        how much memory it needed, how large the input was, and whether caches
+        were hit. While the report is active, `timed_step` records every stage
+        into it.
+
+    Example:
+        ```py
+        report = RenderReport(pathlib.Path("John_Doe_CV.yaml"))
+        with ProgressPanel(quiet=True) as progress:
+            run_teklinicv(pathlib.Path("John_Doe_CV.yaml"), progress, report=report)
+        report.write_json_line(pathlib.Path("renders.jsonl"))
+        ```
+
+    Args:
+        input_file_path: Rendered input file, if rendering from a file.
+        trace_memory: Measure each stage's peak Python memory with `tracemalloc`,
+            which slows rendering down.
+    """
+
+    def __init__(
+        self, input_file_path: pathlib.Path | None = None, trace_memory: bool = True
+    ):
+        self.input_file_path = input_file_path
+        self.trace_memory = trace_memory
+        self.started_at: DateTime | None = None
+        self.duration_ms: float | None = None
+        self.error: str | None = None
+        self.stages: list[StageReport] = []
+        self.section_count: int | None = None
+        self.entry_count: int | None = None
+        self.page_count: int | None = None
+        self.caches: dict[str, CacheReport] = {}
+        self.start_time = 0.0
+        self.started_tracing = False
+        self.start_cache_infos: dict[str, functools._CacheInfo] = {}
+        self.token: contextvars.Token | None = None
+
+    def __enter__(self) -> Self:
+        self.token = active_render_report.set(self)
+        self.started_at = DateTime.now(UTC)
+        self.start_time = time.perf_counter()
+        self.start_cache_infos = get_cache_infos()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        return self
+
+    def __exit__(self, exception_type, exception, traceback) -> None:
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+        self.duration_ms = (time.perf_counter() - self.start_time) * 1000
+        for name, cache_info in get_cache_infos().items():
+            start_cache_info = self.start_cache_infos[name]
+            self.caches[name] = CacheReport(
+                hits=cache_info.hits - start_cache_info.hits,
+                misses=cache_info.misses - start_cache_info.misses,
+            )
+        if exception is not None:
+            self.error = f"{type(exception).__name__}: {exception}"
+        if self.token is not None:
+            active_render_report.reset(self.token)
+            self.token = None
+
+    @contextlib.contextmanager
+    def record_stage(self, name: str) -> Iterator[StageReport]:
+        """Measure the block as a stage.
+
+        Args:
+            name: Stage name.
+
+        Returns:
+            Context manager yielding the stage, to which outputs can be added.
+            Peak memory is what the stage allocated on top of what was already
+            allocated.
+        """
+        stage = StageReport(name, duration_ms=0)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            start_memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.duration_ms = (time.perf_counter() - start) * 1000
+            if tracing:
+                _, peak_memory = tracemalloc.get_traced_memory()
+                stage.peak_memory_bytes = max(peak_memory - start_memory, 0)
+            self.stages.append(stage)
+
+    def record_input(self, teklinicv_model: TekliniCVModel) -> None:
+        """Record the size of the validated input.
+
+        Args:
+            teklinicv_model: Validated CV model.
+        """
+        sections = teklinicv_model.cv.teklinicv_sections
+        self.section_count = len(sections)
+        self.entry_count = sum(len(section.entries) for section in sections)
+
+    def to_dictionary(self) -> dict[str, Any]:
+        """Convert the report to JSON-compatible data.
+
+        Returns:
+            Report as a dictionary.
+        """
+        input_size_bytes = None
+        if self.input_file_path is not None and self.input_file_path.is_file():
+            input_size_bytes = self.input_file_path.stat().st_size
+        return {
+            "input_file": (str(self.input_file_path) if self.input_file_path else None),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "duration_ms": self.duration_ms,
+            "success": self.error is None,
+            "error": self.error,
+            "input": {
+                "size_bytes": input_size_bytes,
+                "section_count": self.section_count,
+                "entry_count": self.entry_count,
+            },
+            "page_count": self.page_count,
+            "stages": [asdict(stage) for stage in self.stages],
+            "caches": {name: asdict(cache) for name, cache in self.caches.items()},
+        }
+
+    def write_json_line(self, file_path: pathlib.Path | None = None) -> None:
+        """Write the report as a line of JSON.
+
+        Why:
+            Appending one line per render turns the file into JSON Lines, so
+            watch mode and repeated runs build up a log that tools can stream.
+
+        Args:
+            file_path: File to append to. Defaults to standard output.
+        """
+        line = json.dumps(self.to_dictionary()) + "\n"
+        if file_path is None:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+        else:
+            with file_path.open("a", encoding="utf-8") as file:
+                file.write(line)
+
+
+def get_active_render_report() -> RenderReport | None:
+    """Return the report of the render in progress.
+
+    Returns:
+        Active report, or None if the render is not reported.
+    """
+    return active_render_report.get()
+
+
+def record_page_count(page_count: int) -> None:
+    """Record the number of pages of the rendered document, if reporting.
+
+    Args:
+        page_count: Number of pages.
+    """
+    report = active_render_report.get()
+    if report is not None:
+        report.page_count = page_count
@@ -0,0 +1,199 @@
+import json
+import pathlib
+from collections.abc import Sequence
+from datetime import UTC
+from datetime import datetime as DateTime
+
+from teklinicv.schema.models.design.classic_theme import FontFamily
+from teklinicv.schema.models.teklinicv_model import TekliniCVModel
+
+from .output_file import write_output_file
+from .pdf_png import compile_typst, get_downscaled_photo
+from .photo import get_downscaled_photo_name, place_file
+from .templater.templater import render_full_template
+
+
+def get_chapter_label(chapter_number: int) -> str:
+    """Return the Typst label placed at the start of a chapter.
+
+    Args:
+        chapter_number: Chapter number, starting from 1.
+
+    Returns:
+        Label name. The end of the chapter is labeled with `-end` appended.
+    """
+    return f"teklinicv-chapter-{chapter_number}"
+
+
+def render_book_chapter(teklinicv_model: TekliniCVModel, chapter_number: int) -> str:
+    """Render a CV as a chapter of a combined document.
+
+    Why:
+        The preamble's show rule configures the page and text for the rest of
+        its scope. Wrapping each CV in a content block scopes its design, header,
+        and footer to its own pages, while the Typst package import and fonts
+        are shared by all chapters.
+
+    Args:
+        teklinicv_model: CV model of the chapter.
+        chapter_number: Chapter number, starting from 1.
+
+    Returns:
+        Typst code of the chapter.
+    """
+    chapter_label = get_chapter_label(chapter_number)
+    code = render_full_template(teklinicv_model, "typst", chapter_label=chapter_label)
+    return f"#[\n{code}\n#metadata(none) <{chapter_label}-end>\n]\n"
+
+
+def render_book_table_of_contents(
+    teklinicv_models: Sequence[TekliniCVModel], title: str
+) -> str:
+    """Render a table of contents page linking to each chapter.
+
+    Why:
+        The table of contents doesn't rely on headings, which themes may not
+        use, but on the labels placed at the start of each chapter. Its page
+        uses the first CV's page size and body font.
+
+    Args:
+        teklinicv_models: CV models of the chapters, in order.
+        title: Title of the table of contents.
+
+    Returns:
+        Typst code of the table of contents page.
+    """
+    first_design = teklinicv_models[0].design
+    font_family = first_design.typography.font_family
+    body_font = font_family.body if isinstance(font_family, FontFamily) else font_family
+    rows = ""
+    for chapter_number, teklinicv_model in enumerate(teklinicv_models, start=1):
+        chapter_label = get_chapter_label(chapter_number)
+        name = json.dumps(teklinicv_model.cv.name or "", ensure_ascii=False)
+        rows += (
+            f"  link(<{chapter_label}>, {name}),\n"
+            f"  context link(<{chapter_label}>, str(locate(<{chapter_label}>).page())),\n"
+        )
+    return (
+        f'#set page(paper: "{first_design.page.size}")\n'
+        f"#set text(font: {json.dumps(body_font, ensure_ascii=False)})\n"
+        f'#text(size: 1.6em, weight: "bold", {json.dumps(title, ensure_ascii=False)})\n'
+        "#v(1em)\n"
+        "#grid(\n"
+        "  columns: (1fr, auto),\n"
+        "  row-gutter: 0.8em,\n"
+        f"{rows}"
+        ")\n"
+    )
+
+
+def place_chapter_photo(
+    teklinicv_model: TekliniCVModel, directory: pathlib.Path, chapter_number: int
+) -> TekliniCVModel:
+    """Place a chapter's photo under a name unique to the chapter.
+
+    Why:
+        Typst resolves photos relative to the source file, and CVs often share
+        photo file names like `photo.jpg`. Prefixing the chapter number keeps
+        them apart. Downscaled copies are placed if `photo_ppi` asks for them.
+
+    Args:
+        teklinicv_model: CV model of the chapter.
+        directory: Directory of the combined Typst file.
+        chapter_number: Chapter number, starting from 1.
+
+    Returns:
+        Model whose photo is the placed file, or the same model without a photo.
+    """
+    photo_path = teklinicv_model.cv.photo
+    if not photo_path:
+        return teklinicv_model
+
+    source_path = photo_path
+    if get_downscaled_photo_name(teklinicv_model):
+        source_path = get_downscaled_photo(
+            photo_path,
+            teklinicv_model.design.header.photo_width,
+            teklinicv_model.settings.render_command.photo_ppi,  # ty: ignore[invalid-argument-type]
+        )
+    chapter_photo_path = directory / f"chapter_{chapter_number}_{source_path.name}"
+    place_file(source_path, chapter_photo_path)
+
+    teklinicv_model = teklinicv_model.model_copy(deep=True)
+    teklinicv_model.cv.photo = chapter_photo_path
+    teklinicv_model.settings.render_command.photo_ppi = None
+    return teklinicv_model
+
+
+def generate_book_typst(
+    teklinicv_models: Sequence[TekliniCVModel],
+    typst_path: pathlib.Path,
+    table_of_contents_title: str | None = None,
+) -> pathlib.Path:
+    """Generate one Typst file with each CV as a chapter.
+
+    Why:
+        Bundling CVs used to mean compiling each one and merging the PDFs, which
+        loads fonts and the Typst package once per CV and embeds the same fonts
+        many times. One document compiles in a single pass, with each chapter
+        keeping its own header, footer, and page numbering.
+
+    Example:
+        ```py
+        generate_book_typst(models, pathlib.Path("Team_CVs.typ"), "Contents")
+        ```
+
+    Args:
+        teklinicv_models: CV models, in chapter order.
+        typst_path: Typst file to write. Photos are placed next to it.
+        table_of_contents_title: Title of a table of contents page added before
+            the chapters, or None for no table of contents.
+
+    Returns:
+        Path to the Typst file.
+    """
+    typst_path.parent.mkdir(parents=True, exist_ok=True)
+    chapter_models = [
+        place_chapter_photo(teklinicv_model, typst_path.parent, chapter_number)
+        for chapter_number, teklinicv_model in enumerate(teklinicv_models, start=1)
+    ]
+    code = ""
+    if table_of_contents_title is not None:
+        code += render_book_table_of_contents(chapter_models, table_of_contents_title)
+    code += "".join(
+        render_book_chapter(teklinicv_model, chapter_number)
+        for chapter_number, teklinicv_model in enumerate(chapter_models, start=1)
+    )
+    write_output_file(typst_path, code)
+    return typst_path
+
+
+def generate_book_pdf(
+    teklinicv_models: Sequence[TekliniCVModel],
+    typst_path: pathlib.Path,
+    pdf_path: pathlib.Path,
+) -> pathlib.Path:
+    """Compile a combined Typst file to a single PDF.
+
+    Args:
+        teklinicv_models: CV models of the chapters. Fonts are looked up next
+            to the first CV's input file, and its current date is the PDF's
+            creation date.
+        typst_path: Combined Typst file.
+        pdf_path: PDF file to write.
+
+    Returns:
+        Path to the PDF file.
+    """
+    first_model = teklinicv_models[0]
+    current_date = first_model.settings.current_date
+    _, pdf_bytes = compile_typst(
+        typst_path,
+        first_model._input_file_path,
+        "pdf",
+        timestamp=DateTime(
+            current_date.year, current_date.month, current_date.day, tzinfo=UTC
+        ),
+    )
+    write_output_file(pdf_path, b"".join(pdf_bytes))
+    return pdf_path
@@ -0,0 +1,39 @@
+import os
+import pathlib
+import sys
+
+
+def get_cache_path(*parts: str) -> pathlib.Path:
+    """Return a directory inside TekliniCV's persistent cache, creating it if needed.
+
+    Why:
+        Downloaded Typst packages and other derived data should survive between
+        runs without cluttering the user's project folder. The location follows
+        platform conventions and can be moved with `TEKLINICV_CACHE_DIR`, e.g.,
+        to a volume shared by render nodes or baked into a container image.
+
+    Example:
+        ```py
+        path = get_cache_path("typst_packages")
+        # Returns: ~/.cache/teklinicv/typst_packages on Linux
+        ```
+
+    Args:
+        parts: Subdirectory names inside the cache directory.
+
+    Returns:
+        Path to the existing cache directory.
+    """
+    if custom_cache_path := os.environ.get("TEKLINICV_CACHE_DIR"):
+        cache_path = pathlib.Path(custom_cache_path)
+    elif sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        cache_path = pathlib.Path(os.environ["LOCALAPPDATA"]) / "teklinicv" / "cache"
+    elif sys.platform == "darwin":
+        cache_path = pathlib.Path.home() / "Library" / "Caches" / "teklinicv"
+    else:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+        cache_path = pathlib.Path(cache_home) / "teklinicv"
+
+    cache_path = cache_path.joinpath(*parts)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    return cache_path
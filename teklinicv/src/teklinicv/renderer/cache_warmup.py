@@ -0,0 +1,182 @@
+import importlib.util
+import pathlib
+import py_compile
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import jinja2
+import rendercv_fonts
+
+from teklinicv.exception import TekliniCVInternalError, TekliniCVUserError
+
+from .cache_path import get_cache_path
+from .font_index import index_font_folders, read_font_index
+from .templater.templater import get_jinja2_environment, templates_directory
+from .typst_package import (
+    get_typst_package_cache_path,
+    is_typst_package_available,
+    prewarm_typst_package,
+)
+
+package_directory = pathlib.Path(__file__).parent.parent
+
+
+@dataclass
+class WarmedCache:
+    """What warming one cache did.
+
+    Args:
+        name: Name of the cache.
+        path: Where the cache lives.
+        built_count: Items built by this warm-up.
+        cached_count: Items that were already cached.
+        skipped_count: Items that couldn't be cached, e.g., in read-only folders.
+    """
+
+    name: str
+    path: pathlib.Path
+    built_count: int
+    cached_count: int
+    skipped_count: int = 0
+
+    @property
+    def summary(self) -> str:
+        """Counts in a single line, such as `Font index (2 built, 60 cached)`."""
+        counts = f"{self.built_count} built, {self.cached_count} cached"
+        if self.skipped_count:
+            counts += f", {self.skipped_count} skipped"
+        return f"{self.name} ({counts})"
+
+
+def check_theme_folder(theme_folder: pathlib.Path) -> None:
+    """Raise a user error unless the folder is a custom theme.
+
+    Args:
+        theme_folder: Folder created with `teklinicv create-theme`.
+    """
+    if not theme_folder.is_dir() or not any(theme_folder.rglob("*.j2.typ")):
+        message = (
+            f"The custom theme folder `{theme_folder}` doesn't exist or doesn't"
+            " contain any *.j2.typ files!"
+        )
+        raise TekliniCVUserError(message)
+
+
+def warm_python_bytecode(theme_folders: Sequence[pathlib.Path]) -> WarmedCache:
+    """Byte-compile TekliniCV's modules and the custom themes' Python files.
+
+    Why:
+        Importing TekliniCV builds the theme and locale variant models from
+        their YAML files, and Python compiles every module it imports unless
+        its bytecode is cached. Installations from read-only or stripped images
+        often lack that bytecode, so every new process compiled it again.
+
+    Args:
+        theme_folders: Custom theme folders.
+
+    Returns:
+        Number of modules compiled, up to date, and in read-only folders.
+    """
+    warmed_cache = WarmedCache("Python bytecode", package_directory, 0, 0)
+    for folder in (package_directory, *theme_folders):
+        for source_path in sorted(folder.rglob("*.py")):
+            bytecode_path = pathlib.Path(importlib.util.cache_from_source(source_path))
+            if (
+                bytecode_path.is_file()
+                and bytecode_path.stat().st_mtime >= source_path.stat().st_mtime
+            ):
+                warmed_cache.cached_count += 1
+                continue
+            try:
+                py_compile.compile(str(source_path), doraise=True)
+            except (OSError, py_compile.PyCompileError):
+                warmed_cache.skipped_count += 1
+            else:
+                warmed_cache.built_count += 1
+    return warmed_cache
+
+
+def warm_jinja_templates(theme_folders: Sequence[pathlib.Path]) -> WarmedCache:
+    """Compile the built-in and custom theme templates into the persistent cache.
+
+    Args:
+        theme_folders: Custom theme folders.
+
+    Returns:
+        Number of templates compiled and already cached.
+    """
+    warmed_cache = WarmedCache("Jinja templates", get_cache_path("jinja"), 0, 0)
+    template_sets: list[tuple[jinja2.Environment, pathlib.Path, str]] = [
+        (get_jinja2_environment(), templates_directory, "")
+    ]
+    for theme_folder in theme_folders:
+        template_sets.append(
+            (
+                # Templates are looked up next to the input file:
+                get_jinja2_environment(theme_folder.parent / "theme.yaml"),
+                theme_folder,
+                f"{theme_folder.name}/",
+            )
+        )
+
+    for environment, folder, name_prefix in template_sets:
+        loader, bytecode_cache = environment.loader, environment.bytecode_cache
+        if loader is None or bytecode_cache is None:
+            message = "The Jinja2 environment has no loader or bytecode cache"
+            raise TekliniCVInternalError(message)
+        for template_path in sorted(folder.rglob("*.j2.*")):
+            name = name_prefix + template_path.relative_to(folder).as_posix()
+            source, filename, _ = loader.get_source(environment, name)
+            bucket = bytecode_cache.get_bucket(environment, name, filename, source)
+            if bucket.code is None:
+                environment.get_template(name)
+                warmed_cache.built_count += 1
+            else:
+                warmed_cache.cached_count += 1
+    return warmed_cache
+
+
+def warm_font_index(theme_folders: Sequence[pathlib.Path]) -> WarmedCache:
+    """Index the bundled fonts and the fonts next to the custom themes.
+
+    Args:
+        theme_folders: Custom theme folders. Fonts are looked up in a `fonts`
+            folder next to the input file, which is next to the theme folder.
+
+    Returns:
+        Number of font files indexed and already indexed.
+    """
+    font_index_entries = read_font_index()
+    font_folders = index_font_folders(
+        [
+            *rendercv_fonts.paths_to_font_folders,
+            *dict.fromkeys(
+                theme_folder.parent / "fonts" for theme_folder in theme_folders
+            ),
+        ]
+    )
+    warmed_cache = WarmedCache("Font index", get_cache_path("fonts"), 0, 0)
+    for font_folder in font_folders:
+        for path, size, mtime_ns in font_folder.signature:
+            entry = font_index_entries.get(path, {})
+            if entry.get("size") == size and entry.get("mtime_ns") == mtime_ns:
+                warmed_cache.cached_count += 1
+            else:
+                warmed_cache.built_count += 1
+    return warmed_cache
+
+
+def warm_typst_package() -> WarmedCache:
+    """Download the TekliniCV Typst package unless it is bundled or cached.
+
+    Returns:
+        Whether the package was downloaded or already available.
+    """
+    is_available = is_typst_package_available()
+    prewarm_typst_package()
+    return WarmedCache(
+        "Typst package",
+        get_typst_package_cache_path(),
+        built_count=0 if is_available else 1,
+        cached_count=1 if is_available else 0,
+    )
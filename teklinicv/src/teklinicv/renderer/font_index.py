@@ -0,0 +1,274 @@
+import importlib.metadata
+import json
+import os
+import pathlib
+import tempfile
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import typst
+
+from teklinicv.caches import bounded_cache
+from teklinicv.hooks import emit_cache_hook
+
+from .cache_path import get_cache_path
+
+font_index_version = 1
+font_file_extensions = frozenset({".ttf", ".otf", ".ttc", ".otc"})
+# Families the Typst package and Typst's glyph fallback rely on, even if the Typst
+# source never names them (icons and CJK characters):
+fallback_font_family_prefixes = ("Font Awesome", "Noto Sans")
+
+
+@dataclass(frozen=True)
+class FontFolder:
+    """Font folder with the families it provides.
+
+    Args:
+        path: Folder containing font files.
+        families: Font family names found in the folder.
+        signature: Path, size, and modification time of each font file. Changes
+            whenever a font file is added, removed, or replaced.
+    """
+
+    path: pathlib.Path
+    families: frozenset[str]
+    signature: tuple[tuple[str, int, int], ...]
+
+
+def get_font_index_path() -> pathlib.Path:
+    """Return the location of the persistent font index.
+
+    Returns:
+        Path to the font index JSON file.
+    """
+    return get_cache_path("fonts") / "font_index.json"
+
+
+def read_font_index() -> dict[str, dict]:
+    """Read font index entries, discarding indexes from other versions.
+
+    Returns:
+        Font file paths mapped to their size, modification time, and families.
+    """
+    try:
+        font_index = json.loads(get_font_index_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(font_index, dict) or font_index.get("version") != [
+        font_index_version,
+        importlib.metadata.version("typst"),
+    ]:
+        return {}
+    return font_index.get("fonts", {})
+
+
+def write_font_index(entries: dict[str, dict]) -> None:
+    """Atomically replace the persistent font index.
+
+    Why:
+        Several processes may index fonts at the same time. Writing to a
+        temporary file and renaming it means readers never see a partial file.
+
+    Args:
+        entries: Font file paths mapped to their size, modification time, and
+            families.
+    """
+    font_index_path = get_font_index_path()
+    font_index = {
+        "version": [font_index_version, importlib.metadata.version("typst")],
+        "fonts": entries,
+    }
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=font_index_path.parent,
+        suffix=".tmp",
+        delete=False,
+    ) as temporary_file:
+        json.dump(font_index, temporary_file)
+    pathlib.Path(temporary_file.name).replace(font_index_path)
+
+
+def get_folder_modification_times(folder: pathlib.Path) -> tuple[int, ...]:
+    """Return the modification times of a folder and its subfolders.
+
+    Why:
+        A folder's modification time changes whenever a file in it is added,
+        removed, or renamed, which is how font files are installed and
+        replaced. Checking the folders instead of every font file keeps
+        unchanged font folders nearly free to look up.
+
+    Args:
+        folder: Folder to check.
+
+    Returns:
+        Modification times in nanoseconds, in walk order.
+    """
+    modification_times = []
+    folders = [folder]
+    while folders:
+        current_folder = folders.pop()
+        modification_times.append(current_folder.stat().st_mtime_ns)
+        with os.scandir(current_folder) as entries:
+            folders.extend(
+                pathlib.Path(entry.path)
+                for entry in sorted(entries, key=lambda entry: entry.name)
+                if entry.is_dir()
+            )
+    return tuple(modification_times)
+
+
+def index_font_folders(font_folders: Sequence[pathlib.Path]) -> list[FontFolder]:
+    """Find the font families in each folder, reusing the font indexes.
+
+    Why:
+        Discovering font families means parsing every font file. The results
+        are stored per file, keyed by path, size, and modification time, so
+        later processes only stat the files and parse the ones that changed.
+        Within a process, the folders are only indexed again once their
+        modification times change, since a compiler is looked up several
+        times per render.
+
+    Example:
+        ```py
+        font_folders = index_font_folders(rendercv_fonts.paths_to_font_folders)
+        # font_folders[0].families == frozenset({"Mukta"})
+        ```
+
+    Args:
+        font_folders: Folders containing font files. Missing folders are skipped.
+
+    Returns:
+        Indexed font folders in the given order.
+    """
+    return list(
+        index_font_folders_with_modification_times(
+            tuple(
+                (font_folder, get_folder_modification_times(font_folder))
+                for font_folder in font_folders
+                if font_folder.is_dir()
+            ),
+            get_font_index_path(),
+        )
+    )
+
+
+@bounded_cache(maxsize=16)
+def index_font_folders_with_modification_times(
+    font_folders: tuple[tuple[pathlib.Path, tuple[int, ...]], ...],
+    font_index_path: pathlib.Path,  # NOQA: ARG001
+) -> tuple[FontFolder, ...]:
+    """Index font folders. Modification times and the index path are only part of the cache key.
+
+    Args:
+        font_folders: Existing folders containing font files, with the
+            modification times of the folders and their subfolders.
+        font_index_path: Persistent font index the results are stored in.
+
+    Returns:
+        Indexed font folders in the given order.
+    """
+    entries = read_font_index()
+    index_changed = False
+    indexed_font_folders = []
+    for font_folder, _ in font_folders:
+        font_files = sorted(
+            path
+            for path in font_folder.rglob("*")
+            if path.suffix.lower() in font_file_extensions and path.is_file()
+        )
+        signature = []
+        for font_file in font_files:
+            stat = font_file.stat()
+            signature.append((str(font_file), stat.st_size, stat.st_mtime_ns))
+
+        is_indexed = all(
+            entries.get(path, {}).get("size") == size
+            and entries.get(path, {}).get("mtime_ns") == mtime_ns
+            for path, size, mtime_ns in signature
+        )
+        emit_cache_hook("font_index", is_indexed)
+        if not is_indexed:
+            families_by_file: dict[str, set[str]] = {}
+            for font in typst.Fonts(False, False, [font_folder]).fonts():
+                if font.path is not None:
+                    families_by_file.setdefault(font.path, set()).add(font.family)
+            for path, size, mtime_ns in signature:
+                entries[path] = {
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                    "families": sorted(families_by_file.get(path, set())),
+                }
+            index_changed = True
+
+        indexed_font_folders.append(
+            FontFolder(
+                path=font_folder,
+                families=frozenset(
+                    family
+                    for path, _, _ in signature
+                    for family in entries[path]["families"]
+                ),
+                signature=tuple(signature),
+            )
+        )
+
+    if index_changed:
+        write_font_index(entries)
+
+    return tuple(indexed_font_folders)
+
+
+def select_font_folders(
+    font_folders: Sequence[FontFolder], typst_source: str
+) -> tuple[FontFolder, ...]:
+    """Keep only the font folders whose families the Typst source uses.
+
+    Why:
+        Typst parses every font it is given. A CV uses a handful of families,
+        named as string literals by the design options and templates, so the
+        other bundled families are skipped. Like Typst, family names are
+        matched case-insensitively. Fallback families stay available for icons
+        and characters the chosen fonts lack.
+
+    Args:
+        font_folders: Indexed font folders.
+        typst_source: Contents of the Typst file to compile.
+
+    Returns:
+        Font folders to load.
+    """
+    lowercase_typst_source = typst_source.lower()
+    return tuple(
+        font_folder
+        for font_folder in font_folders
+        if any(
+            family.startswith(fallback_font_family_prefixes)
+            or f'"{family.lower()}"' in lowercase_typst_source
+            for family in font_folder.families
+        )
+    )
+
+
+@bounded_cache(maxsize=4)
+def get_typst_fonts(font_folders: tuple[FontFolder, ...]) -> typst.Fonts:
+    """Load fonts once per process for a set of font folders.
+
+    Why:
+        Every `typst.Compiler` given plain font paths parses all font files
+        again. Sharing a loaded `typst.Fonts` lets consecutive compilers (watch
+        mode, batch rendering) skip that work until a font file changes.
+
+    Args:
+        font_folders: Font folders to load.
+
+    Returns:
+        Loaded fonts, including system and embedded fonts.
+    """
+    return typst.Fonts(
+        include_system_fonts=True,
+        include_embedded_fonts=True,
+        font_paths=[font_folder.path for font_folder in font_folders],
+    )
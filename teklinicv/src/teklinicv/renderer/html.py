@@ -2,12 +2,15 @@ import pathlib
 
 from teklinicv.schema.models.teklinicv_model import TekliniCVModel
 
+from .output_file import write_output_file
 from .path_resolver import resolve_teklinicv_file_path
 from .templater.templater import render_html
 
 
 def generate_html(
-    teklinicv_model: TekliniCVModel, markdown_path: pathlib.Path | None
+    teklinicv_model: TekliniCVModel,
+    markdown_path: pathlib.Path | None,
+    markdown_contents: str | None = None,
 ) -> pathlib.Path | None:
     """Generate HTML file from Markdown source with styling.
 
@@ -18,6 +21,8 @@ def generate_html(
     Args:
         teklinicv_model: CV model for path resolution and rendering context.
         markdown_path: Path to Markdown source file.
+        markdown_contents: In-memory contents of the Markdown file. Read from
+            `markdown_path` if not provided.
 
     Returns:
         Path to generated HTML file, or None if generation disabled.
@@ -30,8 +35,8 @@ def generate_html(
     html_path = resolve_teklinicv_file_path(
         teklinicv_model, teklinicv_model.settings.render_command.html_path
     )
-    html_contents = render_html(
-        teklinicv_model, markdown_path.read_text(encoding="utf-8")
-    )
-    html_path.write_text(html_contents, encoding="utf-8")
+    if markdown_contents is None:
+        markdown_contents = markdown_path.read_text(encoding="utf-8")
+    html_contents = render_html(teklinicv_model, markdown_contents)
+    write_output_file(html_path, html_contents)
     return html_path
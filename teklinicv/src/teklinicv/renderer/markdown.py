@@ -2,11 +2,33 @@ import pathlib
 
 from teklinicv.schema.models.teklinicv_model import TekliniCVModel
 
+from .output_file import write_output_file
 from .path_resolver import resolve_teklinicv_file_path
 from .templater.templater import render_full_template
 
 
-def generate_markdown(teklinicv_model: TekliniCVModel) -> pathlib.Path | None:
+def render_markdown(teklinicv_model: TekliniCVModel) -> str | None:
+    """Render Markdown contents from CV model via Jinja2 templates.
+
+    Why:
+        Both the Markdown file and the HTML file are built from the same
+        Markdown. Rendering it once in memory lets HTML generation skip reading
+        the Markdown file back from disk.
+
+    Args:
+        teklinicv_model: Validated CV model with content.
+
+    Returns:
+        Markdown contents, or None if Markdown generation disabled.
+    """
+    if teklinicv_model.settings.render_command.dont_generate_markdown:
+        return None
+    return render_full_template(teklinicv_model, "markdown")
+
+
+def generate_markdown(
+    teklinicv_model: TekliniCVModel, markdown_contents: str | None = None
+) -> pathlib.Path | None:
     """Generate Markdown file from CV model via Jinja2 templates.
 
     Why:
@@ -15,6 +37,8 @@ def generate_markdown(teklinicv_model: TekliniCVModel) -> pathlib.Path | None:
 
     Args:
         teklinicv_model: Validated CV model with content.
+        markdown_contents: Already rendered Markdown (see `render_markdown`).
+            Rendered from the model if not provided.
 
     Returns:
         Path to generated Markdown file, or None if generation disabled.
@@ -24,6 +48,7 @@ def generate_markdown(teklinicv_model: TekliniCVModel) -> pathlib.Path | None:
     markdown_path = resolve_teklinicv_file_path(
         teklinicv_model, teklinicv_model.settings.render_command.markdown_path
     )
-    markdown_contents = render_full_template(teklinicv_model, "markdown")
-    markdown_path.write_text(markdown_contents, encoding="utf-8")
+    if markdown_contents is None:
+        markdown_contents = render_full_template(teklinicv_model, "markdown")
+    write_output_file(markdown_path, markdown_contents)
     return markdown_path
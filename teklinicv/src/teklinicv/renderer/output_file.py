@@ -0,0 +1,83 @@
+import contextlib
+import contextvars
+import pathlib
+import shutil
+import uuid
+from collections.abc import Iterator
+
+from teklinicv.hooks import HookEvent, emit_hook
+
+unchanged_output_files: contextvars.ContextVar[list[pathlib.Path] | None] = (
+    contextvars.ContextVar("unchanged_output_files", default=None)
+)
+
+
+@contextlib.contextmanager
+def record_unchanged_output_files() -> Iterator[list[pathlib.Path]]:
+    """Collect output files that were left as they were while the block runs.
+
+    Why:
+        The CLI reports which outputs were skipped because their contents did
+        not change. A context variable keeps the record separate per thread, so
+        concurrent renders don't mix up their reports.
+
+    Example:
+        ```py
+        with record_unchanged_output_files() as unchanged_files:
+            generate_typst(teklinicv_model)
+        # unchanged_files == [Path("teklinicv_output/John_Doe_CV.typ")]
+        ```
+
+    Returns:
+        List that is filled with the unchanged output files.
+    """
+    unchanged_files: list[pathlib.Path] = []
+    token = unchanged_output_files.set(unchanged_files)
+    try:
+        yield unchanged_files
+    finally:
+        unchanged_output_files.reset(token)
+
+
+def write_output_file(file_path: pathlib.Path, contents: str | bytes) -> bool:
+    """Atomically write an output file, skipping writes that change nothing.
+
+    Why:
+        Rewriting identical outputs bumps modification times, which retriggers
+        sync tools and make-style pipelines. Writing to a temporary file in the
+        same directory and renaming it means other processes never read a
+        partially written file.
+
+    Args:
+        file_path: Output file path.
+        contents: Text (written as UTF-8) or bytes to write.
+
+    Returns:
+        True if the file was written, False if it already had these contents.
+    """
+    if isinstance(contents, str):
+        contents = contents.encode("utf-8")
+
+    if (
+        file_path.is_file()
+        and file_path.stat().st_size == len(contents)
+        and file_path.read_bytes() == contents
+    ):
+        unchanged_files = unchanged_output_files.get()
+        if unchanged_files is not None:
+            unchanged_files.append(file_path)
+        emit_hook(HookEvent.output_written, path=file_path, unchanged=True)
+        return False
+
+    temporary_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with temporary_path.open("xb") as temporary_file:
+            temporary_file.write(contents)
+        if file_path.is_file():
+            shutil.copymode(file_path, temporary_path)
+        temporary_path.replace(file_path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+    emit_hook(HookEvent.output_written, path=file_path, unchanged=False)
+    return True
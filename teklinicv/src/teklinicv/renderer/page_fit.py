@@ -0,0 +1,235 @@
+import enum
+import pathlib
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from teklinicv.exception import TekliniCVUserError
+from teklinicv.schema.models.teklinicv_model import TekliniCVModel
+from teklinicv.schema.sample_generator import dictionary_to_yaml
+
+from .output_file import write_output_file
+from .pdf_png import count_typst_pages, photo_next_to_typst_file
+from .templater.templater import render_full_template
+
+# Number of shrink levels between the design as written and the most aggressive
+# setting. A binary search needs at most 2 + log2(fit_steps) compilations:
+fit_steps = 16
+typst_dimension_pattern = re.compile(r"(-?\d+(?:\.\d+)?)(cm|in|pt|mm|ex|em)")
+
+
+class FitParameter(enum.StrEnum):
+    font_size = "font_size"
+    line_spacing = "line_spacing"
+    margins = "margins"
+
+
+@dataclass(frozen=True)
+class FitParameterFields:
+    design_fields: tuple[tuple[str, ...], ...]
+    minimum_ratio: float
+
+
+fit_parameter_fields: dict[FitParameter, FitParameterFields] = {
+    FitParameter.font_size: FitParameterFields(
+        (("typography", "font_size", "body"),), minimum_ratio=0.8
+    ),
+    FitParameter.line_spacing: FitParameterFields(
+        (("typography", "line_spacing"),), minimum_ratio=0.5
+    ),
+    FitParameter.margins: FitParameterFields(
+        (
+            ("page", "top_margin"),
+            ("page", "bottom_margin"),
+            ("page", "left_margin"),
+            ("page", "right_margin"),
+        ),
+        minimum_ratio=0.5,
+    ),
+}
+
+
+@dataclass
+class PageFit:
+    teklinicv_model: TekliniCVModel
+    page_count: int
+    compilation_count: int
+    changed_values: dict[FitParameter, list[str]] = field(default_factory=dict)
+
+    @property
+    def summary(self) -> str:
+        """Chosen values in a single line, such as `font size 9.5pt, margins 0.6in`."""
+        if not self.changed_values:
+            return "design unchanged"
+        return ", ".join(
+            f"{parameter.replace('_', ' ')} {' '.join(dict.fromkeys(values))}"
+            for parameter, values in self.changed_values.items()
+        )
+
+
+def scale_typst_dimension(dimension: str, ratio: float) -> str:
+    """Multiply a Typst dimension, keeping its unit.
+
+    Example:
+        ```py
+        scale_typst_dimension("0.7in", 0.5)
+        # "0.35in"
+        ```
+
+    Args:
+        dimension: Typst dimension, such as `10pt`.
+        ratio: Factor to multiply the number by.
+
+    Returns:
+        Scaled dimension, rounded to two decimals.
+    """
+    match = typst_dimension_pattern.fullmatch(dimension)
+    if match is None:
+        return dimension
+    return f"{round(float(match.group(1)) * ratio, 2):g}{match.group(2)}"
+
+
+def shrink_design(
+    teklinicv_model: TekliniCVModel,
+    parameters: tuple[FitParameter, ...],
+    level: float,
+) -> tuple[TekliniCVModel, dict[FitParameter, list[str]]]:
+    """Return a copy of the model with the design shrunk by a common level.
+
+    Why:
+        Scaling every parameter by the same fraction of its allowed range turns
+        the search space into one axis, so "least aggressive" is well defined
+        and a binary search finds it. Designs of custom themes without a field
+        are left as they are for that field.
+
+    Args:
+        teklinicv_model: Model to shrink the design of. It is not modified.
+        parameters: Parameters to shrink.
+        level: 0 for the design as written, 1 for the minimum ratios.
+
+    Returns:
+        Model with the shrunk design, and the new values of each parameter
+        that changed.
+    """
+    design = teklinicv_model.design.model_copy(deep=True)
+    changed_values: dict[FitParameter, list[str]] = {}
+    for parameter in parameters:
+        fields = fit_parameter_fields[parameter]
+        ratio = 1 - level * (1 - fields.minimum_ratio)
+        for *parent_names, name in fields.design_fields:
+            parent: object = design
+            for parent_name in parent_names:
+                parent = getattr(parent, parent_name, None)
+            dimension = getattr(parent, name, None)
+            if not isinstance(dimension, str):
+                continue
+            scaled_dimension = scale_typst_dimension(dimension, ratio)
+            if scaled_dimension != dimension:
+                setattr(parent, name, scaled_dimension)
+                changed_values.setdefault(parameter, []).append(scaled_dimension)
+
+    return teklinicv_model.model_copy(update={"design": design}), changed_values
+
+
+def fit_design_to_pages(
+    teklinicv_model: TekliniCVModel,
+    typst_path: pathlib.Path,
+    page_count: int,
+    parameters: Iterable[str] = tuple(FitParameter),
+) -> PageFit:
+    """Shrink the design until the CV fits on the given number of pages.
+
+    Why:
+        Users used to tweak font size, line spacing, and margins by hand, with a
+        full render per attempt. Here each attempt only renders the Typst
+        source and counts its pages with the warm compiler, and a binary search
+        over `fit_steps` shrink levels stops at the least aggressive one that
+        fits. The Typst file is rewritten with the chosen design, so PDF and PNG
+        generation can continue from it.
+
+    Example:
+        ```py
+        page_fit = fit_design_to_pages(teklinicv_model, typst_path, 1)
+        page_fit.summary
+        # "font size 9.62pt, line spacing 0.54em, margins 0.62in"
+        ```
+
+    Args:
+        teklinicv_model: Model whose Typst file has been generated.
+        typst_path: Generated Typst file.
+        page_count: Maximum number of pages.
+        parameters: Names of the design parameters that may be shrunk.
+
+    Returns:
+        Model with the chosen design, its page count, and the changed values.
+    """
+    parameters = tuple(FitParameter(parameter) for parameter in parameters)
+    attempts: dict[
+        int, tuple[TekliniCVModel, dict[FitParameter, list[str]], str, int]
+    ] = {}
+
+    def count_pages(step: int) -> int:
+        if step not in attempts:
+            model, changed_values = shrink_design(
+                teklinicv_model, parameters, step / fit_steps
+            )
+            typst_source = render_full_template(model, "typst")
+            with photo_next_to_typst_file(teklinicv_model, typst_path):
+                attempts[step] = (
+                    model,
+                    changed_values,
+                    typst_source,
+                    count_typst_pages(
+                        typst_path, teklinicv_model._input_file_path, typst_source
+                    ),
+                )
+        return attempts[step][3]
+
+    if count_pages(0) <= page_count:
+        return PageFit(teklinicv_model, attempts[0][3], compilation_count=1)
+
+    if count_pages(fit_steps) > page_count:
+        raise TekliniCVUserError(
+            message=(
+                f"The CV doesn't fit on {page_count} page{'s' if page_count > 1 else ''}"
+                " even with the smallest"
+                f" {', '.join(parameter.replace('_', ' ') for parameter in parameters)}"
+                f" (it has {attempts[fit_steps][3]} pages). Shorten the content or"
+                " allow more pages."
+            )
+        )
+
+    # The largest step known not to fit, and the smallest known to fit:
+    low, high = 0, fit_steps
+    while high - low > 1:
+        middle = (low + high) // 2
+        if count_pages(middle) <= page_count:
+            high = middle
+        else:
+            low = middle
+
+    model, changed_values, typst_source, fitted_page_count = attempts[high]
+    write_output_file(typst_path, typst_source)
+    return PageFit(model, fitted_page_count, len(attempts), changed_values)
+
+
+def write_design_overlay(
+    teklinicv_model: TekliniCVModel, design_path: pathlib.Path
+) -> None:
+    """Write the design of a model as a file for `--design`.
+
+    Why:
+        Once a fit is found, users want to keep it without searching again on
+        every render. Only the values that differ from the theme's defaults are
+        written, so the file stays short and the fitted values stand out.
+
+    Args:
+        teklinicv_model: Model with the fitted design.
+        design_path: YAML file to write.
+    """
+    design = teklinicv_model.design
+    design_dictionary = {
+        "theme": design.theme,
+        **design.model_dump(mode="json", exclude_defaults=True),
+    }
+    write_output_file(design_path, dictionary_to_yaml({"design": design_dictionary}))
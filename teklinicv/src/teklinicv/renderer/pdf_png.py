@@ -1,14 +1,40 @@
-import functools
+import contextlib
 import pathlib
-import shutil
+import threading
+import uuid
+from collections.abc import Generator, Iterator
+from datetime import UTC
+from datetime import datetime as DateTime
+from typing import Any, Literal, cast
 
 import rendercv_fonts
 import typst
 
+from teklinicv.caches import bounded_thread_local_cache
 from teklinicv.exception import TekliniCVInternalError
+from teklinicv.hooks import call_cached, emit_cache_hook, hook_stage
+from teklinicv.profiler import profile_span
+from teklinicv.render_report import record_page_count
+from teklinicv.schema.models.settings.page_range import page_range_to_page_numbers
 from teklinicv.schema.models.teklinicv_model import TekliniCVModel
 
+from .cache_path import get_cache_path
+from .font_index import (
+    FontFolder,
+    get_typst_fonts,
+    index_font_folders,
+    select_font_folders,
+)
+from .output_file import write_output_file
 from .path_resolver import resolve_teklinicv_file_path
+from .photo import get_downscaled_photo_name, get_file_digest, place_file
+from .typst_package import bundled_typst_packages_path, get_typst_package_cache_path
+from .typst_worker_pool import TypstCompileJob, get_active_typst_worker_pool
+
+# Locks for the folders photos are placed in, picked by the hash of the folder. A
+# fixed number of locks guards any number of folders, and renders only wait for
+# each other when their folders share a lock:
+photo_locks = tuple(threading.Lock() for _ in range(64))
 
 
 def generate_pdf(
@@ -19,7 +45,8 @@ def generate_pdf(
     Why:
         PDF is the primary output format for CVs. Typst compilation produces
         high-quality PDFs with proper fonts, layout, and typography from the
-        intermediate Typst markup.
+        intermediate Typst markup. The PDF creation date is the CV's current date,
+        so unchanged CVs compile to identical PDFs and are not rewritten.
 
     Args:
         teklinicv_model: CV model for path resolution and photo handling.
@@ -33,9 +60,17 @@ def generate_pdf(
     pdf_path = resolve_teklinicv_file_path(
         teklinicv_model, teklinicv_model.settings.render_command.pdf_path
     )
-    typst_compiler = get_typst_compiler(typst_path, teklinicv_model._input_file_path)
-    copy_photo_next_to_typst_file(teklinicv_model, typst_path)
-    typst_compiler.compile(format="pdf", output=pdf_path)
+    current_date = teklinicv_model.settings.current_date
+    with photo_next_to_typst_file(teklinicv_model, typst_path):
+        _, pdf_bytes = compile_typst(
+            typst_path,
+            teklinicv_model._input_file_path,
+            "pdf",
+            timestamp=DateTime(
+                current_date.year, current_date.month, current_date.day, tzinfo=UTC
+            ),
+        )
+    write_output_file(pdf_path, b"".join(pdf_bytes))
 
     return pdf_path
 
@@ -47,7 +82,8 @@ def generate_png(
 
     Why:
         PNG format enables CV preview in web applications and README files.
-        Multi-page CVs produce multiple PNG files with sequential numbering.
+        Multi-page CVs produce multiple PNG files numbered by page. Each page is
+        written and released before the next one is taken.
 
     Args:
         teklinicv_model: CV model for path resolution and photo handling.
@@ -61,59 +97,326 @@ def generate_png(
     png_path = resolve_teklinicv_file_path(
         teklinicv_model, teklinicv_model.settings.render_command.png_path
     )
-    typst_compiler = get_typst_compiler(typst_path, teklinicv_model._input_file_path)
-    copy_photo_next_to_typst_file(teklinicv_model, typst_path)
-    png_files_bytes = typst_compiler.compile(format="png")
-
-    if not isinstance(png_files_bytes, list):
-        png_files_bytes = [png_files_bytes]
 
     png_files = []
-    for i, png_file_bytes in enumerate(png_files_bytes):
-        if png_file_bytes is None:
-            raise TekliniCVInternalError("Typst compiler returned None for PNG bytes")
-        png_file = png_path.parent / (png_path.stem + f"_{i + 1}.png")
-        png_file.write_bytes(png_file_bytes)
+    for page_number, png_file_bytes in generate_png_pages(teklinicv_model, typst_path):
+        png_file = png_path.parent / (png_path.stem + f"_{page_number}.png")
+        write_output_file(png_file, png_file_bytes)
         png_files.append(png_file)
 
     return png_files if png_files else None
 
 
+def generate_preview_png(
+    teklinicv_model: TekliniCVModel,
+    typst_path: pathlib.Path | None,
+    page_count: int,
+    ppi: float,
+) -> list[pathlib.Path] | None:
+    """Compile the first pages of the CV to low-resolution preview PNG files.
+
+    Why:
+        Previews are refreshed on every save while editing, so they must be
+        cheap. They are written next to the PNG output with a `_preview` suffix
+        so they never overwrite or get mistaken for the full-resolution files.
+
+    Args:
+        teklinicv_model: CV model for path resolution and photo handling.
+        typst_path: Path to Typst source file to compile.
+        page_count: Number of pages to preview, starting from the first page.
+        ppi: Resolution of the preview in pixels per inch.
+
+    Returns:
+        List of paths to generated preview PNG files, or None if there is no Typst
+        file.
+    """
+    if typst_path is None:
+        return None
+    png_path = resolve_teklinicv_file_path(
+        teklinicv_model, teklinicv_model.settings.render_command.png_path
+    )
+
+    preview_files = []
+    for page_number, png_file_bytes in generate_png_pages(
+        teklinicv_model, typst_path, png_pages=f"1-{page_count}", png_ppi=ppi
+    ):
+        preview_file = png_path.parent / (png_path.stem + f"_preview_{page_number}.png")
+        write_output_file(preview_file, png_file_bytes)
+        preview_files.append(preview_file)
+
+    return preview_files if preview_files else None
+
+
+def generate_png_pages(
+    teklinicv_model: TekliniCVModel,
+    typst_path: pathlib.Path,
+    *,
+    png_pages: str | None = None,
+    png_ppi: float | None = None,
+) -> Iterator[tuple[int, bytes]]:
+    """Yield the selected PNG pages of the CV one by one.
+
+    Why:
+        Previews need a small first page while print proofs need every page at
+        high resolution. Pages are filtered by `png_pages`, rasterized at
+        `png_ppi`, and handed over one at a time so callers can stream them to
+        disk, a network response, or a cache.
+
+    Example:
+        ```py
+        for page_number, png_bytes in generate_png_pages(teklinicv_model, typst_path):
+            upload(f"page_{page_number}.png", png_bytes)
+        ```
+
+    Args:
+        teklinicv_model: CV model with PNG settings and photo path.
+        typst_path: Path to Typst source file to compile.
+        png_pages: Page selection to use instead of `png_pages` from the settings.
+        png_ppi: Resolution to use instead of `png_ppi` from the settings.
+
+    Returns:
+        Iterator of page numbers (1-based) and PNG bytes.
+    """
+    render_command = teklinicv_model.settings.render_command
+    png_pages = png_pages or render_command.png_pages
+    png_ppi = png_ppi or render_command.png_ppi
+    with photo_next_to_typst_file(teklinicv_model, typst_path):
+        page_count, png_files_bytes = compile_typst(
+            typst_path, teklinicv_model._input_file_path, "png", ppi=png_ppi
+        )
+
+    if png_pages is None:
+        page_numbers = set(range(1, page_count + 1))
+    else:
+        page_numbers = set(page_range_to_page_numbers(png_pages, page_count))
+
+    with contextlib.closing(png_files_bytes):
+        for page_number, png_file_bytes in enumerate(png_files_bytes, start=1):
+            if page_number in page_numbers:
+                yield page_number, png_file_bytes
+
+
+def compile_typst(
+    typst_path: pathlib.Path,
+    input_file_path: pathlib.Path | None,
+    output_format: Literal["pdf", "png"],
+    *,
+    ppi: float | None = None,
+    timestamp: DateTime | None = None,
+) -> tuple[int, Generator[bytes]]:
+    """Compile Typst source in-process or in the active worker pool.
+
+    Why:
+        Compilation runs in-process by default. Inside a `TypstWorkerPool`
+        block, it runs in a worker subprocess with time and memory limits
+        instead. Either way, pages are handed over one at a time so each is
+        freed once consumed.
+
+    Args:
+        typst_path: Path to Typst source file to compile.
+        input_file_path: Original input file path for relative font resolution.
+        output_format: Output format. PDFs are a single page.
+        ppi: Resolution of PNG output in pixels per inch.
+        timestamp: Creation date stored in PDF output.
+
+    Returns:
+        Number of pages and an iterator of their bytes.
+    """
+    typst_worker_pool = get_active_typst_worker_pool()
+    stage = f"Typst {output_format.upper()}"
+    with (
+        profile_span(stage, "typst", in_worker_pool=typst_worker_pool is not None),
+        hook_stage(stage),
+    ):
+        if typst_worker_pool is not None:
+            page_count, pages = typst_worker_pool.compile(
+                TypstCompileJob(
+                    typst_path,
+                    input_file_path,
+                    output_format,
+                    ppi=ppi,
+                    timestamp=timestamp,
+                )
+            )
+            if output_format == "png":
+                record_page_count(page_count)
+            return page_count, pages
+
+        typst_compiler = get_typst_compiler(typst_path, input_file_path)
+        # The input is passed explicitly since the cached compiler keeps the last
+        # one, which may be in-memory source from `count_typst_pages`:
+        result = typst_compiler.compile(
+            input=typst_path, format=output_format, ppi=ppi, timestamp=timestamp
+        )
+    pages = cast("list[bytes | None]", result if isinstance(result, list) else [result])
+    if output_format == "png":
+        record_page_count(len(pages))
+
+    def iterate_pages() -> Generator[bytes]:
+        for index, page in enumerate(pages):
+            # Drop the compiler's reference so each page is freed once consumed:
+            pages[index] = None
+            if page is None:
+                raise TekliniCVInternalError("Typst compiler returned None for a page")
+            yield page
+
+    return len(pages), iterate_pages()
+
+
+def count_typst_pages(
+    typst_path: pathlib.Path, input_file_path: pathlib.Path | None, typst_source: str
+) -> int:
+    """Count the pages of in-memory Typst source with the warm compiler.
+
+    Why:
+        Fitting a CV to a page count compiles several variants of its source.
+        Compiling them from memory skips writing files, and rasterizing at one
+        pixel per inch costs almost nothing next to layout. The source is
+        compiled in the directory of `typst_path` with its fonts, so it lays out
+        exactly like the file would.
+
+    Args:
+        typst_path: Typst file whose compiler, fonts, and directory to use.
+        input_file_path: Original input file path for relative font resolution.
+        typst_source: Typst source to lay out.
+
+    Returns:
+        Number of pages.
+    """
+    typst_compiler = get_typst_compiler(typst_path, input_file_path)
+    with profile_span("Typst page count", "typst"):
+        result = typst_compiler.compile(
+            input=typst_source.encode("utf-8"), format="png", ppi=1
+        )
+    return len(result) if isinstance(result, list) else 1
+
+
 def copy_photo_next_to_typst_file(
     teklinicv_model: TekliniCVModel, typst_path: pathlib.Path
 ) -> None:
-    """Copy CV photo to Typst file directory for compilation.
+    """Place CV photo in Typst file directory for compilation.
 
     Why:
         Typst compiler resolves image paths relative to source file location.
-        Copying photo ensures compilation succeeds regardless of original
-        photo location.
+        Placing photo ensures compilation succeeds regardless of original
+        photo location. The photo is only copied when its contents changed.
+        With `photo_ppi` set, a cached
+        downscaled copy is placed instead of large photos.
 
     Args:
         teklinicv_model: CV model containing photo path.
         typst_path: Path to Typst source file.
     """
-    if teklinicv_model.cv.photo:
-        photo_path = teklinicv_model.cv.photo
-        copy_to = typst_path.parent / photo_path.name
-        if photo_path != copy_to:
-            shutil.copy(
-                teklinicv_model.cv.photo,
-                typst_path.parent / teklinicv_model.cv.photo.name,
+    photo_path = teklinicv_model.cv.photo
+    if not photo_path:
+        return
+
+    downscaled_photo_name = get_downscaled_photo_name(teklinicv_model)
+    if downscaled_photo_name:
+        place_file(
+            get_downscaled_photo(
+                photo_path,
+                teklinicv_model.design.header.photo_width,
+                teklinicv_model.settings.render_command.photo_ppi,  # ty: ignore[invalid-argument-type]
+            ),
+            typst_path.parent / downscaled_photo_name,
+        )
+    elif photo_path != typst_path.parent / photo_path.name:
+        place_file(photo_path, typst_path.parent / photo_path.name)
+
+
+@contextlib.contextmanager
+def photo_next_to_typst_file(
+    teklinicv_model: TekliniCVModel, typst_path: pathlib.Path
+) -> Iterator[None]:
+    """Place the CV photo next to the Typst file and keep it there while the block runs.
+
+    Why:
+        Renders that write into the same folder place their photos at the same
+        path when the photo file names match. Placing and compiling under the
+        folder's lock stops another render from replacing the photo while it is
+        being compiled. Renders without a photo don't lock anything.
+
+    Example:
+        ```py
+        with photo_next_to_typst_file(teklinicv_model, typst_path):
+            compile_typst(typst_path, teklinicv_model._input_file_path, "pdf")
+        ```
+
+    Args:
+        teklinicv_model: CV model containing photo path.
+        typst_path: Path to Typst source file.
+
+    Returns:
+        Context manager that holds the photo's lock until the block ends.
+    """
+    photo_path = teklinicv_model.cv.photo
+    if not photo_path:
+        yield
+        return
+
+    with photo_locks[hash(typst_path.parent.absolute()) % len(photo_locks)]:
+        copy_photo_next_to_typst_file(teklinicv_model, typst_path)
+        yield
+
+
+def get_downscaled_photo(
+    photo_path: pathlib.Path, photo_width: str, photo_ppi: float
+) -> pathlib.Path:
+    """Return a downscaled PNG copy of the photo, creating it if not cached.
+
+    Why:
+        Full-resolution camera photos slow down compilation and inflate PDFs.
+        Typst itself rasterizes the photo at the printed width, so no imaging
+        library is needed. Copies are cached by photo contents, width, and
+        resolution, and reused until the photo changes.
+
+    Args:
+        photo_path: Original PNG or JPEG photo.
+        photo_width: Printed photo width as a Typst length.
+        photo_ppi: Target resolution in pixels per inch.
+
+    Returns:
+        Path to the cached downscaled photo.
+    """
+    downscaled_photo_path = get_cache_path("photos") / (
+        f"{get_file_digest(photo_path)}_{photo_width}_{photo_ppi:g}ppi.png"
+    )
+    is_cached = downscaled_photo_path.exists()
+    emit_cache_hook("downscaled_photo", is_cached)
+    if not is_cached:
+        temporary_path = downscaled_photo_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        typst_source = (
+            f"#set page(width: {photo_width}, height: auto, margin: 0pt)\n"
+            f'#image("/{photo_path.name}", width: 100%)\n'
+        ).encode()
+        temporary_path.write_bytes(
+            typst.compile(
+                # typst-py's stub requires the source and root to be the same
+                # type, but in-memory source with a directory root is supported:
+                cast("Any", typst_source),
+                root=photo_path.parent,
+                format="png",
+                ppi=photo_ppi,
             )
+        )
+        temporary_path.replace(downscaled_photo_path)
+
+    return downscaled_photo_path
 
 
-@functools.lru_cache(maxsize=1)
 def get_typst_compiler(
     file_path: pathlib.Path,
     input_file_path: pathlib.Path | None,
 ) -> typst.Compiler:
-    """Create cached Typst compiler with font paths configured.
+    """Return a Typst compiler loaded with the fonts the Typst source uses.
 
     Why:
-        Compiler initialization is expensive. Caching enables reuse for both
-        PDF and PNG generation. Font paths include package fonts and optional
-        user fonts from input file directory.
+        Font loading dominates compiler start-up. The bundled and user font
+        folders are looked up in the persistent font index, and only the ones
+        providing families the Typst source names (plus fallback families) are
+        loaded. Font paths include package fonts and optional user fonts from
+        input file directory.
 
     Args:
         file_path: Typst source file to compile.
@@ -122,14 +425,51 @@ def get_typst_compiler(
     Returns:
         Configured Typst compiler instance.
     """
-    return typst.Compiler(
-        file_path,
-        font_paths=[
+    font_folders = index_font_folders(
+        [
             *rendercv_fonts.paths_to_font_folders,
             (
                 input_file_path.parent / "fonts"
                 if input_file_path
                 else pathlib.Path.cwd() / "fonts"
             ),
-        ],
+        ]
+    )
+    return call_cached(
+        "typst_compiler",
+        create_typst_compiler,
+        file_path,
+        select_font_folders(font_folders, file_path.read_text(encoding="utf-8")),
+    )
+
+
+# Room for the compilers of the files watch mode re-renders, in each thread:
+@bounded_thread_local_cache(maxsize=4)
+def create_typst_compiler(
+    file_path: pathlib.Path,
+    font_folders: tuple[FontFolder, ...],
+) -> typst.Compiler:
+    """Create cached Typst compiler with font and package paths configured.
+
+    Why:
+        Compiler initialization is expensive. Caching enables reuse for both
+        PDF and PNG generation, and across watch mode re-renders until the
+        selected fonts change. The TekliniCV Typst package is looked up in the
+        copy bundled with the distribution, then in TekliniCV's package cache,
+        so a pre-warmed installation compiles without network access.
+        A compiler can't compile from two threads at once, so each thread keeps
+        its own.
+
+    Args:
+        file_path: Typst source file to compile.
+        font_folders: Font folders to load.
+
+    Returns:
+        Configured Typst compiler instance.
+    """
+    return typst.Compiler(
+        file_path,
+        font_paths=call_cached("typst_fonts", get_typst_fonts, font_folders),
+        package_path=bundled_typst_packages_path,
+        package_cache_path=get_typst_package_cache_path(),
     )
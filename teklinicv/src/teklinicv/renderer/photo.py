@@ -0,0 +1,159 @@
+import hashlib
+import pathlib
+import re
+import shutil
+import struct
+import uuid
+
+from teklinicv.caches import bounded_cache
+from teklinicv.schema.models.teklinicv_model import TekliniCVModel
+
+# Inches per unit of the absolute Typst lengths a photo width can be given in:
+inches_per_typst_unit = {"in": 1.0, "cm": 1 / 2.54, "mm": 1 / 25.4, "pt": 1 / 72}
+# JPEG start-of-frame markers, which carry the image size:
+jpeg_start_of_frame_markers = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def get_file_digest(file_path: pathlib.Path) -> str:
+    """Return the SHA-256 digest of a file, hashing it once per change.
+
+    Why:
+        Photos are compared on every render to decide whether they need to be
+        placed again. Digests are cached by path, size, and modification time,
+        so unchanged multi-megabyte photos are only read once per process.
+
+    Args:
+        file_path: File to hash.
+
+    Returns:
+        Hexadecimal SHA-256 digest of the file contents.
+    """
+    stat = file_path.stat()
+    return compute_file_digest(file_path, stat.st_size, stat.st_mtime_ns)
+
+
+@bounded_cache(maxsize=64)
+def compute_file_digest(file_path: pathlib.Path, size: int, mtime_ns: int) -> str:  # NOQA: ARG001
+    """Hash a file. Size and modification time are only part of the cache key.
+
+    Args:
+        file_path: File to hash.
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+
+    Returns:
+        Hexadecimal SHA-256 digest of the file contents.
+    """
+    with file_path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def place_file(source: pathlib.Path, destination: pathlib.Path) -> bool:
+    """Make destination hold the contents of source, doing nothing if it already does.
+
+    Why:
+        PDF and PNG generation both need the photo next to the Typst file, and
+        watch mode re-renders on every save. Comparing contents avoids rewriting
+        identical files. The destination is always a copy, never a hardlink, so
+        editing either file can't change the other. The file is copied under a
+        temporary name and renamed, so the destination is never missing or
+        partially written.
+
+    Args:
+        source: File to place.
+        destination: Where the file should be.
+
+    Returns:
+        True if the destination was written, False if it was already up to date.
+    """
+    if (
+        destination.exists()
+        and destination.stat().st_size == source.stat().st_size
+        and get_file_digest(destination) == get_file_digest(source)
+    ):
+        return False
+
+    temporary_path = destination.with_name(
+        f".{destination.name}.{uuid.uuid4().hex}.tmp"
+    )
+    try:
+        shutil.copyfile(source, temporary_path)
+        temporary_path.replace(destination)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+    return True
+
+
+def get_image_size(image_path: pathlib.Path) -> tuple[int, int] | None:
+    """Read the pixel size of a PNG or JPEG image from its header.
+
+    Args:
+        image_path: Image file.
+
+    Returns:
+        Width and height in pixels, or None if the format is not recognized.
+    """
+    with image_path.open("rb") as file:
+        header = file.read(24)
+        if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", header[16:24])
+            return width, height
+        if not header.startswith(b"\xff\xd8"):
+            return None
+
+        file.seek(2)
+        while marker := file.read(2):
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            if marker[1] == 0xFF:  # Fill byte
+                file.seek(-1, 1)
+                continue
+            (length,) = struct.unpack(">H", file.read(2))
+            if marker[1] in jpeg_start_of_frame_markers:
+                height, width = struct.unpack(">xHH", file.read(5))
+                return width, height
+            file.seek(length - 2, 1)
+
+    return None
+
+
+def get_downscaled_photo_name(teklinicv_model: TekliniCVModel) -> str | None:
+    """Decide whether the photo is downscaled and return the downscaled file name.
+
+    Why:
+        Camera photos are often many times larger than needed for a few
+        centimeters of a printed page. With `photo_ppi` set, PNG and JPEG photos
+        wider than `design.header.photo_width` at that resolution are replaced
+        with a downscaled PNG. Photos that are already small enough, vector
+        images, and widths relative to the font size are left as they are.
+
+    Example:
+        ```py
+        name = get_downscaled_photo_name(teklinicv_model)
+        # Returns "photo_300ppi.png" for photo.jpg and photo_ppi 300
+        ```
+
+    Args:
+        teklinicv_model: CV model with photo and photo width.
+
+    Returns:
+        Downscaled photo file name, or None if the original photo is used.
+    """
+    photo = teklinicv_model.cv.photo
+    photo_ppi = teklinicv_model.settings.render_command.photo_ppi
+    if photo is None or photo_ppi is None:
+        return None
+
+    match = re.fullmatch(
+        r"(\d+(?:\.\d+)?)(cm|in|pt|mm)", teklinicv_model.design.header.photo_width
+    )
+    image_size = get_image_size(photo) if photo.is_file() else None
+    if match is None or image_size is None:
+        return None
+
+    target_width = float(match.group(1)) * inches_per_typst_unit[match.group(2)]
+    # Photos are scaled to their printed width, whatever their height:
+    if image_size[0] <= target_width * photo_ppi:
+        return None
+
+    return f"{photo.stem}_{photo_ppi:g}ppi.png"
@@ -1,13 +1,56 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date as Date
 
+from teklinicv.caches import bounded_cache
 from teklinicv.exception import TekliniCVInternalError
 from teklinicv.schema.models.cv.entries.bases.entry_with_complex_fields import (
     get_date_object,
 )
+from teklinicv.schema.models.cv.section import Entry
 from teklinicv.schema.models.locale.locale import Locale
 
 from .string_processor import substitute_placeholders
 
+date_cache_size = 4096
+
+
+@dataclass(frozen=True)
+class DateLocale:
+    month_names: tuple[str, ...]
+    month_abbreviations: tuple[str, ...]
+    present: str
+    year: str
+    years: str
+    month: str
+    months: str
+
+
+def get_date_locale(locale: Locale) -> DateLocale:
+    """Extract the date-related translations of a locale into a hashable object.
+
+    Why:
+        Locale models are mutable Pydantic models and can't be used as cache
+        keys. Date formatting only depends on a handful of their fields, so
+        those are copied into a frozen dataclass that memoized functions can
+        be keyed by.
+
+    Args:
+        locale: Locale providing month names and time span translations.
+
+    Returns:
+        Hashable snapshot of the locale's date translations.
+    """
+    return DateLocale(
+        month_names=tuple(locale.month_names),
+        month_abbreviations=tuple(locale.month_abbreviations),
+        present=locale.present,
+        year=locale.year,
+        years=locale.years,
+        month=locale.month,
+        months=locale.months,
+    )
+
 
 def date_object_to_string(
     date: Date, *, locale: Locale, single_date_template: str
@@ -37,15 +80,31 @@ def date_object_to_string(
     Returns:
         Formatted date string with placeholders substituted.
     """
-    month_names = locale.month_names
-    month_abbreviations = locale.month_abbreviations
+    return memoized_date_object_to_string(
+        date, get_date_locale(locale), single_date_template
+    )
+
+
+@bounded_cache(maxsize=date_cache_size)
+def memoized_date_object_to_string(
+    date: Date, date_locale: DateLocale, single_date_template: str
+) -> str:
+    """Memoized implementation of `date_object_to_string`.
 
-    month = int(date.strftime("%m"))
-    year = int(date.strftime(format="%Y"))
+    Args:
+        date: Date to format.
+        date_locale: Hashable date translations of the locale.
+        single_date_template: Template with date placeholders.
+
+    Returns:
+        Formatted date string with placeholders substituted.
+    """
+    month = date.month
+    year = date.year
 
     placeholders: dict[str, str] = {
-        "MONTH_NAME": month_names[month - 1],
-        "MONTH_ABBREVIATION": month_abbreviations[month - 1],
+        "MONTH_NAME": date_locale.month_names[month - 1],
+        "MONTH_ABBREVIATION": date_locale.month_abbreviations[month - 1],
         "MONTH": str(month),
         "MONTH_IN_TWO_DIGITS": f"{month:02d}",
         "YEAR": str(year),
@@ -89,6 +148,35 @@ def format_date_range(
         single_date_template: Template for formatting individual dates.
         date_range_template: Template combining start and end dates.
 
+    Returns:
+        Formatted date range string.
+    """
+    return memoized_format_date_range(
+        start_date,
+        end_date,
+        get_date_locale(locale),
+        single_date_template,
+        date_range_template,
+    )
+
+
+@bounded_cache(maxsize=date_cache_size)
+def memoized_format_date_range(
+    start_date: str | int,
+    end_date: str | int,
+    date_locale: DateLocale,
+    single_date_template: str,
+    date_range_template: str,
+) -> str:
+    """Memoized implementation of `format_date_range`.
+
+    Args:
+        start_date: Start date as integer year or ISO date string.
+        end_date: End date as integer year, ISO date string, or "present".
+        date_locale: Hashable date translations of the locale.
+        single_date_template: Template for formatting individual dates.
+        date_range_template: Template combining start and end dates.
+
     Returns:
         Formatted date range string.
     """
@@ -98,20 +186,20 @@ def format_date_range(
     else:
         # Then it means start_date is either in YYYY-MM-DD or YYYY-MM format
         date_object = get_date_object(start_date)
-        start_date = date_object_to_string(
-            date_object, locale=locale, single_date_template=single_date_template
+        start_date = memoized_date_object_to_string(
+            date_object, date_locale, single_date_template
         )
 
     if end_date == "present":
-        end_date = locale.present
+        end_date = date_locale.present
     elif isinstance(end_date, int):
         # Then it means only the year is provided
         end_date = str(end_date)
     else:
         # Then it means end_date is either in YYYY-MM-DD or YYYY-MM format
         date_object = get_date_object(end_date)
-        end_date = date_object_to_string(
-            date_object, locale=locale, single_date_template=single_date_template
+        end_date = memoized_date_object_to_string(
+            date_object, date_locale, single_date_template
         )
 
     placeholders: dict[str, str] = {
@@ -152,6 +240,25 @@ def format_single_date(
         locale: Locale providing present translation.
         single_date_template: Template for formatting standard dates.
 
+    Returns:
+        Formatted date string or original custom text.
+    """
+    return memoized_format_single_date(
+        date, get_date_locale(locale), single_date_template
+    )
+
+
+@bounded_cache(maxsize=date_cache_size)
+def memoized_format_single_date(
+    date: str | int, date_locale: DateLocale, single_date_template: str
+) -> str:
+    """Memoized implementation of `format_single_date`.
+
+    Args:
+        date: Date as integer year, ISO date string, "present", or custom text.
+        date_locale: Hashable date translations of the locale.
+        single_date_template: Template for formatting standard dates.
+
     Returns:
         Formatted date string or original custom text.
     """
@@ -159,12 +266,12 @@ def format_single_date(
         # Only year is provided
         date_string = str(date)
     elif date == "present":
-        date_string = locale.present
+        date_string = date_locale.present
     else:
         try:
             date_object = get_date_object(date)
-            date_string = date_object_to_string(
-                date_object, locale=locale, single_date_template=single_date_template
+            date_string = memoized_date_object_to_string(
+                date_object, date_locale, single_date_template
             )
         except TekliniCVInternalError:
             # Then it is a custom date string (e.g., "My Custom Date")
@@ -207,6 +314,35 @@ def compute_time_span_string(
         current_date: Reference date for "present" calculation.
         time_span_template: Template for formatting duration output.
 
+    Returns:
+        Formatted time span string with years and months.
+    """
+    return memoized_compute_time_span_string(
+        start_date,
+        end_date,
+        get_date_locale(locale),
+        current_date,
+        time_span_template,
+    )
+
+
+@bounded_cache(maxsize=date_cache_size)
+def memoized_compute_time_span_string(
+    start_date: str | int,
+    end_date: str | int,
+    date_locale: DateLocale,
+    current_date: Date,
+    time_span_template: str,
+) -> str:
+    """Memoized implementation of `compute_time_span_string`.
+
+    Args:
+        start_date: Start date as integer year or ISO date string.
+        end_date: End date as integer year, ISO date string, or "present".
+        date_locale: Hashable date translations of the locale.
+        current_date: Reference date for "present" calculation.
+        time_span_template: Template for formatting duration output.
+
     Returns:
         Formatted time span string with years and months.
     """
@@ -220,10 +356,10 @@ def compute_time_span_string(
 
         if time_span_in_years < 2:
             how_many_years = "1"
-            locale_years = locale.year
+            locale_years = date_locale.year
         else:
             how_many_years = str(time_span_in_years)
-            locale_years = locale.years
+            locale_years = date_locale.years
 
         placeholders: dict[str, str] = {
             "HOW_MANY_YEARS": how_many_years,
@@ -255,10 +391,10 @@ def compute_time_span_string(
         locale_years = ""
     elif how_many_years == 1:
         how_many_years = "1"
-        locale_years = locale.year
+        locale_years = date_locale.year
     else:
         how_many_years = str(how_many_years)
-        locale_years = locale.years
+        locale_years = date_locale.years
 
     # Format the number of months between start_date and end_date:
     if how_many_months == 0:
@@ -266,10 +402,10 @@ def compute_time_span_string(
         locale_months = ""
     elif how_many_months == 1:
         how_many_months = "1"
-        locale_months = locale.month
+        locale_months = date_locale.month
     else:
         how_many_months = str(how_many_months)
-        locale_months = locale.months
+        locale_months = date_locale.months
 
     placeholders = {
         "HOW_MANY_YEARS": how_many_years,
@@ -278,3 +414,147 @@ def compute_time_span_string(
         "MONTHS": locale_months,
     }
     return substitute_placeholders(time_span_template, placeholders)
+
+
+@bounded_cache(maxsize=date_cache_size)
+def format_entry_date(
+    *,
+    date: str | int | None,
+    start_date: str | int | None,
+    end_date: str | int | None,
+    date_locale: DateLocale,
+    current_date: Date,
+    show_time_span: bool,
+    single_date_template: str,
+    date_range_template: str,
+    time_span_template: str,
+) -> str:
+    """Format an entry's date field as single date or range with optional time span.
+
+    Why:
+        Entries in a CV often share the same dates (e.g., several positions at
+        the same company), and each entry is rendered once per output format.
+        Memoizing the full combination avoids reformatting identical dates.
+
+    Args:
+        date: Single date for publications and certifications.
+        start_date: Range start for employment and education.
+        end_date: Range end for employment and education.
+        date_locale: Hashable date translations of the locale.
+        current_date: Reference date for "present" calculation.
+        show_time_span: Whether to append duration to date range.
+        single_date_template: Template for single date formatting.
+        date_range_template: Template for date range formatting.
+        time_span_template: Template for duration formatting.
+
+    Returns:
+        Formatted date string, optionally with time span on new lines.
+    """
+    if date and not (start_date or end_date):
+        return memoized_format_single_date(date, date_locale, single_date_template)
+    if start_date and end_date:
+        date_range = memoized_format_date_range(
+            start_date,
+            end_date,
+            date_locale,
+            single_date_template,
+            date_range_template,
+        )
+        if show_time_span:
+            time_span = memoized_compute_time_span_string(
+                start_date,
+                end_date,
+                date_locale,
+                current_date,
+                time_span_template,
+            )
+            return f"{date_range}\n\n{time_span}"
+
+        return date_range
+
+    raise TekliniCVInternalError("Date is not provided for this entry.")
+
+
+def format_entry_dates(
+    entries: Sequence[Entry],
+    *,
+    locale: Locale,
+    current_date: Date,
+    show_time_span: bool,
+    single_date_template: str,
+    date_range_template: str,
+    time_span_template: str,
+) -> list[str | None]:
+    """Format the date fields of all entries of a section in one call.
+
+    Why:
+        All entries of a section share the locale, the templates, and the time
+        span setting. Resolving the locale once per section instead of once per
+        entry keeps the per-entry cost to a cache lookup.
+
+    Example:
+        ```py
+        dates = format_entry_dates(
+            section.entries,
+            locale=english_locale,
+            current_date=Date(2025, 1, 1),
+            show_time_span=False,
+            single_date_template="MONTH_ABBREVIATION YEAR",
+            date_range_template="START_DATE to END_DATE",
+            time_span_template="HOW_MANY_YEARS YEARS",
+        )
+        # Returns: ["Jun 2020 to present", None, "Mar 2024"]
+        ```
+
+    Args:
+        entries: Entries of a section.
+        locale: Locale for date formatting.
+        current_date: Reference date for "present" calculation.
+        show_time_span: Whether to append duration to date ranges.
+        single_date_template: Template for single date formatting.
+        date_range_template: Template for date range formatting.
+        time_span_template: Template for duration formatting.
+
+    Returns:
+        Formatted date of each entry, or None for entries without dates.
+    """
+    date_locale = get_date_locale(locale)
+    dates: list[str | None] = []
+    for entry in entries:
+        date = getattr(entry, "date", None)
+        start_date = getattr(entry, "start_date", None)
+        end_date = getattr(entry, "end_date", None)
+        if isinstance(entry, str) or not (date or (start_date and end_date)):
+            dates.append(None)
+            continue
+
+        dates.append(
+            format_entry_date(
+                date=date,
+                start_date=start_date,
+                end_date=end_date,
+                date_locale=date_locale,
+                current_date=current_date,
+                show_time_span=show_time_span,
+                single_date_template=single_date_template,
+                date_range_template=date_range_template,
+                time_span_template=time_span_template,
+            )
+        )
+
+    return dates
+
+
+def clear_date_caches() -> None:
+    """Clear all memoized date parsing and formatting results.
+
+    Why:
+        Date caches are bounded, but long-running processes may still want to
+        release them explicitly, e.g., between batches of unrelated CVs.
+    """
+    get_date_object.cache_clear()
+    memoized_date_object_to_string.cache_clear()
+    memoized_format_date_range.cache_clear()
+    memoized_format_single_date.cache_clear()
+    memoized_compute_time_span_string.cache_clear()
+    format_entry_date.cache_clear()
@@ -1,17 +1,24 @@
 import re
 import textwrap
+from dataclasses import dataclass
 from datetime import date as Date
 
+from teklinicv.caches import bounded_cache
 from teklinicv.exception import TekliniCVInternalError
 from teklinicv.schema.models.cv.entries.publication import PublicationEntry
 from teklinicv.schema.models.cv.section import Entry
 from teklinicv.schema.models.design.classic_theme import Templates
 from teklinicv.schema.models.locale.locale import Locale
 
-from .date import compute_time_span_string, format_date_range, format_single_date
-from .string_processor import clean_url, substitute_placeholders
+from .date import format_entry_date, format_single_date, get_date_locale
+from .string_processor import (
+    build_keyword_matcher_pattern,
+    clean_url,
+    substitute_placeholders,
+)
 
 uppercase_word_pattern = re.compile(r"\b[A-Z_]+\b")
+whitespace_pattern = re.compile(r"(\s+)")
 
 
 def render_entry_templates[EntryType: Entry](
@@ -21,6 +28,8 @@ def render_entry_templates[EntryType: Entry](
     locale: Locale,
     show_time_span: bool,
     current_date: Date,
+    formatted_date: str | None = None,
+    entry_template_plans: dict[str, "EntryTemplatePlan"] | None = None,
 ) -> EntryType:
     """Expand entry templates by substituting field placeholders with processed values.
 
@@ -35,17 +44,24 @@ def render_entry_templates[EntryType: Entry](
         locale: Locale for date and text formatting.
         show_time_span: Whether to include duration calculation in dates.
         current_date: Reference date for "present" and time span calculations.
+        formatted_date: Already formatted date of the entry (e.g., from
+            `format_entry_dates`). Computed from the entry if not provided.
+        entry_template_plans: Already compiled plans of `templates` (e.g., from
+            `compile_entry_template_plans`). Compiled if not provided.
 
     Returns:
         Entry with template-generated display fields.
     """
-    if isinstance(entry, str) or not hasattr(templates, entry.entry_type_in_snake_case):
-        # It's a TextEntry, or an entry type without templates. Return it as is:
+    if isinstance(entry, str):
+        # It's a TextEntry. Return it as is:
         return entry
 
-    entry_templates: dict[str, str] = getattr(
-        templates, entry.entry_type_in_snake_case
-    ).model_dump(exclude_none=True)
+    if entry_template_plans is None:
+        entry_template_plans = compile_entry_template_plans(templates)
+    plan = entry_template_plans.get(entry.entry_type_in_snake_case)
+    if plan is None:
+        # It's an entry type without templates. Return it as is:
+        return entry
 
     entry_fields: dict[str, str | str] = {
         key.upper(): value for key, value in entry.model_dump(exclude_none=True).items()
@@ -64,7 +80,9 @@ def render_entry_templates[EntryType: Entry](
             raise TekliniCVInternalError("AUTHORS in fields but authors is None")
         entry_fields["AUTHORS"] = process_authors(authors)
 
-    if (
+    if formatted_date is not None:
+        entry_fields["DATE"] = formatted_date
+    elif (
         "DATE" in entry_fields
         or "START_DATE" in entry_fields
         or "END_DATE" in entry_fields
@@ -111,18 +129,197 @@ def render_entry_templates[EntryType: Entry](
     if "SUMMARY" in entry_fields:
         entry_fields["SUMMARY"] = process_summary(entry_fields["SUMMARY"])
 
-    entry_templates = remove_not_provided_placeholders(entry_templates, entry_fields)
+    for template_name, value in fill_entry_template_plan(plan, entry_fields).items():
+        setattr(entry, template_name, value)
 
-    for template_name, template in (entry_templates | entry_fields).items():
+    for field_name, field_value in entry_fields.items():
         setattr(
             entry,
-            template_name,
-            substitute_placeholders(template, entry_fields),
+            field_name,
+            substitute_placeholders(field_value, entry_fields),
         )
 
     return entry
 
 
+@dataclass(frozen=True, eq=False)
+class EntryTemplatePlan:
+    """Entry templates split into whitespace-separated tokens.
+
+    Each token records the placeholders it contains, so the tokens of missing
+    fields can be dropped without scanning the template text again.
+
+    Args:
+        templates: Template names mapped to their alternating non-whitespace and
+            whitespace tokens.
+        token_placeholders: Placeholders found in each token, parallel to
+            `templates`.
+        placeholders: All uppercase words used in the templates.
+    """
+
+    templates: tuple[tuple[str, tuple[str, ...]], ...]
+    token_placeholders: tuple[tuple[frozenset[str], ...], ...]
+    placeholders: frozenset[str]
+
+
+@bounded_cache(maxsize=256)
+def compile_entry_template_plan(
+    entry_templates: tuple[tuple[str, str], ...],
+) -> EntryTemplatePlan:
+    """Parse entry templates into a reusable plan of tokens and placeholders.
+
+    Why:
+        Every entry of a type shares the same templates, and rendering runs once
+        per output format. Parsing the templates once per distinct template set
+        keeps the per-entry work to filling slots.
+
+    Example:
+        ```py
+        plan = compile_entry_template_plan(
+            (("main_column", "POSITION at COMPANY, LOCATION"),)
+        )
+        # plan.placeholders == frozenset({"POSITION", "COMPANY", "LOCATION"})
+        ```
+
+    Args:
+        entry_templates: Template names and template strings of an entry type.
+
+    Returns:
+        Plan shared by all entries rendered with these templates.
+    """
+    placeholders = frozenset(
+        uppercase_word_pattern.findall(
+            " ".join(template for _, template in entry_templates)
+        )
+    )
+    templates = []
+    token_placeholders = []
+    for template_name, template in entry_templates:
+        tokens = tuple(whitespace_pattern.split(template))
+        templates.append((template_name, tokens))
+        token_placeholders.append(
+            tuple(
+                frozenset(
+                    placeholder for placeholder in placeholders if placeholder in token
+                )
+                for token in tokens
+            )
+        )
+
+    return EntryTemplatePlan(
+        templates=tuple(templates),
+        token_placeholders=tuple(token_placeholders),
+        placeholders=placeholders,
+    )
+
+
+def compile_entry_template_plans(templates: Templates) -> dict[str, EntryTemplatePlan]:
+    """Compile the templates of every entry type once per render.
+
+    Why:
+        Dumping an entry type's templates and building the cache key of its plan
+        costs more than filling the plan. Compiling every plan once before the
+        entries are rendered leaves a dictionary lookup per entry.
+
+    Args:
+        templates: Template collection for entry types and dates.
+
+    Returns:
+        Entry types in snake case mapped to their plans.
+    """
+    return {
+        entry_type: compile_entry_template_plan(tuple(entry_templates.items()))
+        for entry_type, entry_templates in templates.model_dump(
+            exclude_none=True
+        ).items()
+        if isinstance(entry_templates, dict)
+    }
+
+
+@bounded_cache(maxsize=1024)
+def resolve_entry_template_plan(
+    plan: EntryTemplatePlan, provided_placeholders: frozenset[str]
+) -> tuple[tuple[str, str, tuple[str, ...]], ...]:
+    """Resolve a plan for one set of provided fields.
+
+    Why:
+        Entries of a type usually provide the same few field combinations.
+        Dropping the tokens of missing fields and locating placeholder slots once
+        per combination leaves only a join per entry.
+
+    Args:
+        plan: Compiled entry templates.
+        provided_placeholders: Uppercase names of the fields the entry provides.
+
+    Returns:
+        Template names with their cleaned text and segments. Segments alternate
+        between literal text (even indices) and placeholder names (odd indices).
+    """
+    not_provided_placeholders = plan.placeholders - provided_placeholders
+    slot_pattern = (
+        build_keyword_matcher_pattern(provided_placeholders)
+        if provided_placeholders
+        else None
+    )
+
+    resolved = []
+    for (template_name, tokens), token_placeholders in zip(
+        plan.templates, plan.token_placeholders, strict=True
+    ):
+        if not_provided_placeholders:
+            text = clean_trailing_parts(
+                "".join(
+                    "" if placeholders & not_provided_placeholders else token
+                    for token, placeholders in zip(
+                        tokens, token_placeholders, strict=True
+                    )
+                )
+            )
+        else:
+            text = "".join(tokens)
+
+        segments = tuple(slot_pattern.split(text)) if slot_pattern else (text,)
+        resolved.append((template_name, text, segments))
+
+    return tuple(resolved)
+
+
+def fill_entry_template_plan(
+    plan: EntryTemplatePlan, entry_fields: dict[str, str]
+) -> dict[str, str]:
+    """Render compiled entry templates with the values of an entry.
+
+    Example:
+        ```py
+        plan = compile_entry_template_plan(
+            (("main_column", "POSITION at COMPANY, LOCATION"),)
+        )
+        result = fill_entry_template_plan(
+            plan, {"POSITION": "Engineer", "COMPANY": "Acme"}
+        )
+        # Returns: {"main_column": "Engineer at Acme"}
+        ```
+
+    Args:
+        plan: Compiled entry templates.
+        entry_fields: Processed field values with uppercase keys.
+
+    Returns:
+        Template names mapped to rendered strings.
+    """
+    resolved = resolve_entry_template_plan(plan, frozenset(entry_fields))
+    if not entry_fields:
+        return {template_name: text for template_name, text, _ in resolved}
+
+    return {
+        template_name: "".join(
+            entry_fields[segment] if i % 2 else segment
+            for i, segment in enumerate(segments)
+        ).strip()
+        for template_name, _, segments in resolved
+    }
+
+
 def process_highlights(highlights: list[str]) -> str:
     """Convert highlight list to Markdown unordered list with nested items.
 
@@ -227,31 +424,17 @@ def process_date(
     Returns:
         Formatted date string, optionally with time span on new lines.
     """
-    if date and not (start_date or end_date):
-        return format_single_date(
-            date, locale=locale, single_date_template=single_date_template
-        )
-    if start_date and end_date:
-        date_range = format_date_range(
-            start_date,
-            end_date,
-            locale=locale,
-            single_date_template=single_date_template,
-            date_range_template=date_range_template,
-        )
-        if show_time_span:
-            time_span = compute_time_span_string(
-                start_date,
-                end_date,
-                locale=locale,
-                current_date=current_date,
-                time_span_template=time_span_template,
-            )
-            return f"{date_range}\n\n{time_span}"
-
-        return date_range
-
-    raise TekliniCVInternalError("Date is not provided for this entry.")
+    return format_entry_date(
+        date=date,
+        start_date=start_date,
+        end_date=end_date,
+        date_locale=get_date_locale(locale),
+        current_date=current_date,
+        show_time_span=show_time_span,
+        single_date_template=single_date_template,
+        date_range_template=date_range_template,
+        time_span_template=time_span_template,
+    )
 
 
 def process_url(entry: Entry) -> str:
@@ -327,8 +510,9 @@ def remove_not_provided_placeholders(
 
     Why:
         Optional entry fields like location or URL should disappear cleanly from
-        templates when not provided. Regex removal eliminates placeholders plus
-        adjacent punctuation to prevent "Position at " or trailing commas.
+        templates when not provided. Dropping the whole token around each missing
+        placeholder, then trailing punctuation, prevents "Position at " or
+        trailing commas.
 
     Example:
         ```py
@@ -345,24 +529,13 @@ def remove_not_provided_placeholders(
     Returns:
         Templates with missing placeholders and surrounding characters removed.
     """
-    # Remove the not provided placeholders from the templates, including characters
-    # around them:
-    used_placeholders_in_templates = set(
-        uppercase_word_pattern.findall(" ".join(entry_templates.values()))
-    )
-    not_provided_placeholders = used_placeholders_in_templates - set(
-        entry_fields.keys()
-    )
-    if not_provided_placeholders:
-        not_provided_placeholders_pattern = re.compile(
-            r"\S*(?:" + "|".join(not_provided_placeholders) + r")\S*"
+    plan = compile_entry_template_plan(tuple(entry_templates.items()))
+    return {
+        template_name: text
+        for template_name, text, _ in resolve_entry_template_plan(
+            plan, frozenset(entry_fields)
         )
-        entry_templates = {
-            key: clean_trailing_parts(not_provided_placeholders_pattern.sub("", value))
-            for key, value in entry_templates.items()
-        }
-
-    return entry_templates
+    }
 
 
 unwanted_trailing_parts_pattern = re.compile(r"[^A-Za-z0-9.!?\[\]\(\)\*_%]+$")
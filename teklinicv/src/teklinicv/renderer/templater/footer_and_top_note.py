@@ -83,6 +83,7 @@ def render_footer_template(
     name: str | None,
     single_date_template: str,
     string_processors: list[Callable[[str], str]] | None = None,
+    chapter_label: str | None = None,
 ) -> str:
     """Render footer by substituting placeholders and wrapping in Typst context block.
 
@@ -110,6 +111,9 @@ def render_footer_template(
         name: CV owner name for placeholder substitution.
         single_date_template: Template for date formatting.
         string_processors: Optional processors for markdown parsing and formatting.
+        chapter_label: Label of the CV's chapter when several CVs are combined
+            into one document. Page numbers then count from the chapter's first
+            page, and the total is the chapter's page count.
 
     Returns:
         Typst context block with rendered footer content.
@@ -130,8 +134,16 @@ def render_footer_template(
             single_date_template=single_date_template,
         ),
         "NAME": name or "",
-        "PAGE_NUMBER": "#str(here().page())",
-        "TOTAL_PAGES": "#str(counter(page).final().first())",
+        "PAGE_NUMBER": (
+            "#str(here().page())"
+            if chapter_label is None
+            else "#str(counter(page).get().first())"
+        ),
+        "TOTAL_PAGES": (
+            "#str(counter(page).final().first())"
+            if chapter_label is None
+            else f"#str(counter(page).at(<{chapter_label}-end>).first())"
+        ),
         "MONTH_NAME": month_names[month - 1],
         "MONTH_ABBREVIATION": month_abbreviations[month - 1],
         "MONTH": str(month),
@@ -1,11 +1,13 @@
 import itertools
 import re
+import threading
 from xml.etree.ElementTree import Element
 
 import markdown
 import markdown.core
 
 from teklinicv.exception import TekliniCVUserError
+from teklinicv.profiler import profile_span
 
 
 def to_typst_string(elem: Element) -> str:
@@ -150,16 +152,33 @@ def escape_typst_characters(string: str) -> str:
     return string
 
 
-# Create a Markdown instance
-md = markdown.core.Markdown(extensions=["admonition"])
-md.output_formats["typst"] = to_typst_string  # pyright: ignore[reportArgumentType]
-md.set_output_format("typst")  # pyright: ignore[reportArgumentType]
-md.parser.blockprocessors.deregister("hashheader")
-md.parser.blockprocessors.deregister("setextheader")
-md.parser.blockprocessors.deregister("olist")
-md.parser.blockprocessors.deregister("ulist")
-md.parser.blockprocessors.deregister("quote")
-md.stripTopLevelTags = False
+typst_converters = threading.local()
+
+
+def get_typst_markdown_converter() -> markdown.core.Markdown:
+    """Return the calling thread's reusable Markdown-to-Typst converter.
+
+    Why:
+        A `Markdown` instance keeps the state of the document it is converting,
+        so CVs rendered from several threads at once would mix each other's
+        content through a shared converter.
+
+    Returns:
+        Markdown converter with Typst output.
+    """
+    converter = getattr(typst_converters, "converter", None)
+    if converter is None:
+        converter = markdown.core.Markdown(extensions=["admonition"])
+        converter.output_formats["typst"] = to_typst_string  # pyright: ignore[reportArgumentType]
+        converter.set_output_format("typst")  # pyright: ignore[reportArgumentType]
+        converter.parser.blockprocessors.deregister("hashheader")
+        converter.parser.blockprocessors.deregister("setextheader")
+        converter.parser.blockprocessors.deregister("olist")
+        converter.parser.blockprocessors.deregister("ulist")
+        converter.parser.blockprocessors.deregister("quote")
+        converter.stripTopLevelTags = False
+        typst_converters.converter = converter
+    return converter
 
 
 def markdown_to_typst(markdown_string: str) -> str:
@@ -176,7 +195,30 @@ def markdown_to_typst(markdown_string: str) -> str:
     Returns:
         Typst-formatted string.
     """
-    return md.convert(markdown_string)
+    with profile_span("Markdown to Typst", "markdown"):
+        # Without a reset, stashed HTML and link references pile up across inputs:
+        return get_typst_markdown_converter().reset().convert(markdown_string)
+
+
+html_converters = threading.local()
+
+
+def get_html_markdown_converter() -> markdown.core.Markdown:
+    """Return the calling thread's reusable Markdown-to-HTML converter.
+
+    Why:
+        `markdown.markdown()` builds a new `Markdown` instance and loads its
+        extensions on every call. A `Markdown` instance keeps per-document state,
+        so one converter is kept per thread instead of sharing a global.
+
+    Returns:
+        Markdown converter with HTML output.
+    """
+    converter = getattr(html_converters, "converter", None)
+    if converter is None:
+        converter = markdown.core.Markdown()
+        html_converters.converter = converter
+    return converter
 
 
 def markdown_to_html(markdown_string: str) -> str:
@@ -188,4 +230,5 @@ def markdown_to_html(markdown_string: str) -> str:
     Returns:
         HTML-formatted string.
     """
-    return markdown.markdown(markdown_string)
+    with profile_span("Markdown to HTML", "markdown"):
+        return get_html_markdown_converter().reset().convert(markdown_string)
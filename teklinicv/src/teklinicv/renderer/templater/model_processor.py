@@ -4,15 +4,23 @@ from typing import Literal
 from teklinicv.schema.models.cv.section import Entry
 from teklinicv.schema.models.teklinicv_model import TekliniCVModel
 
+from ..photo import get_downscaled_photo_name
 from .connections import compute_connections
-from .entry_templates_from_input import render_entry_templates
+from .date import format_entry_dates
+from .entry_templates_from_input import (
+    compile_entry_template_plans,
+    render_entry_templates,
+)
 from .footer_and_top_note import render_footer_template, render_top_note_template
 from .markdown_parser import markdown_to_typst
 from .string_processor import apply_string_processors, make_keywords_bold
 
 
 def process_model(
-    teklinicv_model: TekliniCVModel, file_type: Literal["typst", "markdown"]
+    teklinicv_model: TekliniCVModel,
+    file_type: Literal["typst", "markdown"],
+    *,
+    chapter_label: str | None = None,
 ) -> TekliniCVModel:
     """Pre-process CV model for template rendering with format-specific transformations.
 
@@ -24,6 +32,8 @@ def process_model(
     Args:
         teklinicv_model: Validated CV model.
         file_type: Target format for format-specific processors.
+        chapter_label: Label of the CV's chapter when several CVs are combined
+            into one document, for the footer's page numbers.
 
     Returns:
         Processed model ready for templates.
@@ -31,10 +41,17 @@ def process_model(
     teklinicv_model = teklinicv_model.model_copy(deep=True)
 
     string_processors: list[Callable[[str], str]] = [
-        lambda string: make_keywords_bold(string, teklinicv_model.settings.bold_keywords)
+        lambda string: make_keywords_bold(
+            string, teklinicv_model.settings.bold_keywords
+        )
     ]
     if file_type == "typst":
         string_processors.extend([markdown_to_typst])
+        downscaled_photo_name = get_downscaled_photo_name(teklinicv_model)
+        if downscaled_photo_name and teklinicv_model.cv.photo:
+            teklinicv_model.cv.photo = teklinicv_model.cv.photo.with_name(
+                downscaled_photo_name
+            )
 
     teklinicv_model.cv.plain_name = teklinicv_model.cv.name  # ty: ignore[unresolved-attribute]
     teklinicv_model.cv.name = apply_string_processors(
@@ -60,16 +77,29 @@ def process_model(
         name=teklinicv_model.cv.name,
         single_date_template=teklinicv_model.design.templates.single_date,
         string_processors=string_processors,
+        chapter_label=chapter_label,
     )
     if teklinicv_model.cv.sections is None:
         return teklinicv_model
 
+    entry_template_plans = compile_entry_template_plans(
+        teklinicv_model.design.templates
+    )
     for section in teklinicv_model.cv.teklinicv_sections:
         section.title = apply_string_processors(section.title, string_processors)
         show_time_span = (
             section.snake_case_title
             in teklinicv_model.design.sections.show_time_spans_in
         )
+        formatted_dates = format_entry_dates(
+            section.entries,
+            locale=teklinicv_model.locale,
+            current_date=teklinicv_model.settings.current_date,
+            show_time_span=show_time_span,
+            single_date_template=teklinicv_model.design.templates.single_date,
+            date_range_template=teklinicv_model.design.templates.date_range,
+            time_span_template=teklinicv_model.design.templates.time_span,
+        )
         for i, entry in enumerate(section.entries):
             entry = render_entry_templates(  # NOQA: PLW2901
                 entry,
@@ -77,6 +107,8 @@ def process_model(
                 locale=teklinicv_model.locale,
                 show_time_span=show_time_span,
                 current_date=teklinicv_model.settings.current_date,
+                formatted_date=formatted_dates[i],
+                entry_template_plans=entry_template_plans,
             )
             section.entries[i] = process_fields(entry, string_processors)
 
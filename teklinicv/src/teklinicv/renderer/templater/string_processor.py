@@ -5,6 +5,7 @@ from typing import overload
 
 import pydantic
 
+from teklinicv.caches import bounded_cache
 from teklinicv.exception import TekliniCVInternalError
 
 
@@ -38,7 +39,7 @@ def apply_string_processors(
     return functools.reduce(lambda v, f: f(v), string_processors, string)
 
 
-@functools.lru_cache(maxsize=64)
+@bounded_cache(maxsize=64)
 def build_keyword_matcher_pattern(keywords: frozenset[str]) -> re.Pattern:
     """Build cached regex pattern for matching keywords with longest-first priority.
 
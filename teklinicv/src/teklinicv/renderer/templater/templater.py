@@ -1,12 +1,15 @@
 import contextlib
-import functools
 import pathlib
 from typing import Literal
 
 import jinja2
 
+from teklinicv.caches import bounded_cache
+from teklinicv.hooks import hook_stage
+from teklinicv.profiler import profile_span
 from teklinicv.schema.models.teklinicv_model import TekliniCVModel
 
+from ..cache_path import get_cache_path
 from .markdown_parser import markdown_to_html
 from .model_processor import process_model
 from .string_processor import clean_url
@@ -14,7 +17,9 @@ from .string_processor import clean_url
 templates_directory = pathlib.Path(__file__).parent / "templates"
 
 
-@functools.lru_cache(maxsize=1)
+# One environment per input folder rendered from, so concurrent renders of CVs
+# in different folders don't evict each other's environments:
+@bounded_cache(maxsize=8)
 def get_jinja2_environment(
     input_file_path: pathlib.Path | None = None,
 ) -> jinja2.Environment:
@@ -24,6 +29,8 @@ def get_jinja2_environment(
         Template rendering is called multiple times per render. Caching environment
         prevents repeated filesystem scans. Loader hierarchy enables user template
         overrides by checking input file directory before built-in templates.
+        Compiled templates are kept in TekliniCV's persistent cache, so new
+        processes load them instead of compiling them again.
 
     Args:
         input_file_path: Path to input file for user template override resolution.
@@ -42,6 +49,7 @@ def get_jinja2_environment(
         ),
         trim_blocks=True,
         lstrip_blocks=True,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(str(get_cache_path("jinja"))),
     )
     env.filters["clean_url"] = clean_url
     env.filters["strip"] = lambda string: string.strip()
@@ -49,7 +57,10 @@ def get_jinja2_environment(
 
 
 def render_full_template(
-    teklinicv_model: TekliniCVModel, file_type: Literal["typst", "markdown"]
+    teklinicv_model: TekliniCVModel,
+    file_type: Literal["typst", "markdown"],
+    *,
+    chapter_label: str | None = None,
 ) -> str:
     """Render complete CV document by assembling preamble, header, and sections.
 
@@ -70,6 +81,10 @@ def render_full_template(
     Args:
         teklinicv_model: CV model to render.
         file_type: Output format for template selection and processing.
+        chapter_label: Typst label of the CV's chapter when several CVs are
+            combined into one document. The page counter restarts after the
+            preamble, where the label is placed, and the footer counts pages
+            within the chapter.
 
     Returns:
         Complete rendered document as string.
@@ -79,7 +94,13 @@ def render_full_template(
         "markdown": "md",
     }[file_type]
 
-    teklinicv_model = process_model(teklinicv_model, file_type)
+    with (
+        profile_span("Process model", "stage", file_type=file_type),
+        hook_stage("Process model"),
+    ):
+        teklinicv_model = process_model(
+            teklinicv_model, file_type, chapter_label=chapter_label
+        )
 
     header = render_single_template(
         file_type,
@@ -92,37 +113,46 @@ def render_full_template(
             f"Preamble.j2.{extension}",
             teklinicv_model,
         )
+        if chapter_label is not None:
+            # After the preamble, whose page setup starts the chapter's first page:
+            preamble += f"\n#counter(page).update(1)\n#metadata(none) <{chapter_label}>"
         code = f"{preamble}\n\n{header}\n"
     else:
         code = f"{header}\n"
 
     for teklinicv_section in teklinicv_model.cv.teklinicv_sections:
-        section_beginning = render_single_template(
-            file_type,
-            f"SectionBeginning.j2.{extension}",
-            teklinicv_model,
-            section_title=teklinicv_section.title,
-            snake_case_section_title=teklinicv_section.snake_case_title,
-            entry_type=teklinicv_section.entry_type,
-        )
-        section_ending = render_single_template(
-            file_type,
-            f"SectionEnding.j2.{extension}",
-            teklinicv_model,
+        with profile_span(
+            teklinicv_section.title,
+            "section",
             entry_type=teklinicv_section.entry_type,
-        )
-        entry_codes = []
-        for entry in teklinicv_section.entries:
-            entry_code = render_single_template(
+            entry_count=len(teklinicv_section.entries),
+        ):
+            section_beginning = render_single_template(
                 file_type,
-                f"entries/{teklinicv_section.entry_type}.j2.{extension}",
+                f"SectionBeginning.j2.{extension}",
                 teklinicv_model,
-                entry=entry,
+                section_title=teklinicv_section.title,
+                snake_case_section_title=teklinicv_section.snake_case_title,
+                entry_type=teklinicv_section.entry_type,
             )
-            entry_codes.append(entry_code)
-        entries_code = "\n\n".join(entry_codes)
-        section_code = f"{section_beginning}\n{entries_code}\n{section_ending}"
-        code += f"\n{section_code}"
+            section_ending = render_single_template(
+                file_type,
+                f"SectionEnding.j2.{extension}",
+                teklinicv_model,
+                entry_type=teklinicv_section.entry_type,
+            )
+            entry_codes = []
+            for entry in teklinicv_section.entries:
+                entry_code = render_single_template(
+                    file_type,
+                    f"entries/{teklinicv_section.entry_type}.j2.{extension}",
+                    teklinicv_model,
+                    entry=entry,
+                )
+                entry_codes.append(entry_code)
+            entries_code = "\n\n".join(entry_codes)
+            section_code = f"{section_beginning}\n{entries_code}\n{section_ending}"
+            code += f"\n{section_code}"
 
     return code
 
@@ -205,10 +235,11 @@ def render_single_template(
             f"{file_type}/{relative_template_path}"
         )
 
-    return template.render(
-        cv=teklinicv_model.cv,
-        design=teklinicv_model.design,
-        locale=teklinicv_model.locale,
-        settings=teklinicv_model.settings,
-        **kwargs,
-    )
+    with profile_span(template.name or relative_template_path, "template"):
+        return template.render(
+            cv=teklinicv_model.cv,
+            design=teklinicv_model.design,
+            locale=teklinicv_model.locale,
+            settings=teklinicv_model.settings,
+            **kwargs,
+        )
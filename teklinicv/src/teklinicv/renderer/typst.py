@@ -2,6 +2,7 @@ import pathlib
 
 from teklinicv.schema.models.teklinicv_model import TekliniCVModel
 
+from .output_file import write_output_file
 from .path_resolver import resolve_teklinicv_file_path
 from .templater.templater import render_full_template
 
@@ -26,5 +27,5 @@ def generate_typst(teklinicv_model: TekliniCVModel) -> pathlib.Path | None:
         teklinicv_model, teklinicv_model.settings.render_command.typst_path
     )
     typst_contents = render_full_template(teklinicv_model, "typst")
-    typst_path.write_text(typst_contents, encoding="utf-8")
+    write_output_file(typst_path, typst_contents)
     return typst_path
@@ -0,0 +1,146 @@
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+
+import typst
+
+from teklinicv.exception import TekliniCVUserError
+
+from .cache_path import get_cache_path
+
+typst_package_namespace = "preview"
+typst_package_name = "teklinicv"
+typst_package_version = "0.1.0"
+typst_package_import = (
+    f"@{typst_package_namespace}/{typst_package_name}:{typst_package_version}"
+)
+
+bundled_typst_packages_path = pathlib.Path(__file__).parent / "typst_packages"
+
+
+def get_typst_default_package_cache_path() -> pathlib.Path:
+    """Return the package cache directory the Typst CLI uses by default.
+
+    Returns:
+        Typst's package cache directory, which may not exist.
+    """
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        cache_path = pathlib.Path(os.environ["LOCALAPPDATA"])
+    elif sys.platform == "darwin":
+        cache_path = pathlib.Path.home() / "Library" / "Caches"
+    else:
+        cache_path = pathlib.Path(
+            os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+        )
+    return cache_path / "typst" / "packages"
+
+
+def get_typst_package_cache_path() -> pathlib.Path:
+    """Return the Typst package cache directory to compile with.
+
+    Why:
+        Typst's default cache is shared with other tools and may be empty in
+        fresh containers. A TekliniCV-specific cache can be pre-warmed once and
+        moved with `TEKLINICV_CACHE_DIR`. If only Typst's default cache has the
+        TekliniCV package (e.g., downloaded by the Typst CLI or an older
+        TekliniCV), that cache is used instead of downloading the package again.
+
+    Returns:
+        Directory Typst uses to cache downloaded packages.
+    """
+    cache_path = get_cache_path("typst_packages")
+    if (get_typst_package_directory(cache_path) / "typst.toml").is_file():
+        return cache_path
+
+    default_cache_path = get_typst_default_package_cache_path()
+    if (get_typst_package_directory(default_cache_path) / "typst.toml").is_file():
+        return default_cache_path
+
+    return cache_path
+
+
+def get_typst_package_directory(packages_path: pathlib.Path) -> pathlib.Path:
+    """Return where the TekliniCV Typst package lives inside a packages directory.
+
+    Args:
+        packages_path: Typst packages directory (local package path or cache).
+
+    Returns:
+        Package directory following Typst's `namespace/name/version` layout.
+    """
+    return (
+        packages_path
+        / typst_package_namespace
+        / typst_package_name
+        / typst_package_version
+    )
+
+
+def is_typst_package_available() -> bool:
+    """Check whether compiling needs no network access for the TekliniCV package.
+
+    Returns:
+        True if the package is bundled with the distribution or already cached.
+    """
+    return any(
+        (get_typst_package_directory(packages_path) / "typst.toml").is_file()
+        for packages_path in (
+            bundled_typst_packages_path,
+            get_typst_package_cache_path(),
+        )
+    )
+
+
+def prewarm_typst_package(destination: pathlib.Path | None = None) -> pathlib.Path:
+    """Make the TekliniCV Typst package available locally, downloading it once.
+
+    Why:
+        The Typst preamble imports the TekliniCV package. With a cold cache,
+        the first compilation waits for a download, and fails on offline render
+        nodes. Pre-warming during installation or image builds moves that cost
+        out of rendering.
+
+    Example:
+        ```py
+        prewarm_typst_package()
+        # The package is now bundled or cached; compiling won't touch the network.
+
+        prewarm_typst_package(bundled_typst_packages_path)
+        # Copies the package into the distribution before building a wheel.
+        ```
+
+    Args:
+        destination: Packages directory to copy the package into. Only the
+            cache is populated if not provided.
+
+    Returns:
+        Directory containing the package.
+    """
+    package_directory = get_typst_package_directory(bundled_typst_packages_path)
+    if not (package_directory / "typst.toml").is_file():
+        package_directory = get_typst_package_directory(get_typst_package_cache_path())
+
+    if not (package_directory / "typst.toml").is_file():
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            main_file = pathlib.Path(temporary_directory) / "main.typ"
+            main_file.write_text(f'#import "{typst_package_import}": *\n')
+            try:
+                typst.Compiler(
+                    main_file, package_cache_path=get_typst_package_cache_path()
+                ).compile(format="pdf")
+            except typst.TypstError as e:
+                message = (
+                    f"The Typst package {typst_package_import} couldn't be"
+                    f" downloaded!\n\n{e}"
+                )
+                raise TekliniCVUserError(message) from e
+
+    if destination is None:
+        return package_directory
+
+    destination_directory = get_typst_package_directory(destination)
+    if destination_directory != package_directory:
+        shutil.copytree(package_directory, destination_directory, dirs_exist_ok=True)
+    return destination_directory
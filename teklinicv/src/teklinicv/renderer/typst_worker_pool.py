@@ -0,0 +1,382 @@
+import contextlib
+import contextvars
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.process
+import pathlib
+import queue
+import sys
+import time
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from datetime import datetime as DateTime
+from typing import Any, Literal, Self, cast
+
+import typst
+
+from teklinicv.exception import TekliniCVUserError
+
+if sys.platform != "win32":
+    import resource
+
+# Seconds a worker may take to start, separate from the jobs' timeout, which can
+# be shorter than starting a Python process:
+worker_start_timeout = 60
+
+active_typst_worker_pool: contextvars.ContextVar["TypstWorkerPool | None"] = (
+    contextvars.ContextVar("active_typst_worker_pool", default=None)
+)
+
+
+def get_active_typst_worker_pool() -> "TypstWorkerPool | None":
+    """Return the worker pool Typst compilations currently run in.
+
+    Returns:
+        Innermost open `TypstWorkerPool`, or None to compile in-process.
+    """
+    return active_typst_worker_pool.get()
+
+
+@dataclass(frozen=True)
+class TypstCompileJob:
+    """Typst compilation sent to a worker process.
+
+    Args:
+        typst_path: Typst source file to compile.
+        input_file_path: Original input file path for relative font resolution.
+        format: Output format.
+        ppi: Resolution of PNG output in pixels per inch.
+        timestamp: Creation date stored in PDF output.
+    """
+
+    typst_path: pathlib.Path
+    input_file_path: pathlib.Path | None
+    format: Literal["pdf", "png"]
+    ppi: float | None = None
+    timestamp: DateTime | None = None
+
+
+def run_typst_worker(
+    connection: multiprocessing.connection.Connection, memory_limit: int | None
+) -> None:
+    """Compile jobs received from the parent process until told to stop.
+
+    Why:
+        Each compiled page is sent back as raw bytes as soon as the job is done,
+        so the parent can write or forward pages one by one without pickling
+        them. The worker keeps its own cached compilers and fonts across jobs.
+
+    Args:
+        connection: Pipe end to receive jobs from and send results to.
+        memory_limit: Address space limit of the worker in bytes.
+    """
+    from .pdf_png import get_typst_compiler  # NOQA: PLC0415
+
+    # Limit the compilations, not importing TekliniCV:
+    if memory_limit is not None and sys.platform != "win32":
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    connection.send("ready")
+
+    with contextlib.suppress(EOFError, ConnectionResetError):  # The parent is gone
+        while (job := connection.recv()) is not None:
+            run_typst_compile_job(connection, job, get_typst_compiler)
+
+
+def run_typst_compile_job(
+    connection: multiprocessing.connection.Connection,
+    job: TypstCompileJob,
+    get_typst_compiler: Callable[..., typst.Compiler],
+) -> None:
+    """Compile a job and send the result to the parent process.
+
+    Args:
+        connection: Pipe end to send results to.
+        job: Compilation to run.
+        get_typst_compiler: Function returning a cached compiler for a file.
+    """
+    try:
+        typst_compiler = get_typst_compiler(job.typst_path, job.input_file_path)
+        result = typst_compiler.compile(
+            format=job.format, ppi=job.ppi, timestamp=job.timestamp
+        )
+    except typst.TypstError as e:
+        connection.send(("typst_error", (e.message, e.diagnostic, e.hints, e.trace)))
+        return
+    except Exception as e:  # NOQA: BLE001
+        connection.send(("error", e))
+        return
+
+    # Pages are replaced with None once sent, to free each one early:
+    pages = cast("list[bytes | None]", result if isinstance(result, list) else [result])
+    connection.send(("pages", len(pages)))
+    for index, page in enumerate(pages):
+        connection.send_bytes(page or b"")
+        pages[index] = None
+
+
+@dataclass
+class TypstWorker:
+    process: multiprocessing.process.BaseProcess
+    connection: multiprocessing.connection.Connection
+    job_count: int = 0
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it doesn't."""
+        with contextlib.suppress(OSError):
+            self.connection.send(None)
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        """Kill the worker process immediately."""
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class TypstWorkerPool:
+    """Pool of subprocesses that compile Typst with time and memory limits.
+
+    Why:
+        Typst compiles in-process by default. In a shared render service, a
+        pathological template or huge input could hang or exhaust memory for
+        every user. Compiling in separate processes lets a job be killed after
+        a wall-clock timeout, caps each worker's memory, and recycles workers
+        after a number of jobs so leaks can't build up. While the pool is open,
+        `generate_pdf`, `generate_png`, and `generate_preview_png` compile
+        through it in the thread that opened it. Threads started inside the
+        block use it too if they run in a copy of its context (e.g.,
+        `contextvars.copy_context().run`).
+
+    Example:
+        ```py
+        with TypstWorkerPool(worker_count=4, timeout=30, memory_limit=2 * 1024**3):
+            run_teklinicv(pathlib.Path("John_Doe_CV.yaml"), progress)
+        ```
+
+    Args:
+        worker_count: Number of worker processes, i.e., concurrent compilations.
+        timeout: Seconds a compilation may take before its worker is killed.
+        memory_limit: Address space limit of each worker in bytes. Not enforced
+            on Windows.
+        max_jobs_per_worker: Jobs after which a worker is replaced with a fresh
+            one.
+    """
+
+    def __init__(
+        self,
+        worker_count: int = 1,
+        timeout: float | None = 60,
+        memory_limit: int | None = None,
+        max_jobs_per_worker: int | None = 100,
+    ):
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.token: contextvars.Token | None = None
+        # Each slot holds an idle worker, or None if a worker is yet to be started:
+        self.idle_workers: queue.Queue[TypstWorker | None] = queue.Queue()
+        for _ in range(worker_count):
+            self.idle_workers.put(None)
+
+    def __enter__(self) -> Self:
+        self.token = active_typst_worker_pool.set(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self.token is not None:
+            active_typst_worker_pool.reset(self.token)
+            self.token = None
+        self.close()
+
+    def start_worker(self) -> TypstWorker:
+        """Start a worker process.
+
+        Why:
+            Workers are spawned rather than forked so they don't inherit the
+            parent's threads, locks, and memory. Waiting until the worker is
+            ready keeps its start-up time out of the first job's timeout. The
+            wait has a timeout of its own, so a worker that hangs while starting
+            can't block the render forever.
+
+        Returns:
+            Started worker.
+        """
+        context = multiprocessing.get_context("spawn")
+        parent_connection, child_connection = context.Pipe()
+        process = context.Process(
+            target=run_typst_worker,
+            args=(child_connection, self.memory_limit),
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        worker = TypstWorker(process, parent_connection)
+        try:
+            if not parent_connection.poll(worker_start_timeout):
+                message = (
+                    f"A Typst worker didn't start within {worker_start_timeout:g}"
+                    " seconds."
+                )
+                raise TekliniCVUserError(message=message)
+            self.receive(worker, deadline=None)
+        except TekliniCVUserError:
+            worker.kill()
+            raise
+        return worker
+
+    def receive(
+        self, worker: TypstWorker, deadline: float | None, *, as_bytes: bool = False
+    ) -> Any:
+        """Receive a message from a worker, enforcing the job's deadline.
+
+        Args:
+            worker: Worker running the job.
+            deadline: `time.monotonic()` value after which the job is stopped.
+            as_bytes: Receive raw bytes instead of a pickled object.
+
+        Returns:
+            Received message.
+        """
+        if deadline is not None and not worker.connection.poll(
+            max(deadline - time.monotonic(), 0)
+        ):
+            message = (
+                f"Typst compilation took longer than {self.timeout:g} seconds and was"
+                " stopped."
+            )
+            raise TekliniCVUserError(message=message)
+        try:
+            if as_bytes:
+                return worker.connection.recv_bytes()
+            return worker.connection.recv()
+        except (EOFError, OSError) as e:
+            raise self.get_crash_error() from e
+
+    def get_crash_error(self) -> TekliniCVUserError:
+        """Create the error shown when a worker dies during a compilation.
+
+        Returns:
+            User-facing error.
+        """
+        return TekliniCVUserError(
+            message=(
+                "Typst compilation was stopped because it ran out of memory or crashed."
+            )
+        )
+
+    def compile(self, job: TypstCompileJob) -> tuple[int, Generator[bytes]]:
+        """Compile a job in a worker and stream the pages back.
+
+        Why:
+            The page count is returned as soon as compilation is done, so
+            callers can select pages before any page is transferred. Pages are
+            then received one at a time as the iterator is consumed.
+
+        Example:
+            ```py
+            page_count, pages = pool.compile(
+                TypstCompileJob(typst_path, None, format="png", ppi=144)
+            )
+            for page_number, png_bytes in enumerate(pages, start=1):
+                ...
+            ```
+
+        Args:
+            job: Compilation to run.
+
+        Returns:
+            Number of pages and an iterator of their bytes. The iterator must be
+            consumed or closed to release the worker.
+        """
+        worker = self.idle_workers.get()
+        try:
+            if worker is None or not worker.process.is_alive():
+                worker = self.start_worker()
+            deadline = (
+                time.monotonic() + self.timeout if self.timeout is not None else None
+            )
+            try:
+                worker.connection.send(job)
+            except OSError as e:
+                raise self.get_crash_error() from e
+            status, payload = self.receive(worker, deadline)
+        except BaseException:
+            self.release(worker, broken=True)
+            raise
+
+        if status != "pages":
+            self.release(worker, broken=False)
+            if status == "typst_error":
+                # Rebuild the error as the in-process compiler raises it:
+                message, diagnostic, hints, trace = payload
+                typst_error = typst.TypstError(message, diagnostic, hints, trace)
+                # The constructor only stores its arguments, while the compiler
+                # raises errors with the message as the only argument:
+                typst_error.args = (message,)
+                typst_error.message = message
+                typst_error.diagnostic = diagnostic
+                typst_error.hints = hints
+                typst_error.trace = trace
+                raise typst_error
+            raise payload
+
+        return payload, self.receive_pages(worker, payload, deadline)
+
+    def receive_pages(
+        self, worker: TypstWorker, page_count: int, deadline: float | None
+    ) -> Generator[bytes]:
+        """Yield pages sent by a worker, then release the worker.
+
+        Args:
+            worker: Worker that compiled the job.
+            page_count: Number of pages the worker sends.
+            deadline: `time.monotonic()` value after which the job is stopped.
+
+        Returns:
+            Iterator of page bytes.
+        """
+        received_pages = 0
+        try:
+            for _ in range(page_count):
+                page = self.receive(worker, deadline, as_bytes=True)
+                received_pages += 1
+                yield page
+        finally:
+            # A worker with pages left in the pipe can't take new jobs:
+            self.release(worker, broken=received_pages < page_count)
+
+    def release(self, worker: TypstWorker | None, broken: bool) -> None:
+        """Return a worker's slot to the pool, replacing it if needed.
+
+        Args:
+            worker: Worker to return.
+            broken: Whether the worker is in an unknown state and must be killed.
+        """
+        if worker is not None:
+            worker.job_count += 1
+            if broken:
+                worker.kill()
+                worker = None
+            elif (
+                self.max_jobs_per_worker is not None
+                and worker.job_count >= self.max_jobs_per_worker
+            ):
+                worker.stop()
+                worker = None
+        self.idle_workers.put(worker)
+
+    def close(self) -> None:
+        """Stop idle workers. New workers are started if the pool is used again."""
+        stopped_workers = 0
+        while True:
+            try:
+                worker = self.idle_workers.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                worker.stop()
+            stopped_workers += 1
+        for _ in range(stopped_workers):
+            self.idle_workers.put(None)
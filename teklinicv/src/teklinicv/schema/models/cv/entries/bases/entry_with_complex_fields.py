@@ -5,6 +5,7 @@ from typing import Annotated, Literal, Self
 import pydantic
 import pydantic_core
 
+from teklinicv.caches import bounded_cache
 from teklinicv.exception import TekliniCVInternalError
 
 from .....pydantic_error_handling import CustomPydanticErrorTypes
@@ -40,13 +41,16 @@ def validate_exact_date(date: str | int) -> str | int:
 type ExactDate = Annotated[str | int, pydantic.AfterValidator(validate_exact_date)]
 
 
+@bounded_cache(maxsize=4096)
 def get_date_object(date: str | int, current_date: Date | None = None) -> Date:
     """Convert date string/int to Python Date object.
 
     Why:
         Date arithmetic (start/end comparison, duration calculation) requires
         Python Date objects. This parser handles multiple formats including
-        "present" keyword for ongoing positions.
+        "present" keyword for ongoing positions. The same raw dates are parsed
+        during validation and again for every output format, so results are
+        memoized in a bounded cache.
 
     Example:
         ```py
@@ -2,14 +2,17 @@ import importlib
 import importlib.util
 import pathlib
 import re
+import types
 from typing import Annotated, Any
 
 import pydantic
 import pydantic_core
 
+from teklinicv.caches import bounded_cache
 from teklinicv.exception import TekliniCVInternalError
 
 from ...pydantic_error_handling import CustomPydanticErrorTypes
+from ..base import BaseModelWithoutExtraKeys
 from ..validation_context import get_input_file_path
 from .built_in_design import BuiltInDesign, built_in_design_adapter
 from .classic_theme import ClassicTheme
@@ -90,20 +93,11 @@ def validate_design(design: Any, info: pydantic.ValidationInfo) -> Any:
     # Import __init__.py file from the custom theme folder if it exists:
     path_to_init_file = custom_theme_folder / "__init__.py"
     if path_to_init_file.exists():
-        spec = importlib.util.spec_from_file_location(
-            "theme",
-            path_to_init_file,
-        )
-        if spec is None:
-            msg = f"Failed to load spec from {path_to_init_file}"
-            raise TekliniCVInternalError(msg)
-
-        theme_module = importlib.util.module_from_spec(spec)
+        stat = path_to_init_file.stat()
         try:
-            if spec.loader is None:
-                msg = f"spec.loader is None for {path_to_init_file}"
-                raise TekliniCVInternalError(msg)
-            spec.loader.exec_module(theme_module)
+            theme_module = load_custom_theme_module(
+                path_to_init_file.absolute(), stat.st_size, stat.st_mtime_ns
+            )
         except SyntaxError as e:
             raise pydantic_core.PydanticCustomError(
                 CustomPydanticErrorTypes.other.value,
@@ -135,15 +129,69 @@ def validate_design(design: Any, info: pydantic.ValidationInfo) -> Any:
         theme_data_model = theme_data_model_class(**design)
     else:
         # Then it means there is no __init__.py file in the custom theme folder.
-        # Create a dummy data model and use that instead.
-        class ThemeOptionsAreNotProvided(ClassicTheme):
-            theme: str = theme_name
-
-        theme_data_model = ThemeOptionsAreNotProvided(theme=theme_name)
+        # Use a dummy data model instead.
+        theme_data_model = create_theme_options_are_not_provided_model(
+            theme_name
+        ).model_validate({"theme": theme_name})
 
     return theme_data_model
 
 
+@bounded_cache(maxsize=16)
+def load_custom_theme_module(
+    init_file_path: pathlib.Path,
+    size: int,  # NOQA: ARG001
+    mtime_ns: int,  # NOQA: ARG001
+) -> types.ModuleType:
+    """Execute a custom theme's __init__.py file once per version of the file.
+
+    Why:
+        Every input using a custom theme is validated against the theme's
+        model. Executing the file for each validation created new Pydantic
+        model classes every time, which is slow and piles up in long-running
+        processes. Size and modification time are only part of the cache key,
+        so an edited file is executed again.
+
+    Args:
+        init_file_path: Absolute path of the theme's __init__.py file.
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+
+    Returns:
+        Executed module.
+    """
+    spec = importlib.util.spec_from_file_location("theme", init_file_path)
+    if spec is None:
+        msg = f"Failed to load spec from {init_file_path}"
+        raise TekliniCVInternalError(msg)
+    if spec.loader is None:
+        msg = f"spec.loader is None for {init_file_path}"
+        raise TekliniCVInternalError(msg)
+
+    theme_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(theme_module)
+    return theme_module
+
+
+@bounded_cache(maxsize=16)
+def create_theme_options_are_not_provided_model(
+    theme_name: str,
+) -> type[BaseModelWithoutExtraKeys]:
+    """Create the design model of a custom theme without an __init__.py file.
+
+    Args:
+        theme_name: Name of the custom theme.
+
+    Returns:
+        Model with the classic theme's options and the custom theme's name.
+    """
+
+    class ThemeOptionsAreNotProvided(ClassicTheme):
+        theme: str = theme_name
+
+    return ThemeOptionsAreNotProvided
+
+
 # TekliniCV supports custom themes as well. For JSON schema, expose only BuiltInDesign.
 # The validator runs after the built-in validation to support custom themes.
 Design = Annotated[
@@ -0,0 +1,73 @@
+import re
+from typing import Annotated
+
+import pydantic
+import pydantic_core
+
+from ...pydantic_error_handling import CustomPydanticErrorTypes
+
+page_range_part_pattern = re.compile(r"(\d+)(?:(-)(\d+)?)?")
+
+
+def validate_page_range(page_range: str) -> str:
+    """Validate comma-separated page numbers and page ranges.
+
+    Why:
+        Users select pages like `1` for thumbnails or `2-4,6` for proofs.
+        Validation catches typos and reversed ranges before any compilation.
+
+    Args:
+        page_range: Page selection string to validate.
+
+    Returns:
+        Original page selection if valid.
+    """
+    for part in page_range.replace(" ", "").split(","):
+        match = page_range_part_pattern.fullmatch(part)
+        if (
+            match is None
+            or int(match.group(1)) == 0
+            or (match.group(3) and int(match.group(3)) < int(match.group(1)))
+        ):
+            raise pydantic_core.PydanticCustomError(
+                CustomPydanticErrorTypes.other.value,
+                "The value must be comma-separated page numbers or ranges, starting"
+                " from 1. For example, 1 or 1,3-5 or 2-.",
+            )
+    return page_range
+
+
+def page_range_to_page_numbers(page_range: str, page_count: int) -> list[int]:
+    """Expand a page selection into sorted page numbers of a document.
+
+    Example:
+        ```py
+        result = page_range_to_page_numbers("4-,1", page_count=5)
+        # Returns: [1, 4, 5]
+        ```
+
+    Args:
+        page_range: Validated page selection. Ranges like `2-` run to the last page.
+        page_count: Number of pages in the document.
+
+    Returns:
+        Selected page numbers (1-based), ignoring pages beyond the document.
+    """
+    page_numbers: set[int] = set()
+    for part in page_range.replace(" ", "").split(","):
+        match = page_range_part_pattern.fullmatch(part)
+        if match is None:
+            continue
+        start = int(match.group(1))
+        if match.group(2) is None:
+            end = start
+        elif match.group(3) is None:
+            end = page_count
+        else:
+            end = int(match.group(3))
+        page_numbers.update(range(start, min(end, page_count) + 1))
+
+    return sorted(page_numbers)
+
+
+type PageRange = Annotated[str, pydantic.AfterValidator(validate_page_range)]
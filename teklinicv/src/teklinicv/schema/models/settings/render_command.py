@@ -4,6 +4,7 @@ import pydantic
 
 from ..base import BaseModelWithoutExtraKeys
 from ..path import ExistingPathRelativeToInput, PlannedPathRelativeToInput
+from .page_range import PageRange
 
 file_path_placeholders_description = """The following placeholders can be used:
 
@@ -76,6 +77,35 @@ class RenderCommand(BaseModelWithoutExtraKeys):
             f"{file_path_placeholders_description}"
         ),
     )
+    png_pages: PageRange | None = pydantic.Field(
+        default=None,
+        title="PNG Pages",
+        description=(
+            "Pages to export as PNG files, as comma-separated page numbers or ranges"
+            " (e.g., `1` or `1,3-5` or `2-`). All pages are exported if not provided."
+            " The default value is `null`."
+        ),
+    )
+    png_ppi: float = pydantic.Field(
+        default=144,
+        gt=0,
+        title="PNG PPI",
+        description=(
+            "Resolution of the PNG files in pixels per inch. The default value is"
+            " `144`."
+        ),
+    )
+    photo_ppi: float | None = pydantic.Field(
+        default=None,
+        gt=0,
+        title="Photo PPI",
+        description=(
+            "Downscale PNG and JPEG photos to this resolution in pixels per inch at"
+            " `design.header.photo_width` before embedding them. Downscaled photos"
+            " are cached until the photo changes. Photos are embedded at full"
+            " resolution if not provided. The default value is `null`."
+        ),
+    )
     dont_generate_markdown: bool = pydantic.Field(
         default=False,
         title="Don't Generate Markdown",
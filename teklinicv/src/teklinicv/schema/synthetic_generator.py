@@ -0,0 +1,316 @@
+import json
+import pathlib
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+# Base section titles of the entry types, in the order sections cycle through them:
+section_titles = {
+    "education": "Education",
+    "experience": "Experience",
+    "normal": "Projects",
+    "publication": "Publications",
+    "one_line": "Skills",
+    "bullet": "Highlights",
+    "numbered": "Achievements",
+    "reversed_numbered": "Talks",
+    "text": "Summary",
+}
+words = (
+    "analysis",
+    "design",
+    "system",
+    "data",
+    "model",
+    "research",
+    "platform",
+    "performance",
+    "service",
+    "network",
+    "security",
+    "pipeline",
+    "interface",
+    "algorithm",
+    "framework",
+    "cloud",
+    "testing",
+    "architecture",
+    "scalable",
+    "distributed",
+    "learning",
+    "optimization",
+    "deployment",
+    "infrastructure",
+    "product",
+    "customer",
+    "team",
+    "project",
+    "process",
+    "quality",
+    "strategy",
+)
+social_networks = ("LinkedIn", "GitHub", "GitLab", "Instagram", "X", "Telegram")
+
+
+@dataclass(frozen=True)
+class SyntheticCvOptions:
+    """Shape of a synthetic CV.
+
+    Args:
+        seed: Seed of the random generator. The same options always produce the
+            same CV.
+        section_count: Number of sections. Sections cycle through the nine entry
+            types, so at least nine are needed to include every entry type.
+        entries_per_type: Number of entries of each entry type, split evenly
+            across the sections of that type.
+        highlights_per_entry: Number of highlights of entries that have them.
+        bold_keyword_count: Number of `settings.bold_keywords`, which are also
+            mentioned in the generated text.
+        connection_count: Number of emails, websites, social networks, and custom
+            connections, in rotation.
+        markup_density: Probability between 0 and 1 that a sentence contains
+            Markdown or Typst markup.
+    """
+
+    seed: int = 0
+    section_count: int = 9
+    entries_per_type: int = 2
+    highlights_per_entry: int = 3
+    bold_keyword_count: int = 10
+    connection_count: int = 4
+    markup_density: float = 0.2
+
+    def __post_init__(self):
+        counts = (
+            self.section_count,
+            self.entries_per_type,
+            self.highlights_per_entry,
+            self.bold_keyword_count,
+            self.connection_count,
+        )
+        if min(counts) < 0:
+            message = "Synthetic CV counts can't be negative."
+            raise ValueError(message)
+        if not 0 <= self.markup_density <= 1:
+            message = "The markup density must be between 0 and 1."
+            raise ValueError(message)
+
+
+class SyntheticTextGenerator:
+    """Random sentences with keywords and markup, drawn from a seeded generator."""
+
+    def __init__(self, options: SyntheticCvOptions):
+        self.options = options
+        self.random = random.Random(options.seed)
+        self.keywords = [
+            f"Keyword{index}" for index in range(options.bold_keyword_count)
+        ]
+
+    def markup(self, word: str) -> str:
+        """Wrap a word in one of the supported kinds of markup."""
+        return self.random.choice(
+            (
+                f"**{word}**",
+                f"*{word}*",
+                f"[{word}](https://example.com/{word})",
+                f"`{word}`",
+                f"$${word}^2$$",
+                f"#emph[{word}]",
+            )
+        )
+
+    def sentence(self, word_count: int = 10) -> str:
+        """Create a sentence, possibly with a keyword and markup."""
+        sentence_words = self.random.choices(words, k=word_count)
+        if self.keywords:
+            sentence_words[self.random.randrange(word_count)] = self.random.choice(
+                self.keywords
+            )
+        if self.random.random() < self.options.markup_density:
+            index = self.random.randrange(word_count)
+            sentence_words[index] = self.markup(sentence_words[index])
+        sentence = " ".join(sentence_words)
+        return f"{sentence[0].upper()}{sentence[1:]}."
+
+    def title(self) -> str:
+        """Create a short title without markup."""
+        return " ".join(self.random.choices(words, k=3)).title()
+
+    def date_range(self) -> dict[str, str]:
+        """Create a start date and an end date, which may be "present"."""
+        start_year = self.random.randint(1990, 2020)
+        start_month = self.random.randint(1, 12)
+        end_date = (
+            "present"
+            if self.random.random() < 0.2
+            else f"{start_year + self.random.randint(1, 5)}-{start_month:02d}"
+        )
+        return {"start_date": f"{start_year}-{start_month:02d}", "end_date": end_date}
+
+    def entry(self, entry_type: str) -> dict[str, Any] | str:
+        """Create an entry of the given type."""
+        details = {
+            **self.date_range(),
+            "location": self.title(),
+            "summary": self.sentence(),
+            "highlights": [
+                self.sentence() for _ in range(self.options.highlights_per_entry)
+            ],
+        }
+        match entry_type:
+            case "education":
+                return {
+                    "institution": self.title(),
+                    "area": self.title(),
+                    "degree": self.random.choice(("BS", "MS", "PhD")),
+                    **details,
+                }
+            case "experience":
+                return {"company": self.title(), "position": self.title(), **details}
+            case "normal":
+                return {"name": self.title(), **details}
+            case "publication":
+                return {
+                    "title": self.sentence(6),
+                    "authors": [self.title() for _ in range(self.random.randint(1, 6))],
+                    "doi": f"10.{self.random.randint(1000, 9999)}/{self.random.randint(1, 99999)}",
+                    "journal": self.title(),
+                    "date": self.date_range()["start_date"],
+                }
+            case "one_line":
+                return {"label": self.title(), "details": self.sentence()}
+            case "bullet":
+                return {"bullet": self.sentence()}
+            case "numbered":
+                return {"number": self.sentence()}
+            case "reversed_numbered":
+                return {"reversed_number": self.sentence()}
+            case _:
+                return self.sentence(30)
+
+    def connections(self) -> dict[str, list[Any]]:
+        """Create connections, rotating through the connection kinds."""
+        connections: dict[str, list[Any]] = {}
+        for index in range(self.options.connection_count):
+            match index % 4:
+                case 0:
+                    key, value = "email", f"user{index}@example.com"
+                case 1:
+                    key, value = "website", f"https://example{index}.com/"
+                case 2:
+                    network = social_networks[index // 4 % len(social_networks)]
+                    key, value = (
+                        "social_networks",
+                        {"network": network, "username": f"user{index}"},
+                    )
+                case _:
+                    key, value = (
+                        "custom_connections",
+                        {
+                            "fontawesome_icon": "calendar-days",
+                            "placeholder": self.title(),
+                            "url": f"https://example.com/connection{index}",
+                        },
+                    )
+            connections.setdefault(key, []).append(value)
+        return connections
+
+
+def iterate_synthetic_yaml_lines(options: SyntheticCvOptions) -> Iterator[str]:
+    """Yield the lines of a synthetic YAML input file one by one.
+
+    Why:
+        Load tests need inputs far larger than the sample CV, with control over
+        the shape that drives rendering cost. Yielding lines instead of building
+        a dictionary and dumping it keeps memory flat, so inputs with millions of
+        entries can be streamed straight to a file. Values are written as JSON,
+        which is valid YAML and needs no escaping of markup characters.
+
+    Example:
+        ```py
+        lines = iterate_synthetic_yaml_lines(SyntheticCvOptions(entries_per_type=5))
+        # Yields 'cv:\\n', '  name: "Synthetic Person"\\n', ...
+        ```
+
+    Args:
+        options: Shape of the CV.
+
+    Returns:
+        Iterator of newline-terminated YAML lines.
+    """
+    text = SyntheticTextGenerator(options)
+
+    def dump(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False)
+
+    yield "cv:\n"
+    yield f"  name: {dump('Synthetic Person')}\n"
+    yield f"  headline: {dump(text.title())}\n"
+    yield f"  location: {dump(text.title())}\n"
+    for key, values in text.connections().items():
+        yield f"  {key}:\n"
+        for value in values:
+            yield f"    - {dump(value)}\n"
+
+    entry_types = list(section_titles)
+    if options.section_count:
+        yield "  sections:\n"
+    for section_index in range(options.section_count):
+        type_index = section_index % len(entry_types)
+        entry_type = entry_types[type_index]
+        sections_of_type = len(
+            range(type_index, options.section_count, len(entry_types))
+        )
+        index_in_type = section_index // len(entry_types)
+        entry_count = options.entries_per_type // sections_of_type + (
+            index_in_type < options.entries_per_type % sections_of_type
+        )
+        if not entry_count:
+            continue
+
+        title = section_titles[entry_type]
+        if sections_of_type > 1:
+            title = f"{title} {index_in_type + 1}"
+        yield f"    {dump(title)}:\n"
+        for _ in range(entry_count):
+            yield f"      - {dump(text.entry(entry_type))}\n"
+
+    yield "settings:\n"
+    yield f"  bold_keywords: {dump(text.keywords)}\n"
+
+
+def write_synthetic_yaml_input_file(
+    options: SyntheticCvOptions, output: pathlib.Path | TextIO
+) -> None:
+    """Stream a synthetic YAML input file to a path or an open text stream.
+
+    Example:
+        ```py
+        write_synthetic_yaml_input_file(
+            SyntheticCvOptions(seed=1, section_count=90, entries_per_type=1000),
+            pathlib.Path("Synthetic_CV.yaml"),
+        )
+        ```
+
+    Args:
+        options: Shape of the CV.
+        output: File path to write, or a text stream such as `sys.stdout`.
+    """
+    if isinstance(output, pathlib.Path):
+        with output.open("w", encoding="utf-8") as file:
+            file.writelines(iterate_synthetic_yaml_lines(options))
+    else:
+        output.writelines(iterate_synthetic_yaml_lines(options))
+
+
+def create_synthetic_yaml_input(options: SyntheticCvOptions) -> str:
+    """Return a synthetic YAML input file as a string.
+
+    Args:
+        options: Shape of the CV.
+
+    Returns:
+        YAML input file contents.
+    """
+    return "".join(iterate_synthetic_yaml_lines(options))
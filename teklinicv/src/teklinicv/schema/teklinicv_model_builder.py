@@ -5,6 +5,8 @@ import pydantic
 from ruamel.yaml.comments import CommentedMap
 
 from teklinicv.exception import TekliniCVUserValidationError
+from teklinicv.hooks import hook_stage
+from teklinicv.profiler import profile_span
 
 from .models.teklinicv_model import TekliniCVModel
 from .models.validation_context import ValidationContext
@@ -22,6 +24,9 @@ class BuildTeklinicvModelArguments(TypedDict, total=False):
     markdown_path: pathlib.Path | str | None
     html_path: pathlib.Path | str | None
     png_path: pathlib.Path | str | None
+    png_pages: str | None
+    png_ppi: float | None
+    photo_ppi: float | None
     dont_generate_typst: bool | None
     dont_generate_html: bool | None
     dont_generate_markdown: bool | None
@@ -76,12 +81,15 @@ def build_teklinicv_dictionary(
                 input_dict["settings"]["render_command"][key] = path_or_contents
 
     # Optional render-command overrides
-    render_overrides: dict[str, pathlib.Path | str | bool | None] = {
+    render_overrides: dict[str, pathlib.Path | str | float | bool | None] = {
         "typst_path": kwargs.get("typst_path"),
         "pdf_path": kwargs.get("pdf_path"),
         "markdown_path": kwargs.get("markdown_path"),
         "html_path": kwargs.get("html_path"),
         "png_path": kwargs.get("png_path"),
+        "png_pages": kwargs.get("png_pages"),
+        "png_ppi": kwargs.get("png_ppi"),
+        "photo_ppi": kwargs.get("photo_ppi"),
         "dont_generate_typst": kwargs.get("dont_generate_typst"),
         "dont_generate_html": kwargs.get("dont_generate_html"),
         "dont_generate_markdown": kwargs.get("dont_generate_markdown"),
@@ -171,11 +179,13 @@ def build_teklinicv_dictionary_and_model(
     Returns:
         Tuple of merged dictionary and validated model.
     """
-    d = build_teklinicv_dictionary(main_input_file_path_or_contents, **kwargs)
+    with profile_span("Read YAML", "stage"), hook_stage("Read YAML"):
+        d = build_teklinicv_dictionary(main_input_file_path_or_contents, **kwargs)
     input_file_path = (
         main_input_file_path_or_contents
         if isinstance(main_input_file_path_or_contents, pathlib.Path)
         else None
     )
-    m = build_teklinicv_model_from_commented_map(d, input_file_path)
+    with profile_span("Validate", "stage"), hook_stage("Validate"):
+        m = build_teklinicv_model_from_commented_map(d, input_file_path)
     return d, m
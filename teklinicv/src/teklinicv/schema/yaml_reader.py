@@ -1,4 +1,5 @@
 import pathlib
+import threading
 
 import ruamel.yaml
 import ruamel.yaml.scanner
@@ -50,6 +51,10 @@ def read_yaml(file_path_or_contents: pathlib.Path | str) -> CommentedMap:
     else:
         file_content = file_path_or_contents
 
+    yaml = get_yaml_loader()
+    # The loader keeps the version and tags of every document it loaded, which
+    # only grows in long-running processes:
+    yaml.doc_infos.clear()
     yaml_as_dictionary: CommentedMap = yaml.load(file_content)
 
     if yaml_as_dictionary is None:
@@ -78,9 +83,26 @@ class ScannerNoAlias(RoundTripScanner):
 
 # Monkey-patch the RoundTripScanner to treat * as a regular character:
 ruamel.yaml.scanner.RoundTripScanner = ScannerNoAlias  # ty: ignore[invalid-assignment]
-yaml = ruamel.yaml.YAML()
+yaml_loaders = threading.local()
 
-# Disable ISO date parsing, keep it as a string:
-yaml.constructor.yaml_constructors["tag:yaml.org,2002:timestamp"] = (
-    lambda loader, node: loader.construct_scalar(node)
-)
+
+def get_yaml_loader() -> ruamel.yaml.YAML:
+    """Return the calling thread's YAML loader.
+
+    Why:
+        A `YAML` instance keeps the state of the document it is loading, so
+        threads that load at the same time need their own. Each thread reuses
+        its loader, since creating one for every file is slow.
+
+    Returns:
+        Round-trip YAML loader that keeps ISO dates as strings.
+    """
+    loader = getattr(yaml_loaders, "loader", None)
+    if loader is None:
+        loader = ruamel.yaml.YAML()
+        # Disable ISO date parsing, keep it as a string:
+        loader.constructor.yaml_constructors["tag:yaml.org,2002:timestamp"] = (
+            lambda loader, node: loader.construct_scalar(node)
+        )
+        yaml_loaders.loader = loader
+    return loader
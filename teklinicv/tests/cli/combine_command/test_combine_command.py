@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from teklinicv.cli.combine_command.combine_command import cli_command_combine
+from teklinicv.schema.sample_generator import create_sample_yaml_input_file
+
+
+@pytest.fixture
+def input_files(tmp_path):
+    input_files = [tmp_path / "John_Doe_CV.yaml", tmp_path / "Jane_Doe_CV.yaml"]
+    for input_file, name in zip(input_files, ["John Doe", "Jane Doe"], strict=True):
+        create_sample_yaml_input_file(file_path=input_file, name=name)
+    return input_files
+
+
+@patch("teklinicv.renderer.book.generate_book_pdf")
+def test_combines_input_files(mock_generate_book_pdf, tmp_path, input_files):
+    output_file_path = tmp_path / "output" / "Team_CVs.pdf"
+
+    cli_command_combine(
+        input_files,
+        output_file_path=output_file_path,
+        table_of_contents=True,
+        quiet=True,
+    )
+
+    typst_source = (tmp_path / "output" / "Team_CVs.typ").read_text(encoding="utf-8")
+    assert typst_source.index("John Doe") < typst_source.index("Jane Doe")
+    assert "<teklinicv-chapter-2-end>" in typst_source
+    teklinicv_models, typst_path, pdf_path = mock_generate_book_pdf.call_args[0]
+    assert [model.cv.name for model in teklinicv_models] == ["John Doe", "Jane Doe"]
+    assert typst_path == tmp_path / "output" / "Team_CVs.typ"
+    assert pdf_path == output_file_path
+
+
+def test_lists_all_invalid_input_files(tmp_path, input_files, capsys):
+    invalid_files = [tmp_path / "Invalid_CV.yaml", tmp_path / "Other_Invalid_CV.yaml"]
+    for invalid_file in invalid_files:
+        invalid_file.write_text("cv:\n  email: not-an-email\n", encoding="utf-8")
+
+    with pytest.raises(typer.Exit) as exit_info:
+        cli_command_combine(
+            [invalid_files[0], *input_files, invalid_files[1]],
+            output_file_path=tmp_path / "Team_CVs.pdf",
+            quiet=True,
+        )
+
+    assert exit_info.value.exit_code == 1
+    assert not (tmp_path / "Team_CVs.typ").exists()
+    output = capsys.readouterr().out
+    assert "Some input files are invalid!" in output
+    assert "Invalid_CV.yaml: cv.email: " in output
+    assert "Other_Invalid_CV.yaml: cv.email: " in output
+    assert "John_Doe_CV.yaml" not in output
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+import typer
+
+from teklinicv.cli.enqueue_command.enqueue_command import (
+    cli_command_enqueue,
+    format_job_counts,
+)
+from teklinicv.cli.worker_command.job_queue import JobQueue, JobStatus
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    manifest_path = tmp_path / "manifest.jsonl"
+    manifest_path.write_text(
+        "\n".join(
+            json.dumps(
+                {"input": f"CV_{index}.yaml", "output_directory": f"out/{index}"}
+            )
+            for index in range(3)
+        ),
+        encoding="utf-8",
+    )
+    return manifest_path
+
+
+def test_format_job_counts():
+    counts = {
+        JobStatus.queued: 2,
+        JobStatus.running: 1,
+        JobStatus.done: 6,
+        JobStatus.failed: 1,
+    }
+
+    assert format_job_counts(counts) == "6/10 done, 1 failed, 1 running, 2 queued"
+
+
+def test_cli_command_enqueue(tmp_path, manifest_path, capsys):
+    database_path = tmp_path / "jobs.sqlite"
+
+    cli_command_enqueue(manifest_path, queue=database_path, max_attempts=5)
+
+    assert "Enqueued 3 jobs" in capsys.readouterr().out
+    with JobQueue(database_path) as job_queue:
+        jobs = job_queue.get_jobs()
+    assert [job.job.input for job in jobs] == [
+        tmp_path / f"CV_{index}.yaml" for index in range(3)
+    ]
+    assert {job.status for job in jobs} == {JobStatus.queued}
+
+
+def test_cli_command_enqueue_with_invalid_manifest(tmp_path):
+    manifest_path = tmp_path / "manifest.jsonl"
+    manifest_path.write_text('{"design": "design.yaml"}', encoding="utf-8")
+
+    with pytest.raises(typer.Exit) as exit_info:
+        cli_command_enqueue(manifest_path, queue=tmp_path / "jobs.sqlite")
+
+    assert exit_info.value.exit_code == 1
+
+
+def test_watch_exits_with_an_error_if_a_job_failed(tmp_path, manifest_path, capsys):
+    database_path = tmp_path / "jobs.sqlite"
+    cli_command_enqueue(manifest_path, queue=database_path)
+    with JobQueue(database_path) as job_queue:
+        for error in [None, None, "Invalid input"]:
+            claimed_job = job_queue.claim("worker", lease_seconds=60)
+            assert claimed_job is not None
+            job_queue.finish(claimed_job.id, "worker", {}, error)
+
+    with pytest.raises(typer.Exit) as exit_info:
+        cli_command_enqueue(None, queue=database_path, watch=True, poll_seconds=0)
+
+    assert exit_info.value.exit_code == 1
+    output = capsys.readouterr().out
+    assert "2/3 done, 1 failed, 0 running, 0 queued" in output
+    assert "Job 3" in output
+    assert "Invalid input" in output
@@ -0,0 +1,33 @@
+import pathlib
+
+from teklinicv.cli.generate_synthetic_command.generate_synthetic_command import (
+    cli_command_generate_synthetic,
+)
+from teklinicv.schema.synthetic_generator import (
+    SyntheticCvOptions,
+    create_synthetic_yaml_input,
+)
+from teklinicv.schema.teklinicv_model_builder import (
+    build_teklinicv_dictionary_and_model,
+)
+
+
+def test_cli_command_generate_synthetic(tmp_path):
+    output_file_path = tmp_path / "Synthetic_CV.yaml"
+
+    cli_command_generate_synthetic(
+        output_file_path, seed=5, entries_per_type=4, markup_density=0.5
+    )
+
+    assert output_file_path.read_text(encoding="utf-8") == create_synthetic_yaml_input(
+        SyntheticCvOptions(seed=5, entries_per_type=4, markup_density=0.5)
+    )
+    build_teklinicv_dictionary_and_model(output_file_path)
+
+
+def test_cli_command_generate_synthetic_to_stdout(capsys):
+    cli_command_generate_synthetic(pathlib.Path("-"), entries_per_type=1)
+
+    assert capsys.readouterr().out == create_synthetic_yaml_input(
+        SyntheticCvOptions(entries_per_type=1)
+    )
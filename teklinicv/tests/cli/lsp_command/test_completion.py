@@ -0,0 +1,95 @@
+import pytest
+
+from teklinicv.cli.lsp_command.completion import (
+    get_completion_items,
+    get_yaml_path,
+    parse_key_line,
+)
+
+
+def get_labels(text: str, line_number: int, character: int) -> list[str]:
+    lines = text.splitlines(keepends=True)
+    return [
+        item["label"] for item in get_completion_items(lines, line_number, character)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("name: John Doe", ("name", "John Doe")),
+        ("  sections:  # comment", ("sections", None)),
+        ("- institution: Princeton", ("institution", "Princeton")),
+        ('"quoted key": "value"', ("quoted key", "value")),
+        ("- just text", None),
+    ],
+)
+def test_parse_key_line(line, expected):
+    assert parse_key_line(line) == expected
+
+
+def test_get_yaml_path():
+    lines = [
+        "cv:\n",
+        "  sections:\n",
+        "    Education:\n",
+        "      - institution: Princeton\n",
+        "        highlights:\n",
+        "          - \n",
+    ]
+
+    assert get_yaml_path(lines, 5, 12) == [
+        "cv",
+        "sections",
+        "Education",
+        "-",
+        "highlights",
+        "-",
+    ]
+    assert get_yaml_path(lines, 4, 8) == ["cv", "sections", "Education", "-"]
+
+
+def test_completes_keys_not_yet_in_the_mapping():
+    labels = get_labels("cv:\n  name: John Doe\n  \n", 2, 2)
+
+    assert "headline" in labels
+    assert "sections" in labels
+    assert "name" not in labels
+
+
+def test_completes_entry_keys():
+    labels = get_labels(
+        "cv:\n  sections:\n    Education:\n      - institution: Princeton\n        \n",
+        4,
+        8,
+    )
+
+    assert "degree" in labels
+    assert "institution" not in labels
+
+
+def test_completes_keys_of_the_chosen_theme():
+    labels = get_labels("design:\n  theme: classic\n  \n", 2, 2)
+
+    assert "colors" in labels
+    assert "theme" not in labels
+
+
+@pytest.mark.parametrize(
+    ("text", "character", "expected"),
+    [
+        ("design:\n  theme: \n", 9, "moderncv"),
+        ("locale:\n  language: \n", 12, "turkish"),
+        ("settings:\n  render_command:\n    dont_generate_png: \n", 23, "true"),
+    ],
+)
+def test_completes_values(text, character, expected):
+    line_number = text.count("\n") - 1
+
+    assert expected in get_labels(text, line_number, character)
+
+
+def test_offers_nothing_inside_text():
+    assert (
+        get_labels("cv:\n  sections:\n    Summary:\n      - Some text\n", 3, 17) == []
+    )
@@ -0,0 +1,131 @@
+import json
+
+import pytest
+
+from teklinicv.cli.lsp_command import document_parser
+from teklinicv.cli.lsp_command.document_parser import DocumentParser, split_lines
+from teklinicv.cli.validate_command.validate_files import validate_file
+from teklinicv.exception import TekliniCVUserValidationError
+from teklinicv.schema.sample_generator import create_sample_yaml_input_file
+from teklinicv.schema.synthetic_generator import (
+    SyntheticCvOptions,
+    create_synthetic_yaml_input,
+)
+from teklinicv.schema.teklinicv_model_builder import (
+    build_teklinicv_model_from_commented_map,
+)
+from teklinicv.schema.yaml_reader import read_yaml
+
+sample_text = create_sample_yaml_input_file(file_path=None)
+
+
+def to_plain_data(data):
+    return json.loads(json.dumps(data, default=str))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        sample_text,
+        create_synthetic_yaml_input(SyntheticCvOptions(seed=1, section_count=10)),
+        # Indentless sequences, comments, and multi-line strings:
+        (
+            "cv:\n  name: John Doe\n  email:\n  - a@example.com\n  # comment\n"
+            "  - b@example.com\n  headline:\n    A long\n    headline\n"
+        ),
+        # Flow style, parsed whole:
+        '{"cv": {"name": "John Doe"}}\n',
+    ],
+    ids=["sample", "synthetic", "mixed_styles", "flow_style"],
+)
+def test_parses_like_a_full_parse(text):
+    parsed_document = DocumentParser().parse(text)
+
+    assert not parsed_document.yaml_errors
+    assert to_plain_data(parsed_document.dictionary) == to_plain_data(read_yaml(text))
+
+
+def test_reparses_only_changed_blocks(monkeypatch):
+    parser = DocumentParser()
+    parser.parse(sample_text)
+    parsed_texts = []
+    yaml = document_parser.get_yaml_loader()
+    load = yaml.load
+
+    def record_load(text):
+        parsed_texts.append(text)
+        return load(text)
+
+    monkeypatch.setattr(yaml, "load", record_load)
+    parser.parse(sample_text.replace("name: John Doe", "name: Jane Doe", 1))
+
+    assert parsed_texts == ["name: Jane Doe\n"]
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        # A YAML error inside a block:
+        ("name: John Doe", "name: John: Doe"),
+        # Validation errors, including a missing key:
+        ("name: John Doe", "name: John Doe\n  email: not-an-email"),
+        ("    - institution: Princeton University", "    - institution_: Princeton"),
+    ],
+)
+def test_coordinates_match_a_full_parse(tmp_path, old, new):
+    text = sample_text.replace(old, new, 1)
+    input_file_path = tmp_path / "John_Doe_CV.yaml"
+    input_file_path.write_text(text, encoding="utf-8")
+    expected_locations = [
+        error.yaml_location for error in validate_file(input_file_path).errors
+    ]
+
+    parser = DocumentParser()
+    parser.parse(sample_text)
+    parsed_document = parser.parse(text)
+    errors = parsed_document.yaml_errors
+    if not errors:
+        assert parsed_document.dictionary is not None
+        with pytest.raises(TekliniCVUserValidationError) as exception_info:
+            build_teklinicv_model_from_commented_map(parsed_document.dictionary)
+        errors = exception_info.value.validation_errors
+        assert parsed_document.root is not None
+        locations = [
+            parsed_document.root.get_coordinates(error.location) for error in errors
+        ]
+    else:
+        locations = [error.yaml_location for error in errors]
+
+    assert expected_locations
+    assert locations == expected_locations
+
+
+def test_reparsing_a_large_cv_reuses_unchanged_blocks():
+    text = create_synthetic_yaml_input(
+        SyntheticCvOptions(seed=1, section_count=10, entries_per_type=50)
+    )
+    parser = DocumentParser()
+    parser.parse(text)
+    old_cache = parser.cache
+
+    parsed_document = parser.parse(text.replace("Synthetic Person", "Person", 1))
+
+    assert parsed_document.dictionary is not None
+    reused_blocks = old_cache.keys() & parser.cache.keys()
+    assert len(reused_blocks) == len(parser.cache) - 1
+    assert all(parser.cache[block] is old_cache[block] for block in reused_blocks)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected_lines"),
+    [
+        ("", []),
+        ("a", ["a"]),
+        ("a\nb\n", ["a\n", "b\n"]),
+        ("a\r\nb\rc", ["a\r\n", "b\r", "c"]),
+        ("a\n\n", ["a\n", "\n"]),
+        ("a\x0cb\u2028c\x85d\n", ["a\x0cb\u2028c\x85d\n"]),
+    ],
+)
+def test_split_lines(text, expected_lines):
+    assert split_lines(text) == expected_lines
@@ -0,0 +1,221 @@
+import io
+
+import pytest
+
+from teklinicv.cli.lsp_command.language_server import (
+    LanguageServer,
+    apply_change,
+    read_message,
+    uri_to_path,
+    utf16_to_index,
+    write_message,
+)
+from teklinicv.schema.sample_generator import create_sample_yaml_input_file
+from teklinicv.schema.synthetic_generator import (
+    SyntheticCvOptions,
+    create_synthetic_yaml_input,
+)
+
+uri = "file:///cvs/John_Doe_CV.yaml"
+
+
+def run_server(messages: list[dict]) -> tuple[int, list[dict]]:
+    input_stream = io.BytesIO()
+    for message in messages:
+        write_message(input_stream, {"jsonrpc": "2.0", **message})
+    input_stream.seek(0)
+    output_stream = io.BytesIO()
+
+    exit_code = LanguageServer(input_stream, output_stream).serve()
+
+    output_stream.seek(0)
+    responses = []
+    while (response := read_message(output_stream)) is not None:
+        responses.append(response)
+    return exit_code, responses
+
+
+def open_document(text: str) -> dict:
+    return {
+        "method": "textDocument/didOpen",
+        "params": {
+            "textDocument": {
+                "uri": uri,
+                "languageId": "yaml",
+                "version": 1,
+                "text": text,
+            }
+        },
+    }
+
+
+def get_diagnostics(responses: list[dict]) -> list[list[dict]]:
+    return [
+        response["params"]["diagnostics"]
+        for response in responses
+        if response.get("method") == "textDocument/publishDiagnostics"
+    ]
+
+
+def test_read_and_write_message():
+    stream = io.BytesIO()
+    write_message(stream, {"text": "Boğaziçi"})
+    stream.seek(0)
+
+    assert read_message(stream) == {"text": "Boğaziçi"}
+    assert read_message(stream) is None
+
+
+def test_apply_change():
+    text = "cv:\n  name: 😀 Doe\n"
+    change = {
+        "range": {
+            "start": {"line": 1, "character": 11},
+            "end": {"line": 1, "character": 14},
+        },
+        "text": "Smith",
+    }
+
+    assert utf16_to_index("  name: 😀 Doe", 11) == 10
+    assert apply_change(text, change) == "cv:\n  name: 😀 Smith\n"
+    assert apply_change(text, {"text": "cv: {}"}) == "cv: {}"
+
+
+def test_apply_change_counts_only_lsp_line_breaks():
+    text = "cv:\n  name: A\x0cB\n  email: a@b.com\n"
+    change = {
+        "range": {
+            "start": {"line": 2, "character": 2},
+            "end": {"line": 2, "character": 7},
+        },
+        "text": "phone",
+    }
+
+    assert apply_change(text, change) == "cv:\n  name: A\x0cB\n  phone: a@b.com\n"
+
+
+def test_uri_to_path():
+    path = uri_to_path("file:///cvs/John%20Doe.yaml")
+    assert path is not None
+    assert path.name == "John Doe.yaml"
+    assert uri_to_path("untitled:Untitled-1") is None
+
+
+def test_lifecycle():
+    exit_code, responses = run_server(
+        [
+            {"id": 1, "method": "initialize", "params": {}},
+            {"method": "initialized", "params": {}},
+            {"id": 2, "method": "textDocument/hover", "params": {}},
+            {"id": 3, "method": "shutdown"},
+            {"method": "exit"},
+        ]
+    )
+
+    assert exit_code == 0
+    assert responses[0]["result"]["capabilities"]["textDocumentSync"]["change"] == 2
+    assert responses[1]["error"]["code"] == -32601
+    assert responses[2] == {"jsonrpc": "2.0", "id": 3, "result": None}
+
+
+def test_publishes_diagnostics_on_open_change_and_close():
+    text = "cv:\n  name: John Doe\n  email: john@example.com\n"
+    _, responses = run_server(
+        [
+            open_document(text),
+            {
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": uri, "version": 2},
+                    "contentChanges": [
+                        {
+                            "range": {
+                                "start": {"line": 2, "character": 13},
+                                "end": {"line": 2, "character": 14},
+                            },
+                            "text": "",
+                        }
+                    ],
+                },
+            },
+            {
+                "method": "textDocument/didClose",
+                "params": {"textDocument": {"uri": uri}},
+            },
+        ]
+    )
+
+    opened, changed, closed = get_diagnostics(responses)
+    assert opened == []
+    assert changed[0]["range"]["start"] == {"line": 2, "character": 2}
+    assert changed[0]["source"] == "teklinicv"
+    assert closed == []
+
+
+def test_publishes_yaml_errors():
+    _, responses = run_server([open_document("cv:\n  name: John: Doe\n")])
+
+    (diagnostics,) = get_diagnostics(responses)
+    assert diagnostics[0]["range"]["start"]["line"] == 1
+    assert "not a valid YAML file" in diagnostics[0]["message"]
+
+
+def test_completion():
+    _, responses = run_server(
+        [
+            open_document("cv:\n  name: John Doe\n  \n"),
+            {
+                "id": 1,
+                "method": "textDocument/completion",
+                "params": {
+                    "textDocument": {"uri": uri},
+                    "position": {"line": 2, "character": 2},
+                },
+            },
+        ]
+    )
+
+    labels = [item["label"] for item in responses[-1]["result"]]
+    assert "headline" in labels
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        create_sample_yaml_input_file(file_path=None),
+        create_synthetic_yaml_input(
+            SyntheticCvOptions(seed=1, section_count=10, entries_per_type=50)
+        ),
+    ],
+    ids=["sample", "synthetic"],
+)
+def test_revalidation_reuses_unchanged_blocks(text):
+    server = LanguageServer(io.BytesIO(), io.BytesIO())
+    server.initialize({})
+    server.did_open({"textDocument": {"uri": uri, "text": text}})
+    old_cache = server.documents[uri].parser.cache
+    name_line = next(
+        index
+        for index, line in enumerate(text.splitlines())
+        if line.startswith("  name:")
+    )
+
+    server.did_change(
+        {
+            "textDocument": {"uri": uri},
+            "contentChanges": [
+                {
+                    "range": {
+                        "start": {"line": name_line, "character": 8},
+                        "end": {"line": name_line, "character": 8},
+                    },
+                    "text": "A",
+                }
+            ],
+        }
+    )
+    new_cache = server.documents[uri].parser.cache
+
+    reused_blocks = old_cache.keys() & new_cache.keys()
+    assert len(reused_blocks) == len(new_cache) - 1
+    assert all(new_cache[block] is old_cache[block] for block in reused_blocks)
@@ -0,0 +1,25 @@
+import json
+import subprocess
+import sys
+
+
+def test_cli_command_lsp():
+    messages = [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+        {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+        {"jsonrpc": "2.0", "method": "exit"},
+    ]
+    bodies = [json.dumps(message).encode() for message in messages]
+    input_bytes = b"".join(
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body for body in bodies
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-m", "teklinicv", "lsp"],
+        input=input_bytes,
+        capture_output=True,
+        check=False,
+    )
+
+    assert result.returncode == 0
+    assert b'"serverInfo"' in result.stdout
@@ -1,6 +1,7 @@
 import pathlib
 
 import pytest
+import rich.panel
 import typer
 
 from teklinicv.cli.render_command.progress_panel import CompletedStep, ProgressPanel
@@ -37,6 +38,15 @@ class TestProgressPanelUpdateProgress:
         assert len(panel.completed_steps) == 1
         assert panel.completed_steps[0].paths == []
 
+    def test_records_unchanged_paths(self):
+        panel = ProgressPanel(quiet=True)
+        path1 = pathlib.Path.cwd() / "page1.png"
+        path2 = pathlib.Path.cwd() / "page2.png"
+
+        panel.update_progress("250", "Generated PNG", [path1, path2], [path2])
+
+        assert panel.completed_steps[0].unchanged_paths == [path2]
+
 
 class TestProgressPanelFinishProgress:
     def test_clears_completed_steps(self):
@@ -49,6 +59,15 @@ class TestProgressPanelFinishProgress:
 
         assert len(panel.completed_steps) == 0
 
+    def test_uses_custom_title(self):
+        panel = ProgressPanel(quiet=False)
+        panel.completed_steps.append(CompletedStep("100", "Test", []))
+
+        panel.finish_progress(title="Your CV preview is ready")
+
+        assert isinstance(panel.renderable, rich.panel.Panel)
+        assert panel.renderable.title == "Your CV preview is ready"
+
 
 class TestProgressPanelPrintProgressPanel:
     def test_respects_quiet_mode(self):
@@ -102,6 +121,22 @@ class TestProgressPanelPrintProgressPanel:
 
         panel.print_progress_panel("Rendering your CV...")
 
+    def test_marks_unchanged_paths(self):
+        panel = ProgressPanel(quiet=False)
+        path1 = pathlib.Path.cwd() / "page1.png"
+        path2 = pathlib.Path.cwd() / "page2.png"
+        panel.completed_steps.append(
+            CompletedStep("500", "Generated PNG", [path1, path2], [path2])
+        )
+
+        panel.print_progress_panel("Rendering your CV...")
+
+        assert isinstance(panel.renderable, rich.panel.Panel)
+        content = panel.renderable.renderable
+        assert isinstance(content, str)
+        assert "./page1.png;" in content
+        assert "./page2.png (unchanged)" in content
+
 
 class TestProgressPanelPrintUserError:
     def test_exits_with_code_1(self):
@@ -0,0 +1,145 @@
+import io
+import pathlib
+
+import pytest
+import rich.console
+import typer
+
+from teklinicv.cli.render_command.progress_reporter import (
+    BatchProgressReporter,
+    LineProgressReporter,
+    ProgressReporter,
+    QuietProgressReporter,
+    format_output_paths,
+)
+from teklinicv.exception import TekliniCVUserError, TekliniCVValidationError
+
+validation_error = TekliniCVValidationError(
+    location=("cv", "email"),
+    yaml_location=((3, 3), (3, 8)),
+    input="not-an-email",
+    message="Invalid email.",
+)
+
+
+def test_format_output_paths():
+    path1 = pathlib.Path.cwd() / "page1.png"
+    path2 = pathlib.Path.cwd() / "page2.png"
+
+    assert format_output_paths([path1, path2], [path2]) == (
+        "./page1.png; ./page2.png (unchanged)"
+    )
+
+
+class TestProgressReporter:
+    def test_does_nothing_but_exit_on_errors(self):
+        with ProgressReporter() as progress:
+            progress.update_progress("100", "Generated PDF", [pathlib.Path("cv.pdf")])
+            progress.finish_progress()
+
+            with pytest.raises(typer.Exit):
+                progress.print_user_error(TekliniCVUserError("Error"))
+            with pytest.raises(typer.Exit):
+                progress.print_validation_errors([validation_error])
+
+
+class TestLineProgressReporter:
+    def test_writes_a_line_per_step(self):
+        file = io.StringIO()
+        progress = LineProgressReporter(file)
+
+        progress.update_progress("100", "Validated the input file", [])
+        progress.update_progress(
+            "150", "Generated PDF", [pathlib.Path.cwd() / "cv.pdf"]
+        )
+        progress.finish_progress()
+
+        assert file.getvalue().splitlines() == [
+            "+ 150 ms   Generated PDF:              ./cv.pdf",
+            "Your CV is ready.",
+        ]
+
+    def test_writes_errors_and_exits(self):
+        file = io.StringIO()
+        progress = LineProgressReporter(file)
+
+        with pytest.raises(typer.Exit) as exit_info:
+            progress.print_validation_errors([validation_error])
+
+        assert exit_info.value.exit_code == 1
+        assert "cv.email: Invalid email. (input: not-an-email)" in file.getvalue()
+
+
+class TestBatchProgressReporter:
+    def test_counts_renders_without_exiting(self):
+        progress = BatchProgressReporter(total=4, quiet=True)
+
+        progress.finish_progress()
+        progress.count_render()
+        progress.start_render("Jane_Doe_CV.yaml")
+        progress.print_user_error(TekliniCVUserError("Missing file"))
+        progress.print_validation_errors([validation_error])
+
+        assert progress.finished_count == 2
+        assert progress.failed_count == 2
+        assert progress.failed_errors == [
+            "Jane_Doe_CV.yaml: Missing file",
+            "Jane_Doe_CV.yaml: cv.email: Invalid email.",
+        ]
+        status = progress.create_status_line().plain
+        assert status.startswith("4/4 rendered, 2 failed")
+        assert "ETA 0 s" in status
+
+    def test_status_line_without_total(self):
+        progress = BatchProgressReporter(action="validated", quiet=True)
+
+        progress.count_render()
+
+        assert progress.create_status_line().plain.startswith("1 validated, 0 failed")
+
+    def test_writes_the_final_line_outside_terminals(self):
+        file = io.StringIO()
+        console = rich.console.Console(file=file)
+
+        with BatchProgressReporter(total=1, console=console) as progress:
+            progress.count_render()
+
+        assert file.getvalue().startswith("1/1 rendered, 0 failed")
+        assert file.getvalue().endswith("\n")
+
+    def test_quiet_shows_nothing(self):
+        file = io.StringIO()
+
+        with BatchProgressReporter(
+            quiet=True, console=rich.console.Console(file=file)
+        ) as progress:
+            progress.count_render("Missing file")
+
+        assert file.getvalue() == ""
+
+
+class TestQuietProgressReporter:
+    def test_hides_steps(self):
+        file = io.StringIO()
+
+        with QuietProgressReporter(LineProgressReporter(file)) as progress:
+            progress.update_progress("150", "Generated PDF", [pathlib.Path("cv.pdf")])
+            progress.finish_progress()
+
+        assert file.getvalue() == ""
+
+    def test_shows_errors_and_exits(self):
+        file = io.StringIO()
+        progress = QuietProgressReporter(LineProgressReporter(file))
+
+        with pytest.raises(typer.Exit) as exit_info:
+            progress.print_user_error(TekliniCVUserError("Missing file"))
+        with pytest.raises(typer.Exit):
+            progress.print_validation_errors([validation_error])
+
+        assert exit_info.value.exit_code == 1
+        assert file.getvalue().splitlines() == [
+            "Error: Missing file",
+            "There are errors in the input file!",
+            "cv.email: Invalid email. (input: not-an-email)",
+        ]
@@ -1,10 +1,22 @@
+import json
 import os
 from unittest.mock import MagicMock, patch
 
 import pytest
+import typer
 
 from teklinicv.cli.new_command.new_command import cli_command_new
-from teklinicv.cli.render_command.render_command import cli_command_render
+from teklinicv.cli.render_command.progress_reporter import (
+    LineProgressReporter,
+    QuietProgressReporter,
+)
+from teklinicv.cli.render_command.render_command import (
+    FitParameter,
+    ReportFormat,
+    cli_command_render,
+    create_progress_reporter,
+)
+from teklinicv.cli.render_command.run_teklinicv import run_teklinicv
 
 
 class TestCliCommandRender:
@@ -21,13 +33,27 @@ class TestCliCommandRender:
             "markdown_path": None,
             "html_path": None,
             "png_path": None,
+            "png_pages": None,
+            "png_ppi": None,
+            "photo_ppi": None,
             "dont_generate_markdown": False,
             "dont_generate_html": False,
             "dont_generate_typst": False,
             "dont_generate_pdf": False,
             "dont_generate_png": False,
             "watch": False,
+            "preview": False,
+            "preview_pages": 1,
+            "preview_ppi": 50,
+            "preview_idle_seconds": 2.0,
             "quiet": False,
+            "profile": False,
+            "profile_python": False,
+            "report": None,
+            "report_path": None,
+            "fit_pages": None,
+            "fit_parameters": None,
+            "fit_design_path": None,
             "_": None,
             "extra_data_model_override_arguments": context,
         }
@@ -165,6 +191,41 @@ class TestCliCommandRender:
         teklinicv_output = input_file.parent / "teklinicv_output"
         assert (teklinicv_output / "John_Doe_CV.pdf").exists()
 
+    def test_prints_report_to_stdout(self, input_file, default_arguments, capsys):
+        cli_command_render(
+            input_file_name=input_file,
+            **{
+                **default_arguments,
+                "report": ReportFormat.json,
+                "dont_generate_typst": True,
+            },
+        )
+
+        captured = capsys.readouterr()
+        report = json.loads(captured.out)
+        assert report["success"]
+        assert report["input"]["section_count"] > 0
+        assert "Your CV is ready" in captured.err
+
+    def test_appends_reports_to_file(self, input_file, default_arguments):
+        report_path = input_file.parent / "reports.jsonl"
+        arguments = {
+            **default_arguments,
+            "report": ReportFormat.json,
+            "report_path": report_path,
+            "dont_generate_typst": True,
+        }
+
+        cli_command_render(input_file_name=input_file, **arguments)
+        cli_command_render(input_file_name=input_file, **arguments)
+
+        reports = [
+            json.loads(line)
+            for line in report_path.read_text(encoding="utf-8").splitlines()
+        ]
+        assert len(reports) == 2
+        assert reports[0]["stages"][0]["name"] == "Validated the input file"
+
     @patch("teklinicv.cli.render_command.render_command.run_function_if_file_changes")
     def test_calls_watcher_when_watch_flag_is_true(
         self, mock_watcher, input_file, default_arguments
@@ -178,6 +239,63 @@ class TestCliCommandRender:
         call_args = mock_watcher.call_args
         assert call_args[0][0] == input_file.absolute()
 
+    @patch("teklinicv.cli.render_command.render_command.run_function_if_file_changes")
+    def test_defers_full_render_when_watching_with_preview(
+        self, mock_watcher, input_file, default_arguments
+    ):
+        cli_command_render(
+            input_file_name=input_file,
+            **{
+                **default_arguments,
+                "watch": True,
+                "preview": True,
+                "preview_idle_seconds": 5.0,
+            },
+        )
+
+        mock_watcher.assert_called_once()
+        call_args = mock_watcher.call_args
+        assert call_args.kwargs["idle_function"] is not None
+        assert call_args.kwargs["idle_seconds"] == 5.0
+
+    @patch("teklinicv.cli.render_command.run_teklinicv.run_teklinicv")
+    @patch("teklinicv.cli.render_command.run_teklinicv.run_teklinicv_preview")
+    def test_renders_only_preview_with_preview_flag(
+        self, mock_preview, mock_render, input_file, default_arguments
+    ):
+        cli_command_render(
+            input_file_name=input_file,
+            **{**default_arguments, "preview": True, "preview_pages": 2},
+        )
+
+        mock_render.assert_not_called()
+        mock_preview.assert_called_once()
+        assert mock_preview.call_args[0][2:] == (2, 50)
+
+    @patch("teklinicv.cli.render_command.run_teklinicv.run_teklinicv")
+    def test_passes_fit_options(self, mock_render, input_file, default_arguments):
+        fit_design_path = input_file.parent / "fitted_design.yaml"
+
+        cli_command_render(
+            input_file_name=input_file,
+            **{
+                **default_arguments,
+                "fit_pages": 1,
+                "fit_parameters": [FitParameter.margins],
+                "fit_design_path": fit_design_path,
+            },
+        )
+
+        call_kwargs = mock_render.call_args.kwargs
+        assert call_kwargs["fit_pages"] == 1
+        assert call_kwargs["fit_parameters"] == ("margins",)
+        assert call_kwargs["fit_design_path"] == fit_design_path
+
+    def test_fit_parameters_match_the_renderer(self):
+        from teklinicv.renderer import page_fit  # NOQA: PLC0415
+
+        assert list(FitParameter) == list(page_fit.FitParameter)
+
     @pytest.mark.parametrize(
         ("config_type", "config_content", "expected_in_output"),
         [
@@ -206,3 +324,27 @@ class TestCliCommandRender:
 
         typst_file = input_file.parent / "teklinicv_output" / "John_Doe_CV.typ"
         assert expected_in_output in typst_file.read_text()
+
+
+def test_create_progress_reporter():
+    quiet_progress = create_progress_reporter(quiet=True)
+    assert isinstance(quiet_progress, QuietProgressReporter)
+    assert isinstance(quiet_progress.error_reporter, LineProgressReporter)
+    # Tests don't run in a terminal:
+    assert isinstance(create_progress_reporter(quiet=False), LineProgressReporter)
+
+
+def test_quiet_render_shows_validation_errors(tmp_path, capsys):
+    input_file = tmp_path / "John_Doe_CV.yaml"
+    input_file.write_text("cv:\n  name: John Doe\n  email: not-an-email\n")
+
+    with (
+        pytest.raises(typer.Exit) as exit_info,
+        create_progress_reporter(quiet=True) as progress,
+    ):
+        run_teklinicv(input_file, progress)
+
+    assert exit_info.value.exit_code == 1
+    output = capsys.readouterr().out
+    assert "There are errors in the input file!" in output
+    assert "cv.email" in output
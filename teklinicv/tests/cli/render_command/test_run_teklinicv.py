@@ -5,8 +5,20 @@ import sys
 import pytest
 import typer
 
+from teklinicv.cli.render_command import run_teklinicv as run_teklinicv_module
 from teklinicv.cli.render_command.progress_panel import ProgressPanel
-from teklinicv.cli.render_command.run_teklinicv import run_teklinicv, timed_step
+from teklinicv.cli.render_command.run_teklinicv import (
+    run_teklinicv,
+    run_teklinicv_preview,
+    timed_step,
+)
+from teklinicv.hooks import HookEvent, register_hook, unregister_hook
+from teklinicv.profiler import Profiler
+from teklinicv.render_report import RenderReport
+from teklinicv.renderer.output_file import write_output_file
+from teklinicv.renderer.page_fit import PageFit, shrink_design
+from teklinicv.schema.sample_generator import create_sample_yaml_input_file
+from teklinicv.schema.yaml_reader import read_yaml
 
 
 class TestTimedStep:
@@ -67,6 +79,20 @@ class TestTimedStep:
 
         assert progress.completed_steps[0].message == "Generated PNGs"
 
+    def test_reports_unchanged_output_files(self, tmp_path):
+        output_file = tmp_path / "cv.typ"
+        write_output_file(output_file, "Hello")
+
+        def sample_func() -> pathlib.Path:
+            write_output_file(output_file, "Hello")
+            return output_file
+
+        progress = ProgressPanel(quiet=True)
+
+        timed_step("Generated Typst", progress, sample_func)
+
+        assert progress.completed_steps[0].unchanged_paths == [output_file]
+
     def test_passes_args_and_kwargs_to_function(self):
         def sample_func(a: int, b: int, c: int = 0) -> int:
             return a + b + c
@@ -135,6 +161,156 @@ design:
         with pytest.raises(typer.Exit) as _, progress:
             run_teklinicv(yaml_file, progress)
 
+    def test_writes_profile(self, tmp_path):
+        yaml_file = tmp_path / "John_Doe_CV.yaml"
+        create_sample_yaml_input_file(file_path=yaml_file)
+        profiler = Profiler(tmp_path / "John_Doe_CV_profile")
+
+        with ProgressPanel(quiet=True) as progress:
+            run_teklinicv(
+                yaml_file, progress, profiler=profiler, dont_generate_typst=True
+            )
+
+        span_names = [span.name for span in profiler.spans]
+        assert "Validated the input file" in span_names
+        assert "Generated Markdown" in span_names
+        assert "markdown/entries/ExperienceEntry.j2.md" in span_names
+        assert (tmp_path / "John_Doe_CV_profile.json").is_file()
+
+    def test_times_markdown_rendering_in_its_step(self, tmp_path):
+        yaml_file = tmp_path / "John_Doe_CV.yaml"
+        create_sample_yaml_input_file(file_path=yaml_file)
+        profiler = Profiler(tmp_path / "John_Doe_CV_profile")
+
+        with ProgressPanel(quiet=True) as progress:
+            run_teklinicv(
+                yaml_file, progress, profiler=profiler, dont_generate_typst=True
+            )
+
+        markdown_step = next(
+            span for span in profiler.spans if span.name == "Generated Markdown"
+        )
+        markdown_template = next(
+            span
+            for span in profiler.spans
+            if span.name == "markdown/entries/ExperienceEntry.j2.md"
+        )
+        assert markdown_step.start_ns <= markdown_template.start_ns
+        assert (
+            markdown_template.start_ns + markdown_template.duration_ns
+            <= markdown_step.start_ns + markdown_step.duration_ns
+        )
+
+    def test_records_report(self, tmp_path):
+        yaml_file = tmp_path / "John_Doe_CV.yaml"
+        create_sample_yaml_input_file(file_path=yaml_file)
+        report = RenderReport(yaml_file)
+
+        with ProgressPanel(quiet=True) as progress:
+            run_teklinicv(yaml_file, progress, report=report, dont_generate_typst=True)
+
+        markdown_stage = next(
+            stage for stage in report.stages if stage.name == "Generated Markdown"
+        )
+        assert report.error is None
+        assert report.entry_count is not None
+        assert report.entry_count > 0
+        assert markdown_stage.outputs[0].path.endswith("John_Doe_CV.md")
+        assert markdown_stage.outputs[0].size_bytes > 0
+        assert markdown_stage.peak_memory_bytes is not None
+
+    def test_fits_the_design_to_pages(self, tmp_path, monkeypatch):
+        yaml_file = tmp_path / "John_Doe_CV.yaml"
+        create_sample_yaml_input_file(file_path=yaml_file)
+        fit_design_path = tmp_path / "fitted_design.yaml"
+        fit_calls = []
+
+        def fit_design_to_pages(teklinicv_model, typst_path, page_count, parameters):
+            fit_calls.append((typst_path, page_count, parameters))
+            model, changed_values = shrink_design(teklinicv_model, parameters, 0.5)
+            return PageFit(model, page_count, 5, changed_values)
+
+        monkeypatch.setattr(
+            run_teklinicv_module, "fit_design_to_pages", fit_design_to_pages
+        )
+
+        progress = ProgressPanel(quiet=True)
+        # Keep the steps, which finishing the render clears:
+        monkeypatch.setattr(progress, "finish_progress", lambda: None)
+        with progress:
+            run_teklinicv(
+                yaml_file,
+                progress,
+                fit_pages=1,
+                fit_parameters=("font_size",),
+                fit_design_path=fit_design_path,
+                dont_generate_pdf=True,
+                dont_generate_png=True,
+            )
+
+        [(typst_path, page_count, parameters)] = fit_calls
+        assert typst_path.suffix == ".typ"
+        assert (page_count, parameters) == (1, ("font_size",))
+        fit_step = next(
+            step for step in progress.completed_steps if "Fitted" in step.message
+        )
+        assert fit_step.message == "Fitted to 1 page (font size 9pt, 5 compilations)"
+        assert fit_step.paths == [typst_path, fit_design_path]
+        assert read_yaml(fit_design_path)["design"]["typography"] == {
+            "font_size": {"body": "9pt"}
+        }
+
+    def test_emits_hooks(self, tmp_path):
+        yaml_file = tmp_path / "John_Doe_CV.yaml"
+        create_sample_yaml_input_file(file_path=yaml_file)
+        ended_stages = []
+        written_paths = []
+
+        def on_stage_end(stage, duration_seconds, failed):  # NOQA: ARG001
+            ended_stages.append(stage)
+
+        def on_output_written(path, unchanged):  # NOQA: ARG001
+            written_paths.append(path)
+
+        register_hook(HookEvent.stage_end, on_stage_end)
+        register_hook(HookEvent.output_written, on_output_written)
+        try:
+            with ProgressPanel(quiet=True) as progress:
+                run_teklinicv(yaml_file, progress, dont_generate_typst=True)
+        finally:
+            unregister_hook(HookEvent.stage_end, on_stage_end)
+            unregister_hook(HookEvent.output_written, on_output_written)
+
+        assert ended_stages[:3] == ["Read YAML", "Validate", "Validated the input file"]
+        assert "Process model" in ended_stages
+        assert "Generated Markdown" in ended_stages
+        assert [path.name for path in written_paths] == [
+            "John_Doe_CV.md",
+            "John_Doe_CV.html",
+        ]
+
+    def test_records_failed_render_in_report(self, tmp_path):
+        invalid_yaml = tmp_path / "invalid.yaml"
+        invalid_yaml.write_text("invalid: yaml: content: :", encoding="utf-8")
+        report = RenderReport(invalid_yaml)
+
+        with pytest.raises(typer.Exit), ProgressPanel(quiet=True) as progress:
+            run_teklinicv(invalid_yaml, progress, report=report)
+
+        assert report.to_dictionary()["success"] is False
+        assert report.error is not None
+
+    def test_preview_invalid_yaml(self, tmp_path):
+        invalid_yaml = tmp_path / "invalid.yaml"
+        invalid_yaml.write_text("invalid: yaml: content: :", encoding="utf-8")
+
+        progress = ProgressPanel(quiet=True)
+
+        with pytest.raises(typer.Exit) as exc_info, progress:
+            run_teklinicv_preview(invalid_yaml, progress, 1, 50)
+
+        assert exc_info.value.exit_code == 1
+
     @pytest.mark.skipif(
         sys.platform == "win32", reason="chmod doesn't work the same on Windows"
     )
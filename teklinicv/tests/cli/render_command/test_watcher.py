@@ -80,3 +80,38 @@ class TestRunFunctionIfFileChanges:
         time.sleep(0.2)
 
         assert call_count > count_after_exit
+
+    def test_calls_idle_function_once_file_stops_changing(self, tmp_path):
+        watched_file = tmp_path / "test.yaml"
+        watched_file.write_text("initial", encoding="utf-8")
+
+        preview_count = 0
+        full_count = 0
+
+        def preview_function():
+            nonlocal preview_count
+            preview_count += 1
+
+        def full_function():
+            nonlocal full_count
+            full_count += 1
+
+        watcher_thread = threading.Thread(
+            target=watcher.run_function_if_file_changes,
+            args=(watched_file, preview_function),
+            kwargs={"idle_function": full_function, "idle_seconds": 0.5},
+            daemon=True,
+        )
+        watcher_thread.start()
+
+        time.sleep(0.1)
+        for i in range(3):
+            watched_file.write_text(f"edit {i}", encoding="utf-8")
+            time.sleep(0.1)
+
+        assert preview_count > 1
+        assert full_count == 0
+
+        time.sleep(1)
+
+        assert full_count == 1
@@ -48,6 +48,37 @@ class TestCliCommandNoArgs:
         assert "TekliniCV is a command-line tool" in result.output
         mock_warn.assert_called_once()
 
+    @patch("teklinicv.cli.app.warn_if_new_version_is_available")
+    def test_skips_version_check_for_lsp(self, mock_warn):
+        runner = CliRunner()
+        runner.invoke(app, ["lsp", "--help"])
+
+        mock_warn.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("arguments", "checks_version"),
+    [
+        (["validate", "missing.yaml"], True),
+        (["validate", "missing.yaml", "--format", "json"], False),
+        (["validate", "missing.yaml", "-f", "sarif"], False),
+        (["validate", "missing.yaml", "--format", "json", "-o", "out.json"], True),
+        (["render", "missing.yaml", "--report", "json"], False),
+        (["render", "missing.yaml", "-r", "json", "-rp", "report.jsonl"], True),
+    ],
+)
+@patch("urllib.request.urlopen")
+def test_skips_version_check_for_machine_readable_output(
+    mock_urlopen, arguments, checks_version, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    mock_urlopen.side_effect = TimeoutError
+
+    runner = CliRunner()
+    runner.invoke(app, arguments)
+
+    assert mock_urlopen.called == checks_version
+
 
 class TestWarnIfNewVersionIsAvailable:
     @pytest.mark.parametrize(
@@ -73,10 +104,11 @@ class TestWarnIfNewVersionIsAvailable:
         warn_if_new_version_is_available()
 
         captured = capsys.readouterr()
+        assert captured.out == ""
         if should_warn:
-            assert "new version" in captured.out.lower()
+            assert "new version" in captured.err.lower()
         else:
-            assert "new version" not in captured.out.lower()
+            assert "new version" not in captured.err.lower()
 
     @patch("urllib.request.urlopen")
     def test_handles_network_errors_gracefully(self, mock_urlopen, capsys):
@@ -85,4 +117,12 @@ class TestWarnIfNewVersionIsAvailable:
         warn_if_new_version_is_available()
 
         captured = capsys.readouterr()
-        assert "new version" not in captured.out.lower()
+        assert "new version" not in captured.err.lower()
+
+    @patch("urllib.request.urlopen")
+    def test_gives_up_after_a_short_timeout(self, mock_urlopen):
+        mock_urlopen.side_effect = TimeoutError
+
+        warn_if_new_version_is_available()
+
+        assert mock_urlopen.call_args.kwargs["timeout"] <= 5
@@ -0,0 +1,78 @@
+import pathlib
+
+from teklinicv.cli.validate_command.format_diagnostics import (
+    create_json_diagnostics,
+    create_sarif_diagnostics,
+    get_artifact_uri,
+)
+from teklinicv.cli.validate_command.validate_files import FileValidationResult
+from teklinicv.exception import TekliniCVValidationError
+
+results = [
+    FileValidationResult(pathlib.Path("Valid_CV.yaml"), 1.5),
+    FileValidationResult(
+        pathlib.Path("Invalid_CV.yaml"),
+        2.5,
+        [
+            TekliniCVValidationError(
+                location=("cv", "email"),
+                yaml_location=((3, 3), (3, 8)),
+                message="This is not a valid email address.",
+                input="not-an-email",
+            ),
+            TekliniCVValidationError(
+                location=(), yaml_location=None, message="Broken.", input=""
+            ),
+        ],
+    ),
+]
+
+
+def test_create_json_diagnostics():
+    diagnostics = create_json_diagnostics(results)
+
+    assert diagnostics["valid_count"] == 1
+    assert diagnostics["invalid_count"] == 1
+    valid_file, invalid_file = diagnostics["files"]
+    assert valid_file == {
+        "path": "Valid_CV.yaml",
+        "valid": True,
+        "duration_ms": 1.5,
+        "errors": [],
+    }
+    assert invalid_file["errors"][0] == {
+        "location": "cv.email",
+        "yaml_location": {
+            "start": {"line": 3, "column": 3},
+            "end": {"line": 3, "column": 8},
+        },
+        "message": "This is not a valid email address.",
+        "input": "not-an-email",
+    }
+    assert invalid_file["errors"][1]["yaml_location"] is None
+
+
+def test_create_sarif_diagnostics():
+    diagnostics = create_sarif_diagnostics(results)
+
+    assert diagnostics["version"] == "2.1.0"
+    (run,) = diagnostics["runs"]
+    assert [artifact["properties"]["durationMs"] for artifact in run["artifacts"]] == [
+        1.5,
+        2.5,
+    ]
+    email_result, file_result = run["results"]
+    (email_location,) = email_result["locations"]
+    assert email_location["physicalLocation"] == {
+        "artifactLocation": {"uri": "Invalid_CV.yaml", "index": 1},
+        "region": {"startLine": 3, "startColumn": 3, "endLine": 3, "endColumn": 8},
+    }
+    assert email_location["logicalLocations"] == [{"fullyQualifiedName": "cv.email"}]
+    assert file_result["message"] == {"text": "Broken."}
+    assert "region" not in file_result["locations"][0]["physicalLocation"]
+
+
+def test_get_artifact_uri_outside_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    assert get_artifact_uri(pathlib.Path("/CV.yaml")) == "file:///CV.yaml"
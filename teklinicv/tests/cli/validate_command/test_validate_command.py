@@ -0,0 +1,82 @@
+import json
+import subprocess
+import sys
+
+import pytest
+import typer
+
+from teklinicv.cli.validate_command.validate_command import (
+    DiagnosticsFormat,
+    cli_command_validate,
+)
+from teklinicv.schema.sample_generator import create_sample_yaml_input_file
+
+
+@pytest.fixture
+def input_files(tmp_path):
+    valid_file = tmp_path / "John_Doe_CV.yaml"
+    create_sample_yaml_input_file(file_path=valid_file)
+    invalid_file = tmp_path / "Invalid_CV.yaml"
+    invalid_file.write_text(
+        "cv:\n  name: John Doe\n  email: not-an-email\n", encoding="utf-8"
+    )
+    return valid_file, invalid_file
+
+
+def test_valid_files(input_files, capsys):
+    cli_command_validate([input_files[0]], jobs=1)
+
+    assert "1 valid, 0 invalid" in capsys.readouterr().out
+
+
+def test_prints_errors_and_exits_with_error(input_files, capsys):
+    with pytest.raises(typer.Exit) as exit_info:
+        cli_command_validate(list(input_files), jobs=1)
+
+    assert exit_info.value.exit_code == 1
+    output = capsys.readouterr().out
+    assert "Invalid_CV.yaml:3:3" in output
+    assert "cv.email" in output
+    assert "1 valid, 1 invalid" in output
+
+
+@pytest.mark.parametrize(
+    "diagnostics_format", [DiagnosticsFormat.json, DiagnosticsFormat.sarif]
+)
+def test_writes_diagnostics_to_file(input_files, tmp_path, diagnostics_format):
+    output_file_path = tmp_path / "diagnostics.json"
+
+    with pytest.raises(typer.Exit):
+        cli_command_validate(
+            list(input_files),
+            diagnostics_format=diagnostics_format,
+            output_file_path=output_file_path,
+            jobs=1,
+        )
+
+    diagnostics = json.loads(output_file_path.read_text(encoding="utf-8"))
+    if diagnostics_format == DiagnosticsFormat.json:
+        assert diagnostics["invalid_count"] == 1
+    else:
+        assert len(diagnostics["runs"][0]["results"]) == 1
+
+
+def test_prints_json_to_stdout(input_files, capsys):
+    cli_command_validate(
+        [input_files[0]], diagnostics_format=DiagnosticsFormat.json, jobs=1
+    )
+
+    assert json.loads(capsys.readouterr().out)["valid_count"] == 1
+
+
+def test_cli_does_not_import_renderer():
+    code = (
+        "import sys; import teklinicv.cli.app;"
+        " print(any(module.startswith(('teklinicv.renderer', 'typst', 'jinja2'))"
+        " for module in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert output.stdout.strip() == "False"
@@ -0,0 +1,71 @@
+import pathlib
+
+import pytest
+
+from teklinicv.cli.validate_command.validate_files import validate_file, validate_files
+from teklinicv.schema.sample_generator import create_sample_yaml_input_file
+
+
+@pytest.fixture
+def valid_file(tmp_path) -> pathlib.Path:
+    file_path = tmp_path / "John_Doe_CV.yaml"
+    create_sample_yaml_input_file(file_path=file_path)
+    return file_path
+
+
+@pytest.fixture
+def invalid_file(tmp_path) -> pathlib.Path:
+    file_path = tmp_path / "Invalid_CV.yaml"
+    file_path.write_text(
+        "cv:\n  name: John Doe\n  email: not-an-email\n", encoding="utf-8"
+    )
+    return file_path
+
+
+def test_validate_file_with_valid_file(valid_file):
+    result = validate_file(valid_file)
+
+    assert result.is_valid
+    assert result.path == valid_file
+    assert result.duration_ms > 0
+
+
+def test_validate_file_with_validation_error(invalid_file):
+    result = validate_file(invalid_file)
+
+    assert not result.is_valid
+    (error,) = result.errors
+    assert error.location == ("cv", "email")
+    assert error.input == "not-an-email"
+    assert error.yaml_location is not None
+    assert error.yaml_location[0][0] == 3
+
+
+def test_validate_file_with_invalid_yaml(tmp_path):
+    file_path = tmp_path / "Broken_CV.yaml"
+    file_path.write_text("cv:\n  name: [John\n", encoding="utf-8")
+
+    (error,) = validate_file(file_path).errors
+
+    assert error.location == ()
+    assert error.message.startswith("This is not a valid YAML file!")
+    assert error.yaml_location is not None
+
+
+def test_validate_file_with_missing_file(tmp_path):
+    (error,) = validate_file(tmp_path / "Missing_CV.yaml").errors
+
+    assert "doesn't exist" in error.message
+    assert error.yaml_location is None
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_files_keeps_order(valid_file, invalid_file, jobs):
+    results = validate_files([invalid_file, valid_file, invalid_file], jobs=jobs)
+
+    assert [result.path for result in results] == [
+        invalid_file,
+        valid_file,
+        invalid_file,
+    ]
+    assert [result.is_valid for result in results] == [False, True, False]
@@ -0,0 +1,41 @@
+import pathlib
+
+import pytest
+import typer
+
+from teklinicv.cli.warmup_command.warmup_command import cli_command_warmup
+from teklinicv.renderer import cache_warmup
+from teklinicv.renderer.cache_warmup import WarmedCache
+from teklinicv.renderer.templater.templater import get_jinja2_environment
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEKLINICV_CACHE_DIR", str(tmp_path / "cache"))
+    # The Typst package may need the network:
+    monkeypatch.setattr(
+        cache_warmup,
+        "warm_typst_package",
+        lambda: WarmedCache("Typst package", pathlib.Path(), 0, 1),
+    )
+    get_jinja2_environment.cache_clear()
+    yield
+    get_jinja2_environment.cache_clear()
+
+
+def test_cli_command_warmup(capsys):
+    cli_command_warmup(theme_folders=None, quiet=False)
+    cli_command_warmup(theme_folders=None, quiet=False)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 10
+    assert "Jinja templates (0 built, " in lines[6]
+    assert "Typst package (0 built, 1 cached)" in lines[8]
+    assert lines[9] == "TekliniCV's caches are warm."
+
+
+def test_cli_command_warmup_with_invalid_theme_folder(tmp_path):
+    with pytest.raises(typer.Exit) as exit_info:
+        cli_command_warmup(theme_folders=[tmp_path / "missing"], quiet=True)
+
+    assert exit_info.value.exit_code == 1
@@ -0,0 +1,165 @@
+import json
+import pathlib
+import time
+
+import pytest
+
+from teklinicv.cli.worker_command.job_queue import (
+    JobQueue,
+    JobStatus,
+    RenderJob,
+    read_manifest,
+)
+from teklinicv.exception import TekliniCVUserError
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    with JobQueue(tmp_path / "jobs.sqlite") as job_queue:
+        yield job_queue
+
+
+def create_jobs(count: int) -> list[RenderJob]:
+    return [RenderJob(pathlib.Path(f"/cvs/CV_{index}.yaml")) for index in range(count)]
+
+
+class TestReadManifest:
+    def test_resolves_paths_relative_to_the_manifest(self, tmp_path):
+        manifest_path = tmp_path / "manifest.jsonl"
+        lines = [
+            {
+                "input": "John_Doe_CV.yaml",
+                "design": "designs/compact.yaml",
+                "overrides": {"cv.phone": "+1 555 0100", "design.page.show_footer": 0},
+                "output_directory": "out/john",
+            },
+            {},
+            {"input": "/cvs/Jane_Doe_CV.yaml"},
+        ]
+        manifest_path.write_text(
+            "\n".join(json.dumps(line) if line else "" for line in lines),
+            encoding="utf-8",
+        )
+
+        jobs = read_manifest(manifest_path)
+
+        assert jobs == [
+            RenderJob(
+                input=tmp_path / "John_Doe_CV.yaml",
+                design=tmp_path / "designs/compact.yaml",
+                overrides={"cv.phone": "+1 555 0100", "design.page.show_footer": "0"},
+                output_directory=tmp_path / "out/john",
+            ),
+            RenderJob(input=pathlib.Path("/cvs/Jane_Doe_CV.yaml")),
+        ]
+
+    @pytest.mark.parametrize(
+        ("line", "reason"),
+        [
+            ("not json", "Expecting value"),
+            ("[1, 2]", "Each line should be a JSON object."),
+            ('{"design": "design.yaml"}', 'The "input" key should be the path'),
+            ('{"input": "cv.yaml", "output": "out"}', "Unknown keys: output"),
+            ('{"input": "cv.yaml", "overrides": ["a"]}', 'The "overrides" key'),
+        ],
+    )
+    def test_raises_with_the_line_number(self, tmp_path, line, reason):
+        manifest_path = tmp_path / "manifest.jsonl"
+        manifest_path.write_text(f'{{"input": "cv.yaml"}}\n{line}\n', encoding="utf-8")
+
+        with pytest.raises(TekliniCVUserError) as exception_info:
+            read_manifest(manifest_path)
+
+        message = exception_info.value.message
+        assert message is not None
+        assert message.startswith(f"Line 2 of {manifest_path}")
+        assert reason in message
+
+    def test_raises_if_the_manifest_doesnt_exist(self, tmp_path):
+        with pytest.raises(TekliniCVUserError):
+            read_manifest(tmp_path / "missing.jsonl")
+
+
+class TestJobQueue:
+    def test_claims_jobs_in_order_once(self, job_queue):
+        job_ids = job_queue.enqueue(create_jobs(2))
+
+        first_job = job_queue.claim("worker-1", lease_seconds=60)
+        second_job = job_queue.claim("worker-2", lease_seconds=60)
+
+        assert first_job is not None
+        assert second_job is not None
+        assert [first_job.id, second_job.id] == job_ids
+        assert first_job.job == create_jobs(2)[0]
+        assert first_job.attempt == 1
+        assert job_queue.claim("worker-3", lease_seconds=60) is None
+        assert job_queue.count_jobs()[JobStatus.running] == 2
+
+    def test_records_results_and_errors(self, job_queue):
+        job_queue.enqueue(create_jobs(2))
+        first_job = job_queue.claim("worker-1", lease_seconds=60)
+        second_job = job_queue.claim("worker-1", lease_seconds=60)
+        assert first_job is not None
+        assert second_job is not None
+
+        assert job_queue.finish(first_job.id, "worker-1", {"success": True})
+        assert job_queue.finish(second_job.id, "worker-1", None, "Invalid input")
+
+        done_job, failed_job = job_queue.get_jobs()
+        assert done_job.status == JobStatus.done
+        assert done_job.result == {"success": True}
+        assert failed_job.status == JobStatus.failed
+        assert failed_job.error == "Invalid input"
+        assert job_queue.get_jobs(JobStatus.failed) == [failed_job]
+
+    def test_retries_jobs_whose_lease_expired(self, job_queue):
+        job_queue.enqueue(create_jobs(1))
+        crashed_job = job_queue.claim("crashed-worker", lease_seconds=0.05)
+        assert crashed_job is not None
+        assert job_queue.claim("worker-2", lease_seconds=60) is None
+
+        time.sleep(0.1)
+        retried_job = job_queue.claim("worker-2", lease_seconds=60)
+
+        assert retried_job is not None
+        assert retried_job.id == crashed_job.id
+        assert retried_job.attempt == 2
+        # The crashed worker's outcome is ignored once the job is taken over:
+        assert not job_queue.finish(crashed_job.id, "crashed-worker", {})
+        assert not job_queue.renew_lease(crashed_job.id, "crashed-worker", 60)
+        assert job_queue.finish(retried_job.id, "worker-2", {})
+        assert job_queue.count_jobs()[JobStatus.done] == 1
+
+    def test_fails_jobs_after_the_last_attempt(self, job_queue):
+        job_queue.enqueue(create_jobs(1), max_attempts=2)
+        for _ in range(2):
+            assert job_queue.claim("crashing-worker", lease_seconds=0.05) is not None
+            time.sleep(0.1)
+
+        assert job_queue.claim("worker", lease_seconds=60) is None
+        (failed_job,) = job_queue.get_jobs()
+        assert failed_job.status == JobStatus.failed
+        assert failed_job.attempt_count == 2
+        assert failed_job.error == "Workers stopped before finishing the job 2 times."
+
+    def test_renewed_leases_dont_expire(self, job_queue):
+        job_queue.enqueue(create_jobs(1))
+        claimed_job = job_queue.claim("worker-1", lease_seconds=0.2)
+        assert claimed_job is not None
+
+        time.sleep(0.1)
+        assert job_queue.renew_lease(claimed_job.id, "worker-1", 60)
+        time.sleep(0.15)
+
+        assert job_queue.claim("worker-2", lease_seconds=60) is None
+
+    def test_is_shared_between_connections(self, tmp_path, job_queue):
+        with JobQueue(tmp_path / "jobs.sqlite") as other_job_queue:
+            other_job_queue.enqueue(create_jobs(3))
+
+        assert job_queue.count_jobs() == {
+            JobStatus.queued: 3,
+            JobStatus.running: 0,
+            JobStatus.done: 0,
+            JobStatus.failed: 0,
+        }
@@ -0,0 +1,128 @@
+import pathlib
+import time
+
+import pytest
+
+from teklinicv.cli.render_command.progress_reporter import (
+    BatchProgressReporter,
+    ProgressReporter,
+)
+from teklinicv.cli.worker_command.job_queue import (
+    ClaimedJob,
+    JobQueue,
+    JobStatus,
+    RenderJob,
+)
+from teklinicv.cli.worker_command.run_worker import (
+    get_render_arguments,
+    renew_lease_in_background,
+    run_job,
+    run_worker,
+)
+from teklinicv.schema.sample_generator import create_sample_yaml_input_file
+
+# Markdown and HTML only, so the jobs don't need the Typst package:
+offline_overrides = {"settings.render_command.dont_generate_typst": "true"}
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    input_file = tmp_path / "John_Doe_CV.yaml"
+    create_sample_yaml_input_file(file_path=input_file, name="John Doe")
+    return input_file
+
+
+def test_get_render_arguments(tmp_path):
+    job = RenderJob(
+        input=tmp_path / "cv.yaml",
+        design=tmp_path / "design.yaml",
+        overrides={"cv.phone": "+1 555 0100"},
+        output_directory=tmp_path / "out",
+    )
+
+    arguments = get_render_arguments(job)
+
+    assert arguments["design_file_path_or_contents"] == tmp_path / "design.yaml"
+    assert arguments["locale_file_path_or_contents"] is None
+    assert arguments["overrides"] == {"cv.phone": "+1 555 0100"}
+    assert arguments.get("pdf_path") == tmp_path / "out/NAME_IN_SNAKE_CASE_CV.pdf"
+    assert "pdf_path" not in get_render_arguments(RenderJob(tmp_path / "cv.yaml"))
+
+
+class TestRunJob:
+    def test_renders_into_the_output_directory(self, tmp_path, input_file):
+        job = RenderJob(
+            input_file,
+            overrides=offline_overrides,
+            output_directory=tmp_path / "out",
+        )
+
+        result, error = run_job(ClaimedJob(1, job, attempt=1))
+
+        assert error is None
+        assert result["success"]
+        assert (tmp_path / "out/John_Doe_CV.md").is_file()
+        assert str(tmp_path / "out/John_Doe_CV.html") in [
+            output["path"] for stage in result["stages"] for output in stage["outputs"]
+        ]
+
+    def test_returns_errors_instead_of_exiting(self, tmp_path, input_file):
+        job = RenderJob(input_file, overrides={"cv.email": "not-an-email"})
+
+        result, error = run_job(ClaimedJob(1, job, attempt=1))
+
+        assert not result["success"]
+        assert error is not None
+        assert error.startswith("cv.email: ")
+        assert run_job(ClaimedJob(2, RenderJob(tmp_path / "missing.yaml"), 1))[1]
+
+
+def test_run_worker(tmp_path, input_file):
+    database_path = tmp_path / "jobs.sqlite"
+    with JobQueue(database_path) as job_queue:
+        job_queue.enqueue(
+            [
+                RenderJob(input_file, overrides=offline_overrides),
+                RenderJob(tmp_path / "missing.yaml"),
+            ]
+        )
+
+        finished_count = run_worker(
+            database_path, ProgressReporter(), "worker-1", exit_when_empty=True
+        )
+
+        assert finished_count == 2
+        done_job, failed_job = job_queue.get_jobs()
+        assert done_job.status == JobStatus.done
+        assert done_job.worker_id == "worker-1"
+        assert failed_job.status == JobStatus.failed
+        assert "missing.yaml" in (failed_job.error or "")
+
+
+def test_run_worker_counts_jobs_in_batch_progress(tmp_path, input_file):
+    database_path = tmp_path / "jobs.sqlite"
+    with JobQueue(database_path) as job_queue:
+        job_queue.enqueue(
+            [
+                RenderJob(input_file, overrides=offline_overrides),
+                RenderJob(tmp_path / "missing.yaml"),
+            ]
+        )
+    progress = BatchProgressReporter(quiet=True)
+
+    run_worker(database_path, progress, "worker-1", exit_when_empty=True)
+
+    assert progress.finished_count == 1
+    assert progress.failed_count == 1
+
+
+def test_renew_lease_in_background(tmp_path):
+    database_path = tmp_path / "jobs.sqlite"
+    with JobQueue(database_path) as job_queue:
+        job_queue.enqueue([RenderJob(pathlib.Path("/cvs/cv.yaml"))])
+        claimed_job = job_queue.claim("worker-1", lease_seconds=0.3)
+        assert claimed_job is not None
+
+        with renew_lease_in_background(database_path, claimed_job.id, "worker-1", 0.3):
+            time.sleep(0.5)
+            assert job_queue.claim("worker-2", lease_seconds=60) is None
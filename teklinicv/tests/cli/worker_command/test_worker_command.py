@@ -0,0 +1,93 @@
+import subprocess
+import sys
+
+import pytest
+
+from teklinicv.cli.render_command.progress_reporter import ProgressReporter
+from teklinicv.cli.worker_command import run_worker as run_worker_module
+from teklinicv.cli.worker_command.job_queue import JobQueue, JobStatus, RenderJob
+from teklinicv.cli.worker_command.worker_command import cli_command_worker
+from teklinicv.schema.sample_generator import create_sample_yaml_input_file
+
+
+@pytest.fixture
+def input_files(tmp_path):
+    input_files = [tmp_path / f"CV_{index}.yaml" for index in range(6)]
+    for index, input_file in enumerate(input_files):
+        create_sample_yaml_input_file(file_path=input_file, name=f"Person {index}")
+    return input_files
+
+
+def test_cli_command_worker(tmp_path, monkeypatch, capsys):
+    run_worker_arguments = []
+
+    def run_worker(database_path, progress, worker_id, **kwargs):
+        run_worker_arguments.append((database_path, type(progress), worker_id, kwargs))
+        return 1
+
+    monkeypatch.setattr(run_worker_module, "run_worker", run_worker)
+
+    cli_command_worker(
+        queue=tmp_path / "jobs.sqlite",
+        lease_seconds=30,
+        poll_seconds=1,
+        exit_when_empty=True,
+        worker_id="node-1",
+        quiet=True,
+    )
+
+    assert run_worker_arguments == [
+        (
+            tmp_path / "jobs.sqlite",
+            ProgressReporter,
+            "node-1",
+            {"lease_seconds": 30, "poll_seconds": 1, "exit_when_empty": True},
+        )
+    ]
+    assert capsys.readouterr().out == ""
+
+
+def test_workers_share_the_queue(tmp_path, input_files):
+    """Several local worker processes stand in for several nodes."""
+    database_path = tmp_path / "jobs.sqlite"
+    with JobQueue(database_path) as job_queue:
+        job_queue.enqueue(
+            [
+                RenderJob(
+                    input_file,
+                    # Markdown and HTML only, so the jobs don't need the Typst package:
+                    overrides={"settings.render_command.dont_generate_typst": "true"},
+                    output_directory=tmp_path / "out" / input_file.stem,
+                )
+                for input_file in input_files
+            ]
+        )
+
+        workers = [
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "teklinicv",
+                    "worker",
+                    "--queue",
+                    str(database_path),
+                    "--exit-when-empty",
+                    "--worker-id",
+                    f"worker-{index}",
+                ],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for index in range(3)
+        ]
+        outputs = [worker.communicate(timeout=120)[0] for worker in workers]
+
+        assert [worker.returncode for worker in workers] == [0, 0, 0]
+        jobs = job_queue.get_jobs()
+        assert {job.status for job in jobs} == {JobStatus.done}
+        # Each job was rendered exactly once:
+        assert {job.attempt_count for job in jobs} == {1}
+        assert sum(output.count(" finished") for output in outputs) == len(jobs)
+        for index in range(len(input_files)):
+            assert (tmp_path / f"out/CV_{index}/Person_{index}_CV.html").is_file()
@@ -10,6 +10,36 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Update the updatable testdata",
     )
+    parser.addoption(
+        "--soak",
+        action="store_true",
+        default=False,
+        help="Run the long-running soak tests",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--soak"):
+        return
+    skip_soak = pytest.mark.skip(reason="Soak test, run with --soak")
+    for item in items:
+        if "soak" in item.keywords:
+            item.add_marker(skip_soak)
+
+
+@pytest.fixture(scope="session")
+def teklinicv_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    return tmp_path_factory.mktemp("teklinicv_cache")
+
+
+@pytest.fixture(autouse=True)
+def isolate_teklinicv_cache(
+    teklinicv_cache_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Keep the font index and other cached files out of the user's cache:
+    monkeypatch.setenv("TEKLINICV_CACHE_DIR", str(teklinicv_cache_dir))
 
 
 @pytest.fixture
@@ -3,11 +3,17 @@ from datetime import date as Date
 import pytest
 
 from teklinicv.renderer.templater.date import (
+    clear_date_caches,
     compute_time_span_string,
     date_object_to_string,
     format_date_range,
+    format_entry_dates,
     format_single_date,
+    get_date_locale,
+    memoized_format_date_range,
 )
+from teklinicv.schema.models.cv.entries.experience import ExperienceEntry
+from teklinicv.schema.models.cv.entries.normal import NormalEntry
 from teklinicv.schema.models.locale.english_locale import EnglishLocale
 
 
@@ -537,3 +543,61 @@ def test_compute_time_span_string(
         time_span_template=time_span_template,
     )
     assert result == expected
+
+
+def test_get_date_locale_is_hashable_and_reflects_translations():
+    date_locale = get_date_locale(EnglishLocale(present="now"))
+
+    assert hash(date_locale) == hash(get_date_locale(EnglishLocale(present="now")))
+    assert date_locale.present == "now"
+    assert date_locale != get_date_locale(EnglishLocale())
+
+
+class TestFormatEntryDates:
+    def test_formats_all_entries_of_a_section(self):
+        entries = [
+            ExperienceEntry(
+                company="A", position="B", start_date="2020-06", end_date="present"
+            ),
+            NormalEntry(name="No date"),
+            NormalEntry(name="Single date", date="2024-03"),
+            NormalEntry(name="Custom date", date="Fall 2023"),
+            "A text entry",
+        ]
+
+        result = format_entry_dates(
+            entries,
+            locale=EnglishLocale(),
+            current_date=Date(2025, 1, 1),
+            show_time_span=True,
+            single_date_template="MONTH_ABBREVIATION YEAR",
+            date_range_template="START_DATE – END_DATE",
+            time_span_template="HOW_MANY_YEARS YEARS HOW_MANY_MONTHS MONTHS",
+        )
+
+        assert result == [
+            "June 2020 – present\n\n4 years 8 months",
+            None,
+            "Mar 2024",
+            "Fall 2023",
+            None,
+        ]
+
+    def test_reuses_memoized_results_for_identical_dates(self):
+        clear_date_caches()
+        entries = [
+            NormalEntry(name=str(i), start_date="2020-01", end_date="2021-01")
+            for i in range(10)
+        ]
+
+        format_entry_dates(
+            entries,
+            locale=EnglishLocale(),
+            current_date=Date(2025, 1, 1),
+            show_time_span=False,
+            single_date_template="MONTH_ABBREVIATION YEAR",
+            date_range_template="START_DATE – END_DATE",
+            time_span_template="HOW_MANY_YEARS YEARS",
+        )
+
+        assert memoized_format_date_range.cache_info().misses == 1
@@ -6,6 +6,9 @@ import pytest
 from teklinicv.exception import TekliniCVInternalError
 from teklinicv.renderer.templater.entry_templates_from_input import (
     clean_trailing_parts,
+    compile_entry_template_plan,
+    compile_entry_template_plans,
+    fill_entry_template_plan,
     process_authors,
     process_date,
     process_doi,
@@ -14,6 +17,7 @@ from teklinicv.renderer.templater.entry_templates_from_input import (
     process_url,
     remove_not_provided_placeholders,
     render_entry_templates,
+    resolve_entry_template_plan,
 )
 from teklinicv.schema.models.cv.entries.normal import NormalEntry
 from teklinicv.schema.models.cv.entries.publication import PublicationEntry
@@ -407,6 +411,72 @@ def test_remove_not_provided_placeholders(entry_templates, entry_fields, expecte
     assert result == expected
 
 
+class TestEntryTemplatePlan:
+    def test_compiles_each_template_set_once(self):
+        entry_templates = (("main", "POSITION at COMPANY, LOCATION"),)
+
+        plan = compile_entry_template_plan(entry_templates)
+
+        assert compile_entry_template_plan(entry_templates) is plan
+        assert plan.placeholders == {"POSITION", "COMPANY", "LOCATION"}
+
+    def test_fills_slots_and_drops_missing_fields(self):
+        plan = compile_entry_template_plan(
+            (("main", "**POSITION** at COMPANY, LOCATION"), ("side", "DATE"))
+        )
+
+        result = fill_entry_template_plan(
+            plan, {"POSITION": "Engineer", "COMPANY": "Acme"}
+        )
+
+        assert result == {"main": "**Engineer** at Acme", "side": ""}
+
+    def test_does_not_substitute_inside_values(self):
+        plan = compile_entry_template_plan((("main", "NAME - LOCATION"),))
+
+        result = fill_entry_template_plan(
+            plan, {"NAME": "LOCATION Labs", "LOCATION": "NYC"}
+        )
+
+        assert result == {"main": "LOCATION Labs - NYC"}
+
+    def test_reuses_resolution_for_same_fields(self):
+        plan = compile_entry_template_plan((("main", "NAME UNIQUE_PLACEHOLDER"),))
+        resolve_entry_template_plan.cache_clear()
+
+        fill_entry_template_plan(plan, {"NAME": "First"})
+        fill_entry_template_plan(plan, {"NAME": "Second"})
+
+        assert resolve_entry_template_plan.cache_info().misses == 1
+        assert resolve_entry_template_plan.cache_info().hits == 1
+
+    def test_compiles_plans_of_every_entry_type(self):
+        templates = Templates()
+
+        plans = compile_entry_template_plans(templates)
+
+        assert plans["normal_entry"] is compile_entry_template_plan(
+            tuple(templates.normal_entry.model_dump(exclude_none=True).items())
+        )
+        assert "single_date" not in plans
+
+    def test_render_entry_templates_uses_given_plans(self):
+        plans = {
+            "normal_entry": compile_entry_template_plan((("main_column", "NAME!"),))
+        }
+
+        entry = render_entry_templates(
+            NormalEntry(name="Solo"),
+            templates=Templates(),
+            locale=EnglishLocale(),
+            show_time_span=False,
+            current_date=Date(2024, 1, 1),
+            entry_template_plans=plans,
+        )
+
+        assert entry.main_column == "Solo!"  # ty: ignore[unresolved-attribute]
+
+
 @pytest.mark.parametrize(
     ("input_text", "expected"),
     [
@@ -61,3 +61,18 @@ def test_render_footer_template(name, footer_template, expected):
     assert result.replace("context { [", "").replace("] }", "") == expected.replace(
         "TYPST_PAGE_NUMBER", "#str(here().page())"
     ).replace("TYPST_TOTAL_PAGES", "#str(counter(page).final().first())")
+
+
+def test_render_footer_template_in_chapter():
+    result = render_footer_template(
+        "PAGE_NUMBER/TOTAL_PAGES",
+        locale=EnglishLocale(),
+        current_date=Date(2024, 1, 1),
+        name="John Doe",
+        single_date_template="MONTH_ABBREVIATION YEAR",
+        chapter_label="teklinicv-chapter-2",
+    )
+    assert result == (
+        "context { [#str(counter(page).get().first())/"
+        "#str(counter(page).at(<teklinicv-chapter-2-end>).first())] }"
+    )
@@ -1,7 +1,11 @@
+import concurrent.futures
+
 import pytest
 
 from teklinicv.renderer.templater.markdown_parser import (
     escape_typst_characters,
+    get_html_markdown_converter,
+    get_typst_markdown_converter,
     markdown_to_html,
     markdown_to_typst,
 )
@@ -185,7 +189,37 @@ def test_markdown_to_typst(markdown_string, expected_typst_string):
     assert markdown_to_typst(markdown_string) == expected_typst_string
 
 
+def test_markdown_to_typst_forgets_previous_documents():
+    markdown_to_typst("[link][ref]\n\n[ref]: https://example.com")
+
+    assert markdown_to_typst("[link][ref]") == "\\[link\\]\\[ref\\]"
+
+
+def test_markdown_to_typst_uses_a_converter_per_thread():
+    converter = get_typst_markdown_converter()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        other_converter = executor.submit(get_typst_markdown_converter).result()
+
+    assert get_typst_markdown_converter() is converter
+    assert other_converter is not converter
+
+
 def test_markdown_to_html():
     assert (
         markdown_to_html("Hello, **world**!") == "<p>Hello, <strong>world</strong>!</p>"
     )
+
+
+def test_markdown_to_html_reuses_converter_per_thread():
+    converter = get_html_markdown_converter()
+    markdown_to_html("[link][ref]\n\n[ref]: https://example.com")
+
+    assert get_html_markdown_converter() is converter
+    # Reference definitions from the previous document must not leak:
+    assert markdown_to_html("[link][ref]") == "<p>[link][ref]</p>"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        other_converter = executor.submit(get_html_markdown_converter).result()
+
+    assert other_converter is not converter
@@ -1,3 +1,4 @@
+import pathlib
 from datetime import date as Date
 
 import pydantic
@@ -178,3 +179,19 @@ class TestProcessModel:
         assert result.cv.name == "Jane Doe"
         assert result.cv.headline == "Software Engineer"
         assert hasattr(result.cv, "connections")
+
+    def test_typst_output_uses_downscaled_photo(self):
+        photo_path = (
+            pathlib.Path(__file__).parent.parent / "testdata" / "profile_picture.jpg"
+        )
+        teklinicv_model = TekliniCVModel(cv=Cv(name="Jane Doe", photo=photo_path))
+        teklinicv_model.settings.render_command.photo_ppi = 50
+
+        typst_result = process_model(teklinicv_model, "typst")
+        markdown_result = process_model(teklinicv_model, "markdown")
+
+        assert typst_result.cv.photo == photo_path.with_name(
+            "profile_picture_50ppi.png"
+        )
+        assert markdown_result.cv.photo == photo_path
+        assert teklinicv_model.cv.photo == photo_path
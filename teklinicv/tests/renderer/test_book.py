@@ -0,0 +1,75 @@
+import shutil
+
+import pytest
+
+from teklinicv.renderer.book import (
+    generate_book_typst,
+    render_book_chapter,
+    render_book_table_of_contents,
+)
+from teklinicv.schema.models.cv.cv import Cv
+from teklinicv.schema.models.teklinicv_model import TekliniCVModel
+
+
+@pytest.fixture
+def teklinicv_models() -> list[TekliniCVModel]:
+    return [
+        TekliniCVModel(cv=Cv(name="John Doe")),
+        TekliniCVModel(cv=Cv(name='Jane "JD" Doe')),
+    ]
+
+
+def test_render_book_chapter(teklinicv_models):
+    chapter = render_book_chapter(teklinicv_models[0], 3)
+
+    assert chapter.startswith("#[\n")
+    assert chapter.endswith("#metadata(none) <teklinicv-chapter-3-end>\n]\n")
+    # The page counter restarts after the preamble, before the header:
+    preamble_end = chapter.index("#counter(page).update(1)")
+    assert chapter.index("#show: teklinicv.with(") < preamble_end
+    assert chapter.index("#metadata(none) <teklinicv-chapter-3>") > preamble_end
+    assert "counter(page).at(<teklinicv-chapter-3-end>)" in chapter
+    assert "here().page()" not in chapter
+
+
+def test_render_book_table_of_contents(teklinicv_models):
+    table_of_contents = render_book_table_of_contents(teklinicv_models, "Team")
+
+    assert '"Team"' in table_of_contents
+    assert 'link(<teklinicv-chapter-1>, "John Doe")' in table_of_contents
+    assert 'link(<teklinicv-chapter-2>, "Jane \\"JD\\" Doe")' in table_of_contents
+    assert "locate(<teklinicv-chapter-2>).page()" in table_of_contents
+    assert '#set text(font: "Source Sans 3")' in table_of_contents
+
+
+def test_generate_book_typst(tmp_path, teklinicv_models):
+    typst_path = generate_book_typst(teklinicv_models, tmp_path / "book" / "CVs.typ")
+
+    typst_source = typst_path.read_text(encoding="utf-8")
+    assert typst_source.count("#show: teklinicv.with(") == 2
+    assert "<teklinicv-chapter-2-end>" in typst_source
+    assert "#grid(" not in typst_source
+
+
+def test_generate_book_typst_with_table_of_contents(tmp_path, teklinicv_models):
+    typst_path = generate_book_typst(teklinicv_models, tmp_path / "CVs.typ", "Team")
+
+    typst_source = typst_path.read_text(encoding="utf-8")
+    assert typst_source.index("#grid(") < typst_source.index("#[\n")
+
+
+def test_generate_book_typst_places_photos_per_chapter(tmp_path, testdata_dir):
+    photo_path = tmp_path / "photo.jpg"
+    shutil.copy(testdata_dir.parent / "profile_picture.jpg", photo_path)
+    teklinicv_models = [
+        TekliniCVModel(cv=Cv(name="John Doe", photo=photo_path)),
+        TekliniCVModel(cv=Cv(name="Jane Doe", photo=photo_path)),
+    ]
+
+    typst_path = generate_book_typst(teklinicv_models, tmp_path / "book" / "CVs.typ")
+
+    typst_source = typst_path.read_text(encoding="utf-8")
+    for chapter_number in (1, 2):
+        assert (tmp_path / "book" / f"chapter_{chapter_number}_photo.jpg").is_file()
+        assert f"chapter_{chapter_number}_photo.jpg" in typst_source
+    assert teklinicv_models[0].cv.photo == photo_path
@@ -0,0 +1,24 @@
+import sys
+
+import pytest
+
+from teklinicv.renderer.cache_path import get_cache_path
+
+
+def test_uses_teklinicv_cache_dir_environment_variable(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEKLINICV_CACHE_DIR", str(tmp_path / "custom"))
+
+    path = get_cache_path("typst_packages")
+
+    assert path == tmp_path / "custom" / "typst_packages"
+    assert path.is_dir()
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"), reason="XDG is only used on Linux"
+)
+def test_follows_xdg_cache_home(tmp_path, monkeypatch):
+    monkeypatch.delenv("TEKLINICV_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert get_cache_path() == tmp_path / "teklinicv"
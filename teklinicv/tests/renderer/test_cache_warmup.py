@@ -0,0 +1,126 @@
+import pathlib
+import shutil
+
+import pytest
+import rendercv_fonts
+
+from teklinicv.exception import TekliniCVUserError
+from teklinicv.renderer import cache_warmup
+from teklinicv.renderer.cache_warmup import (
+    WarmedCache,
+    check_theme_folder,
+    warm_font_index,
+    warm_jinja_templates,
+    warm_python_bytecode,
+    warm_typst_package,
+)
+from teklinicv.renderer.templater.templater import get_jinja2_environment
+
+
+def get_bundled_font_folder(name: str) -> pathlib.Path:
+    return next(
+        folder for folder in rendercv_fonts.paths_to_font_folders if folder.name == name
+    )
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEKLINICV_CACHE_DIR", str(tmp_path / "cache"))
+    # The environment keeps the bytecode cache it was created with:
+    get_jinja2_environment.cache_clear()
+    yield tmp_path / "cache"
+    get_jinja2_environment.cache_clear()
+
+
+@pytest.fixture
+def theme_folder(tmp_path):
+    theme_folder = tmp_path / "project" / "mytheme"
+    (theme_folder / "entries").mkdir(parents=True)
+    (theme_folder / "Header.j2.typ").write_text("= {{ cv.name }}\n")
+    (theme_folder / "entries" / "NormalEntry.j2.typ").write_text("{{ entry.name }}\n")
+    (theme_folder / "__init__.py").write_text("x = 1\n")
+    return theme_folder
+
+
+def test_summary():
+    warmed_cache = WarmedCache("Font index", pathlib.Path(), 2, 60)
+
+    assert warmed_cache.summary == "Font index (2 built, 60 cached)"
+    warmed_cache.skipped_count = 1
+    assert warmed_cache.summary == "Font index (2 built, 60 cached, 1 skipped)"
+
+
+def test_check_theme_folder(tmp_path, theme_folder):
+    check_theme_folder(theme_folder)
+
+    with pytest.raises(TekliniCVUserError):
+        check_theme_folder(tmp_path / "missing")
+
+
+def test_warm_python_bytecode_is_idempotent(tmp_path, monkeypatch, theme_folder):
+    package_directory = tmp_path / "package"
+    package_directory.mkdir()
+    (package_directory / "module.py").write_text("y = 2\n")
+    monkeypatch.setattr(cache_warmup, "package_directory", package_directory)
+
+    first = warm_python_bytecode([theme_folder])
+    second = warm_python_bytecode([theme_folder])
+
+    assert (first.built_count, first.cached_count) == (2, 0)
+    assert (second.built_count, second.cached_count) == (0, 2)
+    assert list((theme_folder / "__pycache__").glob("__init__.*.pyc"))
+
+
+def test_warm_jinja_templates_is_idempotent(cache_path, theme_folder):
+    first = warm_jinja_templates([theme_folder])
+    second = warm_jinja_templates([theme_folder])
+
+    assert first.built_count > 2
+    assert first.cached_count == 0
+    assert (second.built_count, second.cached_count) == (0, first.built_count)
+    assert first.path == cache_path / "jinja"
+
+
+def test_warm_jinja_templates_is_used_by_new_environments():
+    warm_jinja_templates([])
+    get_jinja2_environment.cache_clear()
+
+    assert warm_jinja_templates([]).built_count == 0
+
+
+def test_warm_font_index(monkeypatch, theme_folder):
+    fonts_folder = theme_folder.parent / "fonts"
+    shutil.copytree(get_bundled_font_folder("Lato"), fonts_folder)
+    mukta_folder = get_bundled_font_folder("Mukta")
+    monkeypatch.setattr(
+        cache_warmup.rendercv_fonts, "paths_to_font_folders", [mukta_folder]
+    )
+
+    first = warm_font_index([theme_folder])
+    second = warm_font_index([theme_folder])
+
+    font_files = [
+        path
+        for folder in (fonts_folder, mukta_folder)
+        for path in folder.rglob("*")
+        if path.suffix in {".ttf", ".otf"}
+    ]
+    assert (first.built_count, first.cached_count) == (len(font_files), 0)
+    assert (second.built_count, second.cached_count) == (0, first.built_count)
+
+
+@pytest.mark.parametrize("is_available", [True, False])
+def test_warm_typst_package(monkeypatch, is_available):
+    prewarm_calls = []
+    monkeypatch.setattr(
+        cache_warmup, "is_typst_package_available", lambda: is_available
+    )
+    monkeypatch.setattr(
+        cache_warmup, "prewarm_typst_package", lambda: prewarm_calls.append(True)
+    )
+
+    warmed_cache = warm_typst_package()
+
+    assert prewarm_calls == [True]
+    assert warmed_cache.built_count == (0 if is_available else 1)
+    assert warmed_cache.cached_count == (1 if is_available else 0)
@@ -0,0 +1,142 @@
+import json
+import os
+import pathlib
+import shutil
+
+import pytest
+import rendercv_fonts
+
+import teklinicv
+from teklinicv.renderer import font_index
+from teklinicv.renderer.pdf_png import get_typst_compiler
+
+
+def get_bundled_font_folder(name: str) -> pathlib.Path:
+    return next(
+        folder for folder in rendercv_fonts.paths_to_font_folders if folder.name == name
+    )
+
+
+@pytest.fixture
+def font_folders(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEKLINICV_CACHE_DIR", str(tmp_path / "cache"))
+    folders = []
+    for name in ("Lato", "Font Awesome 7", "Mukta"):
+        folder = tmp_path / "fonts" / name
+        shutil.copytree(get_bundled_font_folder(name), folder)
+        folders.append(folder)
+    return folders
+
+
+def test_index_font_folders_finds_families(font_folders):
+    indexed = font_index.index_font_folders(font_folders)
+
+    assert [folder.path for folder in indexed] == font_folders
+    assert indexed[0].families == frozenset({"Lato"})
+    assert "Font Awesome 7 Free" in indexed[1].families
+    assert font_index.get_font_index_path().is_file()
+
+
+def test_index_font_folders_skips_missing_folders(font_folders, tmp_path):
+    indexed = font_index.index_font_folders([tmp_path / "missing", font_folders[0]])
+
+    assert [folder.path for folder in indexed] == [font_folders[0]]
+
+
+def test_index_font_folders_reuses_persistent_index(font_folders, monkeypatch):
+    first = font_index.index_font_folders(font_folders)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("fonts should not be parsed again")
+
+    monkeypatch.setattr(font_index.typst, "Fonts", fail)
+    teklinicv.clear_caches()
+
+    assert font_index.index_font_folders(font_folders) == first
+
+
+def test_index_font_folders_skips_unchanged_folders(font_folders, monkeypatch):
+    first = font_index.index_font_folders(font_folders)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("font files should not be checked again")
+
+    monkeypatch.setattr(font_index, "read_font_index", fail)
+
+    assert font_index.index_font_folders(font_folders) == first
+
+
+def test_index_font_folders_notices_added_fonts(font_folders):
+    first = font_index.index_font_folders(font_folders)
+    shutil.copytree(font_folders[2], font_folders[0] / "Mukta")
+
+    second = font_index.index_font_folders(font_folders)
+
+    assert second[0].families == frozenset({"Lato", "Mukta"})
+    assert second[1:] == first[1:]
+
+
+def test_index_font_folders_reparses_only_changed_folders(font_folders, monkeypatch):
+    first = font_index.index_font_folders(font_folders)
+    changed_file = next(font_folders[2].iterdir())
+    stat = changed_file.stat()
+    os.utime(changed_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    parsed_folders = []
+    original_fonts = font_index.typst.Fonts
+
+    def record(include_system_fonts, include_embedded_fonts, font_paths):
+        parsed_folders.extend(font_paths)
+        return original_fonts(include_system_fonts, include_embedded_fonts, font_paths)
+
+    monkeypatch.setattr(font_index.typst, "Fonts", record)
+    teklinicv.clear_caches()
+    second = font_index.index_font_folders(font_folders)
+
+    assert parsed_folders == [font_folders[2]]
+    assert second[2].families == first[2].families
+    assert second[2].signature != first[2].signature
+
+
+def test_read_font_index_discards_other_versions(font_folders):
+    font_index.index_font_folders(font_folders)
+    index_path = font_index.get_font_index_path()
+    contents = json.loads(index_path.read_text(encoding="utf-8"))
+    contents["version"] = [0, "0.0.0"]
+    index_path.write_text(json.dumps(contents), encoding="utf-8")
+
+    assert font_index.read_font_index() == {}
+
+
+@pytest.mark.parametrize(
+    ("typst_source", "expected_folders"),
+    [
+        ('#set text(font: "Lato")', ["Lato", "Font Awesome 7"]),
+        ('#set text(font: "Mukta")', ["Font Awesome 7", "Mukta"]),
+        ('#set text(font: "lato")', ["Lato", "Font Awesome 7"]),
+        ("#set text(font: Lato)", ["Font Awesome 7"]),
+    ],
+)
+def test_select_font_folders(font_folders, typst_source, expected_folders):
+    indexed = font_index.index_font_folders(font_folders)
+
+    selected = font_index.select_font_folders(indexed, typst_source)
+
+    assert [folder.path.name for folder in selected] == expected_folders
+
+
+def test_get_typst_compiler_reuses_compiler_until_fonts_change(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEKLINICV_CACHE_DIR", str(tmp_path / "cache"))
+    typst_path = tmp_path / "cv.typ"
+    typst_path.write_text('#set text(font: "Lato")\nHello', encoding="utf-8")
+
+    compiler = get_typst_compiler(typst_path, None)
+
+    assert get_typst_compiler(typst_path, None) is compiler
+    pdf = compiler.compile(format="pdf")
+    assert isinstance(pdf, bytes)
+    assert pdf.startswith(b"%PDF")
+
+    typst_path.write_text('#set text(font: "Mukta")\nHello', encoding="utf-8")
+
+    assert get_typst_compiler(typst_path, None) is not compiler
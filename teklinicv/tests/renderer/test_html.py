@@ -1,7 +1,7 @@
 import pytest
 
 from teklinicv.renderer.html import generate_html
-from teklinicv.renderer.markdown import generate_markdown
+from teklinicv.renderer.markdown import generate_markdown, render_markdown
 from teklinicv.schema.models.teklinicv_model import TekliniCVModel
 
 
@@ -28,3 +28,21 @@ def test_generate_html(
 
     reference_filename = f"{cv_variant}.html"
     assert compare_file_with_reference(generate_file, reference_filename)
+
+
+def test_generate_html_from_in_memory_markdown(
+    compare_file_with_reference, minimal_teklinicv_model
+):
+    model = TekliniCVModel(
+        cv=minimal_teklinicv_model.cv,
+        locale=minimal_teklinicv_model.locale,
+        settings=minimal_teklinicv_model.settings,
+    )
+
+    def generate_file(output_path):
+        model.settings.render_command.html_path = output_path
+        markdown_contents = render_markdown(model)
+        # The Markdown file is never written, so it must not be read either:
+        generate_html(model, output_path.with_suffix(".md"), markdown_contents)
+
+    assert compare_file_with_reference(generate_file, "minimal.html")
@@ -0,0 +1,82 @@
+import pytest
+
+from teklinicv.renderer.output_file import (
+    record_unchanged_output_files,
+    write_output_file,
+)
+
+
+def test_write_output_file_writes_new_file(tmp_path):
+    output_file = tmp_path / "cv.typ"
+
+    assert write_output_file(output_file, "Hello")
+    assert output_file.read_text(encoding="utf-8") == "Hello"
+
+
+def test_write_output_file_skips_identical_contents(tmp_path):
+    output_file = tmp_path / "cv.pdf"
+    write_output_file(output_file, b"%PDF")
+    modification_time = output_file.stat().st_mtime_ns
+
+    with record_unchanged_output_files() as unchanged_files:
+        assert not write_output_file(output_file, b"%PDF")
+
+    assert output_file.stat().st_mtime_ns == modification_time
+    assert unchanged_files == [output_file]
+
+
+@pytest.mark.parametrize("new_contents", ["Hello, world", "Hallo"])
+def test_write_output_file_replaces_changed_contents(tmp_path, new_contents):
+    output_file = tmp_path / "cv.md"
+    write_output_file(output_file, "Hello")
+
+    with record_unchanged_output_files() as unchanged_files:
+        assert write_output_file(output_file, new_contents)
+
+    assert output_file.read_text(encoding="utf-8") == new_contents
+    assert unchanged_files == []
+
+
+def test_write_output_file_keeps_permissions(tmp_path):
+    output_file = tmp_path / "cv.html"
+    output_file.write_text("old", encoding="utf-8")
+    output_file.chmod(0o640)
+
+    write_output_file(output_file, "new")
+
+    assert output_file.stat().st_mode & 0o777 == 0o640
+
+
+def test_write_output_file_leaves_no_temporary_files(tmp_path):
+    output_file = tmp_path / "cv.png"
+    write_output_file(output_file, b"one")
+    write_output_file(output_file, b"two")
+
+    assert list(tmp_path.iterdir()) == [output_file]
+
+
+def test_write_output_file_removes_temporary_file_on_error(tmp_path, monkeypatch):
+    output_file = tmp_path / "cv.png"
+
+    def fail(*args, **kwargs):
+        raise OSError
+
+    monkeypatch.setattr(type(output_file), "replace", fail)
+
+    with pytest.raises(OSError):  # NOQA: PT011
+        write_output_file(output_file, b"contents")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_record_unchanged_output_files_is_scoped(tmp_path):
+    output_file = tmp_path / "cv.typ"
+    write_output_file(output_file, "Hello")
+
+    with record_unchanged_output_files() as outer:
+        with record_unchanged_output_files() as inner:
+            write_output_file(output_file, "Hello")
+        write_output_file(output_file, "Hello")
+
+    assert inner == [output_file]
+    assert outer == [output_file]
@@ -0,0 +1,135 @@
+import pytest
+
+from teklinicv.exception import TekliniCVUserError
+from teklinicv.renderer import page_fit
+from teklinicv.renderer.page_fit import (
+    FitParameter,
+    fit_design_to_pages,
+    scale_typst_dimension,
+    shrink_design,
+    write_design_overlay,
+)
+from teklinicv.schema.models.teklinicv_model import TekliniCVModel
+from teklinicv.schema.yaml_reader import read_yaml
+
+
+@pytest.mark.parametrize(
+    ("dimension", "ratio", "expected"),
+    [
+        ("10pt", 0.95, "9.5pt"),
+        ("0.7in", 0.5, "0.35in"),
+        ("0.6em", 1, "0.6em"),
+        ("-1cm", 0.5, "-0.5cm"),
+        ("2mm", 1 / 3, "0.67mm"),
+    ],
+)
+def test_scale_typst_dimension(dimension, ratio, expected):
+    assert scale_typst_dimension(dimension, ratio) == expected
+
+
+class TestShrinkDesign:
+    def test_leaves_the_design_at_level_zero(self, minimal_teklinicv_model):
+        model, changed_values = shrink_design(
+            minimal_teklinicv_model, tuple(FitParameter), 0
+        )
+
+        assert changed_values == {}
+        assert model.design == minimal_teklinicv_model.design
+
+    def test_shrinks_to_the_minimum_ratios(self, minimal_teklinicv_model):
+        model, changed_values = shrink_design(
+            minimal_teklinicv_model, tuple(FitParameter), 1
+        )
+
+        design = model.design
+        assert design.typography.font_size.body == "8pt"
+        assert design.typography.line_spacing == "0.3em"
+        assert design.page.top_margin == "0.35in"
+        assert changed_values[FitParameter.margins] == ["0.35in"] * 4
+        # The original model is left as it was:
+        assert minimal_teklinicv_model.design.typography.font_size.body == "10pt"
+        assert model._input_file_path == minimal_teklinicv_model._input_file_path
+
+    def test_only_shrinks_the_given_parameters(self, minimal_teklinicv_model):
+        model, changed_values = shrink_design(
+            minimal_teklinicv_model, (FitParameter.margins,), 1
+        )
+
+        assert list(changed_values) == [FitParameter.margins]
+        assert model.design.typography.font_size.body == "10pt"
+
+
+class TestFitDesignToPages:
+    @pytest.fixture
+    def typst_path(self, tmp_path):
+        typst_path = tmp_path / "cv.typ"
+        typst_path.write_text("original", encoding="utf-8")
+        return typst_path
+
+    @pytest.fixture
+    def compiled_sources(self, monkeypatch) -> list[str]:
+        """Lay out a CV that fits on one page at a body font size of 9.3pt or less."""
+        compiled_sources = []
+
+        def render_full_template(model, file_type):  # NOQA: ARG001
+            return model.design.typography.font_size.body
+
+        def count_typst_pages(typst_path, input_file_path, typst_source):  # NOQA: ARG001
+            compiled_sources.append(typst_source)
+            return 2 if float(typst_source.removesuffix("pt")) > 9.3 else 1
+
+        monkeypatch.setattr(page_fit, "render_full_template", render_full_template)
+        monkeypatch.setattr(page_fit, "count_typst_pages", count_typst_pages)
+        return compiled_sources
+
+    def test_stops_at_the_least_aggressive_fit(
+        self, minimal_teklinicv_model, typst_path, compiled_sources
+    ):
+        result = fit_design_to_pages(
+            minimal_teklinicv_model, typst_path, 1, ["font_size"]
+        )
+
+        # 10pt shrinks by 0.125pt per step, and step 6 is the first at most 9.3pt:
+        assert result.teklinicv_model.design.typography.font_size.body == "9.25pt"
+        assert result.page_count == 1
+        assert result.summary == "font size 9.25pt"
+        assert result.compilation_count == len(compiled_sources) <= 6
+        assert typst_path.read_text(encoding="utf-8") == "9.25pt"
+
+    def test_keeps_a_design_that_already_fits(
+        self, minimal_teklinicv_model, typst_path, compiled_sources
+    ):
+        result = fit_design_to_pages(minimal_teklinicv_model, typst_path, 2)
+
+        assert result.teklinicv_model is minimal_teklinicv_model
+        assert result.summary == "design unchanged"
+        assert compiled_sources == ["10pt"]
+        assert typst_path.read_text(encoding="utf-8") == "original"
+
+    def test_raises_if_nothing_fits(
+        self, minimal_teklinicv_model, typst_path, compiled_sources
+    ):
+        with pytest.raises(TekliniCVUserError) as exception_info:
+            fit_design_to_pages(minimal_teklinicv_model, typst_path, 1, ["margins"])
+
+        assert exception_info.value.message == (
+            "The CV doesn't fit on 1 page even with the smallest margins (it has 2"
+            " pages). Shorten the content or allow more pages."
+        )
+        assert len(compiled_sources) == 2
+
+
+def test_write_design_overlay(tmp_path, minimal_teklinicv_model):
+    model, _ = shrink_design(minimal_teklinicv_model, (FitParameter.font_size,), 1)
+    design_path = tmp_path / "fitted_design.yaml"
+
+    write_design_overlay(model, design_path)
+
+    design = read_yaml(design_path)["design"]
+    assert design == {"theme": "classic", "typography": {"font_size": {"body": "8pt"}}}
+    assert (
+        TekliniCVModel.model_validate(
+            {"cv": {"name": "John Doe"}, "design": design}
+        ).design
+        == model.design
+    )
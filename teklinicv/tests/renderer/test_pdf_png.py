@@ -1,7 +1,24 @@
+import concurrent.futures
+import shutil
+from datetime import UTC
+from datetime import datetime as DateTime
+
 import pytest
 
-from teklinicv.renderer.pdf_png import generate_pdf, generate_png
+from teklinicv.renderer.output_file import record_unchanged_output_files
+from teklinicv.renderer.pdf_png import (
+    compile_typst,
+    copy_photo_next_to_typst_file,
+    count_typst_pages,
+    generate_pdf,
+    generate_png,
+    generate_png_pages,
+    generate_preview_png,
+    get_downscaled_photo,
+)
+from teklinicv.renderer.photo import get_file_digest, get_image_size
 from teklinicv.renderer.typst import generate_typst
+from teklinicv.schema.models.cv.cv import Cv
 from teklinicv.schema.models.design.built_in_design import available_themes
 from teklinicv.schema.models.teklinicv_model import TekliniCVModel
 
@@ -58,3 +75,177 @@ def test_generate_png(
     reference_filename = f"{theme}_minimal.png"
 
     assert compare_file_with_reference(generate_file, reference_filename)
+
+
+@pytest.mark.parametrize(
+    ("png_pages", "expected_page_numbers"),
+    [
+        (None, [1, 2, 3]),
+        ("1", [1]),
+        ("2-", [2, 3]),
+        ("3,1,9", [1, 3]),
+    ],
+)
+def test_generate_png_pages_selects_pages(
+    tmp_path, minimal_teklinicv_model, png_pages, expected_page_numbers
+):
+    typst_path = tmp_path / "pages.typ"
+    typst_path.write_text("One\n#pagebreak()\nTwo\n#pagebreak()\nThree")
+    minimal_teklinicv_model.settings.render_command.png_pages = png_pages
+
+    pages = list(generate_png_pages(minimal_teklinicv_model, typst_path))
+
+    assert [page_number for page_number, _ in pages] == expected_page_numbers
+    assert all(png_bytes.startswith(b"\x89PNG") for _, png_bytes in pages)
+
+
+def test_count_typst_pages(tmp_path, minimal_teklinicv_model):
+    typst_path = tmp_path / "pages.typ"
+    typst_path.write_text("One")
+
+    assert count_typst_pages(typst_path, None, "One\n#pagebreak()\nTwo") == 2
+    assert count_typst_pages(typst_path, None, "One") == 1
+    # Later compilations still compile the file rather than the last source:
+    pages = list(generate_png_pages(minimal_teklinicv_model, typst_path))
+    assert len(pages) == 1
+
+
+def test_generate_png_uses_ppi(tmp_path, minimal_teklinicv_model):
+    typst_path = tmp_path / "page.typ"
+    typst_path.write_text("Thumbnail")
+    render_command = minimal_teklinicv_model.settings.render_command
+
+    render_command.png_ppi = 10
+    [(_, small_png)] = generate_png_pages(minimal_teklinicv_model, typst_path)
+    render_command.png_ppi = 100
+    [(_, large_png)] = generate_png_pages(minimal_teklinicv_model, typst_path)
+
+    assert len(small_png) < len(large_png)
+
+
+def test_generate_preview_png_writes_separate_files(tmp_path, minimal_teklinicv_model):
+    typst_path = tmp_path / "pages.typ"
+    typst_path.write_text("One\n#pagebreak()\nTwo\n#pagebreak()\nThree")
+    minimal_teklinicv_model.settings.render_command.png_path = tmp_path / "cv.png"
+
+    preview_files = generate_preview_png(
+        minimal_teklinicv_model, typst_path, page_count=2, ppi=20
+    )
+
+    assert preview_files == [
+        tmp_path / "cv_preview_1.png",
+        tmp_path / "cv_preview_2.png",
+    ]
+    assert not (tmp_path / "cv_1.png").exists()
+
+
+@pytest.fixture
+def photo_teklinicv_model(tmp_path, testdata_dir, monkeypatch) -> TekliniCVModel:
+    monkeypatch.setenv("TEKLINICV_CACHE_DIR", str(tmp_path / "cache"))
+    photo_path = tmp_path / "photo.jpg"
+    shutil.copy(testdata_dir.parent / "profile_picture.jpg", photo_path)
+    (tmp_path / "output").mkdir()
+    return TekliniCVModel(cv=Cv(name="John Doe", photo=photo_path))
+
+
+def test_copy_photo_next_to_typst_file_places_photo_once(
+    tmp_path, photo_teklinicv_model
+):
+    typst_path = tmp_path / "output" / "cv.typ"
+
+    copy_photo_next_to_typst_file(photo_teklinicv_model, typst_path)
+    placed_photo = tmp_path / "output" / "photo.jpg"
+    modification_time = placed_photo.stat().st_mtime_ns
+    copy_photo_next_to_typst_file(photo_teklinicv_model, typst_path)
+
+    assert placed_photo.read_bytes() == (tmp_path / "photo.jpg").read_bytes()
+    assert placed_photo.stat().st_mtime_ns == modification_time
+
+
+def test_copy_photo_next_to_typst_file_places_downscaled_photo(
+    tmp_path, photo_teklinicv_model
+):
+    photo_teklinicv_model.settings.render_command.photo_ppi = 50
+    typst_path = tmp_path / "output" / "cv.typ"
+
+    copy_photo_next_to_typst_file(photo_teklinicv_model, typst_path)
+
+    downscaled_photo = tmp_path / "output" / "photo_50ppi.png"
+    assert not (tmp_path / "output" / "photo.jpg").exists()
+    assert get_image_size(downscaled_photo) == (69, 69)
+    assert [path.name for path in (tmp_path / "cache" / "photos").iterdir()] == [
+        f"{get_file_digest(tmp_path / 'photo.jpg')}_3.5cm_50ppi.png"
+    ]
+
+
+def test_get_downscaled_photo_reuses_cache(tmp_path, photo_teklinicv_model):
+    photo_path = photo_teklinicv_model.cv.photo
+    assert photo_path is not None
+
+    downscaled_photo = get_downscaled_photo(photo_path, "2cm", 50)
+    modification_time = downscaled_photo.stat().st_mtime_ns
+
+    assert get_downscaled_photo(photo_path, "2cm", 50) == downscaled_photo
+    assert downscaled_photo.stat().st_mtime_ns == modification_time
+    assert get_downscaled_photo(photo_path, "2cm", 100) != downscaled_photo
+    assert downscaled_photo.parent == tmp_path / "cache" / "photos"
+
+
+def test_generate_pdf_skips_unchanged_pdf(tmp_path, minimal_teklinicv_model):
+    typst_path = tmp_path / "cv.typ"
+    typst_path.write_text("Hello")
+    minimal_teklinicv_model.settings.render_command.pdf_path = tmp_path / "cv.pdf"
+
+    pdf_path = generate_pdf(minimal_teklinicv_model, typst_path)
+    assert pdf_path is not None
+    modification_time = pdf_path.stat().st_mtime_ns
+    with record_unchanged_output_files() as unchanged_files:
+        generate_pdf(minimal_teklinicv_model, typst_path)
+
+    assert unchanged_files == [pdf_path]
+    assert pdf_path.stat().st_mtime_ns == modification_time
+
+
+def test_compile_typst_from_several_threads(tmp_path):
+    typst_path = tmp_path / "cv.typ"
+    typst_path.write_text("Hello\n" * 1000)
+
+    def compile_pdf(_) -> bytes:
+        # PDFs store their creation time, so it's fixed to compare them:
+        _, pdf_bytes = compile_typst(
+            typst_path, None, "pdf", timestamp=DateTime(2025, 1, 1, tzinfo=UTC)
+        )
+        return b"".join(pdf_bytes)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        pdfs = list(executor.map(compile_pdf, range(32)))
+
+    assert len(set(pdfs)) == 1
+
+
+def test_generate_pdf_from_several_threads_keeps_photos_apart(tmp_path, testdata_dir):
+    """Renders into one folder place photos with the same name at the same path."""
+    output_folder = tmp_path / "output"
+    output_folder.mkdir()
+    photo_bytes = (testdata_dir.parent / "profile_picture.jpg").read_bytes()
+
+    def render(index: int) -> tuple[bytes, bytes]:
+        photo_path = tmp_path / f"person_{index}" / "photo.jpg"
+        photo_path.parent.mkdir()
+        # Bytes after the end of a JPEG don't change the image, only the file:
+        photo_path.write_bytes(photo_bytes + f"person {index}".encode())
+        model = TekliniCVModel(cv=Cv(name=f"Person {index}", photo=photo_path))
+        model.settings.render_command.pdf_path = output_folder / f"cv_{index}.pdf"
+        typst_path = output_folder / f"cv_{index}.typ"
+        typst_path.write_text('#image("photo.jpg")')
+
+        pdf_path = generate_pdf(model, typst_path)
+
+        assert pdf_path is not None
+        return photo_path.read_bytes(), pdf_path.read_bytes()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        renders = list(executor.map(render, range(16)))
+
+    for photo, pdf in renders:
+        assert photo in pdf
@@ -0,0 +1,124 @@
+import hashlib
+import pathlib
+import shutil
+import struct
+
+import pytest
+
+from teklinicv.renderer import photo
+from teklinicv.schema.models.cv.cv import Cv
+from teklinicv.schema.models.teklinicv_model import TekliniCVModel
+
+
+@pytest.fixture
+def photo_path(tmp_path, testdata_dir) -> pathlib.Path:
+    path = tmp_path / "photo.jpg"
+    shutil.copy(testdata_dir.parent / "profile_picture.jpg", path)
+    return path
+
+
+def test_get_file_digest(photo_path):
+    assert (
+        photo.get_file_digest(photo_path)
+        == hashlib.sha256(photo_path.read_bytes()).hexdigest()
+    )
+
+
+def test_get_file_digest_notices_changes(photo_path):
+    digest = photo.get_file_digest(photo_path)
+    photo_path.write_bytes(b"changed")
+
+    assert photo.get_file_digest(photo_path) != digest
+
+
+def test_place_file_copies_and_skips_identical_files(tmp_path, photo_path):
+    destination = tmp_path / "output" / "photo.jpg"
+    destination.parent.mkdir()
+
+    assert photo.place_file(photo_path, destination)
+    assert not destination.samefile(photo_path)
+    assert destination.read_bytes() == photo_path.read_bytes()
+    assert not photo.place_file(photo_path, destination)
+
+
+def test_place_file_skips_identical_copies(tmp_path, photo_path):
+    destination = tmp_path / "copy.jpg"
+    shutil.copy(photo_path, destination)
+    modification_time = destination.stat().st_mtime_ns
+
+    assert not photo.place_file(photo_path, destination)
+    assert destination.stat().st_mtime_ns == modification_time
+
+
+def test_place_file_replaces_changed_files(tmp_path, photo_path):
+    destination = tmp_path / "copy.jpg"
+    destination.write_bytes(b"old photo")
+
+    assert photo.place_file(photo_path, destination)
+    assert destination.read_bytes() == photo_path.read_bytes()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "copy.jpg",
+        "photo.jpg",
+    ]
+
+
+def test_place_file_keeps_the_old_file_if_placing_fails(
+    tmp_path, photo_path, monkeypatch
+):
+    def fail(*args, **kwargs):
+        raise OSError
+
+    monkeypatch.setattr(shutil, "copyfile", fail)
+    destination = tmp_path / "copy.jpg"
+    destination.write_bytes(b"old photo")
+
+    with pytest.raises(OSError):  # NOQA: PT011
+        photo.place_file(photo_path, destination)
+
+    assert destination.read_bytes() == b"old photo"
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_get_image_size(photo_path, testdata_dir):
+    png_path = testdata_dir.parent / "test_pdf_png" / "classic_minimal_1.png"
+
+    assert photo.get_image_size(photo_path) == (300, 300)
+    assert photo.get_image_size(png_path) == (1224, 1584)
+
+
+def test_get_image_size_returns_none_for_other_formats(tmp_path):
+    svg_path = tmp_path / "photo.svg"
+    svg_path.write_text("<svg></svg>")
+
+    assert photo.get_image_size(svg_path) is None
+
+
+@pytest.mark.parametrize(
+    ("photo_ppi", "photo_width", "expected_name"),
+    [
+        (None, "3.5cm", None),
+        (50, "3.5cm", "photo_50ppi.png"),
+        (50.5, "1in", "photo_50.5ppi.png"),
+        (300, "3.5cm", None),
+        (50, "10em", None),
+    ],
+)
+def test_get_downscaled_photo_name(photo_path, photo_ppi, photo_width, expected_name):
+    teklinicv_model = TekliniCVModel(cv=Cv(name="John Doe", photo=photo_path))
+    teklinicv_model.settings.render_command.photo_ppi = photo_ppi
+    teklinicv_model.design.header.photo_width = photo_width
+
+    assert photo.get_downscaled_photo_name(teklinicv_model) == expected_name
+
+
+def test_get_downscaled_photo_name_compares_widths(tmp_path):
+    # A tall PNG that is narrow enough for its printed width:
+    photo_path = tmp_path / "photo.png"
+    photo_path.write_bytes(
+        b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + struct.pack(">II", 100, 1000)
+    )
+    teklinicv_model = TekliniCVModel(cv=Cv(name="John Doe", photo=photo_path))
+    teklinicv_model.settings.render_command.photo_ppi = 300
+    teklinicv_model.design.header.photo_width = "1in"
+
+    assert photo.get_downscaled_photo_name(teklinicv_model) is None
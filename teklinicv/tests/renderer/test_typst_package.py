@@ -0,0 +1,140 @@
+import pathlib
+
+import pytest
+import typst
+
+from teklinicv.exception import TekliniCVUserError
+from teklinicv.renderer import typst_package
+
+
+def create_fake_typst_package(packages_path: pathlib.Path) -> pathlib.Path:
+    package_directory = typst_package.get_typst_package_directory(packages_path)
+    package_directory.mkdir(parents=True)
+    (package_directory / "typst.toml").write_text(
+        "[package]\n"
+        f'name = "{typst_package.typst_package_name}"\n'
+        f'version = "{typst_package.typst_package_version}"\n'
+        'entrypoint = "lib.typ"\n'
+        'authors = ["TekliniCV"]\n'
+        'license = "MIT"\n'
+        'description = "Test package"\n',
+        encoding="utf-8",
+    )
+    (package_directory / "lib.typ").write_text(
+        "#let hello = [Hello]\n", encoding="utf-8"
+    )
+    return package_directory
+
+
+@pytest.fixture
+def package_paths(tmp_path, monkeypatch):
+    bundled_path = tmp_path / "bundled"
+    bundled_path.mkdir()
+    monkeypatch.setattr(typst_package, "bundled_typst_packages_path", bundled_path)
+    monkeypatch.setenv("TEKLINICV_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg_cache"))
+    monkeypatch.setattr(typst_package.sys, "platform", "linux")
+    return bundled_path, typst_package.get_typst_package_cache_path()
+
+
+def test_preamble_imports_the_bundled_package():
+    assert typst_package.__file__ is not None
+    preamble = (
+        pathlib.Path(typst_package.__file__).parent
+        / "templater"
+        / "templates"
+        / "typst"
+        / "Preamble.j2.typ"
+    )
+
+    assert f'#import "{typst_package.typst_package_import}"' in preamble.read_text(
+        encoding="utf-8"
+    )
+
+
+class TestIsTypstPackageAvailable:
+    @pytest.mark.usefixtures("package_paths")
+    def test_returns_false_for_cold_cache(self):
+        assert not typst_package.is_typst_package_available()
+
+    @pytest.mark.parametrize("location", [0, 1])
+    def test_finds_bundled_or_cached_package(self, package_paths, location):
+        create_fake_typst_package(package_paths[location])
+
+        assert typst_package.is_typst_package_available()
+
+
+class TestGetTypstPackageCachePath:
+    @pytest.mark.usefixtures("package_paths")
+    def test_defaults_to_teklinicv_cache(self, tmp_path):
+        assert (
+            typst_package.get_typst_package_cache_path()
+            == tmp_path / "cache" / "typst_packages"
+        )
+
+    @pytest.mark.usefixtures("package_paths")
+    def test_falls_back_to_typst_default_cache(self, tmp_path):
+        default_cache_path = tmp_path / "xdg_cache" / "typst" / "packages"
+        create_fake_typst_package(default_cache_path)
+
+        assert typst_package.get_typst_default_package_cache_path() == (
+            default_cache_path
+        )
+        assert typst_package.get_typst_package_cache_path() == default_cache_path
+        assert typst_package.is_typst_package_available()
+
+    def test_prefers_teklinicv_cache(self, package_paths, tmp_path):
+        _, cache_path = package_paths
+        create_fake_typst_package(cache_path)
+        create_fake_typst_package(tmp_path / "xdg_cache" / "typst" / "packages")
+
+        assert typst_package.get_typst_package_cache_path() == cache_path
+
+
+class TestPrewarmTypstPackage:
+    def test_prefers_bundled_package(self, package_paths):
+        bundled_path, _ = package_paths
+        package_directory = create_fake_typst_package(bundled_path)
+
+        assert typst_package.prewarm_typst_package() == package_directory
+
+    def test_copies_cached_package_to_destination(self, package_paths, tmp_path):
+        _, cache_path = package_paths
+        create_fake_typst_package(cache_path)
+
+        package_directory = typst_package.prewarm_typst_package(tmp_path / "dist")
+
+        assert (package_directory / "lib.typ").is_file()
+        assert package_directory.is_relative_to(tmp_path / "dist")
+
+    @pytest.mark.usefixtures("package_paths")
+    def test_raises_user_error_when_download_fails(self, monkeypatch):
+        class FailingCompiler:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def compile(self, **kwargs):
+                raise typst.TypstError("failed to download package", "")
+
+        monkeypatch.setattr(typst_package.typst, "Compiler", FailingCompiler)
+
+        with pytest.raises(TekliniCVUserError, match="couldn't be downloaded"):
+            typst_package.prewarm_typst_package()
+
+
+def test_compiler_uses_local_package_without_network(package_paths, tmp_path):
+    bundled_path, _ = package_paths
+    create_fake_typst_package(bundled_path)
+    main_file = tmp_path / "main.typ"
+    main_file.write_text(
+        f'#import "{typst_package.typst_package_import}": *\n#hello',
+        encoding="utf-8",
+    )
+
+    compiler = typst.Compiler(
+        main_file,
+        package_path=bundled_path,
+        package_cache_path=tmp_path / "empty_cache",
+    )
+
+    assert compiler.compile(format="pdf")
@@ -0,0 +1,165 @@
+import concurrent.futures
+import contextvars
+import pathlib
+import sys
+
+import pytest
+import typst
+
+from teklinicv.exception import TekliniCVUserError
+from teklinicv.renderer import typst_worker_pool
+from teklinicv.renderer.pdf_png import generate_pdf, generate_png_pages
+from teklinicv.renderer.typst_worker_pool import (
+    TypstCompileJob,
+    TypstWorkerPool,
+    get_active_typst_worker_pool,
+)
+
+
+@pytest.fixture
+def typst_path(tmp_path) -> pathlib.Path:
+    path = tmp_path / "pages.typ"
+    path.write_text("One\n#pagebreak()\nTwo\n#pagebreak()\nThree", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def slow_typst_path(tmp_path) -> pathlib.Path:
+    path = tmp_path / "slow.typ"
+    path.write_text(
+        "#let x = 0\n"
+        "#for i in range(2000) { for j in range(2000) { for k in range(2000) {"
+        " x += 1 } } }",
+        encoding="utf-8",
+    )
+    return path
+
+
+def get_idle_worker_pids(pool: TypstWorkerPool) -> list[int | None]:
+    return [worker.process.pid for worker in pool.idle_workers.queue if worker]
+
+
+def test_pool_is_active_inside_block():
+    assert get_active_typst_worker_pool() is None
+
+    with TypstWorkerPool() as pool:
+        assert get_active_typst_worker_pool() is pool
+
+    assert get_active_typst_worker_pool() is None
+
+
+def test_pool_is_active_in_copied_contexts_only():
+    with (
+        TypstWorkerPool() as pool,
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor,
+    ):
+        assert executor.submit(get_active_typst_worker_pool).result() is None
+        context = contextvars.copy_context()
+        assert (
+            executor.submit(lambda: context.run(get_active_typst_worker_pool)).result()
+            is pool
+        )
+
+
+def test_start_worker_stops_after_timeout(monkeypatch):
+    monkeypatch.setattr(typst_worker_pool, "worker_start_timeout", 0.001)
+
+    with pytest.raises(TekliniCVUserError) as exc_info:
+        TypstWorkerPool().start_worker()
+
+    assert exc_info.value.message is not None
+    assert "didn't start" in exc_info.value.message
+
+
+def test_compile_streams_pages(typst_path):
+    with TypstWorkerPool() as pool:
+        page_count, pages = pool.compile(
+            TypstCompileJob(typst_path, None, "png", ppi=20)
+        )
+        assert page_count == 3
+        assert all(page.startswith(b"\x89PNG") for page in pages)
+
+        page_count, pages = pool.compile(TypstCompileJob(typst_path, None, "pdf"))
+        assert page_count == 1
+        assert next(pages).startswith(b"%PDF")
+        assert next(pages, None) is None
+
+
+def test_generate_functions_compile_in_pool(
+    tmp_path, typst_path, minimal_teklinicv_model
+):
+    minimal_teklinicv_model.settings.render_command.pdf_path = tmp_path / "cv.pdf"
+    in_process_pdf = generate_pdf(minimal_teklinicv_model, typst_path)
+    assert in_process_pdf is not None
+    in_process_pdf_bytes = in_process_pdf.read_bytes()
+    in_process_pdf.unlink()
+
+    with TypstWorkerPool():
+        pdf_path = generate_pdf(minimal_teklinicv_model, typst_path)
+        pages = list(
+            generate_png_pages(minimal_teklinicv_model, typst_path, png_pages="2-")
+        )
+
+    assert pdf_path is not None
+    assert pdf_path.read_bytes() == in_process_pdf_bytes
+    assert [page_number for page_number, _ in pages] == [2, 3]
+
+
+def test_compile_raises_typst_errors(tmp_path):
+    broken_typst_path = tmp_path / "broken.typ"
+    broken_typst_path.write_text("#let x = ", encoding="utf-8")
+
+    with TypstWorkerPool() as pool:
+        with pytest.raises(typst.TypstError) as exc_info:
+            pool.compile(TypstCompileJob(broken_typst_path, None, "pdf"))
+        worker_pids = get_idle_worker_pids(pool)
+
+    assert exc_info.value.message == "expected expression"
+    assert "broken.typ" in exc_info.value.diagnostic
+    assert len(worker_pids) == 1
+
+
+def test_compile_stops_jobs_after_timeout(slow_typst_path, typst_path):
+    with TypstWorkerPool(timeout=0.5) as pool:
+        with pytest.raises(TekliniCVUserError) as exc_info:
+            pool.compile(TypstCompileJob(slow_typst_path, None, "pdf"))
+
+        assert get_idle_worker_pids(pool) == []
+        page_count, _ = pool.compile(TypstCompileJob(typst_path, None, "pdf"))
+
+    assert "0.5 seconds" in str(exc_info.value.message)
+    assert page_count == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="No memory limits on Windows")
+def test_compile_stops_jobs_exceeding_memory_limit(typst_path):
+    with (
+        TypstWorkerPool(memory_limit=64 * 1024**2) as pool,
+        pytest.raises(TekliniCVUserError) as exc_info,
+    ):
+        pool.compile(TypstCompileJob(typst_path, None, "pdf"))
+
+    assert "ran out of memory" in str(exc_info.value.message)
+
+
+def test_workers_are_recycled(typst_path):
+    with TypstWorkerPool(max_jobs_per_worker=2) as pool:
+        worker_pids = []
+        for _ in range(3):
+            _, pages = pool.compile(TypstCompileJob(typst_path, None, "pdf"))
+            list(pages)
+            worker_pids.append(get_idle_worker_pids(pool))
+
+    first_worker, recycled_worker, second_worker = worker_pids
+    assert len(first_worker) == len(second_worker) == 1
+    assert recycled_worker == []
+    assert first_worker != second_worker
+
+
+def test_abandoned_pages_replace_worker(typst_path):
+    with TypstWorkerPool() as pool:
+        _, pages = pool.compile(TypstCompileJob(typst_path, None, "png", ppi=20))
+        next(pages)
+        pages.close()
+
+        assert get_idle_worker_pids(pool) == []
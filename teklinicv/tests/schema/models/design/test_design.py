@@ -107,6 +107,40 @@ class MythemeTheme(BaseModel):
         assert design.theme == "mytheme"
         assert design.custom_option == "test_value"
 
+    def test_reuses_custom_theme_module_until_it_changes(
+        self, design_adapter, tmp_path
+    ):
+        custom_theme_path = tmp_path / "mytheme"
+        custom_theme_path.mkdir()
+        (custom_theme_path / "EducationEntry.j2.typ").touch()
+        init_file = custom_theme_path / "__init__.py"
+        init_file.write_text(
+            "import pydantic\n\nclass MythemeTheme(pydantic.BaseModel):\n"
+            "    theme: str\n",
+            encoding="utf-8",
+        )
+
+        def validate():
+            return design_adapter.validate_python(
+                {"theme": "mytheme"},
+                context={
+                    "context": ValidationContext(
+                        input_file_path=tmp_path / "input.yaml"
+                    )
+                },
+            )
+
+        first_design, second_design = validate(), validate()
+        init_file.write_text(
+            init_file.read_text(encoding="utf-8") + "    option: int = 1\n",
+            encoding="utf-8",
+        )
+        edited_design = validate()
+
+        assert type(first_design) is type(second_design)
+        assert type(edited_design) is not type(first_design)
+        assert edited_design.option == 1
+
     def test_rejects_custom_theme_with_missing_model_class(
         self, design_adapter, tmp_path
     ):
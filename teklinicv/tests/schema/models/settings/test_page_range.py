@@ -0,0 +1,45 @@
+import pydantic
+import pytest
+
+from teklinicv.schema.models.settings.page_range import (
+    PageRange,
+    page_range_to_page_numbers,
+)
+
+
+class TestPageRange:
+    @pytest.mark.parametrize(
+        "valid_page_range",
+        ["1", "1,3", "1-3", "2-", "1, 3-5", "4-4"],
+    )
+    def test_accepts_valid_page_ranges(self, valid_page_range):
+        page_range_adapter = pydantic.TypeAdapter(PageRange)
+        result = page_range_adapter.validate_python(valid_page_range)
+        assert result == valid_page_range
+
+    @pytest.mark.parametrize(
+        "invalid_page_range",
+        ["", "0", "a", "1-2-3", "3-1", "-2", "1,,2", "1.5"],
+    )
+    def test_rejects_invalid_page_ranges(self, invalid_page_range):
+        page_range_adapter = pydantic.TypeAdapter(PageRange)
+        with pytest.raises(
+            pydantic.ValidationError, match="comma-separated page numbers or ranges"
+        ):
+            page_range_adapter.validate_python(invalid_page_range)
+
+
+@pytest.mark.parametrize(
+    ("page_range", "page_count", "expected"),
+    [
+        ("1", 3, [1]),
+        ("1,3-5", 5, [1, 3, 4, 5]),
+        ("2-", 4, [2, 3, 4]),
+        ("4-,1", 5, [1, 4, 5]),
+        ("2-9", 3, [2, 3]),
+        ("5", 2, []),
+        ("1-2,2-3", 3, [1, 2, 3]),
+    ],
+)
+def test_page_range_to_page_numbers(page_range, page_count, expected):
+    assert page_range_to_page_numbers(page_range, page_count) == expected
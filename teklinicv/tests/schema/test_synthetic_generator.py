@@ -0,0 +1,92 @@
+import io
+
+import pytest
+
+from teklinicv.schema.synthetic_generator import (
+    SyntheticCvOptions,
+    create_synthetic_yaml_input,
+    write_synthetic_yaml_input_file,
+)
+from teklinicv.schema.teklinicv_model_builder import (
+    build_teklinicv_model_from_commented_map,
+)
+from teklinicv.schema.yaml_reader import read_yaml
+
+
+def build_model(options: SyntheticCvOptions):
+    return build_teklinicv_model_from_commented_map(
+        read_yaml(create_synthetic_yaml_input(options))
+    )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        SyntheticCvOptions(),
+        SyntheticCvOptions(section_count=20, entries_per_type=7, markup_density=1),
+        SyntheticCvOptions(connection_count=13, bold_keyword_count=0),
+        SyntheticCvOptions(section_count=0, connection_count=0),
+    ],
+)
+def test_synthetic_input_is_valid(options):
+    build_model(options)
+
+
+def test_synthetic_input_has_requested_shape():
+    options = SyntheticCvOptions(
+        section_count=18,
+        entries_per_type=5,
+        highlights_per_entry=2,
+        bold_keyword_count=7,
+        connection_count=8,
+    )
+    model = build_model(options)
+
+    assert model.cv.sections is not None
+    assert len(model.cv.sections) == 18
+    assert sum(len(entries) for entries in model.cv.sections.values()) == 9 * 5
+    assert len(model.cv.sections["Education 1"]) == 3
+    assert len(model.cv.sections["Education 2"]) == 2
+    assert len(model.cv.sections["Education 1"][0].highlights) == 2
+    assert len(model.settings.bold_keywords) == 7
+    assert len(model.cv.email) == len(model.cv.website) == 2
+    assert len(model.cv.social_networks) == len(model.cv.custom_connections) == 2
+
+
+def test_synthetic_input_is_reproducible():
+    options = SyntheticCvOptions(seed=3, entries_per_type=4)
+
+    assert create_synthetic_yaml_input(options) == create_synthetic_yaml_input(options)
+    assert create_synthetic_yaml_input(options) != create_synthetic_yaml_input(
+        SyntheticCvOptions(seed=4, entries_per_type=4)
+    )
+
+
+@pytest.mark.parametrize(("markup_density", "has_markup"), [(0, False), (1, True)])
+def test_markup_density(markup_density, has_markup):
+    yaml_input = create_synthetic_yaml_input(
+        SyntheticCvOptions(markup_density=markup_density)
+    )
+
+    assert any(markup in yaml_input for markup in ("**", "$$", "#emph", "`")) == (
+        has_markup
+    )
+
+
+def test_write_synthetic_yaml_input_file(tmp_path):
+    options = SyntheticCvOptions(entries_per_type=3)
+    file_path = tmp_path / "Synthetic_CV.yaml"
+    stream = io.StringIO()
+
+    write_synthetic_yaml_input_file(options, file_path)
+    write_synthetic_yaml_input_file(options, stream)
+
+    expected = create_synthetic_yaml_input(options)
+    assert file_path.read_text(encoding="utf-8") == expected
+    assert stream.getvalue() == expected
+
+
+@pytest.mark.parametrize("options", [{"entries_per_type": -1}, {"markup_density": 1.5}])
+def test_invalid_options(options):
+    with pytest.raises(ValueError, match=r"negative|between"):
+        SyntheticCvOptions(**options)
@@ -139,6 +139,9 @@ class TestBuildTeklinicvDictionary:
             ("markdown_path", "output.md"),
             ("html_path", "output.html"),
             ("png_path", "output.png"),
+            ("png_pages", "1,3-5"),
+            ("png_ppi", 300.0),
+            ("photo_ppi", 300.0),
             ("dont_generate_html", True),
             ("dont_generate_markdown", True),
             ("dont_generate_pdf", True),
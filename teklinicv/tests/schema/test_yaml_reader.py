@@ -1,10 +1,11 @@
+import concurrent.futures
 import pathlib
 
 import pytest
 from ruamel.yaml.comments import CommentedMap
 
 from teklinicv.exception import TekliniCVInternalError, TekliniCVUserError
-from teklinicv.schema.yaml_reader import read_yaml
+from teklinicv.schema.yaml_reader import get_yaml_loader, read_yaml
 
 
 class TestReadYaml:
@@ -36,3 +37,18 @@ class TestReadYaml:
 
         with pytest.raises(TekliniCVUserError, match="empty"):
             read_yaml(empty_file_path)
+
+    def test_doesnt_keep_loaded_documents(self):
+        for index in range(3):
+            read_yaml(f"cv:\n  name: Person {index}\n")
+
+        assert len(get_yaml_loader().doc_infos) == 1
+
+    def test_uses_a_loader_per_thread(self):
+        loader = get_yaml_loader()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            other_loader = executor.submit(get_yaml_loader).result()
+
+        assert get_yaml_loader() is loader
+        assert other_loader is not loader
@@ -0,0 +1,130 @@
+import concurrent.futures
+import gc
+import os
+import pathlib
+import sys
+
+import pytest
+
+import teklinicv
+from teklinicv.caches import (
+    bounded_cache,
+    bounded_thread_local_cache,
+    clear_caches,
+    registered_caches,
+)
+from teklinicv.cli.render_command.progress_reporter import ProgressReporter
+from teklinicv.cli.render_command.run_teklinicv import run_teklinicv
+from teklinicv.renderer.templater.templater import get_jinja2_environment
+from teklinicv.schema.synthetic_generator import (
+    SyntheticCvOptions,
+    create_synthetic_yaml_input,
+)
+
+
+def test_bounded_cache():
+    calls = []
+
+    @bounded_cache(maxsize=2)
+    def square(number: int) -> int:
+        calls.append(number)
+        return number**2
+
+    assert [square(number) for number in [1, 2, 1, 3, 1]] == [1, 4, 1, 9, 1]
+
+    assert calls == [1, 2, 3]
+    assert square.cache_info().currsize == 2
+    assert square in registered_caches
+
+
+def test_bounded_thread_local_cache():
+    @bounded_thread_local_cache(maxsize=2)
+    def create(number: int) -> list[int]:
+        return [number]
+
+    first = create(1)
+
+    assert create(1) is first
+    create(2)
+    create(3)
+    assert create(1) is not first
+    assert create.cache_info().hits == 1
+    assert create.cache_info().misses == 4
+    assert create.cache_info().currsize == 2
+    assert create in registered_caches
+
+
+def test_bounded_thread_local_cache_keeps_results_per_thread():
+    @bounded_thread_local_cache(maxsize=2)
+    def create(number: int) -> list[int]:
+        return [number]
+
+    first = create(1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread_result = executor.submit(create, 1).result()
+        clear_caches()
+
+        assert executor.submit(create, 1).result() is not other_thread_result
+
+    assert other_thread_result is not first
+    assert create(1) is not first
+
+
+def test_clear_caches():
+    environment = get_jinja2_environment()
+
+    teklinicv.clear_caches()
+
+    assert teklinicv.clear_caches is clear_caches
+    assert get_jinja2_environment.cache_info().currsize == 0
+    assert get_jinja2_environment() is not environment
+
+
+def get_rss_bytes() -> int:
+    page_count = int(pathlib.Path("/proc/self/statm").read_text().split()[1])
+    return page_count * os.sysconf("SC_PAGE_SIZE")
+
+
+@pytest.mark.soak
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="Reads the RSS from /proc"
+)
+def test_memory_stays_bounded_over_thousands_of_renders(tmp_path):
+    """Render varied CVs in one process, as a long-running worker does."""
+    custom_theme_folder = tmp_path / "mytheme"
+    custom_theme_folder.mkdir()
+    (custom_theme_folder / "Header.j2.typ").write_text("= {{ cv.name }}")
+    (custom_theme_folder / "__init__.py").write_text(
+        "from teklinicv.schema.models.design.classic_theme import ClassicTheme\n\n"
+        "class MythemeTheme(ClassicTheme):\n    theme: str = 'mytheme'\n"
+    )
+    themes = ["classic", "moderncv", "sb2nov", "engineeringresumes", "mytheme"]
+    input_file = tmp_path / "CV.yaml"
+
+    def render(index: int) -> None:
+        options = SyntheticCvOptions(
+            seed=index, section_count=1, entries_per_type=1, highlights_per_entry=1
+        )
+        input_file.write_text(create_synthetic_yaml_input(options), encoding="utf-8")
+        run_teklinicv(
+            input_file,
+            ProgressReporter(),
+            design_file_path_or_contents=(
+                f"design:\n  theme: {themes[index % len(themes)]}\n"
+            ),
+            dont_generate_pdf=True,
+            dont_generate_png=True,
+        )
+
+    # Let imports, templates, and compilers settle first:
+    for index in range(200):
+        render(index)
+    gc.collect()
+    start_rss_bytes = get_rss_bytes()
+
+    for index in range(200, 2200):
+        render(index)
+    gc.collect()
+
+    # The caches are full by now, and nothing else should keep growing:
+    assert get_rss_bytes() - start_rss_bytes < 24 * 1024 * 1024
@@ -0,0 +1,121 @@
+import functools
+import threading
+
+import pytest
+
+from teklinicv.caches import bounded_cache
+from teklinicv.hooks import (
+    HookEvent,
+    call_cached,
+    hook_stage,
+    no_stage,
+    register_hook,
+    registered_hooks,
+    unregister_hook,
+)
+
+
+@pytest.fixture
+def events():
+    recorded: list[tuple[HookEvent, dict]] = []
+    callbacks = {
+        event: functools.partial(
+            lambda event, **arguments: recorded.append((event, arguments)), event
+        )
+        for event in HookEvent
+    }
+    for event, callback in callbacks.items():
+        register_hook(event, callback)
+    yield recorded
+    for event, callback in callbacks.items():
+        unregister_hook(event, callback)
+
+
+def test_hook_stage_is_a_no_op_without_callbacks():
+    assert hook_stage("Anything") is no_stage
+
+
+def test_unregister_hook_removes_only_the_callback():
+    def first(**_):
+        pass
+
+    def second(**_):
+        pass
+
+    register_hook(HookEvent.cache_hit, first)
+    register_hook(HookEvent.cache_hit, second)
+    unregister_hook(HookEvent.cache_hit, first)
+    unregister_hook(HookEvent.cache_hit, second)
+    unregister_hook(HookEvent.cache_hit, second)
+
+    assert registered_hooks[HookEvent.cache_hit] == ()
+
+
+def test_hook_stage_emits_start_and_end(events):
+    with hook_stage("Validate"):
+        pass
+
+    (start_event, start), (end_event, end) = events
+    assert (start_event, start) == (HookEvent.stage_start, {"stage": "Validate"})
+    assert end_event == HookEvent.stage_end
+    assert end["stage"] == "Validate"
+    assert end["duration_seconds"] >= 0
+    assert end["failed"] is False
+
+
+def test_nested_stages_emit_error_once(events):
+    error = ValueError("Invalid")
+
+    with (
+        pytest.raises(ValueError, match="Invalid"),
+        hook_stage("Outer"),
+        hook_stage("Inner"),
+    ):
+        raise error
+
+    errors = [arguments for event, arguments in events if event == HookEvent.error]
+    assert errors == [{"stage": "Inner", "error": error}]
+    failed_stages = [
+        arguments["stage"]
+        for event, arguments in events
+        if event == HookEvent.stage_end and arguments["failed"]
+    ]
+    assert failed_stages == ["Inner", "Outer"]
+
+
+def test_call_cached_emits_hits_and_misses(events):
+    @bounded_cache(maxsize=1)
+    def double(number: int) -> int:
+        return number * 2
+
+    assert call_cached("double", double, 2) == 4
+    assert call_cached("double", double, 2) == 4
+
+    assert events == [
+        (HookEvent.cache_miss, {"cache": "double"}),
+        (HookEvent.cache_hit, {"cache": "double"}),
+    ]
+
+
+def test_call_cached_ignores_other_threads_calls(events):
+    other_thread_called = threading.Event()
+
+    @bounded_cache(maxsize=2)
+    def double(number: int) -> int:
+        if number == 3:
+            # Another thread hits the cache while this call misses:
+            thread = threading.Thread(target=call_cached, args=("double", double, 2))
+            thread.start()
+            thread.join()
+            other_thread_called.set()
+        return number * 2
+
+    call_cached("double", double, 2)
+    events.clear()
+
+    assert call_cached("double", double, 3) == 6
+    assert other_thread_called.is_set()
+    assert events == [
+        (HookEvent.cache_hit, {"cache": "double"}),
+        (HookEvent.cache_miss, {"cache": "double"}),
+    ]
@@ -0,0 +1,77 @@
+import json
+import pstats
+import threading
+
+from teklinicv.profiler import Profiler, active_profiler, no_span, profile_span
+
+
+def test_profile_span_is_a_no_op_without_profiler():
+    assert profile_span("Anything", "test") is no_span
+
+
+def test_profiler_records_nested_spans(tmp_path):
+    with Profiler(tmp_path / "profile") as profiler:
+        assert active_profiler.get() is profiler
+        with profile_span("Outer", "stage", size=3), profile_span("Inner", "template"):
+            pass
+
+    assert active_profiler.get() is None
+    inner, outer = profiler.spans
+    assert (inner.name, inner.category) == ("Inner", "template")
+    assert (outer.name, outer.category, outer.arguments) == (
+        "Outer",
+        "stage",
+        {"size": 3},
+    )
+    assert outer.start_ns <= inner.start_ns
+    assert inner.start_ns + inner.duration_ns <= outer.start_ns + outer.duration_ns
+
+
+def test_spans_of_other_threads_are_recorded_separately(tmp_path):
+    def work():
+        with profile_span("Thread", "test"):
+            pass
+
+    with Profiler(tmp_path / "profile") as profiler:
+        with profile_span("Main", "test"):
+            pass
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    # The thread doesn't inherit the context, so only the main thread is profiled:
+    assert [span.name for span in profiler.spans] == ["Main"]
+
+
+def test_write_chrome_trace(tmp_path):
+    with Profiler(tmp_path / "profile") as profiler:
+        with (
+            profile_span("Outer", "stage", path=tmp_path),
+            profile_span("Inner", "template"),
+        ):
+            pass
+        paths = profiler.write_files()
+
+    assert paths == [tmp_path / "profile.json"]
+    trace = json.loads(paths[0].read_text(encoding="utf-8"))
+    inner, outer = trace["traceEvents"]
+    assert outer["ph"] == inner["ph"] == "X"
+    assert outer["ts"] == 0
+    assert outer["dur"] >= inner["dur"]
+    assert outer["args"] == {"path": str(tmp_path)}
+
+
+def test_write_pstats(tmp_path):
+    def profiled_function():
+        return sum(range(1000))
+
+    with Profiler(tmp_path / "profile", capture_python=True) as profiler:
+        profiled_function()
+        paths = profiler.write_files()
+
+    assert paths == [tmp_path / "profile.json", tmp_path / "profile.pstats"]
+    stats = pstats.Stats(str(paths[1]))
+    assert any(
+        function_name == "profiled_function"
+        for _, _, function_name in stats.stats  # ty: ignore[unresolved-attribute]
+    )
@@ -0,0 +1,77 @@
+import concurrent.futures
+import pathlib
+
+import pytest
+
+from teklinicv.exception import TekliniCVUserValidationError
+from teklinicv.render import RenderedCV, render_cv
+from teklinicv.schema.synthetic_generator import (
+    SyntheticCvOptions,
+    create_synthetic_yaml_input,
+)
+
+themes = ["classic", "moderncv", "sb2nov", "engineeringresumes"]
+
+
+def render_synthetic_cv(index: int, output_folder: pathlib.Path) -> RenderedCV:
+    return render_cv(
+        create_synthetic_yaml_input(SyntheticCvOptions(seed=index, section_count=9)),
+        design_file_path_or_contents=f"design:\n  theme: {themes[index % 4]}\n",
+        overrides={"cv.name": f"Person {index}"},
+        typst_path=output_folder / f"{index}.typ",
+        markdown_path=output_folder / f"{index}.md",
+        html_path=output_folder / f"{index}.html",
+        dont_generate_pdf=True,
+        dont_generate_png=True,
+    )
+
+
+def read_outputs(rendered_cv: RenderedCV) -> tuple[str, str, str]:
+    assert rendered_cv.typst_path is not None
+    assert rendered_cv.markdown_path is not None
+    assert rendered_cv.html_path is not None
+    return (
+        rendered_cv.typst_path.read_text(encoding="utf-8"),
+        rendered_cv.markdown_path.read_text(encoding="utf-8"),
+        rendered_cv.html_path.read_text(encoding="utf-8"),
+    )
+
+
+def test_render_cv(tmp_path):
+    rendered_cv = render_synthetic_cv(0, tmp_path)
+
+    assert rendered_cv == RenderedCV(
+        typst_path=tmp_path / "0.typ",
+        pdf_path=None,
+        png_paths=None,
+        markdown_path=tmp_path / "0.md",
+        html_path=tmp_path / "0.html",
+    )
+    assert all("Person 0" in output for output in read_outputs(rendered_cv))
+
+
+def test_render_cv_raises_validation_errors():
+    with pytest.raises(TekliniCVUserValidationError):
+        render_cv("cv:\n  name: 1\n  email: not an email\n")
+
+
+def test_render_cv_from_several_threads(tmp_path):
+    """Concurrent renders must write the same files as renders one at a time."""
+    indices = range(48)
+    expected_outputs = [
+        read_outputs(render_synthetic_cv(index, tmp_path / "sequential"))
+        for index in indices
+    ]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        rendered_cvs = list(
+            executor.map(
+                lambda index: render_synthetic_cv(index, tmp_path / "concurrent"),
+                indices,
+            )
+        )
+
+    for index, rendered_cv in zip(indices, rendered_cvs, strict=True):
+        outputs = read_outputs(rendered_cv)
+        assert outputs == expected_outputs[index]
+        assert all(f"Person {index}" in output for output in outputs)
@@ -0,0 +1,87 @@
+import json
+import tracemalloc
+
+from teklinicv.render_report import (
+    RenderReport,
+    get_active_render_report,
+    record_page_count,
+)
+from teklinicv.renderer.templater.templater import get_jinja2_environment
+
+
+def test_report_is_active_inside_block():
+    report = RenderReport()
+
+    with report:
+        assert get_active_render_report() is report
+        record_page_count(3)
+
+    assert get_active_render_report() is None
+    assert report.page_count == 3
+    assert report.duration_ms is not None
+
+
+def test_record_page_count_without_report():
+    record_page_count(3)
+
+    assert get_active_render_report() is None
+
+
+def test_record_stage_measures_memory(tmp_path):
+    output_file = tmp_path / "cv.md"
+    output_file.write_text("Hello", encoding="utf-8")
+
+    with RenderReport() as report:
+        with report.record_stage("Allocated") as stage:
+            data = bytearray(1024**2)
+            stage.add_outputs([output_file], unchanged_paths=[output_file])
+        del data
+
+    assert not tracemalloc.is_tracing()
+    (stage,) = report.stages
+    assert stage.name == "Allocated"
+    assert stage.peak_memory_bytes is not None
+    assert stage.peak_memory_bytes >= 1024**2
+    assert stage.outputs[0].size_bytes == 5
+    assert stage.outputs[0].unchanged
+
+
+def test_record_stage_without_memory_tracing():
+    with RenderReport(trace_memory=False) as report, report.record_stage("Stage"):
+        pass
+
+    assert report.stages[0].peak_memory_bytes is None
+
+
+def test_report_counts_cache_hits_and_misses():
+    get_jinja2_environment.cache_clear()
+
+    with RenderReport() as report:
+        get_jinja2_environment(None)
+        get_jinja2_environment(None)
+
+    assert report.caches["jinja2_environment"].hits == 1
+    assert report.caches["jinja2_environment"].misses == 1
+
+
+def test_write_json_line_appends(tmp_path):
+    report_path = tmp_path / "reports.jsonl"
+    with RenderReport(tmp_path / "cv.yaml") as report:
+        pass
+
+    report.write_json_line(report_path)
+    report.write_json_line(report_path)
+
+    lines = report_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0]) == report.to_dictionary()
+    assert json.loads(lines[0])["input_file"] == str(tmp_path / "cv.yaml")
+
+
+def test_write_json_line_to_stdout(capsys):
+    with RenderReport() as report:
+        pass
+
+    report.write_json_line()
+
+    assert json.loads(capsys.readouterr().out)["success"]